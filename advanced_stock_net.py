@@ -15,6 +15,9 @@ import matplotlib.pyplot as plt
 from sklearn.preprocessing import MinMaxScaler
 from sklearn.model_selection import train_test_split
 import warnings
+from indicators import Indicator, compute_indicators
+from feature_cache import load_features
+from columnar_cache import read_csv_cached
 warnings.filterwarnings('ignore')
 
 def sigmoid(x):
@@ -48,99 +51,15 @@ def compute_rsi(prices, period=14):
     
     return np.concatenate([[np.nan], rsi])
 
-def add_technical_indicators(df):
-    """Add comprehensive technical indicators."""
-    df_enhanced = df.copy()
-    
-    # Basic moving averages
-    df_enhanced['ma_5'] = df_enhanced['close'].rolling(window=5).mean()
-    df_enhanced['ma_10'] = df_enhanced['close'].rolling(window=10).mean()
-    df_enhanced['ma_20'] = df_enhanced['close'].rolling(window=20).mean()
-    df_enhanced['ma_50'] = df_enhanced['close'].rolling(window=50).mean()
-    
-    # Exponential moving averages
-    df_enhanced['ema_12'] = df_enhanced['close'].ewm(span=12).mean()
-    df_enhanced['ema_26'] = df_enhanced['close'].ewm(span=26).mean()
-    
-    # RSI
-    df_enhanced['rsi'] = compute_rsi(df_enhanced['close'], 14)
-    
-    # Price changes and returns
-    df_enhanced['price_change'] = df_enhanced['close'].pct_change()
-    df_enhanced['price_change_5'] = df_enhanced['close'].pct_change(periods=5)
-    df_enhanced['price_change_10'] = df_enhanced['close'].pct_change(periods=10)
-    
-    # Volatility measures
-    df_enhanced['volatility_10'] = df_enhanced['close'].rolling(window=10).std()
-    df_enhanced['volatility_20'] = df_enhanced['close'].rolling(window=20).std()
-    
-    # Bollinger Bands
-    df_enhanced['bb_middle'] = df_enhanced['close'].rolling(window=20).mean()
-    bb_std = df_enhanced['close'].rolling(window=20).std()
-    df_enhanced['bb_upper'] = df_enhanced['bb_middle'] + (bb_std * 2)
-    df_enhanced['bb_lower'] = df_enhanced['bb_middle'] - (bb_std * 2)
-    df_enhanced['bb_width'] = (df_enhanced['bb_upper'] - df_enhanced['bb_lower']) / df_enhanced['bb_middle']
-    df_enhanced['bb_position'] = (df_enhanced['close'] - df_enhanced['bb_lower']) / (df_enhanced['bb_upper'] - df_enhanced['bb_lower'])
-    
-    # MACD
-    exp1 = df_enhanced['close'].ewm(span=12).mean()
-    exp2 = df_enhanced['close'].ewm(span=26).mean()
-    df_enhanced['macd'] = exp1 - exp2
-    df_enhanced['macd_signal'] = df_enhanced['macd'].ewm(span=9).mean()
-    df_enhanced['macd_histogram'] = df_enhanced['macd'] - df_enhanced['macd_signal']
-    
-    # Stochastic Oscillator
-    low_min = df_enhanced['low'].rolling(window=14).min()
-    high_max = df_enhanced['high'].rolling(window=14).max()
-    df_enhanced['stoch_k'] = 100 * (df_enhanced['close'] - low_min) / (high_max - low_min)
-    df_enhanced['stoch_d'] = df_enhanced['stoch_k'].rolling(window=3).mean()
-    
-    # Williams %R
-    df_enhanced['williams_r'] = -100 * (high_max - df_enhanced['close']) / (high_max - low_min)
-    
-    # Volume indicators
-    df_enhanced['volume_ma'] = df_enhanced['vol'].rolling(window=10).mean()
-    df_enhanced['volume_ratio'] = df_enhanced['vol'] / df_enhanced['volume_ma']
-    df_enhanced['volume_sma_ratio'] = df_enhanced['vol'] / df_enhanced['vol'].rolling(window=20).mean()
-    
-    # Price momentum
-    df_enhanced['momentum_5'] = df_enhanced['close'] - df_enhanced['close'].shift(5)
-    df_enhanced['momentum_10'] = df_enhanced['close'] - df_enhanced['close'].shift(10)
-    
-    # Rate of change
-    df_enhanced['roc_5'] = ((df_enhanced['close'] - df_enhanced['close'].shift(5)) / df_enhanced['close'].shift(5)) * 100
-    df_enhanced['roc_10'] = ((df_enhanced['close'] - df_enhanced['close'].shift(10)) / df_enhanced['close'].shift(10)) * 100
-    
-    # Average True Range (ATR)
-    high_low = df_enhanced['high'] - df_enhanced['low']
-    high_close = np.abs(df_enhanced['high'] - df_enhanced['close'].shift())
-    low_close = np.abs(df_enhanced['low'] - df_enhanced['close'].shift())
-    true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-    df_enhanced['atr'] = true_range.rolling(window=14).mean()
-    
-    # Commodity Channel Index (CCI)
-    typical_price = (df_enhanced['high'] + df_enhanced['low'] + df_enhanced['close']) / 3
-    sma_tp = typical_price.rolling(window=20).mean()
-    mad = typical_price.rolling(window=20).apply(lambda x: np.mean(np.abs(x - x.mean())))
-    df_enhanced['cci'] = (typical_price - sma_tp) / (0.015 * mad)
-    
-    # Money Flow Index (MFI)
-    typical_price = (df_enhanced['high'] + df_enhanced['low'] + df_enhanced['close']) / 3
-    money_flow = typical_price * df_enhanced['vol']
-    
-    positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0).rolling(window=14).sum()
-    negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0).rolling(window=14).sum()
-    
-    mfi_ratio = positive_flow / negative_flow
-    df_enhanced['mfi'] = 100 - (100 / (1 + mfi_ratio))
-    
-    # Support and Resistance levels
-    df_enhanced['support_20'] = df_enhanced['low'].rolling(window=20).min()
-    df_enhanced['resistance_20'] = df_enhanced['high'].rolling(window=20).max()
-    df_enhanced['price_to_support'] = (df_enhanced['close'] - df_enhanced['support_20']) / df_enhanced['support_20']
-    df_enhanced['price_to_resistance'] = (df_enhanced['resistance_20'] - df_enhanced['close']) / df_enhanced['close']
-    
-    return df_enhanced
+# This model was tuned with a simple-moving-average RSI
+ADVANCED_INDICATORS = {
+    'rsi': Indicator('rsi', ('close',),
+                     lambda close: pd.Series(compute_rsi(close.values, 14), index=close.index)),
+}
+
+def add_technical_indicators(df, columns=None):
+    """Add comprehensive technical indicators (only those in columns, if given)."""
+    return compute_indicators(df, columns=columns, overrides=ADVANCED_INDICATORS)
 
 class AdvancedStockNet:
     """Advanced neural network for stock price prediction."""
@@ -404,21 +323,24 @@ def main():
     parser.add_argument('--batch_size', type=int, default=32, help='Batch size')
     parser.add_argument('--validation_split', type=float, default=0.2, help='Validation split')
     parser.add_argument('--early_stopping_patience', type=int, default=15, help='Early stopping patience')
+    parser.add_argument('--no_feature_cache', action='store_true',
+                        help='Recompute technical indicators instead of using the feature cache')
+    parser.add_argument('--columnar_cache', action='store_true',
+                        help='Convert the CSV to a Feather sidecar on first load and read that afterwards')
     
     args = parser.parse_args()
     
-    # Load and prepare data
-    print("Loading data...")
-    df = pd.read_csv(args.data_file)
-    
-    # Add technical indicators
-    print("Adding technical indicators...")
-    df = add_technical_indicators(df)
-    
     # Select features
     x_features = args.x_features.split(',')
     y_feature = args.y_feature
     
+    # Load the data with the technical indicators the model uses (cached per file)
+    print("Loading data and technical indicators...")
+    df = load_features(args.data_file, columns=x_features + [y_feature],
+                       overrides=ADVANCED_INDICATORS, variant='advanced',
+                       cache=not args.no_feature_cache,
+                       reader=read_csv_cached if args.columnar_cache else None)
+    
     # Remove rows with NaN values
     df = df.dropna()
     
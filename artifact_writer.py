@@ -0,0 +1,148 @@
+"""
+Background artifact writer
+
+Queues model artifact writes (NPZ weights, CSVs, JSON, DataFrame copies,
+directory moves) onto a single background thread so they overlap with
+training. Writes run in submission order; arrays are copied at submit time
+so callers may keep updating their buffers in place.
+
+Usage:
+    with ArtifactWriter() as writer:
+        writer.write_csv(df, path)          # starts immediately
+        ...train...
+        writer.savez(weights_path, W1=W1)   # snapshot of W1 taken now
+    # leaving the block waits for every write and re-raises the first error
+"""
+
+import os
+import json
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+class ArtifactWriter:
+    """Single-threaded, ordered background writer with a flush barrier."""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer")
+        self._futures = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Queue an arbitrary write.
+
+        Args:
+            fn (callable): Function performing the write
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            concurrent.futures.Future: Completes when the write has finished
+        """
+        future = self._executor.submit(fn, *args, **kwargs)
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def savez(self, path, **arrays):
+        """Queue np.savez of a snapshot of the given arrays."""
+        snapshot = {name: np.array(value, copy=True) for name, value in arrays.items()}
+        return self.submit(_savez, path, snapshot)
+
+    def savetxt(self, path, array, delimiter=','):
+        """Queue np.savetxt of a snapshot of the array."""
+        return self.submit(np.savetxt, path, np.array(array, copy=True), delimiter=delimiter)
+
+    def write_json(self, path, obj, indent=4):
+        """Queue a JSON dump; the object is serialized before returning."""
+        return self.submit(_write_text, path, json.dumps(obj, indent=indent, default=str))
+
+    def write_csv(self, df, path, index=False):
+        """
+        Queue DataFrame.to_csv.
+
+        The frame is not copied, so it must not be modified until the write
+        completes (training only reads its input frame).
+        """
+        return self.submit(df.to_csv, path, index=index)
+
+    def move(self, src, dst, replace=True):
+        """Queue moving a file or directory, replacing dst if requested."""
+        return self.submit(_move, src, dst, replace)
+
+    def barrier(self):
+        """
+        Future that completes once every write queued so far has finished.
+
+        Returns:
+            concurrent.futures.Future: Result is the list of write errors
+        """
+        with self._lock:
+            pending = list(self._futures)
+        return self._executor.submit(_collect_errors, pending)
+
+    def flush(self, timeout=None):
+        """
+        Block until all queued writes are done.
+
+        Args:
+            timeout (float): Seconds to wait, None to wait indefinitely
+
+        Raises:
+            Exception: The first error raised by a queued write
+        """
+        errors = self.barrier().result(timeout)
+        with self._lock:
+            self._futures = [f for f in self._futures if not f.done()]
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        """Flush outstanding writes and stop the background thread."""
+        try:
+            self.flush()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """Wait for queued writes and stop the thread without raising write errors."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Do not mask the original error with a write failure
+            self.shutdown()
+        return False
+
+
+def _savez(path, arrays):
+    np.savez(path, **arrays)
+
+
+def _write_text(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def _move(src, dst, replace):
+    if not os.path.exists(src):
+        return
+    if replace and os.path.isdir(dst):
+        shutil.rmtree(dst)
+    elif replace and os.path.exists(dst):
+        os.remove(dst)
+    shutil.move(src, dst)
+
+
+def _collect_errors(futures):
+    # Runs on the writer thread after every earlier write, so all are done
+    return [f.exception() for f in futures if f.exception() is not None]
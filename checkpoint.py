@@ -0,0 +1,172 @@
+"""
+Resumable training checkpoints
+
+A checkpoint holds everything StockNet.train needs to continue a run exactly
+where it stopped: weights, Adam moments and step counter, normalization
+bounds, the next epoch, loss history, early-stopping counters and the global
+NumPy RNG state that drives the per-epoch shuffles.
+
+TrainingCheckpointer decides when to write them: every N epochs, when a stop
+is requested from another thread (TrainingIntegration.stop_training_process),
+and on the first Ctrl-C when installed in the main thread.
+"""
+
+import os
+import signal
+import threading
+
+import numpy as np
+
+CHECKPOINT_FILE = "checkpoint.npz"
+
+MODEL_ARRAYS = ('W1', 'b1', 'W2', 'b2',
+                'm_W1', 'm_b1', 'm_W2', 'm_b2',
+                'v_W1', 'v_b1', 'v_W2', 'v_b2')
+
+
+def save_checkpoint(path, model, state):
+    """
+    Atomically write a training checkpoint.
+
+    Args:
+        path (str): Destination .npz file
+        model (StockNet): Model whose parameters and optimizer state to save
+        state (dict): Training loop state with 'epoch' (next epoch to run),
+            'best_mse', 'patience_counter', 'train_losses' and 'val_losses'
+    """
+    rng_name, rng_keys, rng_pos, rng_has_gauss, rng_cached = np.random.get_state()
+    arrays = {name: np.array(getattr(model, name)) for name in MODEL_ARRAYS}
+    has_norm = model.X_min is not None
+    arrays.update(
+        t=model.t,
+        input_size=model.W1.shape[0],
+        hidden_size=model.W1.shape[1],
+        output_size=model.W2.shape[1],
+        has_input_norm=has_norm,
+        X_min=model.X_min if has_norm else np.zeros(0),
+        X_max=model.X_max if has_norm else np.zeros(0),
+        Y_min=model.Y_min if model.has_target_norm else np.nan,
+        Y_max=model.Y_max if model.has_target_norm else np.nan,
+        has_target_norm=model.has_target_norm,
+        epoch=state['epoch'],
+        best_mse=state['best_mse'],
+        patience_counter=state['patience_counter'],
+        train_losses=np.asarray(state['train_losses'], dtype=np.float64),
+        val_losses=np.asarray(state['val_losses'], dtype=np.float64),
+        rng_name=rng_name,
+        rng_keys=rng_keys,
+        rng_pos=rng_pos,
+        rng_has_gauss=rng_has_gauss,
+        rng_cached=rng_cached,
+    )
+
+    # Write next to the target and rename so a crash never leaves a torn file
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, model_cls=None):
+    """
+    Restore a model and its training loop state from a checkpoint.
+
+    Args:
+        path (str): Checkpoint .npz file
+        model_cls (type): Model class to instantiate (defaults to StockNet)
+
+    Returns:
+        tuple: (model, state) where state is the dict accepted by
+        StockNet.train(resume_state=...), including the saved RNG state
+    """
+    if model_cls is None:
+        from stock_net import StockNet
+        model_cls = StockNet
+
+    with np.load(path) as data:
+        model = model_cls(int(data['input_size']), int(data['hidden_size']), int(data['output_size']))
+        for name in MODEL_ARRAYS:
+            setattr(model, name, data[name].copy())
+        model.t = int(data['t'])
+        if bool(data['has_input_norm']):
+            model.X_min = data['X_min'].copy()
+            model.X_max = data['X_max'].copy()
+        model.has_target_norm = bool(data['has_target_norm'])
+        if model.has_target_norm:
+            model.Y_min = float(data['Y_min'])
+            model.Y_max = float(data['Y_max'])
+
+        state = {
+            'epoch': int(data['epoch']),
+            'best_mse': float(data['best_mse']),
+            'patience_counter': int(data['patience_counter']),
+            'train_losses': data['train_losses'].tolist(),
+            'val_losses': data['val_losses'].tolist(),
+            'rng_state': (str(data['rng_name']), data['rng_keys'].copy(), int(data['rng_pos']),
+                          int(data['rng_has_gauss']), float(data['rng_cached'])),
+        }
+    return model, state
+
+
+class TrainingCheckpointer:
+    """Decides when StockNet.train writes checkpoints and when it should stop."""
+
+    def __init__(self, path, every=0):
+        """
+        Args:
+            path (str): Checkpoint file to write
+            every (int): Save every N epochs (0 disables periodic saves)
+        """
+        self.path = path
+        self.every = max(0, int(every))
+        self._stop = threading.Event()
+        self._previous_handler = None
+
+    def request_stop(self):
+        """Ask the training loop to checkpoint and stop after the current epoch."""
+        self._stop.set()
+
+    @property
+    def stop_requested(self):
+        return self._stop.is_set()
+
+    def should_save(self, epoch):
+        """Return True if a periodic checkpoint is due after this epoch."""
+        return self.every > 0 and (epoch + 1) % self.every == 0
+
+    def save(self, model, state):
+        """Write a checkpoint, logging instead of failing the run on errors."""
+        try:
+            save_checkpoint(self.path, model, state)
+        except Exception as e:
+            print(f"Warning: Could not save checkpoint to {self.path}: {e}")
+
+    def install_sigint_handler(self):
+        """
+        Turn the first Ctrl-C into a checkpoint-and-stop request.
+
+        A second Ctrl-C falls through to the previous handler. Only has an
+        effect in the main thread, where Python delivers signals.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        def handler(signum, frame):
+            if self._stop.is_set():
+                previous = self._previous_handler
+                if callable(previous):
+                    previous(signum, frame)
+                else:
+                    raise KeyboardInterrupt
+                return
+            print("\nInterrupt received, saving checkpoint after this epoch (Ctrl-C again to abort)")
+            self._stop.set()
+
+        self._previous_handler = signal.signal(signal.SIGINT, handler)
+
+    def restore_sigint_handler(self):
+        """Reinstate the handler that was active before install_sigint_handler."""
+        if self._previous_handler is not None:
+            signal.signal(signal.SIGINT, self._previous_handler)
+            self._previous_handler = None
@@ -0,0 +1,219 @@
+"""
+Columnar sidecars for CSV inputs
+
+Parsing a large CSV is the slowest part of every GUI session, training run and
+prediction. read_csv_cached converts a CSV once into a typed Feather (Arrow IPC)
+or Parquet sidecar and serves later loads from the sidecar, memory-mapped and
+reading only the requested columns.
+
+A sidecar records the CSV's size and modification time in its schema metadata
+and is rebuilt as soon as either changes. Sidecars are written next to the CSV
+("prices.csv" -> "prices.csv.feather") unless COLUMNAR_CACHE_DIR is set. The
+conversion streams the CSV in blocks with pyarrow.csv, and column types are
+chosen so the loaded frame matches what pd.read_csv gives (dates stay strings,
+empty columns are float).
+
+The mode is opt-in: pass --columnar_cache to the CLI scripts, or set
+COLUMNAR_CACHE=1 for the GUI's DataManager.
+
+Usage:
+    df = read_csv_cached("data/aapl.csv", columns=["open", "close"])
+"""
+
+import os
+import hashlib
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+COLUMNAR_CACHE_ENABLED = os.environ.get('COLUMNAR_CACHE', '').lower() in ('1', 'true', 'yes')
+COLUMNAR_CACHE_DIR = os.environ.get('COLUMNAR_CACHE_DIR') or None
+SIDECAR_FORMATS = ('feather', 'parquet')
+
+# Bytes of CSV text parsed per streamed block
+CSV_BLOCK_BYTES = 16 * 1024 * 1024
+
+_SIZE_KEY = b'csv_source_size'
+_MTIME_KEY = b'csv_source_mtime_ns'
+
+
+def sidecar_path(csv_path, fmt='feather', cache_dir=None):
+    """
+    Where the columnar copy of a CSV lives.
+
+    Args:
+        csv_path (str): Source CSV file
+        fmt (str): 'feather' or 'parquet'
+        cache_dir (str): Directory for sidecars (defaults to COLUMNAR_CACHE_DIR,
+            or next to the CSV when that is unset)
+
+    Returns:
+        str: Sidecar path (which may not exist yet)
+    """
+    if fmt not in SIDECAR_FORMATS:
+        raise ValueError(f"Unsupported sidecar format: {fmt}")
+    source = os.path.abspath(csv_path)
+    cache_dir = cache_dir or COLUMNAR_CACHE_DIR
+    if cache_dir is None:
+        return f"{source}.{fmt}"
+    digest = hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(source)}-{digest}.{fmt}")
+
+
+def _read_schema(sidecar):
+    if sidecar.endswith('.parquet'):
+        return pq.read_schema(sidecar)
+    with pa.memory_map(sidecar) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def sidecar_is_fresh(csv_path, sidecar):
+    """
+    Whether a sidecar was built from the CSV as it is now.
+
+    Args:
+        csv_path (str): Source CSV file
+        sidecar (str): Sidecar path
+
+    Returns:
+        bool: True if the sidecar exists and records the CSV's current size
+        and modification time
+    """
+    if not PYARROW_AVAILABLE or not os.path.exists(sidecar):
+        return False
+    try:
+        metadata = _read_schema(sidecar).metadata or {}
+    except (OSError, pa.ArrowException):
+        return False
+    stat = os.stat(csv_path)
+    return (metadata.get(_SIZE_KEY) == str(stat.st_size).encode()
+            and metadata.get(_MTIME_KEY) == str(stat.st_mtime_ns).encode())
+
+
+def _pandas_compatible_types(schema):
+    """Column type overrides that make Arrow parse a CSV the way pd.read_csv does."""
+    overrides = {}
+    for field in schema:
+        if pa.types.is_temporal(field.type):
+            overrides[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            overrides[field.name] = pa.float64()
+    return overrides
+
+
+def _open_csv(csv_path, column_types=None):
+    return pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types or {}))
+
+
+def _write_batches(batches, schema, tmp_path, fmt):
+    if fmt == 'parquet':
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+    else:
+        # Uncompressed so the sidecar can be memory-mapped without copying
+        with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+
+
+def convert_csv(csv_path, sidecar=None, fmt='feather'):
+    """
+    Convert a CSV into a columnar sidecar, streaming it block by block.
+
+    Column types are inferred from the first block. If a later block does
+    not fit them, the whole file is parsed at once instead so inference sees
+    every row.
+
+    Args:
+        csv_path (str): Source CSV file
+        sidecar (str): Output path (defaults to sidecar_path(csv_path, fmt))
+        fmt (str): 'feather' or 'parquet'
+
+    Returns:
+        str: Path of the written sidecar
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("PyArrow is required for columnar sidecars. Install with: pip install pyarrow")
+    sidecar = sidecar or sidecar_path(csv_path, fmt)
+    os.makedirs(os.path.dirname(sidecar) or '.', exist_ok=True)
+
+    # Record the CSV as it was before parsing, so edits made meanwhile invalidate the sidecar
+    stat = os.stat(csv_path)
+    source_metadata = {_SIZE_KEY: str(stat.st_size).encode(), _MTIME_KEY: str(stat.st_mtime_ns).encode()}
+    tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+
+    try:
+        try:
+            reader = _open_csv(csv_path)
+            overrides = _pandas_compatible_types(reader.schema)
+            if overrides:
+                reader = _open_csv(csv_path, overrides)
+            schema = reader.schema.with_metadata(source_metadata)
+            _write_batches(reader, schema, tmp_path, fmt)
+        except pa.ArrowInvalid:
+            table = pa_csv.read_csv(csv_path)
+            overrides = _pandas_compatible_types(table.schema)
+            if overrides:
+                table = pa_csv.read_csv(csv_path, convert_options=pa_csv.ConvertOptions(column_types=overrides))
+            table = table.replace_schema_metadata(source_metadata)
+            _write_batches(table.to_batches(), table.schema, tmp_path, fmt)
+        os.replace(tmp_path, sidecar)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return sidecar
+
+
+def read_csv_cached(csv_path, columns=None, fmt='feather', cache_dir=None):
+    """
+    Read a CSV through its columnar sidecar, converting it first if needed.
+
+    Falls back to pd.read_csv when PyArrow is missing or the sidecar cannot
+    be written.
+
+    Args:
+        csv_path (str): Source CSV file
+        columns (list or callable): Columns to read, ones the file lacks being
+            skipped, or a predicate on column names like pd.read_csv's usecols
+            (None reads all)
+        fmt (str): 'feather' or 'parquet'
+        cache_dir (str): Directory for sidecars (see sidecar_path)
+
+    Returns:
+        pandas.DataFrame: The CSV's contents
+    """
+    if columns is None or callable(columns):
+        usecols = columns
+    else:
+        wanted = set(columns)
+        usecols = lambda name: name in wanted
+    if not PYARROW_AVAILABLE:
+        return pd.read_csv(csv_path, usecols=usecols)
+
+    sidecar = sidecar_path(csv_path, fmt, cache_dir)
+    if not sidecar_is_fresh(csv_path, sidecar):
+        try:
+            convert_csv(csv_path, sidecar, fmt)
+        except (OSError, pa.ArrowException) as e:
+            print(f"Warning: Could not build columnar sidecar for {csv_path}: {e}")
+            return pd.read_csv(csv_path, usecols=usecols)
+
+    names = _read_schema(sidecar).names
+    read_columns = None if usecols is None else [name for name in names if usecols(name)]
+    if fmt == 'parquet':
+        table = pq.read_table(sidecar, columns=read_columns, memory_map=True)
+    else:
+        table = feather.read_table(sidecar, columns=read_columns, memory_map=True)
+    return table.replace_schema_metadata(None).to_pandas()
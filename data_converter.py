@@ -14,6 +14,8 @@ import argparse
 from datetime import datetime, timedelta
 from tkinter import messagebox
 
+from dataset_loader import map_files
+
 def detect_data_format(df):
     """
     Detect the format of the input data and suggest conversion strategy.
@@ -309,34 +311,35 @@ def convert_data_file(input_file, output_file=None, strategy='auto'):
         print(f"❌ Error during conversion: {e}")
         return None
 
-def batch_convert_directory(input_dir, output_dir=None):
+def batch_convert_directory(input_dir, output_dir=None, max_workers=None):
     """
     Convert all CSV files in a directory to OHLCV format.
     
+    Files are converted in parallel on a thread pool.
+    
     Args:
         input_dir (str): Input directory path
         output_dir (str): Output directory path (optional)
+        max_workers (int): Number of files converted at once (default: automatic)
     """
     if output_dir is None:
         output_dir = os.path.join(input_dir, 'converted')
     
     os.makedirs(output_dir, exist_ok=True)
     
-    csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
+    csv_files = sorted(f for f in os.listdir(input_dir) if f.endswith('.csv'))
     
     print(f"🔄 Converting {len(csv_files)} CSV files in {input_dir}")
     
-    successful_conversions = 0
-    
-    for csv_file in csv_files:
+    def convert(csv_file):
         input_path = os.path.join(input_dir, csv_file)
         output_path = os.path.join(output_dir, csv_file.replace('.csv', '_ohlcv.csv'))
         
         print(f"\n📁 Processing: {csv_file}")
-        result = convert_data_file(input_path, output_path)
-        
-        if result:
-            successful_conversions += 1
+        return convert_data_file(input_path, output_path)
+    
+    results = map_files(convert, csv_files, max_workers)
+    successful_conversions = sum(1 for result in results if result)
     
     print(f"\n🎯 Batch conversion completed!")
     print(f"   Successful: {successful_conversions}/{len(csv_files)}")
@@ -424,11 +427,12 @@ def main():
     parser.add_argument("-s", "--strategy", choices=['auto', 'generic_features', 'numeric', 'timeseries'],
                        default='auto', help="Conversion strategy")
     parser.add_argument("--batch", action="store_true", help="Process all CSV files in directory")
+    parser.add_argument("--workers", type=int, default=None, help="Files converted in parallel in batch mode")
     
     args = parser.parse_args()
     
     if args.batch or os.path.isdir(args.input):
-        batch_convert_directory(args.input, args.output)
+        batch_convert_directory(args.input, args.output, args.workers)
     else:
         convert_data_file(args.input, args.output, args.strategy)
 
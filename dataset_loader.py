@@ -0,0 +1,234 @@
+"""
+Parallel loading of directories of per-ticker data files
+
+A universe of thousands of tickers is stored as one CSV per ticker
+("aapl_combined.csv", "msft_combined.csv", ...). Reading them one after
+another leaves the disk and most cores idle, so this module reads them
+with a thread pool (or a process pool for CPU-bound parsing).
+
+    - load_directory reads every file, tags rows with the ticker from
+      path_utils.get_ticker_from_filename (as a categorical column) and
+      concatenates once, so each column is copied into a buffer sized for
+      the total row count a single time
+    - iter_directory yields (ticker, frame) pairs in file order while
+      reading a bounded number of files ahead, for per-ticker processing
+      without holding the whole universe in memory
+    - map_files runs any per-file function over the pool, for batch jobs
+      such as data_converter.batch_convert_directory
+
+Headers are checked before any data is read, so a file missing a required
+column fails the load immediately instead of after minutes of parsing.
+
+Usage:
+    df = load_directory("data/universe", columns=["open", "high", "low", "close", "vol"])
+    for ticker, frame in iter_directory("data/universe"):
+        ...
+"""
+
+import os
+import csv
+import glob
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from path_utils import get_ticker_from_filename
+
+REQUIRED_COLUMNS = ['open', 'high', 'low', 'close', 'vol']
+
+# Threads overlap file I/O; parsing releases the GIL for much of its work
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def list_data_files(directory, pattern="*.csv"):
+    """
+    Data files in a directory, in sorted order.
+
+    Args:
+        directory (str): Directory to search
+        pattern (str): Glob pattern for data files
+
+    Returns:
+        list: File paths
+
+    Raises:
+        FileNotFoundError: If no files match
+    """
+    files = sorted(glob.glob(os.path.join(directory, pattern)))
+    if not files:
+        raise FileNotFoundError(f"No files matching {pattern} found in directory: {directory}")
+    return files
+
+
+def read_header(path):
+    """Column names of a CSV file, from its first line only."""
+    with open(path, newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def validate_schemas(files, required_columns=REQUIRED_COLUMNS, max_workers=None):
+    """
+    Check every file's header for the required columns before loading.
+
+    Args:
+        files (list): CSV file paths
+        required_columns (list): Columns every file must have
+        max_workers (int): Threads used to read headers
+
+    Returns:
+        dict: File path -> list of its columns
+
+    Raises:
+        ValueError: Naming the files that miss required columns
+    """
+    headers = dict(zip(files, map_files(read_header, files, max_workers)))
+    problems = []
+    for path, columns in headers.items():
+        missing = [c for c in required_columns or () if c not in columns]
+        if missing:
+            problems.append(f"{os.path.basename(path)} (missing {missing})")
+    if problems:
+        shown = ', '.join(problems[:10]) + (f" and {len(problems) - 10} more" if len(problems) > 10 else "")
+        raise ValueError(f"CSV files must contain columns {required_columns}: {shown}")
+    return headers
+
+
+def map_files(func, paths, max_workers=None, use_processes=False):
+    """
+    Apply func to each path on a worker pool.
+
+    Args:
+        func (callable): Function of one path; must be a module-level
+            function when use_processes is True
+        paths (list): Paths to process
+        max_workers (int): Pool size (defaults to DEFAULT_MAX_WORKERS threads
+            or one process per CPU)
+        use_processes (bool): Use processes instead of threads
+
+    Returns:
+        list: func(path) for each path, in the order of paths
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=min(max_workers or DEFAULT_MAX_WORKERS, len(paths)))
+    with executor:
+        return list(executor.map(func, paths))
+
+
+def _read_csv(path, columns=None):
+    return pd.read_csv(path, usecols=columns)
+
+
+class _FileReader:
+    """Picklable callable reading one file with a column selection."""
+
+    def __init__(self, reader, columns):
+        self.reader = reader or _read_csv
+        self.columns = columns
+
+    def __call__(self, path):
+        return self.reader(path, self.columns)
+
+
+def _ticker_codes(tickers, lengths):
+    """Categorical ticker column built from one code per file instead of a string per row."""
+    categories = pd.unique(np.asarray(tickers, dtype=object))
+    codes = pd.Index(categories).get_indexer(tickers)
+    return pd.Categorical.from_codes(np.repeat(codes, lengths), categories=categories)
+
+
+def load_directory(directory, columns=None, required_columns=REQUIRED_COLUMNS, pattern="*.csv",
+                   ticker_column='ticker', max_workers=None, use_processes=False, reader=None):
+    """
+    Load every data file in a directory into one frame, in parallel.
+
+    Args:
+        directory (str): Directory of per-ticker files
+        columns (list): Columns to read from each file (None reads all)
+        required_columns (list): Columns every file must have; checked on
+            the headers before any data is read
+        pattern (str): Glob pattern for data files
+        ticker_column (str): Name of the column tagging each row with its
+            file's ticker (None to leave rows untagged); files that already
+            have the column keep their own values
+        max_workers (int): Pool size
+        use_processes (bool): Parse in worker processes instead of threads
+        reader (callable): reader(path, columns) -> DataFrame (default
+            pd.read_csv); must be module-level when use_processes is True
+
+    Returns:
+        pandas.DataFrame: Rows of all files, in sorted file order
+
+    Raises:
+        FileNotFoundError: If no files match
+        ValueError: If files miss required columns
+    """
+    files = list_data_files(directory, pattern)
+    if required_columns:
+        validate_schemas(files, required_columns, max_workers)
+    frames = map_files(_FileReader(reader, columns), files, max_workers, use_processes)
+    tickers = [get_ticker_from_filename(path) for path in files]
+    lengths = [len(frame) for frame in frames]
+
+    own_tickers = ticker_column is not None and any(ticker_column in frame.columns for frame in frames)
+    if own_tickers:
+        # Some files carry their own tickers: tag the others explicitly
+        frames = [frame if ticker_column in frame.columns else frame.assign(**{ticker_column: ticker})
+                  for frame, ticker in zip(frames, tickers)]
+
+    # A single concat sizes each output block for the total row count up front
+    df = pd.concat(frames, ignore_index=True)
+    if ticker_column is not None and not own_tickers:
+        df.insert(0, ticker_column, _ticker_codes(tickers, lengths))
+    return df
+
+
+def iter_directory(directory, columns=None, required_columns=REQUIRED_COLUMNS, pattern="*.csv",
+                   max_workers=None, prefetch=None, reader=None):
+    """
+    Yield (ticker, frame) for each data file, reading ahead in parallel.
+
+    At most `prefetch` files are read ahead of the consumer, so memory use
+    stays bounded however many files the directory has.
+
+    Args:
+        directory (str): Directory of per-ticker files
+        columns (list): Columns to read from each file (None reads all)
+        required_columns (list): Columns every file must have; all headers
+            are checked before the first frame is yielded
+        pattern (str): Glob pattern for data files
+        max_workers (int): Reader threads
+        prefetch (int): Files read ahead (defaults to twice max_workers)
+        reader (callable): reader(path, columns) -> DataFrame (default pd.read_csv)
+
+    Yields:
+        tuple: (ticker, pandas.DataFrame) in sorted file order
+    """
+    files = list_data_files(directory, pattern)
+    if required_columns:
+        validate_schemas(files, required_columns, max_workers)
+    workers = min(max_workers or DEFAULT_MAX_WORKERS, len(files))
+    prefetch = max(1, prefetch or 2 * workers)
+    read = _FileReader(reader, columns)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        next_file = 0
+        try:
+            while pending or next_file < len(files):
+                while next_file < len(files) and len(pending) < prefetch:
+                    path = files[next_file]
+                    pending.append((get_ticker_from_filename(path), executor.submit(read, path)))
+                    next_file += 1
+                ticker, future = pending.popleft()
+                yield ticker, future.result()
+        finally:
+            # A consumer that stops early should not wait for unread files
+            for _, future in pending:
+                future.cancel()
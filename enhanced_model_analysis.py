@@ -27,6 +27,8 @@ from typing import Optional, List, Dict, Any, Tuple
 import logging
 from pathlib import Path
 
+from model_registry import get_model
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -46,7 +48,7 @@ class EnhancedModelAnalyzer:
     def __init__(self):
         """Initialize the model analyzer."""
         self.current_model_dir = None
-        self.model_info_cache = {}  # Cache for model information
+        self.model_info_cache = {}  # Model directory -> (registry model, model information)
         self.plot_images = []  # Keep references to prevent garbage collection
         
         logger.info("Enhanced model analyzer initialized")
@@ -62,29 +64,29 @@ class EnhancedModelAnalyzer:
             Dictionary containing comprehensive model information
         """
         try:
+            # The registry reloads a model whose files changed; cached info
+            # built from an older load is stale
+            try:
+                loaded = get_model(model_dir)
+            except (json.JSONDecodeError, IOError, ValueError) as e:
+                logger.warning(f"Error loading model files: {e}")
+                loaded = None
+            
             # Check cache first
-            if model_dir in self.model_info_cache:
+            cached_loaded, cached_info = self.model_info_cache.get(model_dir, (None, None))
+            if loaded is not None and cached_loaded is loaded:
                 logger.info(f"Using cached model info for {model_dir}")
-                return self.model_info_cache[model_dir]
+                return cached_info
             
             info = {}
             
             # Feature info with enhanced error handling
-            feature_info_file = os.path.join(model_dir, 'feature_info.json')
-            if os.path.exists(feature_info_file):
-                try:
-                    with open(feature_info_file, 'r') as f:
-                        feature_info = json.load(f)
-                    info['x_features'] = feature_info.get('x_features', [])
-                    info['y_feature'] = feature_info.get('y_feature', '')
-                    info['input_size'] = feature_info.get('input_size', 0)
-                    info['feature_info_loaded'] = True
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Error loading feature info: {e}")
-                    info['x_features'] = []
-                    info['y_feature'] = ''
-                    info['input_size'] = 0
-                    info['feature_info_loaded'] = False
+            feature_info = loaded.feature_info if loaded is not None else None
+            if feature_info is not None:
+                info['x_features'] = feature_info.get('x_features', [])
+                info['y_feature'] = feature_info.get('y_feature', '')
+                info['input_size'] = feature_info.get('input_size', 0)
+                info['feature_info_loaded'] = True
             else:
                 info['x_features'] = []
                 info['y_feature'] = ''
@@ -92,7 +94,7 @@ class EnhancedModelAnalyzer:
                 info['feature_info_loaded'] = False
             
             # Normalization parameters with robust loading
-            info.update(self._load_normalization_params(model_dir))
+            info.update(self._load_normalization_params(loaded))
             
             # Training and validation losses
             info.update(self._load_training_losses(model_dir))
@@ -107,7 +109,7 @@ class EnhancedModelAnalyzer:
             info.update(self._calculate_model_statistics(info))
             
             # Cache the results
-            self.model_info_cache[model_dir] = info
+            self.model_info_cache[model_dir] = (loaded, info)
             
             logger.info(f"Successfully loaded model info for {model_dir}")
             return info
@@ -117,43 +119,26 @@ class EnhancedModelAnalyzer:
             logger.error(error_msg)
             return self._create_error_info(error_msg)
     
-    def _load_normalization_params(self, model_dir: str) -> Dict[str, Any]:
-        """Load normalization parameters with error handling."""
+    def _load_normalization_params(self, loaded) -> Dict[str, Any]:
+        """Normalization parameters from the model registry's copy of the CSV files."""
         params = {}
+        normalization = loaded.normalization if loaded is not None else {}
         
         # Feature normalization
-        scaler_mean_file = os.path.join(model_dir, 'scaler_mean.csv')
-        scaler_std_file = os.path.join(model_dir, 'scaler_std.csv')
-        
-        if os.path.exists(scaler_mean_file) and os.path.exists(scaler_std_file):
-            try:
-                params['X_min'] = np.loadtxt(scaler_mean_file, delimiter=',')
-                params['X_range'] = np.loadtxt(scaler_std_file, delimiter=',')
-                params['normalization_loaded'] = True
-            except Exception as e:
-                logger.warning(f"Error loading normalization params: {e}")
-                params['X_min'] = None
-                params['X_range'] = None
-                params['normalization_loaded'] = False
+        if 'scaler_mean' in normalization and 'scaler_std' in normalization:
+            params['X_min'] = normalization['scaler_mean']
+            params['X_range'] = normalization['scaler_std']
+            params['normalization_loaded'] = True
         else:
             params['X_min'] = None
             params['X_range'] = None
             params['normalization_loaded'] = False
         
         # Target normalization
-        target_min_file = os.path.join(model_dir, 'target_min.csv')
-        target_max_file = os.path.join(model_dir, 'target_max.csv')
-        
-        if os.path.exists(target_min_file) and os.path.exists(target_max_file):
-            try:
-                params['Y_min'] = float(np.loadtxt(target_min_file, delimiter=','))
-                params['Y_max'] = float(np.loadtxt(target_max_file, delimiter=','))
-                params['target_normalization_loaded'] = True
-            except Exception as e:
-                logger.warning(f"Error loading target normalization: {e}")
-                params['Y_min'] = None
-                params['Y_max'] = None
-                params['target_normalization_loaded'] = False
+        if 'target_min' in normalization and 'target_max' in normalization:
+            params['Y_min'] = float(normalization['target_min'])
+            params['Y_max'] = float(normalization['target_max'])
+            params['target_normalization_loaded'] = True
         else:
             params['Y_min'] = None
             params['Y_max'] = None
@@ -0,0 +1,255 @@
+"""
+Persistent cache of indicator-augmented data frames
+
+Training, prediction and the GUI all read the same CSV files and compute the
+same indicators on them. FeatureCache stores the resulting frame on disk
+(Feather when pyarrow is installed, pickle otherwise) so the next load of an
+unchanged file skips both CSV parsing and indicator computation.
+
+An entry is keyed by:
+    - the absolute path of the data file
+    - its fingerprint: size and modification time, or a content hash
+    - indicators.INDICATOR_VERSION
+    - the requested columns and a variant name identifying any overrides
+
+Entries are evicted least-recently-used first once the cache directory grows
+past its byte budget, and older fingerprints of a file are dropped when a new
+one is stored.
+
+Usage:
+    df = load_features("data/aapl.csv", columns=["open", "rsi", "macd"])
+"""
+
+import os
+import glob
+import hashlib
+import json
+import pickle
+
+import pandas as pd
+
+from indicators import INDICATOR_VERSION, compute_indicators
+
+try:
+    import pyarrow  # noqa: F401  (needed by DataFrame.to_feather)
+    FEATHER_AVAILABLE = True
+except ImportError:
+    FEATHER_AVAILABLE = False
+
+FEATURE_CACHE_DIR = os.environ.get(
+    'FEATURE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'stock_features'))
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def file_fingerprint(data_file, content_hash=False):
+    """
+    Identify the current contents of a file.
+
+    Args:
+        data_file (str): Path to the file
+        content_hash (bool): Hash the bytes instead of trusting size and mtime
+
+    Returns:
+        str: Fingerprint that changes whenever the file does
+    """
+    stat = os.stat(data_file)
+    if not content_hash:
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+    digest = hashlib.sha1()
+    with open(data_file, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return f"{stat.st_size}-{digest.hexdigest()}"
+
+
+def _short_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+class FeatureCache:
+    """On-disk LRU cache of feature frames with a byte budget."""
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, content_hash=False):
+        """
+        Args:
+            cache_dir (str): Cache directory (defaults to FEATURE_CACHE_DIR)
+            max_bytes (int): Total size the cache is trimmed to after each store
+            content_hash (bool): Fingerprint files by content instead of size/mtime
+        """
+        self.cache_dir = cache_dir or FEATURE_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.content_hash = content_hash
+        self.extension = '.feather' if FEATHER_AVAILABLE else '.pkl'
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, data_file, columns=None, variant='default'):
+        """
+        Cache file for a data file, column selection and indicator variant.
+
+        Args:
+            data_file (str): Source data file
+            columns (list): Requested columns (None for all indicators)
+            variant (str): Name identifying the overrides used, if any
+
+        Returns:
+            str: Path of the cache entry (which may not exist yet)
+        """
+        source = os.path.abspath(data_file)
+        fingerprint = file_fingerprint(source, self.content_hash)
+        selection = json.dumps({'columns': None if columns is None else list(columns),
+                                'variant': variant, 'version': INDICATOR_VERSION})
+        name = f"{_short_hash(source)}_{_short_hash(fingerprint)}_{_short_hash(selection)}{self.extension}"
+        return os.path.join(self.cache_dir, name)
+
+    def get(self, data_file, columns=None, variant='default'):
+        """
+        Return the cached frame for a data file, or None on a miss.
+
+        Args:
+            data_file (str): Source data file
+            columns (list): Requested columns (None for all indicators)
+            variant (str): Name identifying the overrides used, if any
+
+        Returns:
+            pandas.DataFrame: Cached frame, or None
+        """
+        path = self.entry_path(data_file, columns, variant)
+        try:
+            df = pd.read_feather(path) if FEATHER_AVAILABLE else pd.read_pickle(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError) as e:
+            # A truncated or corrupted entry is recomputed and rewritten
+            print(f"Warning: Dropping unreadable feature cache entry {path}: {e}")
+            self._remove(path)
+            self.misses += 1
+            return None
+        os.utime(path)  # Mark as recently used for eviction
+        self.hits += 1
+        return df
+
+    def put(self, data_file, df, columns=None, variant='default'):
+        """
+        Store a frame for a data file and trim the cache to its budget.
+
+        Frames without a default RangeIndex are not cached (Feather cannot
+        store them).
+
+        Args:
+            data_file (str): Source data file
+            df (pandas.DataFrame): Frame to store
+            columns (list): Requested columns (None for all indicators)
+            variant (str): Name identifying the overrides used, if any
+        """
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            return
+        path = self.entry_path(data_file, columns, variant)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Entries built from an older version of this file can never hit again
+        source_prefix, fingerprint = os.path.basename(path).split('_')[:2]
+        for stale in glob.glob(os.path.join(self.cache_dir, f"{source_prefix}_*")):
+            if os.path.basename(stale).split('_')[1] != fingerprint:
+                self._remove(stale)
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            if FEATHER_AVAILABLE:
+                df.reset_index(drop=True).to_feather(tmp_path)
+            else:
+                df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self._remove(tmp_path)
+            print(f"Warning: Could not write feature cache entry {path}: {e}")
+            return
+        self.evict()
+
+    def load_features(self, data_file, columns=None, overrides=None, variant='default', reader=None):
+        """
+        Load a data file with indicators, from the cache when possible.
+
+        Args:
+            data_file (str): Source data file
+            columns (list): Columns needed (see compute_indicators); None adds
+                every indicator
+            overrides (dict): Indicator overrides passed to compute_indicators
+            variant (str): Name identifying the overrides; must differ for
+                different override sets
+            reader (callable): Reads data_file into a DataFrame (default pd.read_csv)
+
+        Returns:
+            pandas.DataFrame: Frame with the requested indicator columns
+        """
+        df = self.get(data_file, columns, variant)
+        if df is not None:
+            return df
+        raw = (reader or pd.read_csv)(data_file)
+        df = compute_indicators(raw, columns=columns, overrides=overrides)
+        self.put(data_file, df, columns, variant)
+        return df
+
+    def entries(self):
+        """Cache entry paths, least recently used first."""
+        paths = glob.glob(os.path.join(self.cache_dir, f"*{self.extension}"))
+        return sorted(paths, key=lambda p: os.stat(p).st_mtime_ns)
+
+    def size_bytes(self):
+        """Total size of all cache entries."""
+        return sum(os.path.getsize(p) for p in self.entries())
+
+    def evict(self):
+        """
+        Remove least-recently-used entries until the cache fits its budget.
+
+        Returns:
+            int: Number of entries removed
+        """
+        entries = self.entries()
+        total = sum(os.path.getsize(p) for p in entries)
+        removed = 0
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            total -= os.path.getsize(path)
+            self._remove(path)
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Remove every cache entry."""
+        for path in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_features(data_file, columns=None, overrides=None, variant='default', cache=True, reader=None):
+    """
+    Read a data file and add indicators, through the feature cache.
+
+    Args:
+        data_file (str): Source data file
+        columns (list): Columns needed (None adds every indicator)
+        overrides (dict): Indicator overrides passed to compute_indicators
+        variant (str): Name identifying the overrides
+        cache (FeatureCache or bool): Cache to use; True for the default
+            cache directory, False to always recompute
+        reader (callable): Reads data_file into a DataFrame (default pd.read_csv)
+
+    Returns:
+        pandas.DataFrame: Frame with the requested indicator columns
+    """
+    if cache is False or cache is None:
+        raw = (reader or pd.read_csv)(data_file)
+        return compute_indicators(raw, columns=columns, overrides=overrides)
+    if cache is True:
+        cache = FeatureCache()
+    return cache.load_features(data_file, columns, overrides, variant, reader)
@@ -0,0 +1,200 @@
+"""
+On-disk feature store for out-of-core training
+
+Materializes the feature columns and target of a CSV once into float32 .npy
+memory maps, collecting min/max normalization statistics while streaming the
+file in chunks. Training then reads contiguous blocks of rows from the maps
+(see StockNet.train_streaming), so memory use is bounded by a block budget
+instead of the dataset size.
+
+Layout of a store directory:
+    features.json   row count, feature names, statistics, source file info
+    X.npy           float32 [n_rows, n_features]
+    y.npy           float32 [n_rows, 1]
+"""
+
+import os
+import json
+
+import numpy as np
+import pandas as pd
+
+STORE_META_FILE = "features.json"
+
+
+def materialize_features(data_file, x_features, y_feature, store_dir, chunksize=100000,
+                         dtype=np.float32):
+    """
+    Stream a CSV into a memory-mapped feature store.
+
+    The file is read twice in chunks: once to count rows and collect min/max
+    statistics, once to fill the preallocated maps. An existing store built
+    from the same file, modification time and columns is reused.
+
+    Args:
+        data_file (str): Path to the CSV file
+        x_features (list): Input feature columns
+        y_feature (str): Target column
+        store_dir (str): Directory for the store
+        chunksize (int): Rows per CSV chunk
+        dtype: Storage dtype for X and y
+
+    Returns:
+        FeatureStore: The opened store
+    """
+    source = {
+        'data_file': os.path.abspath(data_file),
+        'mtime': os.path.getmtime(data_file),
+        'x_features': list(x_features),
+        'y_feature': y_feature,
+    }
+    if FeatureStore.exists(store_dir):
+        store = FeatureStore(store_dir)
+        if store.meta.get('source') == source:
+            print(f"Reusing feature store in {store_dir}")
+            return store
+
+    columns = list(x_features) + [y_feature]
+    n_features = len(x_features)
+
+    # Pass 1: row count and streaming min/max
+    n_rows = 0
+    X_min = np.full(n_features, np.inf)
+    X_max = np.full(n_features, -np.inf)
+    Y_min, Y_max = np.inf, -np.inf
+    for chunk in pd.read_csv(data_file, usecols=columns, chunksize=chunksize):
+        if len(chunk) == 0:
+            continue
+        X_chunk = chunk[x_features].to_numpy(dtype=np.float64)
+        y_chunk = chunk[y_feature].to_numpy(dtype=np.float64)
+        np.minimum(X_min, X_chunk.min(axis=0), out=X_min)
+        np.maximum(X_max, X_chunk.max(axis=0), out=X_max)
+        Y_min = min(Y_min, float(y_chunk.min()))
+        Y_max = max(Y_max, float(y_chunk.max()))
+        n_rows += len(chunk)
+
+    if n_rows == 0:
+        raise ValueError(f"No rows found in {data_file}")
+
+    # Same zero-range guard as StockNet.normalize
+    X_max = np.where(X_max == X_min, X_max + 1e-8, X_max)
+
+    # Pass 2: fill the preallocated maps chunk by chunk
+    os.makedirs(store_dir, exist_ok=True)
+    X = np.lib.format.open_memmap(os.path.join(store_dir, "X.npy"), mode='w+',
+                                  dtype=dtype, shape=(n_rows, n_features))
+    y = np.lib.format.open_memmap(os.path.join(store_dir, "y.npy"), mode='w+',
+                                  dtype=dtype, shape=(n_rows, 1))
+    row = 0
+    for chunk in pd.read_csv(data_file, usecols=columns, chunksize=chunksize):
+        n = len(chunk)
+        X[row:row + n] = chunk[x_features].to_numpy(dtype=np.float64)
+        y[row:row + n, 0] = chunk[y_feature].to_numpy(dtype=np.float64)
+        row += n
+    X.flush()
+    y.flush()
+    del X, y
+
+    meta = {
+        'n_rows': n_rows,
+        'x_features': list(x_features),
+        'y_feature': y_feature,
+        'dtype': np.dtype(dtype).str,
+        'X_min': X_min.tolist(),
+        'X_max': X_max.tolist(),
+        'Y_min': Y_min,
+        'Y_max': Y_max,
+        'source': source,
+    }
+    with open(os.path.join(store_dir, STORE_META_FILE), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    print(f"Materialized {n_rows} rows x {n_features} features into {store_dir}")
+    return FeatureStore(store_dir)
+
+
+class FeatureStore:
+    """Read-only memory-mapped feature matrix with normalization statistics."""
+
+    def __init__(self, store_dir):
+        """
+        Args:
+            store_dir (str): Directory written by materialize_features
+        """
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, STORE_META_FILE), 'r') as f:
+            self.meta = json.load(f)
+        self.X = np.load(os.path.join(store_dir, "X.npy"), mmap_mode='r')
+        self.y = np.load(os.path.join(store_dir, "y.npy"), mmap_mode='r')
+        self.n_rows = self.meta['n_rows']
+        self.x_features = self.meta['x_features']
+        self.y_feature = self.meta['y_feature']
+        self.X_min = np.array(self.meta['X_min'])
+        self.X_max = np.array(self.meta['X_max'])
+        self.Y_min = self.meta['Y_min']
+        self.Y_max = self.meta['Y_max']
+
+    @staticmethod
+    def exists(store_dir):
+        """Return True if the directory holds a feature store."""
+        return os.path.exists(os.path.join(store_dir, STORE_META_FILE))
+
+    @property
+    def n_features(self):
+        return self.X.shape[1]
+
+    def split(self, validation_split):
+        """
+        Chronological train/validation split.
+
+        The last validation_split fraction of rows is held out, which keeps
+        both ranges contiguous on disk.
+
+        Args:
+            validation_split (float): Fraction of rows used for validation
+
+        Returns:
+            tuple: ((train_start, train_stop), (val_start, val_stop))
+        """
+        n_val = int(round(self.n_rows * validation_split))
+        n_train = self.n_rows - n_val
+        return (0, n_train), (n_train, self.n_rows)
+
+
+def block_rows_for_budget(n_features, memory_budget_mb, batch_size):
+    """
+    Number of rows per shuffle block that fits the memory budget.
+
+    Each block row costs its float64 normalized X and y plus an int64
+    shuffle index.
+
+    Args:
+        n_features (int): Number of input features
+        memory_budget_mb (float): Budget for block buffers in megabytes
+        batch_size (int): Mini-batch size; blocks hold at least one batch
+
+    Returns:
+        int: Rows per block
+    """
+    bytes_per_row = 8 * (n_features + 1) + 8
+    return max(int(batch_size), int(memory_budget_mb * 1024 * 1024) // bytes_per_row)
+
+
+def iter_blocks(start, stop, block_rows, shuffle=False):
+    """
+    Yield (lo, hi) row ranges covering [start, stop).
+
+    Args:
+        start (int): First row
+        stop (int): Row to stop before
+        block_rows (int): Rows per block
+        shuffle (bool): Visit blocks in random order (np.random)
+
+    Yields:
+        tuple: (lo, hi) bounds of each block
+    """
+    starts = np.arange(start, stop, block_rows)
+    if shuffle:
+        starts = np.random.permutation(starts)
+    for lo in starts:
+        yield int(lo), int(min(lo + block_rows, stop))
@@ -14,6 +14,27 @@ from datetime import datetime
 import json
 import tkinter as tk
 from tkinter import messagebox
+from indicators import Indicator, alias, compute_indicators
+from feature_cache import FeatureCache
+
+def _rolling_rsi(close, period=14):
+    """RSI from simple rolling means of gains and losses."""
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+# Column names the GUI has always used, mapped onto the shared indicator engine
+GUI_INDICATORS = {
+    'sma_5': alias('sma_5', 'ma_5'),
+    'sma_20': alias('sma_20', 'ma_20'),
+    'rsi': Indicator('rsi', ('close',), _rolling_rsi),
+    'bollinger_upper': alias('bollinger_upper', 'bb_upper'),
+    'bollinger_lower': alias('bollinger_lower', 'bb_lower'),
+}
+GUI_INDICATOR_COLUMNS = ['sma_5', 'sma_20', 'ema_12', 'ema_26', 'rsi', 'macd', 'macd_signal',
+                         'bollinger_upper', 'bollinger_lower', 'stoch_k', 'stoch_d']
 
 class DataManager:
     """Manages data operations for the stock prediction system."""
@@ -22,6 +43,9 @@ class DataManager:
         self.parent_gui = parent_gui
         self.logger = logging.getLogger(__name__)
         
+        # Indicator frames are cached on disk per data file
+        self.feature_cache = FeatureCache()
+        
         # Data state
         self.current_data = None
         self.data_features = None
@@ -142,42 +166,17 @@ class DataManager:
             if self.current_data is None:
                 raise ValueError("No data loaded")
             
-            # Make a copy to avoid modifying original data
-            enhanced_data = data.copy()
-            
-            # Simple Moving Averages
-            if 'close' in enhanced_data.columns:
-                enhanced_data['sma_5'] = enhanced_data['close'].rolling(window=5).mean()
-                enhanced_data['sma_20'] = enhanced_data['close'].rolling(window=20).mean()
-                
-                # Exponential Moving Averages
-                enhanced_data['ema_12'] = enhanced_data['close'].ewm(span=12).mean()
-                enhanced_data['ema_26'] = enhanced_data['close'].ewm(span=26).mean()
-                
-                # RSI
-                delta = enhanced_data['close'].diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                rs = gain / loss
-                enhanced_data['rsi'] = 100 - (100 / (1 + rs))
-                
-                # MACD
-                ema_12 = enhanced_data['close'].ewm(span=12).mean()
-                ema_26 = enhanced_data['close'].ewm(span=26).mean()
-                enhanced_data['macd'] = ema_12 - ema_26
-                enhanced_data['macd_signal'] = enhanced_data['macd'].ewm(span=9).mean()
-                
-                # Bollinger Bands
-                sma_20 = enhanced_data['close'].rolling(window=20).mean()
-                std_20 = enhanced_data['close'].rolling(window=20).std()
-                enhanced_data['bollinger_upper'] = sma_20 + (std_20 * 2)
-                enhanced_data['bollinger_lower'] = sma_20 - (std_20 * 2)
-                
-                # Stochastic Oscillator
-                low_14 = enhanced_data['low'].rolling(window=14).min()
-                high_14 = enhanced_data['high'].rolling(window=14).max()
-                enhanced_data['stoch_k'] = 100 * ((enhanced_data['close'] - low_14) / (high_14 - low_14))
-                enhanced_data['stoch_d'] = enhanced_data['stoch_k'].rolling(window=3).mean()
+            file_path = self.data_metadata.get('file_path')
+            if 'close' in data.columns and data is self.current_data and file_path:
+                # Unchanged files are served from the feature cache
+                reader = pd.read_csv if file_path.lower().endswith('.csv') else pd.read_excel
+                enhanced_data = self.feature_cache.load_features(
+                    file_path, GUI_INDICATOR_COLUMNS, GUI_INDICATORS, variant='gui', reader=reader)
+            elif 'close' in data.columns:
+                enhanced_data = compute_indicators(data, columns=GUI_INDICATOR_COLUMNS,
+                                                   overrides=GUI_INDICATORS)
+            else:
+                enhanced_data = data.copy()
             
             # Remove NaN values
             enhanced_data = enhanced_data.dropna()
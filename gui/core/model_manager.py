@@ -13,6 +13,8 @@ from datetime import datetime
 import glob
 import shutil
 
+from weight_history import has_snapshots
+
 class ModelManager:
     """Manages model directories and metadata."""
     
@@ -179,13 +181,11 @@ class ModelManager:
             # If no main model file found, check weights_history directory
             if not has_model_file:
                 weights_history_dir = os.path.join(model_dir, 'weights_history')
-                if os.path.exists(weights_history_dir):
-                    weight_files = [f for f in os.listdir(weights_history_dir) if f.endswith('.npz')]
-                    if weight_files:
-                        has_model_file = True
+                if os.path.isdir(weights_history_dir) and has_snapshots(weights_history_dir):
+                    has_model_file = True
             
             if not has_model_file:
-                return False, "No model weights file found (stock_model.npz, model.npz, final_model.npz, best_model.npz, or weight files in weights_history/)"
+                return False, "No model weights file found (stock_model.npz, model.npz, final_model.npz, best_model.npz, or snapshots in weights_history/)"
             
             # Check for feature info (optional but preferred)
             feature_info_path = os.path.join(model_dir, 'feature_info.json')
@@ -13,6 +13,7 @@ from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 import os
+import sys
 import json
 import logging
 from datetime import datetime
@@ -22,6 +23,8 @@ from PIL import Image, ImageTk
 import tkinter as tk
 from tkinter import messagebox
 
+from weight_history import load_snapshots
+
 class PlotManager:
     """Manages all plotting operations for the stock prediction GUI."""
     
@@ -161,33 +164,31 @@ class PlotManager:
     def _load_and_plot_weights_3d(self, weights_dir):
         """Load and plot weights in 3D space."""
         try:
-            # Load weights files
-            weights_files = sorted([f for f in os.listdir(weights_dir) 
-                                  if f.endswith('.npz')])
+            # Memory-mapped store, or per-epoch NPZ files from older models
+            snapshots = load_snapshots(weights_dir)
             
-            if not weights_files:
+            if len(snapshots) == 0:
+                self.logger.warning(f"No weight snapshots in {weights_dir}")
                 return
             
-            # Load first and last weights for comparison
-            first_weights = np.load(os.path.join(weights_dir, weights_files[0]))
-            last_weights = np.load(os.path.join(weights_dir, weights_files[-1]))
-            
-            # Extract weight matrices
-            w1_start = first_weights['W1'] if 'W1' in first_weights else first_weights['weights']
-            w2_start = first_weights['W2'] if 'W2' in first_weights else first_weights['weights']
+            # Compare the first and last snapshots
+            first_weights = snapshots[0]
+            last_weights = snapshots[len(snapshots) - 1]
             
-            w1_end = last_weights['W1'] if 'W1' in last_weights else last_weights['weights']
-            w2_end = last_weights['W2'] if 'W2' in last_weights else last_weights['weights']
+            w1_start, w2_start = first_weights['W1'], first_weights['W2']
+            w1_end, w2_end = last_weights['W1'], last_weights['W2']
             
             # Create 3D scatter plot
             self.gd3d_ax.clear()
             
-            # Plot start weights
-            x1, y1, z1 = w1_start.flatten(), w2_start.flatten(), np.zeros_like(w1_start.flatten())
+            # One point per hidden unit: its mean input weight against its output weight
+            x1, y1 = np.mean(w1_start, axis=0), np.ravel(w2_start)
+            z1 = np.zeros_like(x1)
             self.gd3d_ax.scatter(x1, y1, z1, c='blue', marker='o', s=20, alpha=0.6, label='Start')
             
             # Plot end weights
-            x2, y2, z2 = w1_end.flatten(), w2_end.flatten(), np.ones_like(w1_end.flatten())
+            x2, y2 = np.mean(w1_end, axis=0), np.ravel(w2_end)
+            z2 = np.ones_like(x2)
             self.gd3d_ax.scatter(x2, y2, z2, c='red', marker='^', s=20, alpha=0.6, label='End')
             
             self.gd3d_ax.set_xlabel('W1 Weights')
@@ -269,16 +270,21 @@ class PlotManager:
     
     def _create_animation_script(self, model_dir, output_format):
         """Create temporary script for animation generation."""
+        # The script runs in its own interpreter and imports weight_history
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         return f"""
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import os
-import glob
+import sys
+
+sys.path.insert(0, {project_root!r})
+from weight_history import load_snapshots
 
-# Load weights history
+# Load weights history (memory-mapped store or legacy NPZ files)
 weights_dir = '{model_dir}/weights_history'
-weights_files = sorted(glob.glob(os.path.join(weights_dir, '*.npz')))
+snapshots = load_snapshots(weights_dir)
 
 # Create animation
 fig = plt.figure(figsize=(10, 8))
@@ -286,14 +292,15 @@ ax = fig.add_subplot(111, projection='3d')
 
 def animate(frame):
     ax.clear()
-    weights = np.load(weights_files[frame])
+    weights = snapshots[frame]
     
     # Extract weights
-    w1 = weights['W1'] if 'W1' in weights else weights['weights']
-    w2 = weights['W2'] if 'W2' in weights else weights['weights']
+    w1 = weights['W1']
+    w2 = weights['W2']
     
-    # Create scatter plot
-    x, y, z = w1.flatten(), w2.flatten(), np.full_like(w1.flatten(), frame)
+    # One point per hidden unit: its mean input weight against its output weight
+    x, y = np.mean(w1, axis=0), np.ravel(w2)
+    z = np.full_like(x, frame)
     ax.scatter(x, y, z, c='blue', alpha=0.6)
     
     ax.set_xlabel('W1 Weights')
@@ -302,12 +309,12 @@ def animate(frame):
     ax.set_title(f'Gradient Descent - Step {{frame}}')
 
 # Create animation
-anim = animation.FuncAnimation(fig, animate, frames=len(weights_files), 
+anim = animation.FuncAnimation(fig, animate, frames=len(snapshots), 
                              interval=100, repeat=True)
 
 # Save animation
 output_file = '{model_dir}/plots/gradient_descent_3d_animation.{output_format}'
-anim.save(output_file, writer='ffmpeg' if output_format == 'mp4' else 'pillow')
+anim.save(output_file, writer={'ffmpeg' if output_format == 'mp4' else 'pillow'!r})
 plt.close()
 """
     
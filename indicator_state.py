@@ -0,0 +1,309 @@
+"""
+Streaming indicator state for bar-by-bar updates
+
+IndicatorState keeps just enough state to produce the same feature row that
+compute_indicators (indicators.py) computes for the last bar of a history:
+EMA/MACD/RSI recurrences, fixed-size rolling windows with running sums and
+the previous close and typical price. Each update costs a constant amount of
+work no matter how long the history is, so a live predictor does not have to
+re-run pandas over years of bars whenever one new bar arrives.
+
+Usage:
+    state = IndicatorState.from_history(df)
+    row = state.update({'open': 101.0, 'high': 102.5, 'low': 100.2, 'close': 102.1, 'vol': 1.2e6})
+    row['rsi'], row['macd'], ...
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+
+RAW_COLUMNS = ('open', 'high', 'low', 'close', 'vol')
+
+# Bars replayed by from_history. The longest-memory indicators are the
+# EMA recurrences (span <= 26), whose weight on a bar 1000 steps back is
+# below 1e-33, so replaying more than this cannot change the result.
+SEED_ROWS = 1000
+
+NAN = float('nan')
+
+
+def _div(a, b):
+    """Divide like NumPy does: x/0 is +-inf and 0/0 is NaN instead of raising."""
+    if b == 0:
+        if a == 0 or a != a:
+            return NAN
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+class _RollingWindow:
+    """Fixed-size trailing window with a running sum, matching pandas' min_periods=window."""
+
+    __slots__ = ('size', 'values', 'total', 'nan_count', 'pushes')
+
+    def __init__(self, size):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.nan_count = 0
+        self.pushes = 0
+
+    def push(self, value):
+        if len(self.values) == self.size:
+            old = self.values[0]
+            if old != old:
+                self.nan_count -= 1
+            else:
+                self.total -= old
+        self.values.append(value)
+        if value != value:
+            self.nan_count += 1
+        else:
+            self.total += value
+        # Re-sum once per window length so rounding in the running sum cannot drift
+        self.pushes += 1
+        if self.pushes % self.size == 0:
+            self.total = math.fsum(v for v in self.values if v == v)
+
+    @property
+    def ready(self):
+        return len(self.values) == self.size and self.nan_count == 0
+
+    def sum(self):
+        return self.total if self.ready else NAN
+
+    def mean(self):
+        return self.total / self.size if self.ready else NAN
+
+    def std(self):
+        if not self.ready or self.size < 2:
+            return NAN
+        mean = math.fsum(self.values) / self.size
+        return math.sqrt(math.fsum((v - mean) ** 2 for v in self.values) / (self.size - 1))
+
+    def mad(self):
+        if not self.ready:
+            return NAN
+        mean = math.fsum(self.values) / self.size
+        return math.fsum(abs(v - mean) for v in self.values) / self.size
+
+    def min(self):
+        return min(self.values) if self.ready else NAN
+
+    def max(self):
+        return max(self.values) if self.ready else NAN
+
+    def lag(self, periods):
+        """Value `periods` bars before the newest one, or NaN if not seen yet."""
+        return self.values[-1 - periods] if len(self.values) > periods else NAN
+
+
+class _Ewm:
+    """pandas ewm(span=...).mean() as a recurrence (adjust=True unless told otherwise)."""
+
+    __slots__ = ('decay', 'alpha', 'adjust', 'numerator', 'denominator', 'value')
+
+    def __init__(self, span, adjust=True):
+        self.alpha = 2.0 / (span + 1.0)
+        self.decay = 1.0 - self.alpha
+        self.adjust = adjust
+        self.numerator = 0.0
+        self.denominator = 0.0
+        self.value = NAN
+
+    def push(self, x):
+        if self.adjust:
+            self.numerator = x + self.decay * self.numerator
+            self.denominator = 1.0 + self.decay * self.denominator
+            self.value = self.numerator / self.denominator
+        elif self.value != self.value:
+            self.value = x
+        else:
+            self.value = self.decay * self.value + self.alpha * x
+        return self.value
+
+
+class IndicatorState:
+    """Incrementally updated technical indicators for one instrument."""
+
+    def __init__(self):
+        self._closes = _RollingWindow(11)
+        self._ma = {window: _RollingWindow(window) for window in (5, 10, 20, 50)}
+        self._close_std_10 = _RollingWindow(10)
+        self._ema_12 = _Ewm(12)
+        self._ema_26 = _Ewm(26)
+        self._macd_signal = _Ewm(9)
+        self._avg_gain = _Ewm(14, adjust=False)
+        self._avg_loss = _Ewm(14, adjust=False)
+        self._lows_14 = _RollingWindow(14)
+        self._highs_14 = _RollingWindow(14)
+        self._lows_20 = _RollingWindow(20)
+        self._highs_20 = _RollingWindow(20)
+        self._stoch_k = _RollingWindow(3)
+        self._vol_10 = _RollingWindow(10)
+        self._vol_20 = _RollingWindow(20)
+        self._true_range = _RollingWindow(14)
+        self._typical_price = _RollingWindow(20)
+        self._positive_flow = _RollingWindow(14)
+        self._negative_flow = _RollingWindow(14)
+        self._prev_close = NAN
+        self._prev_typical_price = NAN
+        self.bars_seen = 0
+        self.last_row = None
+
+    @classmethod
+    def from_history(cls, df, max_rows=SEED_ROWS):
+        """
+        Build a state by replaying the tail of a bar history.
+
+        Args:
+            df (pandas.DataFrame): History with open/high/low/close/vol columns
+            max_rows (int): Replay only the last max_rows bars (None for all)
+
+        Returns:
+            IndicatorState: State positioned after the last bar of df
+        """
+        state = cls()
+        history = df if max_rows is None else df.iloc[-max_rows:]
+        columns = [c for c in RAW_COLUMNS if c in history.columns]
+        for values in history[columns].to_numpy(dtype=np.float64):
+            state.update(dict(zip(columns, values.tolist())))
+        return state
+
+    def update(self, bar):
+        """
+        Advance the state by one bar and return its feature row.
+
+        Args:
+            bar (dict): Raw values for the bar; missing open/high/low/close/vol
+                fields are treated as NaN (so indicators using them are NaN)
+
+        Returns:
+            dict: The bar's raw fields plus every indicator, with the same
+            values compute_indicators gives for that row of the full history
+        """
+        high = float(bar.get('high', NAN))
+        low = float(bar.get('low', NAN))
+        close = float(bar.get('close', NAN))
+        vol = float(bar.get('vol', NAN))
+        prev_close = self._prev_close
+        row = dict(bar)
+
+        # Moving averages, EMAs, RSI and returns
+        self._closes.push(close)
+        for window, ma in self._ma.items():
+            ma.push(close)
+            row[f'ma_{window}'] = ma.mean()
+        ema_12 = self._ema_12.push(close)
+        ema_26 = self._ema_26.push(close)
+        row['ema_12'] = ema_12
+        row['ema_26'] = ema_26
+
+        delta = close - prev_close
+        avg_gain = self._avg_gain.push(delta if delta > 0 else 0.0)
+        avg_loss = self._avg_loss.push(-delta if delta < 0 else 0.0)
+        row['rsi'] = 100 - (100 / (1 + _div(avg_gain, avg_loss)))
+
+        lag_5 = self._closes.lag(5)
+        lag_10 = self._closes.lag(10)
+        row['price_change'] = _div(close, prev_close) - 1
+        row['price_change_5'] = _div(close, lag_5) - 1
+        row['price_change_10'] = _div(close, lag_10) - 1
+
+        # Volatility and Bollinger Bands
+        self._close_std_10.push(close)
+        std_20 = self._ma[20].std()
+        row['volatility_10'] = self._close_std_10.std()
+        row['volatility_20'] = std_20
+        bb_middle = row['ma_20']
+        bb_upper = bb_middle + (std_20 * 2)
+        bb_lower = bb_middle - (std_20 * 2)
+        row['bb_middle'] = bb_middle
+        row['bb_upper'] = bb_upper
+        row['bb_lower'] = bb_lower
+        row['bb_width'] = _div(bb_upper - bb_lower, bb_middle)
+        row['bb_position'] = _div(close - bb_lower, bb_upper - bb_lower)
+
+        # MACD
+        macd = ema_12 - ema_26
+        macd_signal = self._macd_signal.push(macd)
+        row['macd'] = macd
+        row['macd_signal'] = macd_signal
+        row['macd_histogram'] = macd - macd_signal
+
+        # Stochastic Oscillator and Williams %R
+        self._lows_14.push(low)
+        self._highs_14.push(high)
+        low_min = self._lows_14.min()
+        high_max = self._highs_14.max()
+        stoch_k = _div(100 * (close - low_min), high_max - low_min)
+        self._stoch_k.push(stoch_k)
+        row['stoch_k'] = stoch_k
+        row['stoch_d'] = self._stoch_k.mean()
+        row['williams_r'] = _div(-100 * (high_max - close), high_max - low_min)
+
+        # Volume indicators
+        self._vol_10.push(vol)
+        self._vol_20.push(vol)
+        volume_ma = self._vol_10.mean()
+        row['volume_ma'] = volume_ma
+        row['volume_ratio'] = _div(vol, volume_ma)
+        row['volume_sma_ratio'] = _div(vol, self._vol_20.mean())
+
+        # Momentum and rate of change
+        row['momentum_5'] = close - lag_5
+        row['momentum_10'] = close - lag_10
+        row['roc_5'] = _div(close - lag_5, lag_5) * 100
+        row['roc_10'] = _div(close - lag_10, lag_10) * 100
+
+        # Average True Range
+        ranges = (high - low, abs(high - prev_close), abs(low - prev_close))
+        self._true_range.push(NAN if any(r != r for r in ranges) else max(ranges))
+        row['atr'] = self._true_range.mean()
+
+        # CCI and MFI
+        typical_price = (high + low + close) / 3
+        self._typical_price.push(typical_price)
+        row['cci'] = _div(typical_price - self._typical_price.mean(), 0.015 * self._typical_price.mad())
+
+        money_flow = typical_price * vol
+        prev_tp = self._prev_typical_price
+        self._positive_flow.push(money_flow if typical_price > prev_tp else 0.0)
+        self._negative_flow.push(money_flow if typical_price < prev_tp else 0.0)
+        mfi_ratio = _div(self._positive_flow.sum(), self._negative_flow.sum())
+        row['mfi'] = 100 - (100 / (1 + mfi_ratio))
+
+        # Support and resistance
+        self._lows_20.push(low)
+        self._highs_20.push(high)
+        support = self._lows_20.min()
+        resistance = self._highs_20.max()
+        row['support_20'] = support
+        row['resistance_20'] = resistance
+        row['price_to_support'] = _div(close - support, support)
+        row['price_to_resistance'] = _div(resistance - close, close)
+
+        self._prev_close = close
+        self._prev_typical_price = typical_price
+        self.bars_seen += 1
+        self.last_row = row
+        return row
+
+    def feature_vector(self, columns, row=None):
+        """
+        Pick columns from a feature row as a float array.
+
+        Args:
+            columns (list): Feature names, in model input order
+            row (dict): Feature row (defaults to the latest one)
+
+        Returns:
+            numpy.ndarray: Values of shape (len(columns),)
+        """
+        row = self.last_row if row is None else row
+        if row is None:
+            raise ValueError("No bars have been added to the indicator state")
+        return np.array([row[name] for name in columns], dtype=np.float64)
+
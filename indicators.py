@@ -0,0 +1,302 @@
+"""
+Technical indicator engine
+
+Every indicator is a node that declares the columns or other nodes it is
+computed from. compute_indicators resolves the requested columns through this
+dependency graph, computes each node (including shared intermediates such as
+the 20-period rolling mean, EMA12/EMA26 and the typical price) exactly once,
+and only evaluates what the requested columns need.
+
+Node names starting with an underscore are private intermediates; they are
+never added to the returned frame. Modules that need a variant of an
+indicator (a different RSI, GUI column names) pass overrides instead of
+keeping their own copy of the whole pipeline.
+
+Usage:
+    df = compute_indicators(df)                               # all indicators
+    df = compute_indicators(df, columns=['open', 'rsi'])      # only what rsi needs
+"""
+
+import numpy as np
+import pandas as pd
+
+from window_kernels import rolling_mad, rolling_max, rolling_min, rolling_std
+
+
+# Bump whenever an indicator's definition or numerics change; cached feature
+# frames (feature_cache.py) built by another version are not reused.
+INDICATOR_VERSION = 2
+
+
+class Indicator:
+    """A named node computed from input columns or other nodes."""
+
+    __slots__ = ('name', 'inputs', 'func')
+
+    def __init__(self, name, inputs, func):
+        """
+        Args:
+            name (str): Output column (or private node) name
+            inputs (tuple): Names of raw columns or nodes passed to func
+            func (callable): Receives the input Series positionally and
+                returns a Series aligned with the frame
+        """
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.func = func
+
+    @property
+    def public(self):
+        return not self.name.startswith('_')
+
+
+def alias(name, source):
+    """Indicator exposing an existing node under another column name."""
+    return Indicator(name, (source,), lambda series: series)
+
+
+INDICATORS = {}
+
+
+def indicator(name, *inputs):
+    """Decorator registering a function as an indicator node."""
+    def register(func):
+        INDICATORS[name] = Indicator(name, inputs, func)
+        return func
+    return register
+
+
+def compute_rsi(prices, period=14):
+    """
+    Compute Relative Strength Index (RSI) for a price series.
+
+    RSI = 100 - (100 / (1 + RS))
+    where RS = Average Gain / Average Loss
+
+    Args:
+        prices (pandas.Series): Price series
+        period (int): Period for RSI calculation (default: 14)
+
+    Returns:
+        pandas.Series: RSI values
+    """
+    # Calculate price changes
+    delta = prices.diff()
+
+    # Separate gains and losses
+    gains = delta.where(delta > 0, 0)
+    losses = -delta.where(delta < 0, 0)
+
+    # Calculate average gains and losses using exponential moving average
+    avg_gains = gains.ewm(span=period, adjust=False).mean()
+    avg_losses = losses.ewm(span=period, adjust=False).mean()
+
+    # Calculate RS and RSI
+    rs = avg_gains / avg_losses
+    rsi = 100 - (100 / (1 + rs))
+
+    return rsi
+
+
+def _rolling(kernel, series, window):
+    """Apply a window_kernels function to a Series, keeping its index."""
+    return pd.Series(kernel(series.values, window), index=series.index)
+
+
+def _register_rolling_means():
+    for window in (5, 10, 20, 50):
+        indicator(f'ma_{window}', 'close')(lambda close, w=window: close.rolling(window=w).mean())
+
+
+_register_rolling_means()
+
+# Exponential moving averages
+indicator('ema_12', 'close')(lambda close: close.ewm(span=12).mean())
+indicator('ema_26', 'close')(lambda close: close.ewm(span=26).mean())
+
+# RSI
+indicator('rsi', 'close')(lambda close: compute_rsi(close, 14))
+
+# Price changes and returns
+indicator('price_change', 'close')(lambda close: close.pct_change())
+indicator('price_change_5', 'close')(lambda close: close.pct_change(periods=5))
+indicator('price_change_10', 'close')(lambda close: close.pct_change(periods=10))
+
+# Volatility measures (the 20-period std is shared with the Bollinger Bands)
+indicator('_close_std_20', 'close')(lambda close: _rolling(rolling_std, close, 20))
+indicator('volatility_10', 'close')(lambda close: _rolling(rolling_std, close, 10))
+INDICATORS['volatility_20'] = alias('volatility_20', '_close_std_20')
+
+# Bollinger Bands
+INDICATORS['bb_middle'] = alias('bb_middle', 'ma_20')
+indicator('bb_upper', 'bb_middle', '_close_std_20')(lambda middle, std: middle + (std * 2))
+indicator('bb_lower', 'bb_middle', '_close_std_20')(lambda middle, std: middle - (std * 2))
+indicator('bb_width', 'bb_upper', 'bb_lower', 'bb_middle')(
+    lambda upper, lower, middle: (upper - lower) / middle)
+indicator('bb_position', 'close', 'bb_upper', 'bb_lower')(
+    lambda close, upper, lower: (close - lower) / (upper - lower))
+
+# MACD
+indicator('macd', 'ema_12', 'ema_26')(lambda ema_12, ema_26: ema_12 - ema_26)
+indicator('macd_signal', 'macd')(lambda macd: macd.ewm(span=9).mean())
+indicator('macd_histogram', 'macd', 'macd_signal')(lambda macd, signal: macd - signal)
+
+# Stochastic Oscillator and Williams %R share the 14-period range
+indicator('_low_min_14', 'low')(lambda low: _rolling(rolling_min, low, 14))
+indicator('_high_max_14', 'high')(lambda high: _rolling(rolling_max, high, 14))
+indicator('stoch_k', 'close', '_low_min_14', '_high_max_14')(
+    lambda close, low_min, high_max: 100 * (close - low_min) / (high_max - low_min))
+indicator('stoch_d', 'stoch_k')(lambda stoch_k: stoch_k.rolling(window=3).mean())
+indicator('williams_r', 'close', '_low_min_14', '_high_max_14')(
+    lambda close, low_min, high_max: -100 * (high_max - close) / (high_max - low_min))
+
+# Volume indicators
+indicator('volume_ma', 'vol')(lambda vol: vol.rolling(window=10).mean())
+indicator('volume_ratio', 'vol', 'volume_ma')(lambda vol, volume_ma: vol / volume_ma)
+indicator('volume_sma_ratio', 'vol')(lambda vol: vol / vol.rolling(window=20).mean())
+
+# Price momentum and rate of change share the lagged closes
+indicator('_close_shift_5', 'close')(lambda close: close.shift(5))
+indicator('_close_shift_10', 'close')(lambda close: close.shift(10))
+indicator('momentum_5', 'close', '_close_shift_5')(lambda close, lag: close - lag)
+indicator('momentum_10', 'close', '_close_shift_10')(lambda close, lag: close - lag)
+indicator('roc_5', 'close', '_close_shift_5')(lambda close, lag: ((close - lag) / lag) * 100)
+indicator('roc_10', 'close', '_close_shift_10')(lambda close, lag: ((close - lag) / lag) * 100)
+
+
+# Average True Range (ATR)
+@indicator('_true_range', 'high', 'low', 'close')
+def _true_range(high, low, close):
+    prev_close = close.shift()
+    high_low = high - low
+    high_close = np.abs(high - prev_close)
+    low_close = np.abs(low - prev_close)
+    return np.maximum(high_low, np.maximum(high_close, low_close))
+
+
+indicator('atr', '_true_range')(lambda true_range: true_range.rolling(window=14).mean())
+
+# Commodity Channel Index (CCI) and Money Flow Index (MFI) share the typical price
+indicator('_typical_price', 'high', 'low', 'close')(lambda high, low, close: (high + low + close) / 3)
+indicator('_tp_sma_20', '_typical_price')(lambda tp: tp.rolling(window=20).mean())
+indicator('_tp_mad_20', '_typical_price')(lambda tp: _rolling(rolling_mad, tp, 20))
+indicator('cci', '_typical_price', '_tp_sma_20', '_tp_mad_20')(
+    lambda tp, sma_tp, mad: (tp - sma_tp) / (0.015 * mad))
+
+
+@indicator('mfi', '_typical_price', 'vol')
+def _mfi(typical_price, vol):
+    money_flow = typical_price * vol
+    previous = typical_price.shift(1)
+    positive_flow = money_flow.where(typical_price > previous, 0).rolling(window=14).sum()
+    negative_flow = money_flow.where(typical_price < previous, 0).rolling(window=14).sum()
+    mfi_ratio = positive_flow / negative_flow
+    return 100 - (100 / (1 + mfi_ratio))
+
+
+# Support and Resistance levels (simplified)
+indicator('support_20', 'low')(lambda low: _rolling(rolling_min, low, 20))
+indicator('resistance_20', 'high')(lambda high: _rolling(rolling_max, high, 20))
+indicator('price_to_support', 'close', 'support_20')(lambda close, support: (close - support) / support)
+indicator('price_to_resistance', 'close', 'resistance_20')(
+    lambda close, resistance: (resistance - close) / close)
+
+
+def available_indicators(overrides=None):
+    """
+    Names of all public indicator columns, in output order.
+
+    Args:
+        overrides (dict): Extra or replacement indicators by name
+
+    Returns:
+        list: Public indicator names
+    """
+    registry = dict(INDICATORS, **(overrides or {}))
+    return [name for name, node in registry.items() if node.public]
+
+
+def plan_indicators(requested, available_columns, overrides=None):
+    """
+    Resolve the nodes needed for the requested columns, in dependency order.
+
+    Args:
+        requested (list): Requested output columns
+        available_columns (iterable): Raw columns present in the frame
+        overrides (dict): Extra or replacement indicators by name
+
+    Returns:
+        list: Indicator nodes to evaluate, each after all of its inputs
+
+    Raises:
+        KeyError: If a needed raw column is missing or a name is unknown
+    """
+    registry = dict(INDICATORS, **(overrides or {}))
+    available = set(available_columns)
+    order = []
+    visiting = set()
+    done = set()
+
+    def visit(name, needed_by):
+        if name in done:
+            return
+        node = registry.get(name)
+        if node is None:
+            if name in available:
+                done.add(name)
+                return
+            if needed_by is None:
+                raise KeyError(f"Unknown column or indicator: '{name}'")
+            raise KeyError(f"Indicator '{needed_by}' requires column '{name}'")
+        if name in visiting:
+            raise ValueError(f"Indicator dependency cycle at '{name}'")
+        visiting.add(name)
+        for dependency in node.inputs:
+            visit(dependency, name)
+        visiting.discard(name)
+        done.add(name)
+        order.append(node)
+
+    for name in requested:
+        visit(name, None)
+    return order
+
+
+def compute_indicators(df, columns=None, overrides=None, inplace=False):
+    """
+    Add technical indicator columns to a DataFrame.
+
+    Args:
+        df (pandas.DataFrame): DataFrame with OHLCV data
+        columns (list): Columns the caller needs. Indicators among them that
+            are missing from df are computed together with their
+            dependencies; raw columns are left alone. None computes every
+            public indicator (overwriting existing ones).
+        overrides (dict): Extra or replacement Indicator nodes by name
+        inplace (bool): Add the columns to df instead of returning a new frame
+
+    Returns:
+        pandas.DataFrame: Frame with the indicator columns added
+    """
+    if columns is None:
+        requested = available_indicators(overrides)
+        base_columns = [c for c in df.columns if c not in requested]
+    else:
+        requested = [c for c in dict.fromkeys(columns) if c not in df.columns]
+        base_columns = list(df.columns)
+
+    values = {}
+    for node in plan_indicators(requested, base_columns, overrides):
+        args = [values[name] if name in values else df[name] for name in node.inputs]
+        values[node.name] = node.func(*args)
+
+    new_columns = [name for name in requested if name in values]
+
+    if inplace:
+        for name in new_columns:
+            df[name] = values[name]
+        return df
+    if not new_columns:
+        return df.copy()
+    added = pd.DataFrame({name: values[name] for name in new_columns}, index=df.index)
+    return pd.concat([df.drop(columns=[c for c in new_columns if c in df.columns]), added], axis=1)
@@ -0,0 +1,141 @@
+"""
+Compiled inference plans for StockNet models
+
+StockPredictor.predict normalizes the inputs, runs the network and
+de-normalizes the output, allocating a full-size temporary at each step.
+Both scalings are affine, so they can be folded into the weights once:
+
+    (X - offset) * scale @ W1 + b1  ==  X @ (scale[:, None] * W1) + (b1 - (offset * scale) @ W1)
+    (a1 @ W2 + b2) * y_scale + y_offset  ==  a1 @ (W2 * y_scale) + (b2 * y_scale + y_offset)
+
+An InferencePlan holds the folded weights as C-contiguous arrays of one dtype
+(float64, or float32 for half the memory traffic) and predicts with two
+matrix products and one in-place sigmoid.
+
+Usage:
+    plan = StockPredictor(model_dir).compile_plan(dtype=np.float32)
+    plan.save("model_dir/inference_plan.npz")
+    predictions = InferencePlan.load("model_dir/inference_plan.npz").predict(X)
+"""
+
+import numpy as np
+
+PLAN_VERSION = 1
+
+# Same epsilon the unfolded path adds to the scaling denominators
+NORMALIZATION_EPSILON = 1e-8
+
+
+def fold_normalization(W1, b1, W2, b2, x_offset=None, x_scale=None, y_scale=None, y_offset=None):
+    """
+    Fold input scaling and output de-scaling into the layer parameters.
+
+    Args:
+        W1, b1, W2, b2 (numpy.ndarray): Network parameters
+        x_offset (numpy.ndarray): Subtracted from each input feature (None for 0)
+        x_scale (numpy.ndarray): Multiplies each shifted feature (None for 1)
+        y_scale (float): Multiplies the raw network output (None for 1)
+        y_offset (float): Added to the scaled output (None for 0)
+
+    Returns:
+        tuple: (W1, b1, W2, b2) with b1 and b2 flattened to 1-D
+    """
+    W1 = np.asarray(W1, dtype=np.float64)
+    b1 = np.asarray(b1, dtype=np.float64).reshape(-1)
+    W2 = np.asarray(W2, dtype=np.float64)
+    b2 = np.asarray(b2, dtype=np.float64).reshape(-1)
+
+    if x_scale is not None:
+        W1 = np.asarray(x_scale, dtype=np.float64).reshape(-1, 1) * W1
+    if x_offset is not None:
+        # W1 already includes the scale here
+        b1 = b1 - np.asarray(x_offset, dtype=np.float64).reshape(-1) @ W1
+    if y_scale is not None:
+        W2 = W2 * y_scale
+        b2 = b2 * y_scale
+    if y_offset is not None:
+        b2 = b2 + y_offset
+    return W1, b1, W2, b2
+
+
+class InferencePlan:
+    """Normalization-free network: predict(X) is X @ W1 + b1 -> sigmoid -> @ W2 + b2."""
+
+    def __init__(self, W1, b1, W2, b2, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        self.W1 = np.ascontiguousarray(W1, dtype=self.dtype)
+        self.b1 = np.ascontiguousarray(np.reshape(b1, -1), dtype=self.dtype)
+        self.W2 = np.ascontiguousarray(W2, dtype=self.dtype)
+        self.b2 = np.ascontiguousarray(np.reshape(b2, -1), dtype=self.dtype)
+        if self.W1.shape[1] != self.b1.shape[0] or self.W2.shape[0] != self.W1.shape[1]:
+            raise ValueError("Inconsistent weight shapes in inference plan")
+
+    @property
+    def input_size(self):
+        return self.W1.shape[0]
+
+    @classmethod
+    def from_predictor(cls, predictor, dtype=np.float64):
+        """
+        Compile a StockPredictor, folding in whichever normalization its
+        predict() would apply.
+
+        Args:
+            predictor (StockPredictor): Loaded model
+            dtype (numpy.dtype): Plan dtype (float64 or float32)
+
+        Returns:
+            InferencePlan: Equivalent plan
+        """
+        x_offset = x_scale = y_scale = y_offset = None
+        if predictor.use_standardization and predictor.X_mean is not None and predictor.X_std is not None:
+            x_offset = predictor.X_mean
+            x_scale = 1.0 / (predictor.X_std + NORMALIZATION_EPSILON)
+        elif predictor.X_min is not None and predictor.X_max is not None:
+            x_offset = predictor.X_min
+            x_scale = 1.0 / (predictor.X_max - predictor.X_min + NORMALIZATION_EPSILON)
+        if predictor.has_target_norm and predictor.Y_min is not None and predictor.Y_max is not None:
+            y_scale = float(predictor.Y_max - predictor.Y_min)
+            y_offset = float(predictor.Y_min)
+        folded = fold_normalization(predictor.W1, predictor.b1, predictor.W2, predictor.b2,
+                                    x_offset, x_scale, y_scale, y_offset)
+        return cls(*folded, dtype=dtype)
+
+    def predict(self, X):
+        """
+        Predict from raw (un-normalized) inputs.
+
+        Args:
+            X (numpy.ndarray): Inputs of shape (n_samples, input_size)
+
+        Returns:
+            numpy.ndarray: Predictions of shape (n_samples,), in target units
+        """
+        X = np.asarray(X, dtype=self.dtype)
+        hidden = X @ self.W1
+        hidden += self.b1
+        # In-place sigmoid: 0.5 * tanh(x / 2) + 0.5
+        hidden *= 0.5
+        np.tanh(hidden, out=hidden)
+        hidden *= 0.5
+        hidden += 0.5
+        output = hidden @ self.W2
+        output += self.b2
+        return output.reshape(-1)
+
+    def save(self, path):
+        """Write the plan to an NPZ file."""
+        np.savez(path, W1=self.W1, b1=self.b1, W2=self.W2, b2=self.b2, plan_version=PLAN_VERSION)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a plan written by save().
+
+        Raises:
+            ValueError: If the file was written by an incompatible version
+        """
+        with np.load(path) as data:
+            if int(data['plan_version']) != PLAN_VERSION:
+                raise ValueError(f"Unsupported inference plan version: {int(data['plan_version'])}")
+            return cls(data['W1'], data['b1'], data['W2'], data['b2'], dtype=data['W1'].dtype)
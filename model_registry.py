@@ -0,0 +1,289 @@
+"""
+Process-wide registry of loaded models
+
+The GUI's prediction worker, predict.StockPredictor and the model analysis
+views each used to re-read a model directory (weights, feature_info.json,
+scaler and target CSVs) and probe several weight file names on every
+prediction. ModelRegistry loads a directory once into a read-only
+LoadedModel and hands the same object to every caller until one of its files
+changes.
+
+    - Freshness is checked by stat()ing the files an entry was built from
+      (plus the directory itself, so newly added files are noticed); no file
+      is read again while they are unchanged
+    - At most MODEL_REGISTRY_MAX_MODELS models stay resident, least recently
+      used first out
+    - Arrays are marked read-only and mappings are read-only views, so one
+      caller cannot change a model another is using
+
+Usage:
+    model = get_model("model_20250626_210814")
+    W1, x_features = model.arrays['W1'], model.x_features
+"""
+
+import os
+import copy
+import json
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+
+from weight_history import WeightHistory, EPOCHS_FILE, has_snapshots
+
+MODEL_REGISTRY_MAX_MODELS = int(os.environ.get('MODEL_REGISTRY_MAX_MODELS', 8))
+
+# Weight files tried in order when the caller does not name one
+WEIGHTS_FILE_NAMES = ('stock_model.npz', 'model.npz', 'final_model.npz', 'best_model.npz')
+WEIGHTS_HISTORY_DIR = 'weights_history'
+
+# Normalization CSVs written next to the weights by training
+NORMALIZATION_FILES = ('scaler_mean', 'scaler_std', 'target_min', 'target_max')
+
+_METADATA_FILES = ('feature_info.json', 'model_params.json')
+
+
+def _read_only(array):
+    array = np.asarray(array)
+    array.setflags(write=False)
+    return array
+
+
+def _read_json(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class LoadedModel:
+    """
+    Read-only contents of a model directory.
+
+    Attributes:
+        model_dir (str): Absolute model directory
+        weights_file (str): Weight file (or weights_history store directory)
+            the arrays came from, or None if the directory has none (e.g.
+            Keras or advanced models)
+        arrays (Mapping): Name -> read-only array of every entry in the weights file
+        normalization (Mapping): Name -> read-only array for each
+            NORMALIZATION_FILES CSV present
+    """
+
+    def __init__(self, model_dir, weights_file, arrays, feature_info, model_params, normalization):
+        self.model_dir = model_dir
+        self.weights_file = weights_file
+        self.arrays = MappingProxyType({name: _read_only(value) for name, value in arrays.items()})
+        self.normalization = MappingProxyType({name: _read_only(value) for name, value in normalization.items()})
+        self._feature_info = feature_info
+        self._model_params = model_params
+
+    @property
+    def feature_info(self):
+        """Contents of feature_info.json (a copy the caller may modify), or None."""
+        return copy.deepcopy(self._feature_info)
+
+    @property
+    def model_params(self):
+        """Contents of model_params.json (a copy the caller may modify), or None."""
+        return copy.deepcopy(self._model_params)
+
+    @property
+    def x_features(self):
+        """Input feature names from feature_info.json, or None."""
+        return list(self._feature_info['x_features']) if self._feature_info and 'x_features' in self._feature_info else None
+
+    @property
+    def y_feature(self):
+        """Target feature name from feature_info.json, or None."""
+        return self._feature_info.get('y_feature') if self._feature_info else None
+
+    @property
+    def has_weights(self):
+        """Whether the directory had a weight file."""
+        return self.weights_file is not None
+
+    def require_weights(self):
+        """
+        Raises:
+            FileNotFoundError: If the directory had no weight file
+        """
+        if not self.has_weights:
+            raise FileNotFoundError(f"No model weights found in {self.model_dir}")
+        return self
+
+
+def find_weights_file(model_dir):
+    """
+    Pick a directory's weight file: the first of WEIGHTS_FILE_NAMES present,
+    else the weights_history store (whose last snapshot is loaded), else the
+    newest legacy NPZ file in weights_history.
+
+    Args:
+        model_dir (str): Model directory
+
+    Returns:
+        str: Path of the weight file or history store, or None if there is none
+    """
+    for name in WEIGHTS_FILE_NAMES:
+        path = os.path.join(model_dir, name)
+        if os.path.exists(path):
+            return path
+    return find_history_weights(model_dir)
+
+
+def find_history_weights(model_dir):
+    """
+    Pick the weights to load from a directory's weights_history: the store
+    itself if it holds snapshots, else the newest legacy NPZ file.
+
+    Args:
+        model_dir (str): Model directory
+
+    Returns:
+        str: Path of the history store or NPZ file, or None if there is none
+    """
+    history_dir = os.path.join(model_dir, WEIGHTS_HISTORY_DIR)
+    if os.path.isdir(history_dir):
+        if WeightHistory.exists(history_dir):
+            return history_dir if has_snapshots(history_dir) else None
+        history = [os.path.join(history_dir, f) for f in os.listdir(history_dir) if f.endswith('.npz')]
+        if history:
+            return max(history, key=os.path.getctime)
+    return None
+
+
+class ModelRegistry:
+    """Thread-safe LRU of LoadedModel objects, invalidated when their files change."""
+
+    def __init__(self, max_models=MODEL_REGISTRY_MAX_MODELS):
+        self.max_models = max_models
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _tracked_files(model_dir, weights_file):
+        files = [os.path.join(model_dir, name) for name in _METADATA_FILES]
+        files += [os.path.join(model_dir, f"{name}.csv") for name in NORMALIZATION_FILES]
+        if weights_file is not None:
+            # Snapshots are written into the store's memory maps in place,
+            # which updates epochs.npy but not the directory
+            files.append(os.path.join(weights_file, EPOCHS_FILE) if os.path.isdir(weights_file) else weights_file)
+        return files
+
+    @staticmethod
+    def _signature(model_dir, files, discover):
+        # A discovered weight file may be superseded by one added later,
+        # which changes the directory (or weights_history) mtime, or by the
+        # first snapshot appended to an empty history store
+        history_dir = os.path.join(model_dir, WEIGHTS_HISTORY_DIR)
+        dirs = (model_dir, history_dir, os.path.join(history_dir, EPOCHS_FILE)) if discover else ()
+        return tuple(_stat(path) for path in (*dirs, *files))
+
+    def _load(self, model_dir, weights_file):
+        arrays = {}
+        if weights_file is not None and os.path.isdir(weights_file):
+            history = WeightHistory(weights_file)
+            arrays = {name: np.array(value) for name, value in history[len(history) - 1].items()}
+        elif weights_file is not None:
+            with np.load(weights_file, allow_pickle=True) as data:
+                arrays = {name: data[name] for name in data.files}
+
+        normalization = {}
+        for name in NORMALIZATION_FILES:
+            path = os.path.join(model_dir, f"{name}.csv")
+            if os.path.exists(path):
+                try:
+                    normalization[name] = np.loadtxt(path, delimiter=',')
+                except ValueError as e:
+                    print(f"Warning: Could not read {path}: {e}")
+
+        return LoadedModel(model_dir, weights_file, arrays,
+                           _read_json(os.path.join(model_dir, 'feature_info.json')),
+                           _read_json(os.path.join(model_dir, 'model_params.json')),
+                           normalization)
+
+    def get(self, model_dir, weights_file=None):
+        """
+        The loaded model for a directory, reading it only if it is not
+        resident or its files changed.
+
+        Args:
+            model_dir (str): Model directory
+            weights_file (str): Weight file to load (defaults to
+                find_weights_file(model_dir))
+
+        Returns:
+            LoadedModel: Shared read-only model
+
+        Raises:
+            FileNotFoundError: If the directory or the named weight file does not exist
+        """
+        model_dir = os.path.abspath(model_dir)
+        if not os.path.isdir(model_dir):
+            raise FileNotFoundError(f"Model directory not found: {model_dir}")
+        discover = weights_file is None
+        if not discover:
+            weights_file = os.path.abspath(weights_file)
+            if not os.path.exists(weights_file):
+                raise FileNotFoundError(f"No model weights found in {model_dir}")
+        key = (model_dir, weights_file)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                model, files, signature = entry
+                if self._signature(model_dir, files, discover) == signature:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return model
+                self.reloads += 1
+            else:
+                self.misses += 1
+
+            # Sign before reading so a file written meanwhile triggers another reload
+            resolved = find_weights_file(model_dir) if discover else weights_file
+            files = self._tracked_files(model_dir, resolved)
+            signature = self._signature(model_dir, files, discover)
+            model = self._load(model_dir, resolved)
+            self._entries[key] = (model, files, signature)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_models:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return model
+
+    def invalidate(self, model_dir=None):
+        """Drop one directory's models (or all models) so the next get reloads them."""
+        with self._lock:
+            if model_dir is None:
+                self._entries.clear()
+                return
+            model_dir = os.path.abspath(model_dir)
+            for key in [key for key in self._entries if key[0] == model_dir]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared by the GUI, the CLI scripts and the prediction server
+MODEL_REGISTRY = ModelRegistry()
+
+
+def get_model(model_dir, weights_file=None):
+    """Load a model directory through the process-wide MODEL_REGISTRY (see ModelRegistry.get)."""
+    return MODEL_REGISTRY.get(model_dir, weights_file)
@@ -0,0 +1,173 @@
+"""
+Incremental model update from newly arrived bars
+
+Warm-starts a trained model directory (weights, Adam state from
+checkpoint.npz when it matches the saved weights, frozen normalization
+bounds), trains only on rows of the data file that the model has not seen yet,
+and updates the model directory in place.
+
+Usage:
+    python online_update.py --model_dir <model_directory> --data_file <path_to_csv> [--epochs 5] [--rescale]
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Add the project directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from stock_net import StockNet
+from checkpoint import CHECKPOINT_FILE, load_checkpoint, save_checkpoint
+from train import str2bool
+
+ONLINE_STATE_FILE = "online_state.json"
+
+
+def load_model_for_update(model_dir):
+    """
+    Load a model directory for warm-started training.
+
+    The checkpoint is used when its weights match stock_model.npz, so the Adam
+    moments carry over; otherwise the saved weights are used with fresh
+    optimizer state.
+
+    Args:
+        model_dir (str): Trained model directory
+
+    Returns:
+        tuple: (model, checkpoint_state or None)
+    """
+    model = StockNet.load_weights(model_dir, "stock_model")
+    checkpoint_path = os.path.join(model_dir, CHECKPOINT_FILE)
+    if os.path.exists(checkpoint_path):
+        checkpoint_model, state = load_checkpoint(checkpoint_path)
+        if (checkpoint_model.W1.shape == model.W1.shape
+                and np.array_equal(checkpoint_model.W1, model.W1)
+                and np.array_equal(checkpoint_model.W2, model.W2)):
+            return checkpoint_model, state
+        print("Checkpoint does not match stock_model.npz, using fresh optimizer state")
+    return model, None
+
+
+def rows_already_seen(model_dir):
+    """
+    Number of leading data-file rows the model has already been trained on.
+
+    Args:
+        model_dir (str): Trained model directory
+
+    Returns:
+        int: Rows recorded by the last update, else the rows_trained that
+        train.py recorded in feature_info.json, else (for models trained
+        before it was recorded) the length of training_data.csv
+    """
+    state_file = os.path.join(model_dir, ONLINE_STATE_FILE)
+    if os.path.exists(state_file):
+        with open(state_file, 'r') as f:
+            return int(json.load(f)['rows_seen'])
+    feature_info_file = os.path.join(model_dir, "feature_info.json")
+    if os.path.exists(feature_info_file):
+        with open(feature_info_file, 'r') as f:
+            feature_info = json.load(f)
+        if 'rows_trained' in feature_info:
+            return int(feature_info['rows_trained'])
+    training_data_file = os.path.join(model_dir, "training_data.csv")
+    if os.path.exists(training_data_file):
+        with open(training_data_file, 'r') as f:
+            return max(0, sum(1 for _ in f) - 1)
+    return 0
+
+
+def update_model(model_dir, data_file, epochs=5, learning_rate=0.001, batch_size=32, rescale=False,
+                 all_rows=False):
+    """
+    Train a model directory on new rows of a data file and save it in place.
+
+    Args:
+        model_dir (str): Trained model directory to update
+        data_file (str): CSV file whose trailing rows are new bars
+        epochs (int): Passes over the new rows
+        learning_rate (float): Learning rate for weight updates
+        batch_size (int): Size of mini-batches
+        rescale (bool): Widen normalization bounds to cover the new rows
+        all_rows (bool): Train on every row of data_file, not just unseen ones
+
+    Returns:
+        dict: Number of new rows and the per-epoch losses (empty if up to date)
+
+    Raises:
+        ValueError: If epochs is less than 1
+    """
+    if epochs < 1:
+        raise ValueError(f"epochs must be at least 1, got {epochs}")
+    with open(os.path.join(model_dir, "feature_info.json"), 'r') as f:
+        feature_info = json.load(f)
+    x_features = feature_info['x_features']
+    y_feature = feature_info['y_feature']
+
+    df = pd.read_csv(data_file)
+    rows_seen = 0 if all_rows else rows_already_seen(model_dir)
+    new_rows = df.iloc[rows_seen:]
+    if new_rows.empty:
+        print(f"No new rows in {data_file} (model has seen {rows_seen})")
+        return {'new_rows': 0, 'losses': []}
+    print(f"Updating on {len(new_rows)} new rows")
+
+    model, state = load_model_for_update(model_dir)
+    losses = model.partial_fit(new_rows[x_features].values, new_rows[y_feature].values,
+                               epochs=epochs, learning_rate=learning_rate,
+                               batch_size=batch_size, rescale=rescale)
+
+    # Weights, optimizer state and normalization bounds, updated in place
+    model.save_weights(model_dir, "stock_model")
+    if state is None:
+        state = {'epoch': 0, 'best_mse': float('inf'), 'patience_counter': 0,
+                 'train_losses': [], 'val_losses': []}
+    state['train_losses'] = list(state['train_losses']) + list(losses)
+    state['val_losses'] = list(state['val_losses']) + list(losses)
+    save_checkpoint(os.path.join(model_dir, CHECKPOINT_FILE), model, state)
+
+    np.savetxt(os.path.join(model_dir, "scaler_mean.csv"), model.X_min, delimiter=',')
+    np.savetxt(os.path.join(model_dir, "scaler_std.csv"), model.X_max - model.X_min, delimiter=',')
+    np.savetxt(os.path.join(model_dir, "target_min.csv"), [model.Y_min], delimiter=',')
+    np.savetxt(os.path.join(model_dir, "target_max.csv"), [model.Y_max], delimiter=',')
+
+    # Append the new losses and rows rather than rewriting the history files
+    with open(os.path.join(model_dir, "training_losses.csv"), 'a') as f:
+        np.savetxt(f, np.column_stack([losses, losses]), delimiter=',')
+    training_data_file = os.path.join(model_dir, "training_data.csv")
+    if os.path.exists(training_data_file):
+        columns = pd.read_csv(training_data_file, nrows=0).columns
+        new_rows.reindex(columns=columns).to_csv(training_data_file, mode='a', header=False, index=False)
+
+    with open(os.path.join(model_dir, ONLINE_STATE_FILE), 'w') as f:
+        json.dump({'rows_seen': len(df), 'data_file': os.path.abspath(data_file),
+                   'last_update': datetime.now().isoformat()}, f, indent=4)
+
+    final_loss = f" (final loss {losses[-1]:.6f})" if len(losses) else ""
+    print(f"Model updated in place: {model_dir}{final_loss}")
+    return {'new_rows': len(new_rows), 'losses': losses}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update a trained model with new rows")
+    parser.add_argument("--model_dir", type=str, required=True, help="Trained model directory to update")
+    parser.add_argument("--data_file", type=str, required=True, help="CSV file containing the new bars")
+    parser.add_argument("--epochs", type=int, default=5, help="Passes over the new rows")
+    parser.add_argument("--learning_rate", type=float, default=0.001, help="Learning rate")
+    parser.add_argument("--batch_size", type=int, default=32, help="Batch size")
+    parser.add_argument("--rescale", type=str2bool, nargs='?', const=True, default=False,
+                        help="Widen normalization bounds when new rows fall outside them")
+    parser.add_argument("--all_rows", type=str2bool, nargs='?', const=True, default=False,
+                        help="Train on every row of data_file instead of only unseen rows")
+
+    args = parser.parse_args()
+    if args.epochs < 1:
+        parser.error("--epochs must be at least 1")
+    update_model(args.model_dir, args.data_file, args.epochs, args.learning_rate,
+                 args.batch_size, args.rescale, args.all_rows)
@@ -27,6 +27,12 @@ import argparse
 from datetime import datetime
 import json
 import matplotlib.pyplot as plt
+from indicators import compute_indicators, compute_rsi
+from indicator_state import IndicatorState, SEED_ROWS
+from feature_cache import load_features
+from columnar_cache import PYARROW_AVAILABLE, read_csv_cached
+from model_registry import get_model
+from inference_plan import InferencePlan
 
 def sigmoid(x):
     """
@@ -48,139 +54,19 @@ def sigmoid(x):
     
     return pos + neg
 
-def compute_rsi(prices, period=14):
-    """
-    Compute Relative Strength Index (RSI) for a price series.
-    
-    RSI = 100 - (100 / (1 + RS))
-    where RS = Average Gain / Average Loss
-    
-    Args:
-        prices (pandas.Series): Price series
-        period (int): Period for RSI calculation (default: 14)
-        
-    Returns:
-        pandas.Series: RSI values
-    """
-    # Calculate price changes
-    delta = prices.diff()
-    
-    # Separate gains and losses
-    gains = delta.where(delta > 0, 0)
-    losses = -delta.where(delta < 0, 0)
-    
-    # Calculate average gains and losses using exponential moving average
-    avg_gains = gains.ewm(span=period, adjust=False).mean()
-    avg_losses = losses.ewm(span=period, adjust=False).mean()
-    
-    # Calculate RS and RSI
-    rs = avg_gains / avg_losses
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
-
-def add_technical_indicators(df):
+def add_technical_indicators(df, columns=None):
     """
     Add technical indicators to the dataframe.
     
     Args:
         df (pandas.DataFrame): DataFrame with OHLCV data
+        columns (list): Columns the caller needs; only the indicators among
+            them (and what they depend on) are computed. None adds all.
         
     Returns:
         pandas.DataFrame: DataFrame with added technical indicators
     """
-    # Make a copy to avoid modifying original
-    df_enhanced = df.copy()
-    
-    # Basic moving averages
-    df_enhanced['ma_5'] = df_enhanced['close'].rolling(window=5).mean()
-    df_enhanced['ma_10'] = df_enhanced['close'].rolling(window=10).mean()
-    df_enhanced['ma_20'] = df_enhanced['close'].rolling(window=20).mean()
-    df_enhanced['ma_50'] = df_enhanced['close'].rolling(window=50).mean()
-    
-    # Exponential moving averages
-    df_enhanced['ema_12'] = df_enhanced['close'].ewm(span=12).mean()
-    df_enhanced['ema_26'] = df_enhanced['close'].ewm(span=26).mean()
-    
-    # RSI
-    df_enhanced['rsi'] = compute_rsi(df_enhanced['close'], 14)
-    
-    # Price changes and returns
-    df_enhanced['price_change'] = df_enhanced['close'].pct_change()
-    df_enhanced['price_change_5'] = df_enhanced['close'].pct_change(periods=5)
-    df_enhanced['price_change_10'] = df_enhanced['close'].pct_change(periods=10)
-    
-    # Volatility measures
-    df_enhanced['volatility_10'] = df_enhanced['close'].rolling(window=10).std()
-    df_enhanced['volatility_20'] = df_enhanced['close'].rolling(window=20).std()
-    
-    # Bollinger Bands
-    df_enhanced['bb_middle'] = df_enhanced['close'].rolling(window=20).mean()
-    bb_std = df_enhanced['close'].rolling(window=20).std()
-    df_enhanced['bb_upper'] = df_enhanced['bb_middle'] + (bb_std * 2)
-    df_enhanced['bb_lower'] = df_enhanced['bb_middle'] - (bb_std * 2)
-    df_enhanced['bb_width'] = (df_enhanced['bb_upper'] - df_enhanced['bb_lower']) / df_enhanced['bb_middle']
-    df_enhanced['bb_position'] = (df_enhanced['close'] - df_enhanced['bb_lower']) / (df_enhanced['bb_upper'] - df_enhanced['bb_lower'])
-    
-    # MACD
-    exp1 = df_enhanced['close'].ewm(span=12).mean()
-    exp2 = df_enhanced['close'].ewm(span=26).mean()
-    df_enhanced['macd'] = exp1 - exp2
-    df_enhanced['macd_signal'] = df_enhanced['macd'].ewm(span=9).mean()
-    df_enhanced['macd_histogram'] = df_enhanced['macd'] - df_enhanced['macd_signal']
-    
-    # Stochastic Oscillator
-    low_min = df_enhanced['low'].rolling(window=14).min()
-    high_max = df_enhanced['high'].rolling(window=14).max()
-    df_enhanced['stoch_k'] = 100 * (df_enhanced['close'] - low_min) / (high_max - low_min)
-    df_enhanced['stoch_d'] = df_enhanced['stoch_k'].rolling(window=3).mean()
-    
-    # Williams %R
-    df_enhanced['williams_r'] = -100 * (high_max - df_enhanced['close']) / (high_max - low_min)
-    
-    # Volume indicators
-    df_enhanced['volume_ma'] = df_enhanced['vol'].rolling(window=10).mean()
-    df_enhanced['volume_ratio'] = df_enhanced['vol'] / df_enhanced['volume_ma']
-    df_enhanced['volume_sma_ratio'] = df_enhanced['vol'] / df_enhanced['vol'].rolling(window=20).mean()
-    
-    # Price momentum
-    df_enhanced['momentum_5'] = df_enhanced['close'] - df_enhanced['close'].shift(5)
-    df_enhanced['momentum_10'] = df_enhanced['close'] - df_enhanced['close'].shift(10)
-    
-    # Rate of change
-    df_enhanced['roc_5'] = ((df_enhanced['close'] - df_enhanced['close'].shift(5)) / df_enhanced['close'].shift(5)) * 100
-    df_enhanced['roc_10'] = ((df_enhanced['close'] - df_enhanced['close'].shift(10)) / df_enhanced['close'].shift(10)) * 100
-    
-    # Average True Range (ATR)
-    high_low = df_enhanced['high'] - df_enhanced['low']
-    high_close = np.abs(df_enhanced['high'] - df_enhanced['close'].shift())
-    low_close = np.abs(df_enhanced['low'] - df_enhanced['close'].shift())
-    true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-    df_enhanced['atr'] = true_range.rolling(window=14).mean()
-    
-    # Commodity Channel Index (CCI)
-    typical_price = (df_enhanced['high'] + df_enhanced['low'] + df_enhanced['close']) / 3
-    sma_tp = typical_price.rolling(window=20).mean()
-    mad = typical_price.rolling(window=20).apply(lambda x: np.mean(np.abs(x - x.mean())))
-    df_enhanced['cci'] = (typical_price - sma_tp) / (0.015 * mad)
-    
-    # Money Flow Index (MFI)
-    typical_price = (df_enhanced['high'] + df_enhanced['low'] + df_enhanced['close']) / 3
-    money_flow = typical_price * df_enhanced['vol']
-    
-    positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0).rolling(window=14).sum()
-    negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0).rolling(window=14).sum()
-    
-    mfi_ratio = positive_flow / negative_flow
-    df_enhanced['mfi'] = 100 - (100 / (1 + mfi_ratio))
-    
-    # Support and Resistance levels (simplified)
-    df_enhanced['support_20'] = df_enhanced['low'].rolling(window=20).min()
-    df_enhanced['resistance_20'] = df_enhanced['high'].rolling(window=20).max()
-    df_enhanced['price_to_support'] = (df_enhanced['close'] - df_enhanced['support_20']) / df_enhanced['support_20']
-    df_enhanced['price_to_resistance'] = (df_enhanced['resistance_20'] - df_enhanced['close']) / df_enhanced['close']
-    
-    return df_enhanced
+    return compute_indicators(df, columns=columns)
 
 class StockPredictor:
     """
@@ -220,90 +106,80 @@ class StockPredictor:
         self.use_standardization = False
         self.has_target_norm = False
         
-        # Load all parameters from NPZ file
+        # Weights, feature info and normalization come from the shared model
+        # registry, so predictors for an unchanged model do not touch the disk
         weights_file = os.path.join(model_dir, 'stock_model.npz')
         if not os.path.exists(weights_file):
             raise FileNotFoundError(f"No model weights found in {model_dir}")
-            
-        with np.load(weights_file, allow_pickle=True) as data:
-            # Load weights and biases
-            self.W1 = data['W1']
-            self.b1 = data['b1']
-            self.W2 = data['W2']
-            self.b2 = data['b2']
-            
-            # Validate weight shapes for consistency
-            if self.W1.shape[1] != self.b1.shape[1] or self.W2.shape[0] != self.W1.shape[1]:
-                raise ValueError("Inconsistent weight shapes in model")
-            
-            # Print hidden layer size
-            print(f"Loaded model with hidden layer size: {self.W1.shape[1]}")
-            
-            # Try to load normalization parameters from NPZ first
-            npz_has_norm = False
-            try:
-                # Check if normalization parameters exist in NPZ and are valid
-                if 'X_min' in data and 'X_max' in data:
-                    x_min = data['X_min']
-                    x_max = data['X_max']
-                    
-                    # Check if the values are valid (not None and not NaN)
-                    if x_min is not None and x_max is not None:
-                        # Convert to numpy arrays if they aren't already
-                        if not isinstance(x_min, np.ndarray):
-                            x_min = np.array(x_min)
-                        if not isinstance(x_max, np.ndarray):
-                            x_max = np.array(x_max)
-                        
-                        # Check for NaN values
-                        if not np.any(np.isnan(x_min)) and not np.any(np.isnan(x_max)):
-                            self.X_min = x_min
-                            self.X_max = x_max
-                            self.Y_min = data['Y_min'] if 'Y_min' in data else None
-                            self.Y_max = data['Y_max'] if 'Y_max' in data else None
-                            self.has_target_norm = bool(data['has_target_norm']) if 'has_target_norm' in data else False
-                            self.use_standardization = False
-                            npz_has_norm = True
-                            print("Loaded normalization parameters from NPZ file")
-                        else:
-                            print("Invalid normalization parameters in NPZ file (NaN values), loading from CSV files...")
+        loaded = get_model(model_dir, weights_file)
+        data = loaded.arrays
+        
+        # Load weights and biases
+        self.W1 = data['W1']
+        self.b1 = data['b1']
+        self.W2 = data['W2']
+        self.b2 = data['b2']
+        
+        # Validate weight shapes for consistency
+        if self.W1.shape[1] != self.b1.shape[1] or self.W2.shape[0] != self.W1.shape[1]:
+            raise ValueError("Inconsistent weight shapes in model")
+        
+        # Print hidden layer size
+        print(f"Loaded model with hidden layer size: {self.W1.shape[1]}")
+        
+        # Try to load normalization parameters from NPZ first
+        npz_has_norm = False
+        try:
+            # Check if normalization parameters exist in NPZ and are valid
+            if 'X_min' in data and 'X_max' in data:
+                x_min = data['X_min']
+                x_max = data['X_max']
+                
+                # Arrays saved from None hold a single object
+                if x_min.dtype != object and x_max.dtype != object:
+                    # Check for NaN values
+                    if not np.any(np.isnan(x_min)) and not np.any(np.isnan(x_max)):
+                        self.X_min = x_min
+                        self.X_max = x_max
+                        self.Y_min = data['Y_min'] if 'Y_min' in data else None
+                        self.Y_max = data['Y_max'] if 'Y_max' in data else None
+                        self.has_target_norm = bool(data['has_target_norm']) if 'has_target_norm' in data else False
+                        self.use_standardization = False
+                        npz_has_norm = True
+                        print("Loaded normalization parameters from NPZ file")
                     else:
-                        print("Invalid normalization parameters in NPZ file (None values), loading from CSV files...")
+                        print("Invalid normalization parameters in NPZ file (NaN values), loading from CSV files...")
                 else:
-                    print("No normalization parameters in NPZ file, loading from CSV files...")
-            except Exception as e:
-                print(f"Error loading from NPZ: {e}, loading from CSV files...")
-            
-            # If NPZ doesn't have valid normalization parameters, load from CSV files
-            if not npz_has_norm:
-                self._load_normalization_from_csv(model_dir)
-            
-            # Store architecture parameters
-            self.input_size = int(data['input_size'])
-            self.hidden_size = int(data['hidden_size'])
+                    print("Invalid normalization parameters in NPZ file (None values), loading from CSV files...")
+            else:
+                print("No normalization parameters in NPZ file, loading from CSV files...")
+        except Exception as e:
+            print(f"Error loading from NPZ: {e}, loading from CSV files...")
+        
+        # If NPZ doesn't have valid normalization parameters, use the CSV files
+        if not npz_has_norm:
+            self._load_normalization_from_csv(loaded)
+        
+        # Store architecture parameters
+        self.input_size = int(data['input_size'])
+        self.hidden_size = int(data['hidden_size'])
         
         # Load feature info if available
-        feature_info_path = os.path.join(model_dir, 'feature_info.json')
-        if os.path.exists(feature_info_path):
-            with open(feature_info_path, 'r') as f:
-                feature_info = json.load(f)
-                self.expected_x_features = feature_info['x_features']
-                self.expected_y_feature = feature_info['y_feature']
+        if loaded.x_features is not None:
+            self.expected_x_features = loaded.x_features
+            self.expected_y_feature = loaded.y_feature
         else:
             self.expected_x_features = ['open', 'high', 'low', 'close', 'vol']
             self.expected_y_feature = 'close'
 
-    def _load_normalization_from_csv(self, model_dir):
-        """Load normalization parameters from separate CSV files."""
+    def _load_normalization_from_csv(self, loaded):
+        """Load normalization parameters from the model's separate CSV files."""
         try:
             # Load min-max normalization parameters for input features
             # The training script uses min-max normalization, not standardization
-            target_min_file = os.path.join(model_dir, 'target_min.csv')
-            target_max_file = os.path.join(model_dir, 'target_max.csv')
-            
-            if os.path.exists(target_min_file) and os.path.exists(target_max_file):
-                self.Y_min = np.loadtxt(target_min_file)
-                self.Y_max = np.loadtxt(target_max_file)
+            if 'target_min' in loaded.normalization and 'target_max' in loaded.normalization:
+                self.Y_min = loaded.normalization['target_min']
+                self.Y_max = loaded.normalization['target_max']
                 self.has_target_norm = True
                 print(f"Loaded target normalization: min={self.Y_min}, max={self.Y_max}")
             else:
@@ -382,6 +258,60 @@ class StockPredictor:
             
         return predictions.flatten()
 
+    def indicator_state(self, df):
+        """
+        Seed a streaming indicator state from a bar history.
+        
+        Args:
+            df (pandas.DataFrame): History with open/high/low/close/vol columns
+            
+        Returns:
+            IndicatorState: State to pass to predict_next
+        """
+        return IndicatorState.from_history(df)
+
+    def predict_next(self, state, bar):
+        """
+        Add one new bar to an indicator state and predict from its features.
+        
+        Only the new bar's indicators are computed (in constant time), so
+        scoring a live bar does not re-run the indicator pipeline over the
+        whole history.
+        
+        Args:
+            state (IndicatorState): State built with indicator_state()
+            bar (dict): open/high/low/close/vol values of the new bar
+            
+        Returns:
+            float: Predicted value for the bar
+        """
+        row = state.update(bar)
+        x = state.feature_vector(self.expected_x_features, row)
+        if self.use_standardization and self.X_mean is not None and self.X_std is not None:
+            x = (x - self.X_mean) / (self.X_std + 1e-8)
+        elif self.X_min is not None and self.X_max is not None:
+            x = (x - self.X_min) / (self.X_max - self.X_min + 1e-8)
+        hidden = sigmoid(x @ self.W1 + self.b1[0])
+        prediction = float((hidden @ self.W2 + self.b2[0])[0])
+        if self.has_target_norm and self.Y_min is not None and self.Y_max is not None:
+            prediction = prediction * float(self.Y_max - self.Y_min) + float(self.Y_min)
+        return prediction
+
+    def compile_plan(self, dtype=np.float64):
+        """
+        Fold this model's normalization into its weights.
+        
+        The plan's predict() gives the same values as predict() (to rounding)
+        with two matrix products and no normalization temporaries.
+        
+        Args:
+            dtype (numpy.dtype): Plan dtype; float32 halves memory traffic
+            
+        Returns:
+            InferencePlan: Compiled plan
+        """
+        return InferencePlan.from_predictor(self, dtype)
+
     @staticmethod
     def load_model(model_dir):
         """
@@ -395,6 +325,208 @@ class StockPredictor:
         """
         return StockPredictor(model_dir)
 
+# Streaming mode: rows scored per chunk, and points kept for the optional plot
+STREAM_CHUNK_ROWS = 100000
+STREAM_PLOT_POINTS = 2000
+
+# Rows of history prepended to each chunk so its first rows get the same
+# indicators as in a full-file computation. Every rolling window is shorter,
+# and the EMA recurrences have forgotten anything older (see indicator_state).
+INDICATOR_WARMUP_ROWS = SEED_ROWS
+
+def iter_feature_chunks(input_file, columns, chunksize=STREAM_CHUNK_ROWS, warmup_rows=INDICATOR_WARMUP_ROWS):
+    """
+    Read a CSV in chunks and add technical indicators to each.
+    
+    The last warmup_rows raw rows of the previous chunk are carried over and
+    prepended before computing indicators, then dropped again, so features
+    at chunk boundaries match those of compute_indicators on the whole file.
+    
+    Args:
+        input_file (str): Input CSV file
+        columns (list): Columns the caller needs (see compute_indicators)
+        chunksize (int): Rows per chunk
+        warmup_rows (int): History rows carried across chunk boundaries
+        
+    Yields:
+        pandas.DataFrame: Feature rows of each chunk, indexed by file row number
+    """
+    tail = None
+    for chunk in pd.read_csv(input_file, chunksize=chunksize):
+        frame = chunk if tail is None else pd.concat([tail, chunk])
+        features = compute_indicators(frame, columns=columns)
+        yield features.iloc[len(frame) - len(chunk):]
+        tail = frame.iloc[-warmup_rows:] if warmup_rows else None
+
+class PredictionWriter:
+    """Appends prediction chunks to a CSV file, or a Parquet file if the name ends in .parquet."""
+    
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.parquet = output_file.lower().endswith(('.parquet', '.pq'))
+        if self.parquet and not PYARROW_AVAILABLE:
+            raise ImportError("PyArrow is required for Parquet output. Install with: pip install pyarrow")
+        self._parquet_writer = None
+        self._header_written = False
+        self.rows = 0
+    
+    def write(self, df):
+        """Append one chunk of results."""
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.output_file, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            df.to_csv(self.output_file, mode='a' if self._header_written else 'w',
+                      header=not self._header_written, index=False)
+            self._header_written = True
+        self.rows += len(df)
+    
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+class _PlotSample:
+    """Every stride-th row, with the stride doubled whenever too many are kept."""
+    
+    def __init__(self, max_points):
+        self.max_points = max_points
+        self.stride = 1
+        self.rows = []
+        self.values = []
+    
+    def add(self, row_numbers, values):
+        keep = row_numbers % self.stride == 0
+        self.rows.extend(row_numbers[keep])
+        self.values.extend(values[keep])
+        while len(self.rows) > self.max_points:
+            self.stride *= 2
+            kept = [i for i, row in enumerate(self.rows) if row % self.stride == 0]
+            self.rows = [self.rows[i] for i in kept]
+            self.values = [self.values[i] for i in kept]
+
+def stream_predictions(input_file, plan, x_features, y_feature, output_file,
+                       chunksize=STREAM_CHUNK_ROWS, plot_points=STREAM_PLOT_POINTS):
+    """
+    Predict a file of any size chunk by chunk with bounded memory.
+    
+    Each chunk is read, gets its indicators (with warm-up rows carried over
+    from the previous chunk), is scored with the inference plan and appended
+    to the output file. Only error sums and a downsampled set of points for
+    the plot are kept across chunks.
+    
+    Args:
+        input_file (str): Input CSV file
+        plan (InferencePlan): Compiled model (see StockPredictor.compile_plan)
+        x_features (list): Input features, in the model's order
+        y_feature (str): Target column; compared with the predictions when
+            the file has it
+        output_file (str): Output CSV or Parquet file
+        chunksize (int): Rows per chunk
+        plot_points (int): Points kept for plotting (0 keeps none)
+        
+    Returns:
+        dict: rows, mse/mae/rmse (None without actual values), and
+        plot_rows/plot_predicted/plot_actual downsampled arrays
+    """
+    columns = list(x_features) + ([y_feature] if y_feature else [])
+    sample = _PlotSample(plot_points) if plot_points else None
+    squared_error = absolute_error = 0.0
+    scored = 0
+    has_actual = False
+    
+    with PredictionWriter(output_file) as writer:
+        for features in iter_feature_chunks(input_file, columns, chunksize):
+            predictions = plan.predict(features[list(x_features)].to_numpy(dtype=np.float64))
+            
+            # Handle dates/timestamps
+            if 'timestamp' in features.columns:
+                dates = pd.to_datetime(features['timestamp']).to_numpy()
+            elif 'date' in features.columns:
+                dates = pd.to_datetime(features['date']).to_numpy()
+            else:
+                dates = features.index.to_numpy()
+            results = {'date': dates, 'predicted': predictions}
+            
+            has_actual = bool(y_feature) and y_feature in features.columns
+            if has_actual:
+                actual = features[y_feature].to_numpy(dtype=np.float64)
+                error = actual - predictions
+                results['actual'] = actual
+                results['error'] = error
+                valid = ~np.isnan(error)
+                squared_error += float(np.dot(error[valid], error[valid]))
+                absolute_error += float(np.abs(error[valid]).sum())
+                scored += int(valid.sum())
+            
+            writer.write(pd.DataFrame(results))
+            
+            if sample is not None:
+                rows = features.index.to_numpy()
+                sample.add(rows, np.column_stack([predictions, actual]) if has_actual else predictions[:, None])
+        
+        total_rows = writer.rows
+    
+    summary = {'rows': total_rows, 'mse': None, 'mae': None, 'rmse': None}
+    if scored:
+        summary['mse'] = squared_error / scored
+        summary['mae'] = absolute_error / scored
+        summary['rmse'] = float(np.sqrt(summary['mse']))
+    if sample is not None:
+        values = np.array(sample.values, dtype=np.float64).reshape(len(sample.rows), 2 if has_actual else 1)
+        summary['plot_rows'] = np.array(sample.rows)
+        summary['plot_predicted'] = values[:, 0]
+        summary['plot_actual'] = values[:, 1] if has_actual else None
+    return summary
+
+def compile_inference_plan(model, dtype, export_path=None):
+    """
+    Fold the model's normalization into an inference plan, once instead of per call.
+
+    Args:
+        model (StockPredictor): Loaded model
+        dtype (str): Plan dtype
+        export_path (str): Save the plan here as well (None skips it)
+
+    Returns:
+        InferencePlan: The compiled plan
+    """
+    plan = model.compile_plan(dtype=dtype)
+    if export_path:
+        plan.save(export_path)
+        print(f"Inference plan saved to: {export_path}")
+    return plan
+
+
+def plot_stream_summary(summary, plot_file, y_feature):
+    """Plot the downsampled actual vs predicted values from stream_predictions."""
+    plt.figure(figsize=(12, 6))
+    if summary.get('plot_actual') is not None:
+        plt.plot(summary['plot_rows'], summary['plot_actual'], 'b-', label='Actual', alpha=0.7, linewidth=1)
+    plt.plot(summary['plot_rows'], summary['plot_predicted'], 'r-', label='Predicted', alpha=0.7, linewidth=1)
+    plt.title(f'Actual vs Predicted {str(y_feature).capitalize()} ({len(summary["plot_rows"])} of {summary["rows"]} rows)')
+    plt.xlabel('Row')
+    plt.ylabel('Price')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    if summary['mse'] is not None:
+        plt.text(0.02, 0.98, f"MSE: {summary['mse']:.6f}\nMAE: {summary['mae']:.6f}\nRMSE: {summary['rmse']:.6f}",
+                 transform=plt.gca().transAxes, va='top',
+                 bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
+    plt.tight_layout()
+    plt.savefig(plot_file, dpi=100, bbox_inches='tight')
+    plt.close()
+
 def main():
     """
     Main function to run predictions on input data.
@@ -407,6 +539,20 @@ def main():
     parser.add_argument('--y_feature', help='Target feature')
     parser.add_argument('--output_dir', type=str, default='.', help='Directory to save predictions and plots')
     parser.add_argument('--output_file', type=str, help='Output filename for predictions (default: auto-generated)')
+    parser.add_argument('--no_feature_cache', action='store_true',
+                        help='Recompute technical indicators instead of using the feature cache')
+    parser.add_argument('--columnar_cache', action='store_true',
+                        help='Convert the CSV to a Feather sidecar on first load and read that afterwards')
+    parser.add_argument('--plan_dtype', choices=['float64', 'float32'], default='float64',
+                        help='Precision of the compiled inference plan used for predictions')
+    parser.add_argument('--export_plan', type=str,
+                        help='Also save the compiled inference plan (normalization folded into the weights) to this NPZ file')
+    parser.add_argument('--stream', action='store_true',
+                        help='Predict chunk by chunk with bounded memory, for inputs larger than RAM')
+    parser.add_argument('--chunksize', type=int, default=STREAM_CHUNK_ROWS,
+                        help='Rows per chunk in --stream mode')
+    parser.add_argument('--plot_points', type=int, default=STREAM_PLOT_POINTS,
+                        help='Points plotted in --stream mode (0 skips the plot)')
     
     args = parser.parse_args()
     
@@ -435,25 +581,55 @@ def main():
     except Exception as e:
         print(f"Error loading model: {str(e)}")
         return
+    
+    if args.stream:
+        x_features = args.x_features.split(',') if args.x_features else model.expected_x_features
+        y_feature = args.y_feature or model.expected_y_feature
+        if args.output_file:
+            predictions_file = os.path.join(args.output_dir, args.output_file)
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            predictions_file = os.path.join(args.output_dir, f'predictions_{timestamp}.csv')
+        try:
+            plan = compile_inference_plan(model, args.plan_dtype, args.export_plan)
+            print(f"Streaming predictions in chunks of {args.chunksize} rows...")
+            summary = stream_predictions(args.input_file, plan, x_features, y_feature, predictions_file,
+                                         chunksize=args.chunksize, plot_points=args.plot_points)
+            print(f"Predictions for {summary['rows']} rows saved to: {predictions_file}")
+            if summary['mse'] is not None:
+                print(f"MSE: {summary['mse']:.6f}  MAE: {summary['mae']:.6f}  RMSE: {summary['rmse']:.6f}")
+            if args.plot_points:
+                plots_dir = os.path.join(args.output_dir, 'plots')
+                os.makedirs(plots_dir, exist_ok=True)
+                plot_file = os.path.join(plots_dir, f'actual_vs_predicted_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png')
+                plot_stream_summary(summary, plot_file, y_feature)
+                print(f"Prediction plot saved to: {plot_file}")
+        except Exception as e:
+            print(f"Error during prediction: {str(e)}")
+            import traceback
+            traceback.print_exc()
+        return
 
     # Load and prepare data
     try:
-        df = pd.read_csv(args.input_file)
-        
-        # Add technical indicators
-        print("Adding technical indicators...")
-        df = add_technical_indicators(df)
-        
+        plan = compile_inference_plan(model, args.plan_dtype, args.export_plan)
+
         # Determine features to use
         if args.x_features and args.y_feature:
             required_columns = args.x_features.split(',')
             # Validate that y_feature is not in x_features
             if args.y_feature in required_columns:
                 raise ValueError("Target feature cannot be used as an input feature")
-            X = df[required_columns].values
         else:
             required_columns = ['open', 'high', 'low', 'close', 'vol']
-            X = df[required_columns].values
+        
+        # Load the data with only the technical indicators the model uses;
+        # an unchanged file is served from the feature cache
+        print("Loading data and technical indicators...")
+        df = load_features(args.input_file, columns=required_columns,
+                           cache=not args.no_feature_cache,
+                           reader=read_csv_cached if args.columnar_cache else None)
+        X = df[required_columns].values
         
         # Handle dates/timestamps
         if 'timestamp' in df.columns:
@@ -464,7 +640,7 @@ def main():
             dates = pd.RangeIndex(len(df))
             
         # Make predictions
-        predictions = model.predict(X)
+        predictions = plan.predict(X)
         
         # Create results DataFrame
         results_data = {
@@ -0,0 +1,279 @@
+"""
+Prediction server client and load generator
+
+PredictionClient holds one keep-alive connection to a prediction_server and
+sends JSON or Arrow prediction requests over it. run_load opens several
+clients that each send requests back to back for a fixed time, and reports
+latency percentiles and throughput together with the server's micro-batch
+counters for the same period.
+
+The generator runs in a single Python process, so at high concurrency it can
+become the bottleneck before the server does; run several instances to
+push further.
+
+Usage:
+    python prediction_client.py --port 8765 --concurrency 32 --duration 10
+    python prediction_client.py --unix /tmp/predict.sock --rows 64 --arrow
+"""
+
+import os
+import json
+import time
+import asyncio
+import argparse
+from urllib.parse import quote
+
+import numpy as np
+
+from prediction_server import (DEFAULT_HOST, DEFAULT_PORT, JSON_TYPE, ARROW_STREAM_TYPE,
+                               PYARROW_AVAILABLE, read_http_message, encode_arrow)
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+    import pyarrow.ipc
+
+LATENCY_PERCENTILES = (50, 90, 99, 99.9)
+
+
+class PredictionClient:
+    """
+    One keep-alive HTTP connection to a prediction server.
+
+    Args:
+        host (str): Server address
+        port (int): Server TCP port
+        unix_path (str): Unix socket to use instead of host/port
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self._reader = None
+        self._writer = None
+
+    async def connect(self):
+        if self.unix_path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.unix_path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        return self
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def request(self, method, path, body=b'', content_type=JSON_TYPE):
+        """
+        Send one request and wait for its response.
+
+        Returns:
+            tuple: (status code, headers dict, body bytes)
+
+        Raises:
+            ConnectionError: If the server closed the connection
+        """
+        head = (f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.host}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n")
+        self._writer.write(head.encode('latin-1') + body)
+        message = await read_http_message(self._reader)
+        if message is None:
+            raise ConnectionError("Prediction server closed the connection")
+        status_line, headers, payload = message
+        return int(status_line.split(' ', 2)[1]), headers, payload
+
+    async def get_json(self, path):
+        status, _, payload = await self.request('GET', path)
+        return self._check(status, payload)
+
+    @staticmethod
+    def _check(status, payload):
+        if status != 200:
+            raise RuntimeError(f"Prediction server returned {status}: {payload.decode(errors='replace')}")
+        return json.loads(payload)
+
+    async def predict(self, rows, model_dir=None):
+        """
+        Score feature rows sent as JSON.
+
+        Args:
+            rows (list or numpy.ndarray): Rows of input features, as lists or
+                {feature: value} dicts
+            model_dir (str): Served model to use (default: the server's default)
+
+        Returns:
+            numpy.ndarray: Predictions, one per row
+        """
+        if isinstance(rows, np.ndarray):
+            rows = rows.tolist()
+        request = {'rows': rows}
+        if model_dir is not None:
+            request['model_dir'] = model_dir
+        status, _, payload = await self.request('POST', '/predict', json.dumps(request).encode())
+        return np.asarray(self._check(status, payload)['predictions'], dtype=np.float64)
+
+    async def predict_arrow(self, columns, model_dir=None):
+        """
+        Score feature columns sent as an Arrow IPC stream.
+
+        Args:
+            columns (dict): Feature name -> column values
+            model_dir (str): Served model to use (default: the server's default)
+
+        Returns:
+            numpy.ndarray: Predictions, one per row
+        """
+        path = '/predict' if model_dir is None else f"/predict?model_dir={quote(model_dir)}"
+        status, _, payload = await self.request('POST', path, encode_arrow(columns), ARROW_STREAM_TYPE)
+        if status != 200:
+            self._check(status, payload)
+        return pa.ipc.open_stream(payload).read_all().column('predicted').to_numpy()
+
+
+def summarize_latencies(latencies, elapsed, rows_per_request):
+    """
+    Latency percentiles and throughput of a load run.
+
+    Args:
+        latencies (list): Per-request latencies in seconds
+        elapsed (float): Wall time of the run in seconds
+        rows_per_request (int): Rows sent with each request
+
+    Returns:
+        dict: requests, requests_per_s, rows_per_s, mean_ms, max_ms and p<N>_ms
+            for each LATENCY_PERCENTILES entry
+    """
+    latencies = np.asarray(latencies, dtype=np.float64) * 1000.0
+    summary = {
+        'requests': int(latencies.size),
+        'requests_per_s': latencies.size / elapsed if elapsed > 0 else 0.0,
+        'rows_per_s': latencies.size * rows_per_request / elapsed if elapsed > 0 else 0.0,
+        'mean_ms': float(latencies.mean()) if latencies.size else float('nan'),
+        'max_ms': float(latencies.max()) if latencies.size else float('nan'),
+    }
+    for q in LATENCY_PERCENTILES:
+        summary[f"p{q:g}_ms"] = float(np.percentile(latencies, q)) if latencies.size else float('nan')
+    return summary
+
+
+async def run_load(host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None, concurrency=16, duration=5.0,
+                   rows_per_request=1, model_dir=None, arrow=False, warmup=0.5, seed=0):
+    """
+    Send requests from concurrent connections and measure their latency.
+
+    Each connection sends its next request as soon as the previous answer
+    arrives. Request bodies are encoded once up front, so the timings cover
+    the round trip and server work only.
+
+    Args:
+        host, port, unix_path: Server address (see PredictionClient)
+        concurrency (int): Number of connections
+        duration (float): Measured seconds
+        rows_per_request (int): Feature rows per request
+        model_dir (str): Served model to target (default: the server's default)
+        arrow (bool): Send Arrow IPC bodies instead of JSON
+        warmup (float): Unmeasured seconds before the run
+        seed (int): Seed for the random feature rows
+
+    Returns:
+        dict: summarize_latencies() output plus the model, the server's
+            request and batch counts over the run (warm-up included) and
+            mean_batch_requests
+    """
+    if arrow and not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for --arrow")
+
+    async with PredictionClient(host, port, unix_path) as probe:
+        health = await probe.get_json('/health')
+        models = {m['model_dir']: m for m in health['models']}
+        if model_dir is None:
+            model = health['models'][0]
+        elif os.path.abspath(model_dir) in models:
+            model = models[os.path.abspath(model_dir)]
+        else:
+            raise ValueError(f"Model not served: {model_dir}")
+        before = (await probe.get_json('/stats'))[model['model_dir']]
+
+    rng = np.random.RandomState(seed)
+    X = rng.uniform(0.0, 100.0, (rows_per_request, model['input_size']))
+    if arrow:
+        names = model['x_features'] or [f"x{i}" for i in range(model['input_size'])]
+        path = f"/predict?model_dir={quote(model['model_dir'])}"
+        body, content_type = encode_arrow({name: X[:, i] for i, name in enumerate(names)}), ARROW_STREAM_TYPE
+    else:
+        path = '/predict'
+        body, content_type = json.dumps({'model_dir': model['model_dir'], 'rows': X.tolist()}).encode(), JSON_TYPE
+
+    loop = asyncio.get_running_loop()
+    start_at = loop.time() + warmup
+    stop_at = start_at + duration
+    latencies = []
+
+    async def worker():
+        async with PredictionClient(host, port, unix_path) as client:
+            while loop.time() < stop_at:
+                sent = time.perf_counter()
+                status, _, payload = await client.request('POST', path, body, content_type)
+                latency = time.perf_counter() - sent
+                if status != 200:
+                    raise RuntimeError(f"Prediction server returned {status}: {payload.decode(errors='replace')}")
+                if loop.time() >= start_at:
+                    latencies.append(latency)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = loop.time() - start_at
+
+    async with PredictionClient(host, port, unix_path) as probe:
+        after = (await probe.get_json('/stats'))[model['model_dir']]
+
+    summary = summarize_latencies(latencies, elapsed, rows_per_request)
+    summary['model_dir'] = model['model_dir']
+    summary['server_requests'] = after['requests'] - before['requests']
+    summary['server_batches'] = after['batches'] - before['batches']
+    summary['mean_batch_requests'] = (summary['server_requests'] / summary['server_batches']
+                                      if summary['server_batches'] else 0.0)
+    return summary
+
+
+def format_report(summary):
+    """Human-readable lines for a run_load() summary."""
+    percentiles = '  '.join(f"p{q:g} {summary[f'p{q:g}_ms']:.3f}" for q in LATENCY_PERCENTILES)
+    return "\n".join([
+        f"Model:       {summary['model_dir']}",
+        f"Requests:    {summary['requests']} ({summary['requests_per_s']:.0f} req/s, {summary['rows_per_s']:.0f} rows/s)",
+        f"Latency ms:  {percentiles}  mean {summary['mean_ms']:.3f}  max {summary['max_ms']:.3f}",
+        f"Batching:    {summary['server_batches']} server batches, "
+        f"{summary['mean_batch_requests']:.1f} requests per batch",
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test a running prediction server.')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST, help='Server address')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Server TCP port')
+    parser.add_argument('--unix', type=str, help='Connect to this Unix socket instead of TCP')
+    parser.add_argument('--model_dir', type=str, help='Served model to target (default: the server default)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent connections')
+    parser.add_argument('--duration', type=float, default=5.0, help='Measured seconds')
+    parser.add_argument('--rows', type=int, default=1, help='Feature rows per request')
+    parser.add_argument('--arrow', action='store_true', help='Send Arrow IPC bodies instead of JSON')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+
+    summary = asyncio.run(run_load(args.host, args.port, args.unix, args.concurrency, args.duration,
+                                   args.rows, args.model_dir, args.arrow))
+    print(json.dumps(summary, indent=2) if args.json else format_report(summary))
+
+
+if __name__ == "__main__":
+    main()
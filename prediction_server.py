@@ -0,0 +1,442 @@
+"""
+Local prediction server
+
+Tools that run predict.py as a subprocess pay for the Python, pandas and
+matplotlib imports and a model load on every call. This server loads each
+model once through StockPredictor, compiles it to an InferencePlan and
+answers prediction requests over HTTP/1.1 (keep-alive) on localhost or a
+Unix socket.
+
+Requests for the same model from concurrent connections are coalesced into
+micro-batches: a batch closes once it holds max_batch_rows rows or
+max_delay_ms after its first request arrived, whichever comes first, and is
+scored with a single plan.predict call. With max_delay_ms 0 a batch holds
+only the requests already queued, so a lone client never waits.
+
+Endpoints:
+    POST /predict   JSON {"model_dir": ..., "rows": [[...], ...]}, rows may
+                    also be {feature: value} objects; or an Arrow IPC stream
+                    (Content-Type: application/vnd.apache.arrow.stream) with
+                    one column per input feature, answered with an Arrow
+                    stream holding a "predicted" column. The model is the
+                    "model_dir" field or ?model_dir= query, defaulting to the
+                    first served model.
+    GET  /health    served models and their input features
+    GET  /stats     request, row and batch counters per model
+
+Usage:
+    python prediction_server.py --model_dir model_20250626_210814 --port 8765
+    python prediction_server.py --model_dir model_20250626_210814 --unix /tmp/predict.sock
+    python prediction_client.py --port 8765 --concurrency 32 --duration 10
+"""
+
+import os
+import io
+import json
+import asyncio
+import argparse
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+
+from model_registry import get_model
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# A micro-batch is scored once it holds this many rows or its first request
+# has waited MAX_DELAY_MS. The default of 0 still coalesces every request that
+# queued up while the previous batch was scored; a positive delay trades
+# latency for larger batches.
+MAX_BATCH_ROWS = 8192
+MAX_DELAY_MS = 0.0
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+JSON_TYPE = 'application/json'
+ARROW_STREAM_TYPE = 'application/vnd.apache.arrow.stream'
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 415: 'Unsupported Media Type', 500: 'Internal Server Error'}
+
+
+class RequestError(Exception):
+    """A request the server rejects, answered with the given HTTP status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+async def read_http_message(reader, max_body=MAX_BODY_BYTES):
+    """
+    Read one HTTP/1.1 request or response with a Content-Length body.
+
+    Args:
+        reader (asyncio.StreamReader): Connection to read from
+        max_body (int): Largest body accepted
+
+    Returns:
+        tuple: (start line, headers dict with lower-case names, body bytes),
+            or None if the peer closed the connection between messages
+
+    Raises:
+        RequestError: If the body is larger than max_body
+    """
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise
+    lines = head.decode('latin-1').split('\r\n')
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length', 0))
+    if length > max_body:
+        raise RequestError(413, f"Body of {length} bytes exceeds {max_body}")
+    body = await reader.readexactly(length) if length else b''
+    return lines[0], headers, body
+
+
+def encode_arrow(columns):
+    """Serialize {name: array} as an Arrow IPC stream."""
+    table = pa.table(columns)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+class ServedModel:
+    """A model directory compiled to an InferencePlan, recompiled when its files change."""
+
+    def __init__(self, model_dir, dtype=np.float64):
+        # Imported here so the load generator, which shares this module's
+        # HTTP helpers, does not pay for predict.py's pandas/matplotlib imports
+        from predict import StockPredictor
+        self._predictor_class = StockPredictor
+        self.model_dir = os.path.abspath(model_dir)
+        self.weights_file = os.path.join(self.model_dir, 'stock_model.npz')
+        self.dtype = np.dtype(dtype)
+        self.loaded = None
+        self.refresh()
+
+    def refresh(self):
+        """
+        The current plan, rebuilt only if the registry reloaded the model.
+
+        Returns:
+            InferencePlan: Plan for the model as it is on disk
+        """
+        loaded = get_model(self.model_dir, self.weights_file)
+        if loaded is not self.loaded:
+            predictor = self._predictor_class(self.model_dir)
+            self.plan = predictor.compile_plan(self.dtype)
+            features = predictor.expected_x_features
+            self.x_features = list(features) if len(features) == self.plan.input_size else None
+            self.y_feature = predictor.expected_y_feature
+            self.loaded = loaded
+        return self.plan
+
+    def describe(self):
+        return {'model_dir': self.model_dir, 'input_size': self.plan.input_size,
+                'x_features': self.x_features, 'y_feature': self.y_feature,
+                'dtype': self.dtype.name}
+
+
+class MicroBatcher:
+    """Queue of pending requests for one model, scored together in micro-batches."""
+
+    def __init__(self, model, max_batch_rows=MAX_BATCH_ROWS, max_delay_ms=MAX_DELAY_MS):
+        self.model = model
+        self.max_batch_rows = max_batch_rows
+        self.max_delay = max_delay_ms / 1000.0
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def predict(self, X):
+        """
+        Score rows as part of the next micro-batch.
+
+        Args:
+            X (numpy.ndarray): Inputs of shape (n_samples, input_size) in the plan dtype
+
+        Returns:
+            numpy.ndarray: Predictions of shape (n_samples,)
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((X, future))
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        pending = [await self._queue.get()]
+        rows = len(pending[0][0])
+        deadline = loop.time() + self.max_delay
+        while rows < self.max_batch_rows:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._queue.get_nowait()
+            pending.append(item)
+            rows += len(item[0])
+        return pending, rows
+
+    async def _run(self):
+        while True:
+            pending, rows = await self._collect()
+            self.batches += 1
+            self.requests += len(pending)
+            self.rows += rows
+            try:
+                plan = self.model.refresh()
+                X = pending[0][0] if len(pending) == 1 else np.concatenate([x for x, _ in pending])
+                predictions = plan.predict(X)
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            start = 0
+            for x, future in pending:
+                # Futures of clients that disconnected are already cancelled
+                if not future.done():
+                    future.set_result(predictions[start:start + len(x)])
+                start += len(x)
+
+    def stats(self):
+        return {'requests': self.requests, 'rows': self.rows, 'batches': self.batches,
+                'mean_batch_requests': self.requests / self.batches if self.batches else 0.0}
+
+
+class PredictionServer:
+    """
+    asyncio HTTP server scoring feature rows against warm models.
+
+    Args:
+        model_dirs (list): Model directories to serve; the first is the default
+        max_batch_rows (int): Rows at which a micro-batch is scored immediately
+        max_delay_ms (float): Longest a request waits for others to join its batch
+        dtype (numpy.dtype): Inference plan dtype
+    """
+
+    def __init__(self, model_dirs, max_batch_rows=MAX_BATCH_ROWS, max_delay_ms=MAX_DELAY_MS, dtype=np.float64):
+        if not model_dirs:
+            raise ValueError("At least one model directory is required")
+        self.batchers = {}
+        for model_dir in model_dirs:
+            model = ServedModel(model_dir, dtype)
+            self.batchers[model.model_dir] = MicroBatcher(model, max_batch_rows, max_delay_ms)
+        self.default_model_dir = next(iter(self.batchers))
+        self._server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """
+        Start listening on host:port, or on a Unix socket if unix_path is given.
+
+        Returns:
+            asyncio.Server: The listening server (port 0 picks a free port)
+        """
+        for batcher in self.batchers.values():
+            batcher.start()
+        if unix_path is not None:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for batcher in self.batchers.values():
+            await batcher.stop()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    message = await read_http_message(reader)
+                except RequestError as e:
+                    self._write_response(writer, e.status, JSON_TYPE, json.dumps({'error': str(e)}).encode(), False)
+                    break
+                if message is None:
+                    break
+                start_line, headers, body = message
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                try:
+                    status, content_type, payload = await self._dispatch(start_line, headers, body)
+                except RequestError as e:
+                    status, content_type, payload = e.status, JSON_TYPE, json.dumps({'error': str(e)}).encode()
+                except Exception as e:
+                    status, content_type, payload = 500, JSON_TYPE, json.dumps({'error': str(e)}).encode()
+                self._write_response(writer, status, content_type, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _write_response(writer, status, content_type, payload, keep_alive):
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + payload)
+
+    async def _dispatch(self, start_line, headers, body):
+        parts = start_line.split(' ')
+        if len(parts) != 3:
+            raise RequestError(400, f"Malformed request line: {start_line!r}")
+        method, target = parts[:2]
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        if url.path == '/predict':
+            if method != 'POST':
+                raise RequestError(405, "Use POST for /predict")
+            content_type = headers.get('content-type', JSON_TYPE).split(';')[0].strip()
+            if content_type == ARROW_STREAM_TYPE:
+                return await self._predict_arrow(query, body)
+            if content_type == JSON_TYPE:
+                return await self._predict_json(query, body)
+            raise RequestError(415, f"Unsupported content type: {content_type}")
+        if url.path == '/health' and method == 'GET':
+            models = [batcher.model.describe() for batcher in self.batchers.values()]
+            return 200, JSON_TYPE, json.dumps({'status': 'ok', 'models': models}).encode()
+        if url.path == '/stats' and method == 'GET':
+            stats = {model_dir: batcher.stats() for model_dir, batcher in self.batchers.items()}
+            return 200, JSON_TYPE, json.dumps(stats).encode()
+        raise RequestError(404, f"Unknown endpoint: {method} {url.path}")
+
+    def _batcher(self, model_dir):
+        if model_dir is None:
+            return self.batchers[self.default_model_dir]
+        batcher = self.batchers.get(os.path.abspath(model_dir))
+        if batcher is None:
+            raise RequestError(404, f"Model not served: {model_dir}")
+        return batcher
+
+    @staticmethod
+    def _check_shape(X, model):
+        if X.ndim != 2 or X.shape[1] != model.plan.input_size:
+            raise RequestError(400, f"Expected rows of {model.plan.input_size} features, got shape {X.shape}")
+        return X
+
+    async def _predict_json(self, query, body):
+        try:
+            request = json.loads(body)
+            rows = request['rows']
+        except (ValueError, TypeError, KeyError) as e:
+            raise RequestError(400, f"Expected a JSON object with 'rows': {e}")
+        batcher = self._batcher(request.get('model_dir', query.get('model_dir')))
+        model = batcher.model
+        if not rows:
+            return 200, JSON_TYPE, b'{"predictions": []}'
+        if isinstance(rows[0], dict):
+            if model.x_features is None:
+                raise RequestError(400, "Model has no feature names; send rows as lists")
+            try:
+                rows = [[row[name] for name in model.x_features] for row in rows]
+            except KeyError as e:
+                raise RequestError(400, f"Missing feature: {e}")
+        try:
+            X = np.asarray(rows, dtype=model.dtype).reshape(len(rows), -1)
+        except (ValueError, TypeError) as e:
+            raise RequestError(400, f"Rows must be numeric: {e}")
+        predictions = await batcher.predict(self._check_shape(X, model))
+        return 200, JSON_TYPE, json.dumps({'predictions': predictions.tolist()}).encode()
+
+    async def _predict_arrow(self, query, body):
+        if not PYARROW_AVAILABLE:
+            raise RequestError(415, "pyarrow is not installed on the server")
+        batcher = self._batcher(query.get('model_dir'))
+        model = batcher.model
+        try:
+            table = pa.ipc.open_stream(body).read_all()
+        except (pa.ArrowInvalid, OSError) as e:
+            raise RequestError(400, f"Invalid Arrow stream: {e}")
+        # Named feature columns are picked out; otherwise columns are taken in order
+        names = model.x_features if model.x_features and set(model.x_features) <= set(table.column_names) else table.column_names
+        X = np.empty((table.num_rows, len(names)), dtype=model.dtype)
+        for i, name in enumerate(names):
+            X[:, i] = table.column(name).to_numpy()
+        predictions = await batcher.predict(self._check_shape(X, model))
+        return 200, ARROW_STREAM_TYPE, encode_arrow({'predicted': predictions})
+
+
+async def serve(model_dirs, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None, **kwargs):
+    """Run a PredictionServer until cancelled."""
+    server = PredictionServer(model_dirs, **kwargs)
+    listener = await server.start(host, port, unix_path)
+    where = unix_path or '{}:{}'.format(*listener.sockets[0].getsockname()[:2])
+    print(f"Serving {len(server.batchers)} model(s) on {where}")
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve predictions from warm models over HTTP.')
+    parser.add_argument('--model_dir', action='append', required=True,
+                        help='Model directory to serve (repeat for several; the first is the default)')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST, help='Address to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='TCP port to listen on')
+    parser.add_argument('--unix', type=str, help='Listen on this Unix socket instead of TCP')
+    parser.add_argument('--max_batch_rows', type=int, default=MAX_BATCH_ROWS,
+                        help='Rows at which a micro-batch is scored without waiting')
+    parser.add_argument('--max_delay_ms', type=float, default=MAX_DELAY_MS,
+                        help='Longest a request waits for others to join its micro-batch')
+    parser.add_argument('--plan_dtype', choices=['float64', 'float32'], default='float64',
+                        help='Precision of the compiled inference plans')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.model_dir, args.host, args.port, args.unix,
+                          max_batch_rows=args.max_batch_rows, max_delay_ms=args.max_delay_ms,
+                          dtype=np.dtype(args.plan_dtype)))
+    except KeyboardInterrupt:
+        print("Server stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ Key Features:
 - Early stopping to prevent overfitting
 - Data normalization
 - Model weight saving/loading with timestamps
+- Stacked multi-model training (StockNetBatch) for hyperparameter sweeps
 - Performance visualization and analysis
 
 Usage:
@@ -31,32 +32,39 @@ import numpy as np
 import os
 import glob
 from datetime import datetime
+from weight_history import WeightHistoryWriter
+from telemetry import stdout_telemetry
+from feature_store import block_rows_for_budget, iter_blocks
+from indicators import compute_indicators, compute_rsi
+from feature_cache import load_features
+from columnar_cache import read_csv_cached
+from dataset_loader import load_directory
 import matplotlib.pyplot as plt
 import argparse
 import json
 
-def sigmoid(x):
+def sigmoid(x, out=None):
     """
     Numerically stable sigmoid activation function.
     
-    This implementation handles positive and negative inputs separately to prevent overflow.
-    For positive inputs: 1 / (1 + exp(-x))
-    For negative inputs: exp(x) / (1 + exp(x))
+    Uses the identity sigmoid(x) = 0.5 * tanh(x / 2) + 0.5, which is bounded for
+    every input, so no overflow handling or positive/negative masks are needed.
+    Every step is an in-place ufunc, so when ``out`` is supplied no temporary
+    arrays are allocated.
     
     Args:
         x (numpy.ndarray): Input array of any shape
+        out (numpy.ndarray, optional): Preallocated array to write the result into.
+            May be ``x`` itself.
         
     Returns:
         numpy.ndarray: Sigmoid activation of the input, same shape as x
     """
-    mask = x >= 0
-    pos = np.zeros_like(x)
-    neg = np.zeros_like(x)
-    
-    pos[mask] = 1 / (1 + np.exp(-x[mask]))
-    neg[~mask] = np.exp(x[~mask]) / (1 + np.exp(x[~mask]))
-    
-    return pos + neg
+    out = np.multiply(x, 0.5, out=out)
+    np.tanh(out, out=out)
+    out *= 0.5
+    out += 0.5
+    return out
 
 def sigmoid_derivative(x):
     """
@@ -101,139 +109,84 @@ def relu_derivative(x):
     """
     return np.where(x > 0, 1, 0)
 
-def compute_rsi(prices, period=14):
-    """
-    Compute Relative Strength Index (RSI) for a price series.
-    
-    RSI = 100 - (100 / (1 + RS))
-    where RS = Average Gain / Average Loss
-    
-    Args:
-        prices (pandas.Series): Price series
-        period (int): Period for RSI calculation (default: 14)
-        
-    Returns:
-        pandas.Series: RSI values
-    """
-    # Calculate price changes
-    delta = prices.diff()
-    
-    # Separate gains and losses
-    gains = delta.where(delta > 0, 0)
-    losses = -delta.where(delta < 0, 0)
-    
-    # Calculate average gains and losses using exponential moving average
-    avg_gains = gains.ewm(span=period, adjust=False).mean()
-    avg_losses = losses.ewm(span=period, adjust=False).mean()
-    
-    # Calculate RS and RSI
-    rs = avg_gains / avg_losses
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
-
-def add_technical_indicators(df):
+def add_technical_indicators(df, columns=None):
     """
     Add technical indicators to the dataframe.
     
     Args:
         df (pandas.DataFrame): DataFrame with OHLCV data
+        columns (list): Columns the caller needs; only the indicators among
+            them (and what they depend on) are computed. None adds all.
         
     Returns:
         pandas.DataFrame: DataFrame with added technical indicators
     """
-    # Make a copy to avoid modifying original
-    df_enhanced = df.copy()
-    
-    # Basic moving averages
-    df_enhanced['ma_5'] = df_enhanced['close'].rolling(window=5).mean()
-    df_enhanced['ma_10'] = df_enhanced['close'].rolling(window=10).mean()
-    df_enhanced['ma_20'] = df_enhanced['close'].rolling(window=20).mean()
-    df_enhanced['ma_50'] = df_enhanced['close'].rolling(window=50).mean()
-    
-    # Exponential moving averages
-    df_enhanced['ema_12'] = df_enhanced['close'].ewm(span=12).mean()
-    df_enhanced['ema_26'] = df_enhanced['close'].ewm(span=26).mean()
-    
-    # RSI
-    df_enhanced['rsi'] = compute_rsi(df_enhanced['close'], 14)
-    
-    # Price changes and returns
-    df_enhanced['price_change'] = df_enhanced['close'].pct_change()
-    df_enhanced['price_change_5'] = df_enhanced['close'].pct_change(periods=5)
-    df_enhanced['price_change_10'] = df_enhanced['close'].pct_change(periods=10)
-    
-    # Volatility measures
-    df_enhanced['volatility_10'] = df_enhanced['close'].rolling(window=10).std()
-    df_enhanced['volatility_20'] = df_enhanced['close'].rolling(window=20).std()
-    
-    # Bollinger Bands
-    df_enhanced['bb_middle'] = df_enhanced['close'].rolling(window=20).mean()
-    bb_std = df_enhanced['close'].rolling(window=20).std()
-    df_enhanced['bb_upper'] = df_enhanced['bb_middle'] + (bb_std * 2)
-    df_enhanced['bb_lower'] = df_enhanced['bb_middle'] - (bb_std * 2)
-    df_enhanced['bb_width'] = (df_enhanced['bb_upper'] - df_enhanced['bb_lower']) / df_enhanced['bb_middle']
-    df_enhanced['bb_position'] = (df_enhanced['close'] - df_enhanced['bb_lower']) / (df_enhanced['bb_upper'] - df_enhanced['bb_lower'])
-    
-    # MACD
-    exp1 = df_enhanced['close'].ewm(span=12).mean()
-    exp2 = df_enhanced['close'].ewm(span=26).mean()
-    df_enhanced['macd'] = exp1 - exp2
-    df_enhanced['macd_signal'] = df_enhanced['macd'].ewm(span=9).mean()
-    df_enhanced['macd_histogram'] = df_enhanced['macd'] - df_enhanced['macd_signal']
-    
-    # Stochastic Oscillator
-    low_min = df_enhanced['low'].rolling(window=14).min()
-    high_max = df_enhanced['high'].rolling(window=14).max()
-    df_enhanced['stoch_k'] = 100 * (df_enhanced['close'] - low_min) / (high_max - low_min)
-    df_enhanced['stoch_d'] = df_enhanced['stoch_k'].rolling(window=3).mean()
-    
-    # Williams %R
-    df_enhanced['williams_r'] = -100 * (high_max - df_enhanced['close']) / (high_max - low_min)
-    
-    # Volume indicators
-    df_enhanced['volume_ma'] = df_enhanced['vol'].rolling(window=10).mean()
-    df_enhanced['volume_ratio'] = df_enhanced['vol'] / df_enhanced['volume_ma']
-    df_enhanced['volume_sma_ratio'] = df_enhanced['vol'] / df_enhanced['vol'].rolling(window=20).mean()
-    
-    # Price momentum
-    df_enhanced['momentum_5'] = df_enhanced['close'] - df_enhanced['close'].shift(5)
-    df_enhanced['momentum_10'] = df_enhanced['close'] - df_enhanced['close'].shift(10)
-    
-    # Rate of change
-    df_enhanced['roc_5'] = ((df_enhanced['close'] - df_enhanced['close'].shift(5)) / df_enhanced['close'].shift(5)) * 100
-    df_enhanced['roc_10'] = ((df_enhanced['close'] - df_enhanced['close'].shift(10)) / df_enhanced['close'].shift(10)) * 100
-    
-    # Average True Range (ATR)
-    high_low = df_enhanced['high'] - df_enhanced['low']
-    high_close = np.abs(df_enhanced['high'] - df_enhanced['close'].shift())
-    low_close = np.abs(df_enhanced['low'] - df_enhanced['close'].shift())
-    true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-    df_enhanced['atr'] = true_range.rolling(window=14).mean()
-    
-    # Commodity Channel Index (CCI)
-    typical_price = (df_enhanced['high'] + df_enhanced['low'] + df_enhanced['close']) / 3
-    sma_tp = typical_price.rolling(window=20).mean()
-    mad = typical_price.rolling(window=20).apply(lambda x: np.mean(np.abs(x - x.mean())))
-    df_enhanced['cci'] = (typical_price - sma_tp) / (0.015 * mad)
-    
-    # Money Flow Index (MFI)
-    typical_price = (df_enhanced['high'] + df_enhanced['low'] + df_enhanced['close']) / 3
-    money_flow = typical_price * df_enhanced['vol']
-    
-    positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0).rolling(window=14).sum()
-    negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0).rolling(window=14).sum()
-    
-    mfi_ratio = positive_flow / negative_flow
-    df_enhanced['mfi'] = 100 - (100 / (1 + mfi_ratio))
-    
-    # Support and Resistance levels (simplified)
-    df_enhanced['support_20'] = df_enhanced['low'].rolling(window=20).min()
-    df_enhanced['resistance_20'] = df_enhanced['high'].rolling(window=20).max()
-    df_enhanced['price_to_support'] = (df_enhanced['close'] - df_enhanced['support_20']) / df_enhanced['support_20']
-    df_enhanced['price_to_resistance'] = (df_enhanced['resistance_20'] - df_enhanced['close']) / df_enhanced['close']
-    
-    return df_enhanced
+    return compute_indicators(df, columns=columns)
+
+class TrainingWorkspace:
+    """
+    Preallocated buffers for one mini-batch shape of a StockNet.
+
+    All per-batch intermediates (gathered batch, hidden activations, output,
+    errors, deltas), the gradients and the Adam temporaries are allocated once
+    here and reused for every mini-batch, so the training loop does not hit the
+    allocator at all. A final partial batch uses leading-row views of the same
+    buffers, which stay C-contiguous and are therefore valid ``out=`` targets.
+
+    The model's parameters, Adam moments and the gradients are packed into flat
+    vectors and the model attributes (W1, m_W1, ...) are rebound to views into
+    them, so the Adam update runs as a handful of whole-vector ufunc calls
+    instead of one set per parameter.
+    """
+
+    PARAM_NAMES = ('W1', 'b1', 'W2', 'b2')
+
+    def __init__(self, model, batch_size, x_dtype=np.float64, y_dtype=np.float64):
+        """
+        Allocate buffers sized for ``model`` and ``batch_size``.
+
+        Args:
+            model (StockNet): Network whose parameter shapes define the buffers
+            batch_size (int): Largest mini-batch the workspace must hold
+            x_dtype (numpy.dtype): Dtype of the training features
+            y_dtype (numpy.dtype): Dtype of the training targets
+        """
+        input_size, hidden_size = model.W1.shape
+        output_size = model.W2.shape[1]
+
+        self.batch_size = batch_size
+
+        # Per-batch intermediates
+        self.X = np.empty((batch_size, input_size), dtype=x_dtype)
+        self.y = np.empty((batch_size, output_size), dtype=y_dtype)
+        self.a1 = np.empty((batch_size, hidden_size))
+        self.output = np.empty((batch_size, output_size))
+        self.error = np.empty((batch_size, output_size))
+        self.delta2 = np.empty((batch_size, output_size))
+        self.delta1 = np.empty((batch_size, hidden_size))
+        self.hidden_tmp = np.empty((batch_size, hidden_size))
+
+        # Flat parameter, moment and gradient vectors
+        shapes = [getattr(model, name).shape for name in self.PARAM_NAMES]
+        sizes = [int(np.prod(shape)) for shape in shapes]
+        total = sum(sizes)
+        self.params = np.empty(total)
+        self.m = np.empty(total)
+        self.v = np.empty(total)
+        self.grad = np.empty(total)
+        self.tmp = np.empty(total)
+        self.step = np.empty(total)
+
+        self.grads = {}
+        offset = 0
+        for name, shape, size in zip(self.PARAM_NAMES, shapes, sizes):
+            section = slice(offset, offset + size)
+            for flat, prefix in ((self.params, ''), (self.m, 'm_'), (self.v, 'v_')):
+                view = flat[section].reshape(shape)
+                view[...] = getattr(model, prefix + name)
+                setattr(model, prefix + name, view)
+            self.grads[name] = self.grad[section].reshape(shape)
+            offset += size
 
 class StockNet:
     """
@@ -344,27 +297,30 @@ class StockNet:
             return Y_norm * (self.Y_max - self.Y_min) + self.Y_min
         return Y_norm
 
-    def save_weights(self, model_dir, prefix="stock_model"):
+    def save_weights(self, model_dir, prefix="stock_model", writer=None):
         """
         Save model weights and parameters to NPZ file.
         
         Args:
             model_dir (str): Directory to save the model
             prefix (str): Prefix for the saved files
+            writer (ArtifactWriter): Optional background writer; the weights
+                are snapshotted now and written asynchronously
         """
         os.makedirs(model_dir, exist_ok=True)
         
         # Save weights and normalization parameters
-        np.savez(os.path.join(model_dir, f'{prefix}.npz'),
-                 W1=self.W1, b1=self.b1,
-                 W2=self.W2, b2=self.b2,
-                 X_min=self.X_min,
-                 X_max=self.X_max,
-                 Y_min=self.Y_min,
-                 Y_max=self.Y_max,
-                 has_target_norm=self.has_target_norm,
-                 input_size=self.W1.shape[0],
-                 hidden_size=self.W1.shape[1])
+        save = writer.savez if writer is not None else np.savez
+        save(os.path.join(model_dir, f'{prefix}.npz'),
+             W1=self.W1, b1=self.b1,
+             W2=self.W2, b2=self.b2,
+             X_min=self.X_min,
+             X_max=self.X_max,
+             Y_min=self.Y_min,
+             Y_max=self.Y_max,
+             has_target_norm=self.has_target_norm,
+             input_size=self.W1.shape[0],
+             hidden_size=self.W1.shape[1])
 
     @classmethod
     def load_weights(cls, model_dir, prefix="stock_model"):
@@ -383,21 +339,35 @@ class StockNet:
             raise FileNotFoundError(f"No model weights found in {model_dir}")
             
         with np.load(weights_file) as data:
-            model = cls(input_size=int(data['input_size']), hidden_size=int(data['hidden_size']))
-            model.W1 = data['W1']
-            model.b1 = data['b1']
-            model.W2 = data['W2']
-            model.b2 = data['b2']
-            
-            # Validate weight shapes for consistency
-            if model.W1.shape[1] != model.b1.shape[1] or model.W2.shape[0] != model.W1.shape[1]:
-                raise ValueError("Inconsistent weight shapes in model")
+            return cls.from_arrays(data)
+
+    @classmethod
+    def from_arrays(cls, data):
+        """
+        Build a model from the arrays of a saved weights file.
+        
+        Args:
+            data (Mapping): Arrays as written by save_weights (an open NPZ file
+                or model_registry.LoadedModel.arrays)
             
-            model.X_min = data['X_min']
-            model.X_max = data['X_max']
-            model.Y_min = data['Y_min']
-            model.Y_max = data['Y_max']
-            model.has_target_norm = bool(data['has_target_norm'])
+        Returns:
+            StockNet: Initialized model with the given weights
+        """
+        model = cls(input_size=int(data['input_size']), hidden_size=int(data['hidden_size']))
+        model.W1 = data['W1']
+        model.b1 = data['b1']
+        model.W2 = data['W2']
+        model.b2 = data['b2']
+        
+        # Validate weight shapes for consistency
+        if model.W1.shape[1] != model.b1.shape[1] or model.W2.shape[0] != model.W1.shape[1]:
+            raise ValueError("Inconsistent weight shapes in model")
+        
+        model.X_min = data['X_min']
+        model.X_max = data['X_max']
+        model.Y_min = data['Y_min']
+        model.Y_max = data['Y_max']
+        model.has_target_norm = bool(data['has_target_norm'])
         
         return model
 
@@ -476,7 +446,105 @@ class StockNet:
         self.W2 += learning_rate * m_W2_corrected / (np.sqrt(v_W2_corrected) + self.epsilon)
         self.b2 += learning_rate * m_b2_corrected / (np.sqrt(v_b2_corrected) + self.epsilon)
 
-    def train(self, X, y, X_val=None, y_val=None, epochs=1000, learning_rate=0.001, batch_size=32, save_history=True, history_interval=50, patience=20, progress_callback=None):
+    def forward_workspace(self, X, workspace):
+        """
+        Forward pass writing every intermediate into a preallocated workspace.
+
+        Args:
+            X (numpy.ndarray): Input batch of shape (m, n_features), m <= workspace.batch_size
+            workspace (TrainingWorkspace): Buffers to compute into
+
+        Returns:
+            numpy.ndarray: View of the workspace output buffer, shape (m, 1)
+        """
+        m = X.shape[0]
+        a1 = workspace.a1[:m]
+        output = workspace.output[:m]
+
+        np.dot(X, self.W1, out=a1)
+        a1 += self.b1
+        sigmoid(a1, out=a1)
+        np.dot(a1, self.W2, out=output)
+        output += self.b2
+
+        return output
+
+    def backward_workspace(self, X, y, workspace, learning_rate=0.001):
+        """
+        In-place equivalent of :meth:`backward` for a batch computed by
+        :meth:`forward_workspace`.
+
+        Applies the same clipped-error Adam update as :meth:`backward` but writes
+        gradients, moments and bias-corrected temporaries into the workspace
+        buffers, updating all parameters with one pass over the flat vectors.
+
+        Args:
+            X (numpy.ndarray): Input batch of shape (m, n_features)
+            y (numpy.ndarray): Target batch of shape (m, 1)
+            workspace (TrainingWorkspace): Buffers holding the forward pass results
+            learning_rate (float): Learning rate for weight updates
+
+        Returns:
+            float: Mean squared error of the batch before the update
+        """
+        m = X.shape[0]
+        a1 = workspace.a1[:m]
+        error = workspace.error[:m]
+        delta2 = workspace.delta2[:m]
+        delta1 = workspace.delta1[:m]
+        hidden_tmp = workspace.hidden_tmp[:m]
+        grads = workspace.grads
+
+        # Output layer error, clipped to [-1, 1]
+        np.subtract(y, workspace.output[:m], out=error)
+        np.minimum(error, 1.0, out=delta2)
+        np.maximum(delta2, -1.0, out=delta2)
+
+        # Hidden layer error; a1 * (1 - a1) never exceeds 0.25 so only the
+        # lower bound of the sigmoid derivative clip is active
+        np.dot(delta2, self.W2.T, out=delta1)
+        np.subtract(1.0, a1, out=hidden_tmp)
+        hidden_tmp *= a1
+        np.maximum(hidden_tmp, 1e-8, out=hidden_tmp)
+        delta1 *= hidden_tmp
+        np.minimum(delta1, 1.0, out=delta1)
+        np.maximum(delta1, -1.0, out=delta1)
+
+        # Gradients, averaged over the batch in one pass over the flat vector
+        np.dot(a1.T, delta2, out=grads['W2'])
+        np.add.reduce(delta2, axis=0, keepdims=True, out=grads['b2'])
+        np.dot(X.T, delta1, out=grads['W1'])
+        np.add.reduce(delta1, axis=0, keepdims=True, out=grads['b1'])
+        workspace.grad /= m
+
+        # Batch MSE
+        flat_error = error.ravel()
+        batch_mse = np.dot(flat_error, flat_error) / flat_error.size
+
+        # Adam update over all parameters at once
+        self.t += 1
+        grad, tmp, step = workspace.grad, workspace.tmp, workspace.step
+        m_all, v_all = workspace.m, workspace.v
+
+        np.multiply(grad, 1 - self.beta1, out=tmp)
+        m_all *= self.beta1
+        m_all += tmp
+
+        np.square(grad, out=tmp)
+        tmp *= 1 - self.beta2
+        v_all *= self.beta2
+        v_all += tmp
+
+        np.divide(v_all, 1 - self.beta2 ** self.t, out=tmp)
+        np.sqrt(tmp, out=tmp)
+        tmp += self.epsilon
+        np.multiply(m_all, learning_rate / (1 - self.beta1 ** self.t), out=step)
+        step /= tmp
+        workspace.params += step
+
+        return batch_mse
+
+    def train(self, X, y, X_val=None, y_val=None, epochs=1000, learning_rate=0.001, batch_size=32, save_history=True, history_interval=50, patience=20, progress_callback=None, use_workspace=True, telemetry=None, checkpointer=None, resume_state=None):
         """
         Train the neural network using mini-batch gradient descent with early stopping.
         
@@ -493,6 +561,17 @@ class StockNet:
             patience (int): Number of epochs to wait for improvement before early stopping
             progress_callback (callable): Optional callback function for progress updates
                 Should accept (epoch, train_loss, val_loss) as arguments
+            use_workspace (bool): Run mini-batches through a preallocated
+                TrainingWorkspace with in-place updates instead of allocating
+                fresh intermediates for every batch
+            telemetry (TrainingTelemetry): Optional telemetry channel that
+                receives per-epoch loss records; use stdout_telemetry() for
+                the legacy LOSS:/WEIGHTS: stdout lines
+            checkpointer (TrainingCheckpointer): Optional checkpoint policy;
+                saves full training state periodically and when a stop is
+                requested, then ends training early on stop
+            resume_state (dict): Loop state returned by
+                checkpoint.load_checkpoint to continue an interrupted run
             
         Returns:
             tuple: (train_losses, val_losses) containing loss history
@@ -500,22 +579,42 @@ class StockNet:
         n_samples = X.shape[0]
         best_mse = float('inf')
         patience_counter = 0
+        start_epoch = 0
         
         # Initialize loss tracking
         train_losses = []
         val_losses = []
         
-        # Create weights history directory if saving history
+        # Continue an interrupted run with its loop state and shuffle sequence
+        if resume_state is not None:
+            start_epoch = resume_state['epoch']
+            best_mse = resume_state['best_mse']
+            patience_counter = resume_state['patience_counter']
+            train_losses = list(resume_state['train_losses'])
+            val_losses = list(resume_state['val_losses'])
+            np.random.set_state(resume_state['rng_state'])
+            if patience_counter >= patience:
+                start_epoch = epochs  # The interrupted run had already early-stopped
+            print(f"Resuming training at epoch {start_epoch}")
+        
+        # Preallocate the memory-mapped weight history for every snapshot epoch
+        history = None
         if save_history:
-            weights_history_dir = os.path.join(os.getcwd(), "weights_history")
-            os.makedirs(weights_history_dir, exist_ok=True)
+            history = self._history_writer(epochs, history_interval, resume_state)
         
         # Memory management: use smaller batch size if data is large
         if n_samples > 10000:
             batch_size = min(batch_size, 16)  # Reduce batch size for large datasets
             print(f"Large dataset detected ({n_samples} samples), using batch size: {batch_size}")
         
-        for epoch in range(epochs):
+        # Size all per-batch buffers once for the whole run
+        workspace = None
+        if use_workspace:
+            workspace = TrainingWorkspace(self, min(batch_size, n_samples), X.dtype, y.dtype)
+        
+        last_epoch = checkpointed_epoch = start_epoch - 1
+        for epoch in range(start_epoch, epochs):
+            last_epoch = epoch
             # Shuffle data for each epoch
             indices = np.random.permutation(n_samples)
             total_mse = 0
@@ -526,16 +625,24 @@ class StockNet:
                 end_idx = min(start_idx + batch_size, n_samples)
                 batch_indices = indices[start_idx:end_idx]
                 
-                # Get current batch
-                X_batch = X[batch_indices]
-                y_batch = y[batch_indices]
-                
-                # Forward and backward pass
-                output = self.forward(X_batch)
-                self.backward(X_batch, y_batch, output, learning_rate)
-                
-                # Calculate batch MSE
-                batch_mse = np.mean((output - y_batch) ** 2)
+                if workspace is not None:
+                    # Gather the batch into the workspace and update in place
+                    m = end_idx - start_idx
+                    X_batch = np.take(X, batch_indices, axis=0, out=workspace.X[:m])
+                    y_batch = np.take(y, batch_indices, axis=0, out=workspace.y[:m])
+                    self.forward_workspace(X_batch, workspace)
+                    batch_mse = self.backward_workspace(X_batch, y_batch, workspace, learning_rate)
+                else:
+                    # Get current batch
+                    X_batch = X[batch_indices]
+                    y_batch = y[batch_indices]
+                    
+                    # Forward and backward pass
+                    output = self.forward(X_batch)
+                    self.backward(X_batch, y_batch, output, learning_rate)
+                    
+                    # Calculate batch MSE
+                    batch_mse = np.mean((output - y_batch) ** 2)
                 total_mse += batch_mse
                 n_batches += 1
             
@@ -560,11 +667,14 @@ class StockNet:
                 except Exception as e:
                     print(f"Warning: Progress callback failed: {e}")
             
+            # Hand the epoch to telemetry; it decides what to sample and emit
+            if telemetry is not None:
+                telemetry.record_epoch(epoch, avg_mse, current_mse, self)
+            
             # Save weight history less frequently to reduce memory usage
-            if save_history and (epoch % history_interval == 0 or epoch == epochs - 1):
+            if history is not None and (epoch % history_interval == 0 or epoch == epochs - 1):
                 try:
-                    history_file = os.path.join(weights_history_dir, f"weights_history_{epoch:04d}.npz")
-                    np.savez(history_file, W1=self.W1, W2=self.W2)
+                    history.append(epoch, W1=self.W1, W2=self.W2)
                 except Exception as e:
                     print(f"Warning: Could not save weight history at epoch {epoch}: {e}")
             
@@ -575,19 +685,20 @@ class StockNet:
             else:
                 patience_counter += 1
                 
+            if checkpointer is not None:
+                stopping = checkpointer.stop_requested
+                if stopping or checkpointer.should_save(epoch):
+                    checkpointer.save(self, {'epoch': epoch + 1, 'best_mse': best_mse,
+                                             'patience_counter': patience_counter,
+                                             'train_losses': train_losses, 'val_losses': val_losses})
+                    checkpointed_epoch = epoch
+                if stopping:
+                    print(f"Training stopped at epoch {epoch}, checkpoint saved to {checkpointer.path}")
+                    break
+            
             if patience_counter >= patience:
                 print(f"Early stopping at epoch {epoch}")
                 break
-                
-            # Print progress for live plotting
-            # Output format: LOSS:epoch,loss_value
-            print(f"LOSS:{epoch},{avg_mse:.6f}")
-            
-            # Output weight values for gradient descent visualization
-            # Format: WEIGHTS:epoch,w1_avg,w2_avg
-            w1_avg = np.mean(self.W1)
-            w2_avg = np.mean(self.W2)
-            print(f"WEIGHTS:{epoch},{w1_avg:.6f},{w2_avg:.6f}")
             
             # Also print detailed progress every 10 epochs
             if epoch % 10 == 0:
@@ -596,18 +707,591 @@ class StockNet:
                 else:
                     print(f"Epoch {epoch}, MSE: {avg_mse:.6f}")
         
+        # With periodic checkpoints on, leave one matching the final weights
+        # so the run can be extended with --resume or warm-started by partial_fit
+        if checkpointer is not None and checkpointer.every > 0 and last_epoch != checkpointed_epoch:
+            checkpointer.save(self, {'epoch': last_epoch + 1, 'best_mse': best_mse,
+                                     'patience_counter': patience_counter,
+                                     'train_losses': train_losses, 'val_losses': val_losses})
+        
+        if history is not None:
+            history.close()
+        if telemetry is not None:
+            telemetry.flush()
+        
         # Force garbage collection after training
         import gc
         gc.collect()
         
         return train_losses, val_losses
 
-def load_data_from_directory(directory_path):
+    def _history_writer(self, epochs, history_interval, resume_state=None):
+        """
+        Open the weight history store for a training run in ./weights_history.
+        
+        A resumed run keeps the snapshots taken before its checkpoint, read
+        from resume_state['history_dir'] if given (train_model points it at
+        the model's saved history) or from ./weights_history otherwise.
+        """
+        weights_history_dir = os.path.join(os.getcwd(), "weights_history")
+        n_snapshots = (epochs + history_interval - 1) // history_interval + 1
+        continue_from = before_epoch = None
+        if resume_state is not None:
+            continue_from = resume_state.get('history_dir', weights_history_dir)
+            before_epoch = resume_state['epoch']
+        return WeightHistoryWriter(weights_history_dir, {'W1': self.W1, 'W2': self.W2},
+                                   capacity=n_snapshots, continue_from=continue_from,
+                                   before_epoch=before_epoch)
+
+    def train_streaming(self, store, epochs=1000, learning_rate=0.001, batch_size=32, validation_split=0.2,
+                        memory_budget_mb=256, save_history=True, history_interval=50, patience=20,
+                        progress_callback=None, telemetry=None, checkpointer=None, resume_state=None):
+        """
+        Train out of core from a memory-mapped FeatureStore.
+        
+        Rows are read in contiguous blocks sized to fit memory_budget_mb.
+        Each epoch visits the blocks in random order and shuffles rows within
+        each block (block shuffling), normalizing every block in place with
+        the store's streamed min/max statistics. The last validation_split
+        fraction of rows is held out for validation. Peak memory is bounded by
+        the block buffers, not by the dataset size.
+        
+        Args:
+            store (FeatureStore): Materialized features and target
+            epochs (int): Maximum number of training epochs
+            learning_rate (float): Learning rate for weight updates
+            batch_size (int): Size of mini-batches for training
+            validation_split (float): Fraction of trailing rows held out
+            memory_budget_mb (float): Budget for the block buffers in megabytes
+            save_history (bool): Whether to save weight history for visualization
+            history_interval (int): How often to save weight history (every N epochs)
+            patience (int): Number of epochs to wait for improvement before early stopping
+            progress_callback (callable): Optional callback accepting
+                (epoch, train_loss, val_loss)
+            telemetry (TrainingTelemetry): Optional per-epoch telemetry channel
+            checkpointer (TrainingCheckpointer): Optional checkpoint policy, as
+                in train()
+            resume_state (dict): Loop state returned by
+                checkpoint.load_checkpoint to continue an interrupted run
+            
+        Returns:
+            tuple: (train_losses, val_losses) containing loss history
+        """
+        # Normalization statistics come from the store, not from a full pass in RAM
+        if self.X_min is None or self.X_max is None:
+            self.X_min = store.X_min
+            self.X_max = store.X_max
+            self.Y_min = store.Y_min
+            self.Y_max = store.Y_max
+            self.has_target_norm = True
+        X_scale = 1.0 / (self.X_max - self.X_min)
+        Y_scale = 1.0 / (self.Y_max - self.Y_min + 1e-8)
+        
+        (train_lo, train_hi), (val_lo, val_hi) = store.split(validation_split)
+        if train_hi <= train_lo:
+            raise ValueError("No training rows left after the validation split")
+        block_rows = min(block_rows_for_budget(store.n_features, memory_budget_mb, batch_size),
+                         max(train_hi - train_lo, val_hi - val_lo))
+        print(f"Streaming {train_hi - train_lo} training rows in blocks of {block_rows}")
+        
+        # The only per-run buffers: one normalized block and one mini-batch workspace
+        X_block = np.empty((block_rows, store.n_features))
+        y_block = np.empty((block_rows, 1))
+        workspace = TrainingWorkspace(self, min(batch_size, block_rows))
+        
+        def load_block(lo, hi):
+            m = hi - lo
+            Xb = np.subtract(store.X[lo:hi], self.X_min, out=X_block[:m])
+            Xb *= X_scale
+            yb = np.subtract(store.y[lo:hi], self.Y_min, out=y_block[:m])
+            yb *= Y_scale
+            return Xb, yb
+        
+        best_mse = float('inf')
+        patience_counter = 0
+        start_epoch = 0
+        train_losses = []
+        val_losses = []
+        
+        # Continue an interrupted run with its loop state and block order
+        if resume_state is not None:
+            start_epoch = resume_state['epoch']
+            best_mse = resume_state['best_mse']
+            patience_counter = resume_state['patience_counter']
+            train_losses = list(resume_state['train_losses'])
+            val_losses = list(resume_state['val_losses'])
+            np.random.set_state(resume_state['rng_state'])
+            if patience_counter >= patience:
+                start_epoch = epochs  # The interrupted run had already early-stopped
+            print(f"Resuming training at epoch {start_epoch}")
+        
+        history = None
+        if save_history:
+            history = self._history_writer(epochs, history_interval, resume_state)
+        
+        last_epoch = checkpointed_epoch = start_epoch - 1
+        for epoch in range(start_epoch, epochs):
+            last_epoch = epoch
+            total_mse = 0
+            n_batches = 0
+            for lo, hi in iter_blocks(train_lo, train_hi, block_rows, shuffle=True):
+                Xb, yb = load_block(lo, hi)
+                indices = np.random.permutation(hi - lo)
+                for start_idx in range(0, hi - lo, batch_size):
+                    batch_indices = indices[start_idx:start_idx + batch_size]
+                    m = len(batch_indices)
+                    X_batch = np.take(Xb, batch_indices, axis=0, out=workspace.X[:m])
+                    y_batch = np.take(yb, batch_indices, axis=0, out=workspace.y[:m])
+                    self.forward_workspace(X_batch, workspace)
+                    total_mse += self.backward_workspace(X_batch, y_batch, workspace, learning_rate)
+                    n_batches += 1
+            avg_mse = total_mse / n_batches
+            train_losses.append(avg_mse)
+            
+            # Validation loss accumulated block by block
+            if val_hi > val_lo:
+                sse = 0.0
+                for lo, hi in iter_blocks(val_lo, val_hi, block_rows):
+                    Xb, yb = load_block(lo, hi)
+                    sse += float(np.sum((self.forward(Xb) - yb) ** 2))
+                current_mse = sse / (val_hi - val_lo)
+            else:
+                current_mse = avg_mse
+            val_losses.append(current_mse)
+            
+            if progress_callback:
+                try:
+                    progress_callback(epoch, avg_mse, current_mse)
+                except Exception as e:
+                    print(f"Warning: Progress callback failed: {e}")
+            if telemetry is not None:
+                telemetry.record_epoch(epoch, avg_mse, current_mse, self)
+            
+            if history is not None and (epoch % history_interval == 0 or epoch == epochs - 1):
+                try:
+                    history.append(epoch, W1=self.W1, W2=self.W2)
+                except Exception as e:
+                    print(f"Warning: Could not save weight history at epoch {epoch}: {e}")
+            
+            # Early stopping check
+            if current_mse < best_mse:
+                best_mse = current_mse
+                patience_counter = 0
+            else:
+                patience_counter += 1
+            
+            if checkpointer is not None:
+                stopping = checkpointer.stop_requested
+                if stopping or checkpointer.should_save(epoch):
+                    checkpointer.save(self, {'epoch': epoch + 1, 'best_mse': best_mse,
+                                             'patience_counter': patience_counter,
+                                             'train_losses': train_losses, 'val_losses': val_losses})
+                    checkpointed_epoch = epoch
+                if stopping:
+                    print(f"Training stopped at epoch {epoch}, checkpoint saved to {checkpointer.path}")
+                    break
+            
+            if patience_counter >= patience:
+                print(f"Early stopping at epoch {epoch}")
+                break
+            
+            if epoch % 10 == 0:
+                print(f"Epoch {epoch}, Train MSE: {avg_mse:.6f}, Val MSE: {current_mse:.6f}")
+        
+        if checkpointer is not None and checkpointer.every > 0 and last_epoch != checkpointed_epoch:
+            checkpointer.save(self, {'epoch': last_epoch + 1, 'best_mse': best_mse,
+                                     'patience_counter': patience_counter,
+                                     'train_losses': train_losses, 'val_losses': val_losses})
+        
+        if history is not None:
+            history.close()
+        if telemetry is not None:
+            telemetry.flush()
+        
+        return train_losses, val_losses
+
+    def rescale_normalization(self, X_min=None, X_max=None, Y_min=None, Y_max=None):
+        """
+        Move the normalization bounds without changing the model's predictions.
+        
+        The first layer absorbs the change of input scaling (W1 rows are scaled,
+        b1 is shifted) and, because the output layer is linear, the last layer
+        absorbs the change of target scaling. Adam moments no longer match the
+        rewritten parameters, so they are reset.
+        
+        Args:
+            X_min (numpy.ndarray): New per-feature minimum (None keeps the current one)
+            X_max (numpy.ndarray): New per-feature maximum (None keeps the current one)
+            Y_min (float): New target minimum (None keeps the current one)
+            Y_max (float): New target maximum (None keeps the current one)
+        """
+        old_range = self.X_max - self.X_min
+        new_min = self.X_min if X_min is None else np.asarray(X_min, dtype=np.float64)
+        new_max = self.X_max if X_max is None else np.asarray(X_max, dtype=np.float64)
+        # x_old = x_new * scale + offset, so x_old @ W1 + b1 == x_new @ W1' + b1'
+        scale = (new_max - new_min) / old_range
+        offset = (new_min - self.X_min) / old_range
+        self.b1 = self.b1 + offset @ self.W1
+        self.W1 = self.W1 * scale[:, None]
+        self.X_min, self.X_max = new_min, new_max
+        
+        if self.has_target_norm and (Y_min is not None or Y_max is not None):
+            new_y_min = self.Y_min if Y_min is None else float(Y_min)
+            new_y_max = self.Y_max if Y_max is None else float(Y_max)
+            y_range = self.Y_max - self.Y_min
+            y_scale = (new_y_max - new_y_min) / y_range
+            y_offset = (new_y_min - self.Y_min) / y_range
+            # y_old = y_new * y_scale + y_offset, solved for the new output layer
+            self.W2 = self.W2 / y_scale
+            self.b2 = (self.b2 - y_offset) / y_scale
+            self.Y_min, self.Y_max = new_y_min, new_y_max
+        
+        for name in ('W1', 'b1', 'W2', 'b2'):
+            setattr(self, 'm_' + name, np.zeros_like(getattr(self, name)))
+            setattr(self, 'v_' + name, np.zeros_like(getattr(self, name)))
+        self.t = 0
+
+    def partial_fit(self, X_new, y_new, epochs=5, learning_rate=0.001, batch_size=32, rescale=False,
+                    use_workspace=True):
+        """
+        Update a trained model on newly arrived rows.
+        
+        Training continues from the current weights and Adam state. Inputs are
+        normalized with the frozen bounds from the original fit; with
+        rescale=True, bounds are first widened to cover the new rows (see
+        rescale_normalization) so drifting prices are not pushed outside the
+        range the network was trained on.
+        
+        Args:
+            X_new (numpy.ndarray): New raw (unnormalized) feature rows
+            y_new (numpy.ndarray): New raw target values
+            epochs (int): Passes over the new rows
+            learning_rate (float): Learning rate for weight updates
+            batch_size (int): Size of mini-batches
+            rescale (bool): Widen normalization bounds to cover the new rows
+            use_workspace (bool): Use the preallocated training workspace
+            
+        Returns:
+            list: Training loss for each epoch
+        """
+        if self.X_min is None or not self.has_target_norm:
+            raise ValueError("partial_fit requires a fitted model with normalization bounds")
+        X_new = np.asarray(X_new, dtype=np.float64)
+        y_new = np.asarray(y_new, dtype=np.float64).reshape(-1, 1)
+        
+        if rescale:
+            X_min = np.minimum(self.X_min, X_new.min(axis=0))
+            X_max = np.maximum(self.X_max, X_new.max(axis=0))
+            Y_min = min(self.Y_min, float(y_new.min()))
+            Y_max = max(self.Y_max, float(y_new.max()))
+            if (np.any(X_min != self.X_min) or np.any(X_max != self.X_max)
+                    or Y_min != self.Y_min or Y_max != self.Y_max):
+                print("New rows fall outside the normalization bounds, rescaling")
+                self.rescale_normalization(X_min, X_max, Y_min, Y_max)
+        
+        # Bounds are frozen here: normalize() reuses the stored statistics
+        X_norm, y_norm = self.normalize(X_new, y_new)
+        train_losses, _ = self.train(X_norm, y_norm, epochs=epochs, learning_rate=learning_rate,
+                                     batch_size=min(batch_size, len(X_norm)), save_history=False,
+                                     patience=epochs + 1, use_workspace=use_workspace)
+        return train_losses
+
+class StockNetBatch:
+    """
+    K independent StockNet models trained together as one stacked tensor.
+
+    Every model shares the input size but may have its own hidden size, seed and
+    learning rate. Parameters and Adam moments are stored with a leading model
+    axis (W1: (K, F, H), b1: (K, 1, H), W2: (K, H, 1), b2: (K, 1, 1)), and all
+    models see the same shuffled mini-batches, so data loading, shuffling and
+    the Python batch loop are paid once for the whole group.
+
+    Models with a smaller hidden size than the widest one are zero-padded; the
+    padded hidden units have zero outgoing weights and their gradients are
+    masked, so they never influence the output.
+
+    Each model has its own early-stopping counter. A stopped model is frozen in
+    place (its updates are masked out) while the rest keep training.
+    """
+
+    def __init__(self, input_size, hidden_sizes, learning_rates=0.001, seeds=None, output_size=1):
+        """
+        Initialize K models with Xavier/Glorot weights.
+
+        Args:
+            input_size (int): Number of input features shared by all models
+            hidden_sizes (list): Hidden layer size of each model; its length is K
+            learning_rates (float or list): One learning rate, or one per model
+            seeds (list, optional): Random seed per model for weight initialization.
+                If omitted, weights are drawn from the global NumPy RNG.
+            output_size (int): Number of output neurons
+        """
+        self.hidden_sizes = [int(h) for h in hidden_sizes]
+        self.n_models = len(self.hidden_sizes)
+        if self.n_models == 0:
+            raise ValueError("StockNetBatch needs at least one model")
+
+        self.learning_rates = np.broadcast_to(
+            np.asarray(learning_rates, dtype=float), (self.n_models,)).copy()
+        if seeds is not None and len(seeds) != self.n_models:
+            raise ValueError("seeds must have one entry per model")
+        self.seeds = list(seeds) if seeds is not None else None
+
+        K = self.n_models
+        H = max(self.hidden_sizes)
+        self.W1 = np.zeros((K, input_size, H))
+        self.b1 = np.zeros((K, 1, H))
+        self.W2 = np.zeros((K, H, output_size))
+        self.b2 = np.zeros((K, 1, output_size))
+
+        # Mask of real (non-padded) hidden units, applied to W2 gradients
+        self.hidden_mask = np.zeros((K, H, 1))
+
+        for k, hidden_size in enumerate(self.hidden_sizes):
+            rng = np.random.RandomState(seeds[k]) if seeds is not None else np.random
+            self.W1[k, :, :hidden_size] = rng.randn(input_size, hidden_size) * np.sqrt(2.0 / input_size)
+            self.W2[k, :hidden_size, :] = rng.randn(hidden_size, output_size) * np.sqrt(2.0 / hidden_size)
+            self.hidden_mask[k, :hidden_size] = 1.0
+
+        # Adam optimizer parameters (same as StockNet)
+        self.beta1 = 0.9
+        self.beta2 = 0.999
+        self.epsilon = 1e-8
+
+        self.m_W1 = np.zeros_like(self.W1)
+        self.m_b1 = np.zeros_like(self.b1)
+        self.m_W2 = np.zeros_like(self.W2)
+        self.m_b2 = np.zeros_like(self.b2)
+        self.v_W1 = np.zeros_like(self.W1)
+        self.v_b1 = np.zeros_like(self.b1)
+        self.v_W2 = np.zeros_like(self.W2)
+        self.v_b2 = np.zeros_like(self.b2)
+        # Adam step count per model, so models stacked from different
+        # training histories keep their own bias correction
+        self.t = np.zeros(K, dtype=np.int64)
+
+        # Per-model training state
+        self.active = np.ones(K, dtype=bool)
+        self.stopped_epoch = np.full(K, -1)
+
+        # Shared normalization parameters (same semantics as StockNet)
+        self.X_min = None
+        self.X_max = None
+        self.Y_min = None
+        self.Y_max = None
+        self.has_target_norm = False
+
+    # The models are trained on identical data, so normalization is shared
+    normalize = StockNet.normalize
+    denormalize = StockNet.denormalize
+
+    @classmethod
+    def from_models(cls, models, learning_rates=0.001):
+        """
+        Stack existing StockNet models (weights and Adam state) into one batch.
+
+        Args:
+            models (list): StockNet instances with the same input and output size
+            learning_rates (float or list): One learning rate, or one per model
+
+        Returns:
+            StockNetBatch: Batch holding copies of the models' parameters
+        """
+        input_size, _ = models[0].W1.shape
+        output_size = models[0].W2.shape[1]
+        batch = cls(input_size, [m.W1.shape[1] for m in models], learning_rates,
+                    seeds=[0] * len(models), output_size=output_size)
+
+        for k, model in enumerate(models):
+            hidden_size = model.W1.shape[1]
+            for prefix in ('', 'm_', 'v_'):
+                getattr(batch, prefix + 'W1')[k, :, :hidden_size] = getattr(model, prefix + 'W1')
+                getattr(batch, prefix + 'b1')[k, :, :hidden_size] = getattr(model, prefix + 'b1')
+                getattr(batch, prefix + 'W2')[k, :hidden_size, :] = getattr(model, prefix + 'W2')
+                getattr(batch, prefix + 'b2')[k] = getattr(model, prefix + 'b2')
+
+        batch.t = np.array([model.t for model in models], dtype=np.int64)
+        for name in ('X_min', 'X_max', 'Y_min', 'Y_max', 'has_target_norm'):
+            setattr(batch, name, getattr(models[0], name))
+        return batch
+
+    def to_models(self):
+        """
+        Split the batch back into independent StockNet models.
+
+        Returns:
+            list: One StockNet per model, trimmed to its own hidden size and
+            carrying its Adam state and the shared normalization parameters
+        """
+        models = []
+        input_size = self.W1.shape[1]
+        output_size = self.W2.shape[2]
+        for k, hidden_size in enumerate(self.hidden_sizes):
+            model = StockNet(input_size, hidden_size, output_size)
+            for prefix in ('', 'm_', 'v_'):
+                setattr(model, prefix + 'W1', getattr(self, prefix + 'W1')[k, :, :hidden_size].copy())
+                setattr(model, prefix + 'b1', getattr(self, prefix + 'b1')[k, :, :hidden_size].copy())
+                setattr(model, prefix + 'W2', getattr(self, prefix + 'W2')[k, :hidden_size, :].copy())
+                setattr(model, prefix + 'b2', getattr(self, prefix + 'b2')[k].copy())
+            model.t = int(self.t[k])
+            for name in ('X_min', 'X_max', 'Y_min', 'Y_max', 'has_target_norm'):
+                setattr(model, name, getattr(self, name))
+            models.append(model)
+        return models
+
+    def forward(self, X):
+        """
+        Forward pass of all models on the same input.
+
+        Args:
+            X (numpy.ndarray): Input data of shape (n_samples, n_features)
+
+        Returns:
+            numpy.ndarray: Outputs of shape (K, n_samples, output_size)
+        """
+        # (n, F) @ (K, F, H) broadcasts to (K, n, H)
+        self.a1 = sigmoid(np.matmul(X, self.W1) + self.b1)
+        self.output = np.matmul(self.a1, self.W2) + self.b2
+        return self.output
+
+    def backward(self, X, y, output):
+        """
+        Backward pass and Adam update for all active models.
+
+        Uses the same clipped errors and Adam update as StockNet.backward, with
+        each model's own learning rate. Frozen (early-stopped) models are left
+        untouched: their weights, Adam moments and step count do not change.
+
+        Args:
+            X (numpy.ndarray): Input batch of shape (m, n_features)
+            y (numpy.ndarray): Target batch of shape (m, output_size)
+            output (numpy.ndarray): Outputs from forward, shape (K, m, output_size)
+
+        Returns:
+            numpy.ndarray: Batch MSE of each model, shape (K,)
+        """
+        m = X.shape[0]
+
+        error = y - output
+        batch_mse = np.mean(error ** 2, axis=(1, 2))
+
+        delta2 = np.clip(error, -1, 1)
+        delta1 = np.clip(np.matmul(delta2, self.W2.transpose(0, 2, 1)) * sigmoid_derivative(self.a1), -1, 1)
+
+        grads = {
+            'W2': np.matmul(self.a1.transpose(0, 2, 1), delta2) / m * self.hidden_mask,
+            'b2': np.sum(delta2, axis=1, keepdims=True) / m,
+            'W1': np.matmul(X.T, delta1) / m,
+            'b1': np.sum(delta1, axis=1, keepdims=True) / m,
+        }
+
+        # Frozen models keep their step count and moments, so to_models()
+        # returns optimizer state that matches their weights
+        active = self.active.reshape(-1, 1, 1)
+        self.t += self.active
+        # A model frozen before its first step has t == 0; its correction is unused
+        bias_correction1 = np.where(active, 1 - self.beta1 ** self.t.reshape(-1, 1, 1), 1.0)
+        bias_correction2 = np.where(active, 1 - self.beta2 ** self.t.reshape(-1, 1, 1), 1.0)
+
+        # Per-model learning rate, zeroed for frozen models
+        step_size = (self.learning_rates * self.active).reshape(-1, 1, 1)
+
+        for name, grad in grads.items():
+            m_param = getattr(self, 'm_' + name)
+            v_param = getattr(self, 'v_' + name)
+            m_param[...] = np.where(active, self.beta1 * m_param + (1 - self.beta1) * grad, m_param)
+            v_param[...] = np.where(active, self.beta2 * v_param + (1 - self.beta2) * grad ** 2, v_param)
+
+            param = getattr(self, name)
+            param += step_size * (m_param / bias_correction1) / (np.sqrt(v_param / bias_correction2) + self.epsilon)
+
+        return batch_mse
+
+    def train(self, X, y, X_val=None, y_val=None, epochs=1000, batch_size=32, patience=20, progress_callback=None):
+        """
+        Train all models on shared mini-batches with per-model early stopping.
+
+        Args:
+            X (numpy.ndarray): Training data
+            y (numpy.ndarray): Target values of shape (n_samples, output_size)
+            X_val (numpy.ndarray): Validation data (optional)
+            y_val (numpy.ndarray): Validation target values (optional)
+            epochs (int): Maximum number of training epochs
+            batch_size (int): Size of mini-batches for training
+            patience (int): Epochs without improvement before a model is frozen
+            progress_callback (callable): Optional callback called after every
+                epoch with (epoch, train_losses, val_losses), each of shape (K,)
+
+        Returns:
+            tuple: (train_losses, val_losses) arrays of shape (n_epochs_run, K).
+            Entries after a model stopped are NaN.
+        """
+        n_samples = X.shape[0]
+        has_val = X_val is not None and y_val is not None
+        best_mse = np.full(self.n_models, np.inf)
+        patience_counter = np.zeros(self.n_models, dtype=int)
+
+        train_losses = []
+        val_losses = []
+
+        for epoch in range(epochs):
+            indices = np.random.permutation(n_samples)
+            total_mse = np.zeros(self.n_models)
+            n_batches = 0
+
+            for start_idx in range(0, n_samples, batch_size):
+                batch_indices = indices[start_idx:start_idx + batch_size]
+                X_batch = X[batch_indices]
+                y_batch = y[batch_indices]
+
+                output = self.forward(X_batch)
+                total_mse += self.backward(X_batch, y_batch, output)
+                n_batches += 1
+
+            avg_mse = total_mse / n_batches
+            if has_val:
+                val_mse = np.mean((self.forward(X_val) - y_val) ** 2, axis=(1, 2))
+            else:
+                val_mse = avg_mse
+
+            # Record losses only for models that were still training this epoch
+            train_losses.append(np.where(self.active, avg_mse, np.nan))
+            val_losses.append(np.where(self.active, val_mse, np.nan))
+
+            if progress_callback:
+                try:
+                    progress_callback(epoch, train_losses[-1], val_losses[-1])
+                except Exception as e:
+                    print(f"Warning: Progress callback failed: {e}")
+
+            # Per-model early stopping
+            improved = val_mse < best_mse
+            best_mse = np.where(improved, val_mse, best_mse)
+            patience_counter = np.where(improved, 0, patience_counter + 1)
+            newly_stopped = self.active & (patience_counter >= patience)
+            self.stopped_epoch[newly_stopped] = epoch
+            self.active &= ~newly_stopped
+
+            if epoch % 10 == 0:
+                print(f"Epoch {epoch}, active models: {int(self.active.sum())}/{self.n_models}, "
+                      f"best val MSE: {np.nanmin(val_losses[-1]):.6f}")
+
+            if not self.active.any():
+                print(f"All models stopped early by epoch {epoch}")
+                break
+
+        return np.array(train_losses), np.array(val_losses)
+
+def load_data_from_directory(directory_path, max_workers=None):
     """
     Load and combine CSV files from a directory.
     
+    Files are read in parallel (see dataset_loader.load_directory) and each
+    row is tagged with its file's ticker in a 'ticker' column.
+    
     Args:
         directory_path (str): Path to directory containing CSV files
+        max_workers (int): Number of reader threads (default: automatic)
         
     Returns:
         pandas.DataFrame: Combined data from all CSV files
@@ -616,21 +1300,9 @@ def load_data_from_directory(directory_path):
         FileNotFoundError: If no CSV files are found
         ValueError: If required columns are missing
     """
-    # Find all CSV files in the directory
-    csv_files = glob.glob(os.path.join(directory_path, "*.csv"))
-    if not csv_files:
-        raise FileNotFoundError(f"No CSV files found in directory: {directory_path}")
-    
-    # Read and concatenate all CSV files
-    dfs = [pd.read_csv(file) for file in csv_files]
-    df = pd.concat(dfs, ignore_index=True)
-    
-    # Ensure required columns exist
+    # Headers are checked for the required columns before any file is parsed
     required_columns = ['open', 'high', 'low', 'close', 'vol']
-    if not all(col in df.columns for col in required_columns):
-        raise ValueError(f"CSV files must contain columns: {required_columns}")
-    
-    return df
+    return load_directory(directory_path, required_columns=required_columns, max_workers=max_workers)
 
 def normalize_features(X):
     """
@@ -723,6 +1395,12 @@ if __name__ == "__main__":
                        help="Target feature to predict")
     parser.add_argument("--data_file", type=str, required=True,
                        help="Path to the input CSV file")
+    parser.add_argument("--telemetry_every", type=int, default=1,
+                       help="Print LOSS:/WEIGHTS: lines once per this many epochs")
+    parser.add_argument("--no_feature_cache", action="store_true",
+                       help="Recompute technical indicators instead of using the feature cache")
+    parser.add_argument("--columnar_cache", action="store_true",
+                       help="Convert the CSV to a Feather sidecar on first load and read that afterwards")
     
     args = parser.parse_args()
     
@@ -754,18 +1432,17 @@ if __name__ == "__main__":
         print(f"Created plots directory: {plots_dir}")
     
     # Load and prepare data
-    print("Loading data...")
-    df = pd.read_csv(args.data_file)
+    x_features = args.x_features.split(',')
+    y_feature = args.y_feature
+    required_features = x_features + [y_feature]
     
-    # Add technical indicators
-    print("Adding technical indicators...")
-    df = add_technical_indicators(df)
+    # Load the data with the technical indicators the model uses (cached per file)
+    print("Loading data and technical indicators...")
+    df = load_features(args.data_file, columns=required_features, cache=not args.no_feature_cache,
+                       reader=read_csv_cached if args.columnar_cache else None)
     
     # Validate features
-    x_features = args.x_features.split(',')
-    y_feature = args.y_feature
     
-    required_features = x_features + [y_feature]
     if not all(col in df.columns for col in required_features):
         raise ValueError(f"CSV file must contain columns: {required_features}")
     
@@ -821,7 +1498,8 @@ if __name__ == "__main__":
     # Train the model with weight history saving
     print("\nTraining model...")
     train_losses, val_losses = model.train(X_train, Y_train, X_val=X_test, y_val=Y_test, epochs=1000, learning_rate=args.learning_rate, 
-                batch_size=args.batch_size, save_history=True, history_interval=50)
+                batch_size=args.batch_size, save_history=True, history_interval=50,
+                telemetry=stdout_telemetry(args.telemetry_every))
     
     # Move weights history to model directory
     if os.path.exists("weights_history"):
@@ -0,0 +1,159 @@
+"""
+Memory-bounded LRU cache of loaded data files for the Stock Prediction GUI.
+
+Entries are keyed by absolute path (plus the column/row selection a load
+asked for, if any) and remember the file's size and
+modification time, so a file that changed on disk is reloaded instead of
+served stale. The total in-memory size of the cached DataFrames is tracked
+incrementally and kept under a byte budget by evicting the least recently
+used files.
+
+Entries are sized when they are stored with a deep-size estimate that reads
+object (string) columns from a small row sample only; once the background
+statistics job has measured the frame on a larger sample, resize() refines it.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+from .data_stats import estimate_memory_bytes
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Rows sampled from object columns to size an entry on the load path
+CACHE_SIZE_SAMPLE_ROWS = 1000
+
+
+class DataCache:
+    """LRU of (DataFrame, info) per file, bounded by DataFrame memory usage."""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.logger = logging.getLogger(__name__)
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(file_path, selection=None):
+        return os.path.abspath(file_path), selection
+
+    @staticmethod
+    def _signature(file_path):
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, file_path, selection=None):
+        """
+        Return the cached (data, info) for a file and selection, or None.
+
+        A hit marks the entry most recently used. An entry whose file changed
+        size or modification time since it was cached is dropped and counted
+        as a miss.
+        """
+        with self._lock:
+            key = self._key(file_path, selection)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            try:
+                current = self._signature(key[0])
+            except OSError:
+                current = None
+            if current != entry['signature']:
+                self._drop(key)
+                self.invalidations += 1
+                self.misses += 1
+                self.logger.info(f"Cached data for {key[0]} is stale, reloading")
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry['data'], entry['info']
+
+    def put(self, file_path, data, info, selection=None):
+        """
+        Cache a loaded file and evict least recently used files over budget.
+
+        The entry is sized from a sampled deep-size estimate until resize()
+        is given the statistics job's measurement. Frames larger than the whole budget are not cached. `selection` is a
+        hashable description of the columns/rows loaded (None for the whole
+        file), so projected loads do not shadow full ones.
+        """
+        key = self._key(file_path, selection)
+        size = estimate_memory_bytes(data, sample_size=CACHE_SIZE_SAMPLE_ROWS)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                self.logger.info(f"Not caching {key[0]}: {size / (1024 * 1024):.1f} MB exceeds the cache budget")
+                return
+            self._entries[key] = {'data': data, 'info': info, 'size': size,
+                                  'signature': self._signature(key[0])}
+            self.total_bytes += size
+            self._evict()
+
+    def resize(self, data, size):
+        """
+        Replace the size of the entry holding `data` with a measured one.
+
+        Called with the deep memory use reported by the statistics job, then
+        evicts least recently used files if the corrected total is over budget.
+
+        Returns:
+            bool: True if an entry for `data` was found
+        """
+        with self._lock:
+            for entry in self._entries.values():
+                if entry['data'] is data:
+                    self.total_bytes += int(size) - entry['size']
+                    entry['size'] = int(size)
+                    self._evict()
+                    return True
+            return False
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry['size']
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __contains__(self, file_path):
+        return self._key(file_path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return entry count, memory use and hit/miss/eviction counters."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def summary(self):
+        """One-line description of the cache for the data-info panel."""
+        stats = self.stats()
+        return (f"{stats['entries']} files, {stats['bytes'] / (1024 * 1024):.1f} / "
+                f"{stats['max_bytes'] / (1024 * 1024):.0f} MB; {stats['hits']} hits, "
+                f"{stats['misses']} misses, {stats['evictions']} evicted")
@@ -4,23 +4,217 @@ Supports multiple modern data file formats including Feather.
 """
 
 import os
+import re
+import operator
 import pandas as pd
 import numpy as np
 import logging
 from datetime import datetime
 import warnings
 
+from columnar_cache import COLUMNAR_CACHE_ENABLED, PYARROW_AVAILABLE, read_csv_cached
+from .data_cache import DataCache, DEFAULT_CACHE_MAX_BYTES
+from .data_stats import StatsJob
+from .format_sniffer import sniff_format
+
 # Suppress warnings for optional imports
 warnings.filterwarnings('ignore', category=ImportWarning)
 
+# Column names (case-insensitive) that date_range filters on, first match wins
+DATE_COLUMN_NAMES = ('date', 'timestamp', 'datetime', 'time')
+
+# Row filter operators: (column, op, value) tuples
+FILTER_OPS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': None,
+    'not in': None,
+}
+
+# Rows per chunk when filtering a CSV while reading it
+CSV_FILTER_CHUNK_ROWS = 250000
+
+# JSON Lines: rows per columnar batch while streaming, and how much of the
+# head get_json_info reads before extrapolating from the file size
+JSON_LINES_BATCH_ROWS = 50000
+JSON_INFO_SAMPLE_BYTES = 1024 * 1024
+JSON_INFO_SAMPLE_LINES = 1000
+
+# Bytes of the head used to tell JSON Lines from a single JSON document
+JSON_SNIFF_BYTES = 64 * 1024
+
+# Loader for each extension, used when the content has no recognized signature
+EXTENSION_FORMATS = {
+    '.csv': 'csv', '.tsv': 'csv', '.tab': 'csv',
+    '.xlsx': 'excel', '.xls': 'excel', '.xlsm': 'excel',
+    '.json': 'json', '.jsonl': 'json', '.ndjson': 'json',
+    '.npy': 'npy', '.npz': 'npz',
+    '.pkl': 'pickle', '.pickle': 'pickle',
+    '.joblib': 'joblib',
+    '.db': 'sqlite', '.sqlite': 'sqlite', '.sqlite3': 'sqlite',
+    '.feather': 'feather', '.ftr': 'feather', '.arrow': 'feather', '.ipc': 'feather',
+    '.parquet': 'parquet', '.pq': 'parquet',
+    '.h5': 'hdf5', '.hdf5': 'hdf5', '.hdf': 'hdf5',
+    '.keras': 'keras',
+    '.duckdb': 'duckdb', '.ddb': 'duckdb',
+    '.txt': 'text',
+}
+
+# Optional library each format's loader needs
+FORMAT_LIBRARIES = {
+    'feather': 'feather',
+    'arrow_stream': 'pyarrow',
+    'parquet': 'pyarrow',
+    'hdf5': 'h5py',
+    'joblib': 'joblib',
+    'duckdb': 'duckdb',
+    'keras': 'keras',
+}
+
+_ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+def _date_column(columns):
+    """First column whose name looks like a date/timestamp, or None."""
+    for name in columns:
+        if str(name).lower() in DATE_COLUMN_NAMES:
+            return name
+    return None
+
+
+def _row_mask(data, row_filter=None, date_range=None):
+    """
+    Boolean mask of the rows matching a row filter and date range.
+
+    Missing values never match, whatever the operator, so the result is the
+    same as the SQL and Parquet pushdown paths give.
+    """
+    mask = np.ones(len(data), dtype=bool)
+    for column, op, value in row_filter or ():
+        if column not in data.columns:
+            raise KeyError(f"Filter column '{column}' not found in data")
+        values = data[column]
+        if op in ('in', 'not in'):
+            matches = values.isin(list(value))
+            if op == 'not in':
+                matches = ~matches
+        else:
+            matches = FILTER_OPS[op](values, value)
+        mask &= matches.fillna(False).to_numpy(dtype=bool) & values.notna().to_numpy()
+    if date_range is not None:
+        column = _date_column(data.columns)
+        if column is None:
+            raise KeyError(f"date_range needs a column named one of {DATE_COLUMN_NAMES}")
+        dates = pd.to_datetime(data[column], errors='coerce')
+        start, end = date_range
+        if start is not None:
+            mask &= (dates >= pd.Timestamp(start)).to_numpy(dtype=bool)
+        if end is not None:
+            mask &= (dates <= pd.Timestamp(end)).to_numpy(dtype=bool)
+    return mask
+
+
+def _select(data, columns=None, row_filter=None, date_range=None):
+    """Apply a row filter/date range, then keep the requested columns that exist."""
+    if row_filter or date_range is not None:
+        data = data[_row_mask(data, row_filter, date_range)].reset_index(drop=True)
+    if columns is not None:
+        data = data[[c for c in columns if c in data.columns]]
+    return data
+
+
+def _needed_columns(available, columns=None, row_filter=None, date_range=None):
+    """
+    Columns a backend has to read: the requested ones that exist, plus
+    whatever the filters look at. None means all of them.
+    """
+    for column, _, _ in row_filter or ():
+        if column not in available:
+            raise KeyError(f"Filter column '{column}' not found in data")
+    if columns is None:
+        return None
+    needed = [c for c in columns if c in available]
+    extra = [c for c, _, _ in row_filter or ()]
+    if date_range is not None:
+        extra.append(_date_column(available))
+    for column in extra:
+        if column is not None and column not in needed:
+            needed.append(column)
+    return needed
+
+
+def _quote(identifier):
+    """Quote an SQL identifier."""
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _sql_value(value):
+    """Plain Python value for a DB-API parameter (NumPy scalars are not accepted)."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _sql_where(row_filter=None, date_column=None, date_range=None):
+    """
+    WHERE clause and parameters for a row filter and, when date_column is
+    given, a date range.
+
+    The date bounds are widened to whole days and compared as ISO text, so the
+    query returns a superset of the range whatever the time-of-day format; the
+    exact range is applied to the result afterwards.
+    """
+    clauses, params = [], []
+    for column, op, value in row_filter or ():
+        if op in ('in', 'not in'):
+            values = [_sql_value(v) for v in value]
+            if not values:
+                clauses.append('1 = 0' if op == 'in' else f"{_quote(column)} IS NOT NULL")
+                continue
+            placeholders = ', '.join('?' * len(values))
+            clauses.append(f"{_quote(column)} {op.upper()} ({placeholders})")
+            params.extend(values)
+        else:
+            clauses.append(f"{_quote(column)} {'=' if op == '==' else op} ?")
+            params.append(_sql_value(value))
+    if date_column is not None and date_range is not None:
+        start, end = date_range
+        if start is not None:
+            clauses.append(f"{_quote(date_column)} >= ?")
+            params.append(pd.Timestamp(start).strftime('%Y-%m-%d'))
+        if end is not None:
+            clauses.append(f"{_quote(date_column)} < ?")
+            params.append((pd.Timestamp(end).normalize() + pd.Timedelta(days=1)).strftime('%Y-%m-%d'))
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def _pushable_date(sample):
+    """Whether a stored date value compares correctly against ISO date text."""
+    if isinstance(sample, str):
+        return bool(_ISO_DATE.match(sample))
+    return isinstance(sample, datetime) or hasattr(sample, 'isoformat')
+
+
 class DataManager:
     """Manages data operations with support for multiple file formats including Feather."""
     
-    def __init__(self):
+    def __init__(self, cache_max_bytes=DEFAULT_CACHE_MAX_BYTES, columnar_cache=COLUMNAR_CACHE_ENABLED):
+        """
+        Args:
+            cache_max_bytes (int): Memory budget of the in-process data cache
+            columnar_cache (bool): Serve CSV files from a Feather sidecar built
+                on first load (see columnar_cache.py); off unless COLUMNAR_CACHE=1
+        """
         self.logger = logging.getLogger(__name__)
+        self.columnar_cache = columnar_cache and PYARROW_AVAILABLE
         self.current_data = None
         self.current_data_info = None
-        self.data_cache = {}
+        self.data_cache = DataCache(cache_max_bytes)
+        self.stats_job = None
+        self.stats_listeners = []
         
         # Initialize optional libraries
         self._init_optional_libraries()
@@ -95,7 +289,7 @@ class DataManager:
             'HDF5': ['.h5', '.hdf5', '.hdf'],
             'Pickle': ['.pkl', '.pickle'],
             'Joblib': ['.joblib'],
-            'JSON': ['.json'],
+            'JSON': ['.json', '.jsonl', '.ndjson'],
             'SQLite': ['.db', '.sqlite', '.sqlite3'],
             'DuckDB': ['.duckdb', '.ddb'],
             'Arrow': ['.arrow', '.ipc'],
@@ -124,30 +318,46 @@ class DataManager:
         
         return formats
     
-    def load_data(self, file_path):
-        """Load data from file with format detection."""
+    def load_data(self, file_path, columns=None, row_filter=None, date_range=None):
+        """
+        Load data from file with format detection.
+
+        Column projection and row filters are pushed into the reader where the
+        format allows it (CSV usecols, Parquet/Feather column selection and
+        Parquet row-group filtering, SQL SELECT ... WHERE, HDF5 column slicing)
+        and applied after loading everywhere else.
+
+        Args:
+            file_path (str): Data file to load
+            columns (list): Columns to keep, in this order; requested columns the
+                file does not have are left out (None keeps every column)
+            row_filter (list): (column, op, value) tuples that must all hold,
+                with op one of ==, !=, <, <=, >, >=, in, not in; rows with a
+                missing value in a filtered column never match
+            date_range (tuple): (start, end) bounds, inclusive and either may be
+                None, on the first column named date/timestamp/datetime/time
+
+        Returns:
+            dict: Info about the loaded data (see analyze_data)
+        """
         try:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File not found: {file_path}")
+            self._check_request(file_path, row_filter)
+            selected = columns is not None or bool(row_filter) or date_range is not None
+            selection = repr((columns, row_filter, date_range)) if selected else None
             
-            # Check if data is already cached
-            if file_path in self.data_cache:
-                self.current_data = self.data_cache[file_path]['data']
-                self.current_data_info = self.data_cache[file_path]['info']
+            # Statistics still running for the previous file are no longer wanted
+            self.cancel_stats()
+            
+            # Check if data is already cached (and unchanged on disk)
+            cached = self.data_cache.get(file_path, selection)
+            if cached is not None:
+                self.current_data, self.current_data_info = cached
                 self.current_data_info['last_accessed'] = datetime.now()
+                if self.current_data_info.get('stats_status') != 'ready':
+                    self.start_stats()
                 return self.current_data_info
             
-            # Detect file format and load
-            file_ext = os.path.splitext(file_path)[1].lower()
-            data = self._load_by_format(file_path, file_ext)
-            
-            # Validate data
-            if data is None or len(data) == 0:
-                raise ValueError("Data file is empty or could not be loaded")
-            
-            # Convert to pandas DataFrame if needed
-            if not isinstance(data, pd.DataFrame):
-                data = pd.DataFrame(data)
+            data = self._read(file_path, columns, row_filter, date_range)
             
             # Store the data
             self.current_data = data
@@ -156,10 +366,10 @@ class DataManager:
             self.current_data_info = self.analyze_data(data, file_path)
             
             # Cache the data
-            self.data_cache[file_path] = {
-                'data': data,
-                'info': self.current_data_info
-            }
+            self.data_cache.put(file_path, data, self.current_data_info, selection)
+            
+            # Missing values, summary statistics and deep memory use follow later
+            self.start_stats()
             
             return self.current_data_info
             
@@ -167,87 +377,229 @@ class DataManager:
             self.logger.error(f"Error loading data: {e}")
             raise
     
-    def _load_by_format(self, file_path, file_ext):
-        """Load data based on file format."""
+    def read_columns(self, file_path, columns=None, row_filter=None, date_range=None):
+        """
+        Read part of a data file without making it the current data.
+
+        Training and prediction read through here, so the dataset the data
+        panel shows (current_data, its info and its cache entry) stays the
+        one the user loaded. A cached full load of the file is reused instead
+        of reading the file again; projected reads are not cached.
+
+        Args:
+            file_path (str): Data file to read
+            columns, row_filter, date_range: As for load_data
+
+        Returns:
+            pandas.DataFrame: The selected rows and columns
+        """
+        try:
+            self._check_request(file_path, row_filter)
+            cached = self.data_cache.get(file_path)
+            if cached is None:
+                return self._read(file_path, columns, row_filter, date_range)
+            data = _select(cached[0], columns, row_filter, date_range)
+            if len(data) == 0:
+                raise ValueError("No rows match the requested filter")
+            return data
+        except Exception as e:
+            self.logger.error(f"Error reading data: {e}")
+            raise
+    
+    @staticmethod
+    def _check_request(file_path, row_filter=None):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        for _, op, _ in row_filter or ():
+            if op not in FILTER_OPS:
+                raise ValueError(f"Unsupported filter operator: {op}")
+    
+    def _read(self, file_path, columns=None, row_filter=None, date_range=None):
+        """Load a file as a DataFrame and apply the selection the reader did not push down."""
+        # Detect file format and load
+        file_ext = os.path.splitext(file_path)[1].lower()
+        data = self._load_by_format(file_path, file_ext, columns, row_filter, date_range)
+        
+        # Validate data
+        filtered = bool(row_filter) or date_range is not None
+        if data is None or len(data) == 0:
+            if filtered and data is not None:
+                raise ValueError("No rows match the requested filter")
+            raise ValueError("Data file is empty or could not be loaded")
+        
+        # Convert to pandas DataFrame if needed
+        if not isinstance(data, pd.DataFrame):
+            data = pd.DataFrame(data)
+        
+        # Apply whatever the reader could not push down
+        if columns is not None or filtered:
+            data = _select(data, columns, row_filter, date_range)
+            if len(data) == 0:
+                raise ValueError("No rows match the requested filter")
+        return data
+    
+    def detect_format(self, file_path, file_ext=None):
+        """
+        Pick the loader for a file from its content, then its extension.
+
+        Args:
+            file_path (str): Data file
+            file_ext (str): Lower-case extension (derived from file_path if None)
+
+        Returns:
+            str: Format name (see EXTENSION_FORMATS and format_sniffer), or
+            None if neither the content nor the extension is recognized
+        """
+        if file_ext is None:
+            file_ext = os.path.splitext(file_path)[1].lower()
+        file_format = sniff_format(file_path)
+        
+        # Pickled joblib dumps are still best read back by joblib
+        if file_format == 'pickle' and file_ext == '.joblib':
+            file_format = 'joblib'
+        
+        return file_format or EXTENSION_FORMATS.get(file_ext)
+    
+    def _load_by_format(self, file_path, file_ext, columns=None, row_filter=None, date_range=None):
+        """
+        Load data based on file format.
+
+        The format is detected from the file's leading bytes where it has a
+        signature, so misnamed files and shared extensions (.h5, .arrow) go
+        straight to the right loader.
+
+        Readers that support it only read the needed columns and rows; the
+        result may still hold extra columns and rows, which load_data drops.
+        """
+        file_format = self.detect_format(file_path, file_ext)
+        
+        library = FORMAT_LIBRARIES.get(file_format)
+        if library is not None and not self.libraries_available[library]:
+            # Polars can still read Parquet without PyArrow
+            if file_format == 'parquet' and self.libraries_available['polars']:
+                import polars as pl
+                return pl.read_parquet(file_path).to_pandas()
+            raise ValueError(f"Unsupported file format: {file_ext} ({file_format} support requires {library})")
         
         # CSV files
-        if file_ext in ['.csv', '.tsv', '.tab']:
-            return pd.read_csv(file_path)
+        if file_format == 'csv':
+            return self._load_csv(file_path, columns, row_filter, date_range)
         
         # Excel files
-        elif file_ext in ['.xlsx', '.xls', '.xlsm']:
-            return pd.read_excel(file_path)
+        elif file_format == 'excel':
+            return pd.read_excel(file_path, usecols=self._usecols(columns, row_filter, date_range))
         
         # JSON files
-        elif file_ext == '.json':
+        elif file_format == 'json':
             return self._load_json(file_path)
         
         # NumPy files
-        elif file_ext == '.npy':
+        elif file_format == 'npy':
             return pd.DataFrame(np.load(file_path))
-        elif file_ext == '.npz':
+        elif file_format == 'npz':
             npz_data = np.load(file_path)
             # Convert to DataFrame with first array
             first_key = list(npz_data.keys())[0]
             return pd.DataFrame(npz_data[first_key])
         
         # Pickle files
-        elif file_ext in ['.pkl', '.pickle']:
+        elif file_format == 'pickle':
             return pd.read_pickle(file_path)
         
         # SQLite files
-        elif file_ext in ['.db', '.sqlite', '.sqlite3']:
-            return self._load_sqlite(file_path)
+        elif file_format == 'sqlite':
+            return self._load_sqlite(file_path, columns, row_filter, date_range)
         
-        # Feather files (PyArrow) - Enhanced support
-        elif file_ext in ['.feather', '.ftr', '.arrow'] and self.libraries_available['feather']:
-            return self._load_feather(file_path)
+        # Feather files and Arrow IPC files (PyArrow) - Enhanced support
+        elif file_format == 'feather':
+            return self._load_feather(file_path, columns, row_filter, date_range)
         
-        # Parquet files (PyArrow)
-        elif file_ext in ['.parquet', '.pq'] and self.libraries_available['pyarrow']:
-            return pd.read_parquet(file_path)
+        # Arrow IPC streams (PyArrow)
+        elif file_format == 'arrow_stream':
+            import pyarrow as pa
+            with pa.memory_map(file_path) as source:
+                return pa.ipc.open_stream(source).read_all().to_pandas()
         
-        # Arrow files (PyArrow)
-        elif file_ext in ['.ipc'] and self.libraries_available['pyarrow']:
-            import pyarrow.parquet as pq
-            return pq.read_table(file_path).to_pandas()
+        # Parquet files (PyArrow)
+        elif file_format == 'parquet':
+            return self._load_parquet(file_path, columns, row_filter, date_range)
         
         # HDF5 files
-        elif file_ext in ['.h5', '.hdf5', '.hdf'] and self.libraries_available['h5py']:
-            return self._load_hdf5(file_path)
+        elif file_format == 'hdf5':
+            return self._load_hdf5(file_path, columns, row_filter, date_range)
         
         # Joblib files
-        elif file_ext == '.joblib' and self.libraries_available['joblib']:
+        elif file_format == 'joblib':
             import joblib
             return joblib.load(file_path)
         
         # DuckDB files
-        elif file_ext in ['.duckdb', '.ddb'] and self.libraries_available['duckdb']:
-            return self._load_duckdb(file_path)
+        elif file_format == 'duckdb':
+            return self._load_duckdb(file_path, columns, row_filter, date_range)
         
         # Keras/TensorFlow files
-        elif file_ext in ['.h5', '.keras'] and self.libraries_available['keras']:
+        elif file_format == 'keras':
             return self._load_keras(file_path)
         
-        # Polars files (if available)
-        elif self.libraries_available['polars']:
-            try:
-                import polars as pl
-                if file_ext in ['.parquet', '.pq']:
-                    return pl.read_parquet(file_path).to_pandas()
-                elif file_ext in ['.csv', '.tsv']:
-                    return pl.read_csv(file_path).to_pandas()
-            except:
-                pass
-        
         # Text files (fallback)
-        elif file_ext in ['.txt']:
+        elif file_format == 'text':
             return pd.read_csv(file_path, sep=None, engine='python')
         
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
     
-    def _load_feather(self, file_path):
+    @staticmethod
+    def _usecols(columns, row_filter=None, date_range=None):
+        """usecols callable for pandas readers, or None to read every column."""
+        if columns is None:
+            return None
+        wanted = set(columns) | {c for c, _, _ in row_filter or ()}
+        if date_range is None:
+            return lambda name: name in wanted
+        return lambda name: name in wanted or str(name).lower() in DATE_COLUMN_NAMES
+    
+    def _load_csv(self, file_path, columns=None, row_filter=None, date_range=None):
+        """Load a CSV file, reading only the needed columns and filtering chunk by chunk."""
+        usecols = self._usecols(columns, row_filter, date_range)
+        
+        # Opt-in: read the memory-mapped columnar copy; filters are applied by load_data
+        if self.columnar_cache and file_path.lower().endswith('.csv'):
+            return read_csv_cached(file_path, columns=usecols)
+        
+        if not row_filter and date_range is None:
+            return pd.read_csv(file_path, usecols=usecols)
+        
+        # Filter each chunk as it is parsed so rows that do not match are never held at once
+        chunks = [chunk[_row_mask(chunk, row_filter, date_range)]
+                  for chunk in pd.read_csv(file_path, usecols=usecols, chunksize=CSV_FILTER_CHUNK_ROWS)]
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True)
+    
+    def _load_parquet(self, file_path, columns=None, row_filter=None, date_range=None):
+        """Load a Parquet file, reading only the needed columns and matching row groups."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        schema = pq.read_schema(file_path)
+        read_columns = _needed_columns(schema.names, columns, row_filter, date_range)
+        filters = [(column, op, list(value) if op in ('in', 'not in') else value)
+                   for column, op, value in row_filter or ()]
+        
+        # Only timezone-naive timestamp columns compare safely with the bounds
+        date_column = _date_column(schema.names) if date_range is not None else None
+        if date_column is not None:
+            field_type = schema.field(date_column).type
+            if pa.types.is_timestamp(field_type) and field_type.tz is None:
+                start, end = date_range
+                if start is not None:
+                    filters.append((date_column, '>=', pd.Timestamp(start).to_pydatetime()))
+                if end is not None:
+                    filters.append((date_column, '<=', pd.Timestamp(end).to_pydatetime()))
+        
+        return pd.read_parquet(file_path, columns=read_columns, filters=filters or None)
+    
+    def _load_feather(self, file_path, columns=None, row_filter=None, date_range=None):
         """Load data from Feather file with enhanced features."""
         try:
             import pyarrow.feather as feather
@@ -255,8 +607,13 @@ class DataManager:
             
             # Try to read with metadata
             try:
-                # Read with metadata to get additional info
-                table = feather.read_feather(file_path, memory_map=True)
+                # Only the needed columns are decoded; the schema comes from the file footer
+                read_columns = None
+                if columns is not None:
+                    with pa.memory_map(file_path) as source:
+                        names = pa.ipc.open_file(source).schema.names
+                    read_columns = _needed_columns(names, columns, row_filter, date_range)
+                table = feather.read_table(file_path, columns=read_columns, memory_map=True)
                 data = table.to_pandas()
                 
                 # Store metadata for analysis
@@ -325,29 +682,47 @@ class DataManager:
         except Exception as e:
             return {"error": str(e)}
     
-    def _load_sqlite(self, file_path):
+    def _load_sqlite(self, file_path, columns=None, row_filter=None, date_range=None):
         """Load data from SQLite database."""
         import sqlite3
         
         # Connect to database
         conn = sqlite3.connect(file_path)
         
-        # Get table names
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
-        
-        if not tables:
-            raise ValueError("No tables found in SQLite database")
+        try:
+            # Get table names
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+            tables = cursor.fetchall()
+            
+            if not tables:
+                raise ValueError("No tables found in SQLite database")
+            
+            # Load first table (or let user choose)
+            table_name = tables[0][0]
+            names = [row[1] for row in cursor.execute(f"PRAGMA table_info({_quote(table_name)})")]
+            query, params = self._sql_query(conn, table_name, names, columns, row_filter, date_range)
+            return pd.read_sql_query(query, conn, params=params)
+        finally:
+            conn.close()
+    
+    def _sql_query(self, conn, table_name, names, columns=None, row_filter=None, date_range=None):
+        """SELECT statement and parameters reading only the needed columns and rows of a table."""
+        read_columns = _needed_columns(names, columns, row_filter, date_range)
+        select = '*' if read_columns is None else ', '.join(_quote(c) for c in read_columns)
         
-        # Load first table (or let user choose)
-        table_name = tables[0][0]
-        data = pd.read_sql_query(f"SELECT * FROM {table_name}", conn)
+        # Push the date range only when stored dates compare correctly as ISO text
+        date_column = _date_column(names) if date_range is not None else None
+        if date_column is not None:
+            sample = conn.execute(f"SELECT {_quote(date_column)} FROM {_quote(table_name)} "
+                                  f"WHERE {_quote(date_column)} IS NOT NULL LIMIT 1").fetchone()
+            if sample is None or not _pushable_date(sample[0]):
+                date_column = None
         
-        conn.close()
-        return data
+        where, params = _sql_where(row_filter, date_column, date_range)
+        return f"SELECT {select} FROM {_quote(table_name)}{where}", params
     
-    def _load_hdf5(self, file_path):
+    def _load_hdf5(self, file_path, columns=None, row_filter=None, date_range=None):
         """Load data from HDF5 file."""
         import h5py
         
@@ -376,6 +751,14 @@ class DataManager:
             # Load first dataset
             dataset_path, dataset_obj = datasets[0]
             
+            # 2D datasets have integer column labels; read only the requested ones
+            if len(dataset_obj.shape) == 2 and columns is not None:
+                labels = range(dataset_obj.shape[1])
+                read_columns = _needed_columns(labels, columns, row_filter, date_range)
+                indices = sorted({int(c) for c in read_columns})
+                if indices:
+                    return pd.DataFrame(dataset_obj[:, indices], columns=indices)
+            
             # Load the dataset data
             data = dataset_obj[:]
             
@@ -388,25 +771,27 @@ class DataManager:
                 # For 3D+ data, flatten
                 return pd.DataFrame(data.reshape(data.shape[0], -1))
     
-    def _load_duckdb(self, file_path):
+    def _load_duckdb(self, file_path, columns=None, row_filter=None, date_range=None):
         """Load data from DuckDB database."""
         import duckdb
         
         # Connect to database
         conn = duckdb.connect(file_path)
         
-        # Get table names
-        tables = conn.execute("SHOW TABLES").fetchall()
-        
-        if not tables:
-            raise ValueError("No tables found in DuckDB database")
-        
-        # Load first table
-        table_name = tables[0][0]
-        data = conn.execute(f"SELECT * FROM {table_name}").fetchdf()
-        
-        conn.close()
-        return data
+        try:
+            # Get table names
+            tables = conn.execute("SHOW TABLES").fetchall()
+            
+            if not tables:
+                raise ValueError("No tables found in DuckDB database")
+            
+            # Load first table
+            table_name = tables[0][0]
+            names = [row[0] for row in conn.execute(f"DESCRIBE {_quote(table_name)}").fetchall()]
+            query, params = self._sql_query(conn, table_name, names, columns, row_filter, date_range)
+            return conn.execute(query, params).fetchdf()
+        finally:
+            conn.close()
     
     def _load_keras(self, file_path):
         """Load data from Keras model file."""
@@ -455,7 +840,14 @@ class DataManager:
                 raise ValueError("Could not load Keras file as model or dataset")
     
     def analyze_data(self, data, file_path):
-        """Analyze the loaded data."""
+        """
+        Describe the loaded data without scanning its values.
+
+        Only the shape, dtypes and file size are filled in here. Missing
+        values, summary statistics and the deep memory size start out empty
+        ('stats_status' is 'pending') and are added by the background job
+        that start_stats runs.
+        """
         try:
             # Basic file info
             file_size = os.path.getsize(file_path)
@@ -467,19 +859,12 @@ class DataManager:
             categorical_columns = list(data.select_dtypes(include=['object']).columns)
             datetime_columns = list(data.select_dtypes(include=['datetime']).columns)
             
-            # Missing values
-            missing_values = data.isnull().sum().to_dict()
-            
             # Data types
             data_types = data.dtypes.to_dict()
             
-            # Summary statistics for numeric columns
-            summary_stats = {}
-            if len(numeric_columns) > 0:
-                summary_stats = data[numeric_columns].describe().to_dict()
-            
-            # Memory usage
-            memory_usage = data.memory_usage(deep=True).sum() / (1024 * 1024)  # MB
+            # Memory usage is exact without deep inspection unless there are object columns
+            needs_deep = any(dtype.kind not in 'biufcmM' for dtype in data.dtypes)
+            memory_usage = data.memory_usage(deep=False).sum() / (1024 * 1024)  # MB
             
             # Feather-specific info
             feather_info = {}
@@ -492,16 +877,17 @@ class DataManager:
             return {
                 'file_path': file_path,
                 'file_size': f"{file_size_mb:.2f} MB",
-                'memory_usage': f"{memory_usage:.2f} MB",
+                'memory_usage': "Calculating..." if needs_deep else f"{memory_usage:.2f} MB",
                 'rows': rows,
                 'columns': columns,
                 'shape': (rows, columns),
                 'numeric_columns': numeric_columns,
                 'categorical_columns': categorical_columns,
                 'datetime_columns': datetime_columns,
-                'missing_values': missing_values,
+                'missing_values': {},
                 'data_types': data_types,
-                'summary_stats': summary_stats,
+                'summary_stats': {},
+                'stats_status': 'pending',
                 'feather_info': feather_info,
                 'last_accessed': datetime.now()
             }
@@ -510,6 +896,60 @@ class DataManager:
             self.logger.error(f"Error analyzing data: {e}")
             raise
     
+    def add_stats_listener(self, callback):
+        """
+        Register a callback for finished background statistics.
+
+        The callback is called from the worker thread with the updated data
+        info dict; GUI code must hand it over to the Tk thread itself.
+        """
+        self.stats_listeners.append(callback)
+    
+    def start_stats(self):
+        """Start computing statistics for the current data on a worker thread."""
+        self.cancel_stats()
+        if self.current_data is None or self.current_data_info is None:
+            return None
+        data, info = self.current_data, self.current_data_info
+        info['stats_status'] = 'running'
+        
+        def on_done(stats):
+            # The user may have moved on to another file in the meantime
+            if job.cancelled or self.current_data_info is not info:
+                return
+            # The cache sized the frame shallowly when it was loaded
+            self.data_cache.resize(data, stats['memory_bytes'])
+            info.update(stats)
+            info['stats_status'] = 'ready'
+            for listener in list(self.stats_listeners):
+                try:
+                    listener(info)
+                except Exception as e:
+                    self.logger.error(f"Error in statistics listener: {e}")
+        
+        job = StatsJob(data, on_done)
+        self.stats_job = job.start()
+        return job
+    
+    def cancel_stats(self):
+        """Cancel the statistics job for the previous data, if one is running."""
+        job, self.stats_job = self.stats_job, None
+        if job is not None and not job.done():
+            job.cancel()
+            if self.current_data_info is not None and self.current_data_info.get('stats_status') == 'running':
+                self.current_data_info['stats_status'] = 'pending'
+    
+    def wait_for_stats(self, timeout=None):
+        """
+        Block until the current statistics job finishes.
+
+        Returns:
+            bool: True if statistics for the current data are available
+        """
+        if self.stats_job is not None:
+            self.stats_job.wait(timeout)
+        return bool(self.current_data_info) and self.current_data_info.get('stats_status') == 'ready'
+    
     def get_data_info(self):
         """Get information about the currently loaded data."""
         if self.current_data_info is None:
@@ -525,8 +965,12 @@ class DataManager:
                 'missing_values': {},
                 'data_types': {},
                 'summary_stats': {},
-                'feather_info': {}
+                'feather_info': {},
+                'cache_stats': self.data_cache.stats(),
+                'cache_summary': self.data_cache.summary()
             }
+        self.current_data_info['cache_stats'] = self.data_cache.stats()
+        self.current_data_info['cache_summary'] = self.data_cache.summary()
         return self.current_data_info
     
     def get_current_data(self):
@@ -562,7 +1006,8 @@ class DataManager:
             if data_info['rows'] < 100:
                 return False, "Insufficient data (need at least 100 rows)"
             
-            # Check for too many missing values
+            # Check for too many missing values (computed by the statistics job)
+            self.wait_for_stats()
             total_missing = sum(data_info['missing_values'].values())
             missing_percentage = (total_missing / (data_info['rows'] * data_info['columns'])) * 100
             
@@ -620,16 +1065,22 @@ class DataManager:
             return False
     
     def get_json_info(self, file_path):
-        """Get information about JSON file structure."""
+        """
+        Get information about JSON file structure.
+
+        JSON Lines files are described from a bounded head sample (see
+        _get_json_lines_info) instead of being parsed in full.
+        """
         try:
             import json
             
-            with open(file_path, 'r') as f:
-                content = f.read().strip()
+            if self._detect_json_layout(file_path) == 'json_lines':
+                return self._get_json_lines_info(file_path)
             
             # Try to parse as single JSON object first
             try:
-                data = json.loads(content)
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
                 return self._get_json_object_info(data, file_path)
             except json.JSONDecodeError:
                 # If single JSON fails, try JSON Lines format
@@ -639,6 +1090,30 @@ class DataManager:
             self.logger.error(f"Error getting JSON info: {e}")
             return None
     
+    def _detect_json_layout(self, file_path):
+        """
+        Tell JSON Lines from a single JSON document by looking at the head.
+
+        A file is JSON Lines when its first line is a complete JSON value and
+        more content follows it. Pretty-printed documents fail the first-line
+        parse, and one-line documents have nothing after the first line.
+
+        Returns:
+            str: 'json_lines' or 'single_json'
+        """
+        import json
+        
+        with open(file_path, 'rb') as f:
+            head = f.read(JSON_SNIFF_BYTES).lstrip()
+        first_line, _, rest = head.partition(b'\n')
+        if not rest.strip():
+            return 'single_json'
+        try:
+            json.loads(first_line)
+        except ValueError:
+            return 'single_json'
+        return 'json_lines'
+    
     def _get_json_object_info(self, data, file_path):
         """Get info for single JSON object."""
         info = {
@@ -658,55 +1133,78 @@ class DataManager:
         return info
     
     def _get_json_lines_info(self, file_path):
-        """Get info for JSON Lines format."""
+        """
+        Get info for JSON Lines format from a sample of the file's head.
+
+        At most JSON_INFO_SAMPLE_LINES lines / JSON_INFO_SAMPLE_BYTES bytes
+        are parsed. Line and row counts for the rest of the file are
+        extrapolated from the sample's bytes per line ('sampled' is True
+        then); smaller files are counted exactly.
+        """
         import json
         
         try:
+            file_size = os.path.getsize(file_path)
             line_count = 0
             valid_lines = 0
-            sample_data = []
+            bytes_read = 0
+            sample_keys = {}
+            all_objects = True
+            reached_end = True
             
-            with open(file_path, 'r') as f:
-                for line_num, line in enumerate(f, 1):
+            with open(file_path, 'rb') as f:
+                for line in f:
+                    if line_count >= JSON_INFO_SAMPLE_LINES or bytes_read >= JSON_INFO_SAMPLE_BYTES:
+                        reached_end = False
+                        break
+                    bytes_read += len(line)
                     line = line.strip()
                     if line:
                         line_count += 1
                         try:
                             data = json.loads(line)
                             valid_lines += 1
-                            if len(sample_data) < 3:  # Keep first 3 valid objects
-                                sample_data.append(data)
+                            if isinstance(data, dict):
+                                sample_keys.update(dict.fromkeys(data))
+                            else:
+                                all_objects = False
                         except json.JSONDecodeError:
                             continue
             
+            # Scale the sample's counts up to the whole file
+            if not reached_end and bytes_read:
+                scale = file_size / bytes_read
+                line_count = int(round(line_count * scale))
+                valid_lines = int(round(valid_lines * scale))
+            
             # Analyze sample data
-            if sample_data:
-                if all(isinstance(item, dict) for item in sample_data):
-                    # All objects have the same structure
-                    sample_keys = list(sample_data[0].keys())
-                    estimated_columns = len(sample_keys)
-                else:
-                    sample_keys = None
-                    estimated_columns = 1
+            if valid_lines and all_objects:
+                object_keys = list(sample_keys)
+                estimated_columns = len(object_keys)
+            elif valid_lines:
+                object_keys = None
+                estimated_columns = 1
             else:
-                sample_keys = None
+                object_keys = None
                 estimated_columns = 0
             
             info = {
                 'file_path': file_path,
-                'file_size': os.path.getsize(file_path),
+                'file_size': file_size,
                 'structure_type': 'json_lines',
                 'is_array': True,
                 'is_object': False,
                 'array_length': valid_lines,
-                'object_keys': sample_keys,
+                'object_keys': object_keys,
                 'nested_levels': 1,  # JSON Lines are typically flat
                 'estimated_rows': valid_lines,
                 'estimated_columns': estimated_columns,
                 'format_type': 'json_lines',
                 'total_lines': line_count,
                 'valid_json_lines': valid_lines,
-                'invalid_lines': line_count - valid_lines
+                'invalid_lines': line_count - valid_lines,
+                'sampled': not reached_end,
+                'sample_bytes': bytes_read
             }
             
             return info
@@ -754,12 +1252,14 @@ class DataManager:
         import json
         
         try:
-            with open(file_path, 'r') as f:
-                content = f.read().strip()
+            # JSON Lines are streamed instead of being parsed as one document first
+            if self._detect_json_layout(file_path) == 'json_lines':
+                return self._load_json_lines(file_path)
             
             # Try to parse as single JSON object first
             try:
-                data = json.loads(content)
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
                 return self._process_json_data(data)
             except json.JSONDecodeError as e:
                 # If single JSON fails, try JSON Lines format
@@ -803,32 +1303,72 @@ class DataManager:
             return pd.DataFrame([data], columns=['value'])
     
     def _load_json_lines(self, file_path):
-        """Load JSON Lines format (multiple JSON objects, one per line)."""
+        """
+        Load JSON Lines format (multiple JSON objects, one per line).
+
+        PyArrow's streaming JSON reader is used when available. Files it
+        rejects (invalid lines, fields that change type) are parsed line by
+        line instead, skipping invalid lines and turning every
+        JSON_LINES_BATCH_ROWS objects into a DataFrame, so only one batch of
+        Python objects is alive at a time.
+        """
+        if self.libraries_available['pyarrow']:
+            try:
+                return self._read_json_lines_arrow(file_path)
+            except Exception as e:
+                self.logger.info(f"PyArrow could not read {file_path} as JSON Lines ({e}); parsing line by line")
+        
         import json
         
         try:
-            data_list = []
+            frames = []
+            batch = []
             
             with open(file_path, 'r') as f:
                 for line_num, line in enumerate(f, 1):
                     line = line.strip()
                     if line:  # Skip empty lines
                         try:
-                            data = json.loads(line)
-                            data_list.append(data)
+                            batch.append(json.loads(line))
                         except json.JSONDecodeError as e:
                             self.logger.warning(f"Invalid JSON on line {line_num}: {e}")
                             continue
+                        if len(batch) >= JSON_LINES_BATCH_ROWS:
+                            frames.append(self._json_batch_frame(batch))
+                            batch = []
             
-            if data_list:
-                # Convert list of objects to DataFrame
-                if all(isinstance(item, dict) for item in data_list):
-                    return pd.DataFrame(data_list)
-                else:
-                    return pd.DataFrame(data_list, columns=['value'])
+            if batch:
+                frames.append(self._json_batch_frame(batch))
+            if frames:
+                return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
             else:
                 raise ValueError("No valid JSON objects found in file")
                 
         except Exception as e:
             self.logger.error(f"Error loading JSON Lines: {e}")
-            raise 
\ No newline at end of file
+            raise
+    
+    @staticmethod
+    def _json_batch_frame(batch):
+        """Columnar frame for a batch of parsed JSON Lines values."""
+        if all(isinstance(item, dict) for item in batch):
+            return pd.DataFrame(batch)
+        return pd.DataFrame({'value': batch})
+    
+    def _read_json_lines_arrow(self, file_path):
+        """
+        Read JSON Lines with PyArrow's block-wise streaming reader.
+
+        Fields PyArrow would parse as timestamps are read as strings, so the
+        frame matches the line-by-line path.
+        """
+        import pyarrow as pa
+        import pyarrow.json as pa_json
+        
+        reader = pa_json.open_json(file_path)
+        strings = [pa.field(field.name, pa.string()) for field in reader.schema
+                   if pa.types.is_temporal(field.type)]
+        if strings:
+            reader = pa_json.open_json(file_path, parse_options=pa_json.ParseOptions(
+                explicit_schema=pa.schema(strings), unexpected_field_behavior='infer'))
+        return reader.read_all().to_pandas()
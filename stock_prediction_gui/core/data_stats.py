@@ -0,0 +1,231 @@
+"""
+Background column statistics for the Stock Prediction GUI.
+
+describe(), isnull().sum() and memory_usage(deep=True) over a large frame can
+take seconds, so DataManager only computes a cheap header while loading and
+hands the rest to a StatsJob running on a worker thread.
+
+The job walks the frame in row chunks, keeping exact streaming accumulators
+(missing counts, count/mean/variance/min/max merged chunk by chunk), and
+checks for cancellation between chunks. Quantiles and the deep memory size of
+object columns are taken from a uniform row sample once the frame has more
+than STATS_SAMPLE_ROWS rows; below that they are exact.
+"""
+
+import logging
+import threading
+
+import numpy as np
+
+STATS_SAMPLE_ROWS = 100000
+STATS_CHUNK_ROWS = 65536
+
+
+def sample_rows(n_rows, k, seed=0):
+    """
+    Sorted positions of a uniform sample of k rows out of n_rows.
+
+    Args:
+        n_rows (int): Number of rows
+        k (int): Sample size
+        seed (int): Random seed, so repeated analyses agree
+
+    Returns:
+        numpy.ndarray: Row positions (all of them when n_rows <= k)
+    """
+    if n_rows <= k:
+        return np.arange(n_rows)
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(n_rows, size=k, replace=False))
+
+
+def _deep_columns(data):
+    # Object-like columns whose values live outside the column buffer
+    return [c for c in data.columns if data[c].dtype.kind not in 'biufcmM']
+
+
+def estimate_memory_bytes(data, sample_size=STATS_SAMPLE_ROWS, seed=0, positions=None):
+    """
+    memory_usage(deep=True).sum() without walking every object value.
+
+    Numeric columns are sized exactly from their buffers; object-like columns
+    are sized from a uniform row sample scaled up to the full frame.
+
+    Args:
+        data (pandas.DataFrame): Frame to size
+        sample_size (int): Rows sampled for object-like columns
+        seed (int): Sampling seed
+        positions (numpy.ndarray): Row sample to use instead of drawing one
+
+    Returns:
+        int: Estimated deep size in bytes (exact below sample_size rows)
+    """
+    memory = data.memory_usage(index=True, deep=False)
+    deep_columns = _deep_columns(data)
+    if deep_columns:
+        if positions is None:
+            positions = sample_rows(len(data), sample_size, seed)
+        deep = data[deep_columns].iloc[positions].memory_usage(index=False, deep=True)
+        scale = len(data) / len(positions) if len(positions) else 0.0
+        for column in deep_columns:
+            memory[column] = deep[column] * scale
+    return int(memory.sum())
+
+
+class _Moments:
+    """Per-column count, mean, sum of squared deviations, min and max, mergeable by chunk."""
+
+    def __init__(self, n_columns):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def add(self, values):
+        """Merge a 2D chunk (rows x columns, NaN for missing) using Chan's update."""
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(np.float64)
+        filled = np.where(valid, values, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = filled.sum(axis=0) / count
+            m2 = np.where(valid, values - mean, 0.0)
+            m2 = (m2 * m2).sum(axis=0)
+            total = self.count + count
+            delta = mean - self.mean
+            has_rows = count > 0
+            self.mean = np.where(has_rows, self.mean + delta * count / total, self.mean)
+            self.m2 = np.where(has_rows, self.m2 + m2 + delta * delta * self.count * count / total, self.m2)
+        self.count = total
+        self.min = np.fmin(self.min, np.where(valid, values, np.inf).min(axis=0, initial=np.inf))
+        self.max = np.fmax(self.max, np.where(valid, values, -np.inf).max(axis=0, initial=-np.inf))
+
+    def std(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+
+def compute_data_stats(data, sample_size=STATS_SAMPLE_ROWS, chunk_rows=STATS_CHUNK_ROWS,
+                       cancel_event=None, seed=0):
+    """
+    Compute missing values, describe()-style summaries and memory usage.
+
+    Args:
+        data (pandas.DataFrame): Frame to analyze
+        sample_size (int): Row count above which quantiles and object-column
+            memory are estimated from a sample of this many rows
+        chunk_rows (int): Rows per chunk for the streaming accumulators
+        cancel_event (threading.Event): Checked between chunks; when set the
+            function gives up and returns None
+        seed (int): Sampling seed
+
+    Returns:
+        dict: 'missing_values', 'summary_stats' (column -> count/mean/std/min/
+        25%/50%/75%/max like describe().to_dict()), 'memory_usage',
+        'memory_bytes', 'stats_sampled' and 'stats_sample_rows'; None if cancelled
+    """
+    n_rows = len(data)
+    numeric_columns = list(data.select_dtypes(include=[np.number]).columns)
+    moments = _Moments(len(numeric_columns))
+    missing = np.zeros(data.shape[1], dtype=np.int64)
+
+    for start in range(0, n_rows, chunk_rows):
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        chunk = data.iloc[start:start + chunk_rows]
+        missing += chunk.isna().sum().to_numpy(dtype=np.int64)
+        if numeric_columns:
+            moments.add(chunk[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan))
+
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+    positions = sample_rows(n_rows, sample_size, seed)
+    sample = data.iloc[positions]
+    sampled = len(positions) < n_rows
+
+    summary_stats = {}
+    if numeric_columns:
+        with np.errstate(all='ignore'):
+            values = sample[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            quantiles = np.full((3, len(numeric_columns)), np.nan)
+            has_values = ~np.isnan(values).all(axis=0)
+            if has_values.any():
+                quantiles[:, has_values] = np.nanpercentile(values[:, has_values], [25, 50, 75], axis=0)
+        std = moments.std()
+        for i, column in enumerate(numeric_columns):
+            present = moments.count[i] > 0
+            summary_stats[column] = {
+                'count': float(moments.count[i]),
+                'mean': float(moments.mean[i]) if present else np.nan,
+                'std': float(std[i]),
+                'min': float(moments.min[i]) if present else np.nan,
+                '25%': float(quantiles[0, i]),
+                '50%': float(quantiles[1, i]),
+                '75%': float(quantiles[2, i]),
+                'max': float(moments.max[i]) if present else np.nan,
+            }
+
+    memory_bytes = estimate_memory_bytes(data, positions=positions)
+    deep_columns = _deep_columns(data)
+
+    return {
+        'missing_values': dict(zip(data.columns, missing.tolist())),
+        'summary_stats': summary_stats,
+        'memory_usage': f"{'~' if sampled and deep_columns else ''}{memory_bytes / (1024 * 1024):.2f} MB",
+        'memory_bytes': memory_bytes,
+        'stats_sampled': sampled,
+        'stats_sample_rows': len(positions),
+    }
+
+
+class StatsJob:
+    """compute_data_stats on a daemon thread, with a result callback and cancellation."""
+
+    def __init__(self, data, callback=None, **kwargs):
+        """
+        Args:
+            data (pandas.DataFrame): Frame to analyze
+            callback (callable): Called from the worker thread with the stats
+                dict when the job finishes without being cancelled
+            **kwargs: Passed to compute_data_stats
+        """
+        self.logger = logging.getLogger(__name__)
+        self.data = data
+        self.callback = callback
+        self.kwargs = kwargs
+        self.result = None
+        self.error = None
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="data-stats", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.result = compute_data_stats(self.data, cancel_event=self._cancel, **self.kwargs)
+            if self.result is not None and not self._cancel.is_set() and self.callback is not None:
+                self.callback(self.result)
+        except Exception as e:
+            self.error = e
+            self.logger.error(f"Error computing data statistics: {e}")
+        finally:
+            self.data = None
+            self._done.set()
+
+    def cancel(self):
+        """Ask the job to stop at the next chunk; its callback will not be called."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Block until the job finishes or is cancelled; returns True if it finished."""
+        return self._done.wait(timeout)
@@ -0,0 +1,111 @@
+"""
+Content-based file format detection for the Stock Prediction GUI.
+
+Several extensions are ambiguous (".h5" is both an HDF5 dataset and a Keras
+model, ".arrow" and ".ipc" may be an Arrow file or an Arrow stream) and files
+are often misnamed, so DataManager picks a loader from the first bytes of the
+file and only falls back to the extension for formats without a signature
+(CSV, JSON, text). The answer is cached per file fingerprint (path, size and
+modification time), so reloading an unchanged file does not touch the disk.
+"""
+
+import os
+import zipfile
+from functools import lru_cache
+
+# Bytes read from the head of a file; HDF5 signatures may follow a user block
+SNIFF_BYTES = 4096
+SNIFF_CACHE_SIZE = 1024
+
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+HDF5_SIGNATURE_OFFSETS = (0, 512, 1024, 2048)
+
+# (format, offset, magic) checked in order against the head of the file
+SIGNATURES = (
+    ('parquet', 0, b'PAR1'),
+    ('parquet', 0, b'PARE'),  # Encrypted footer
+    ('feather', 0, b'ARROW1'),  # Arrow IPC file, i.e. Feather v2
+    ('feather', 0, b'FEA1'),  # Feather v1
+    ('arrow_stream', 0, b'\xff\xff\xff\xff'),  # IPC stream continuation marker
+    ('sqlite', 0, b'SQLite format 3\x00'),
+    ('duckdb', 8, b'DUCK'),
+    ('npy', 0, b'\x93NUMPY'),
+    ('excel', 0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),  # OLE2 (.xls)
+)
+
+ZIP_SIGNATURES = (b'PK\x03\x04', b'PK\x05\x06')
+
+
+def sniff_format(file_path):
+    """
+    Detect a file's format from its content.
+
+    Args:
+        file_path (str): File to inspect
+
+    Returns:
+        str: One of 'parquet', 'feather', 'arrow_stream', 'sqlite', 'duckdb',
+        'npy', 'npz', 'excel', 'hdf5', 'keras' or 'pickle', or None when the
+        content has no recognized signature
+    """
+    stat = os.stat(file_path)
+    return _sniff(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=SNIFF_CACHE_SIZE)
+def _sniff(path, size, mtime_ns):
+    """Cached on (path, size, mtime_ns) so a changed file is sniffed again."""
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+
+    for file_format, offset, magic in SIGNATURES:
+        if head[offset:offset + len(magic)] == magic:
+            return file_format
+
+    if any(head[offset:offset + len(HDF5_SIGNATURE)] == HDF5_SIGNATURE for offset in HDF5_SIGNATURE_OFFSETS):
+        return _hdf5_kind(path)
+
+    if head[:4] in ZIP_SIGNATURES:
+        return _zip_kind(path)
+
+    # Binary pickles (protocol 2+) start with PROTO and the protocol number
+    if len(head) >= 2 and head[0] == 0x80 and 2 <= head[1] <= 5:
+        return 'pickle'
+
+    return None
+
+
+def _hdf5_kind(path):
+    """'keras' for a model saved by Keras, 'hdf5' for any other HDF5 file."""
+    try:
+        import h5py
+    except ImportError:
+        return 'hdf5'
+    try:
+        with h5py.File(path, 'r') as f:
+            if 'model_config' in f.attrs or 'keras_version' in f.attrs:
+                return 'keras'
+    except OSError:
+        pass
+    return 'hdf5'
+
+
+def _zip_kind(path):
+    """Tell .npz archives, .keras models and .xlsx workbooks apart by their entries."""
+    try:
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+    except zipfile.BadZipFile:
+        return None
+    if '[Content_Types].xml' in names:
+        return 'excel'
+    if 'config.json' in names and ('metadata.json' in names or 'model.weights.h5' in names):
+        return 'keras'
+    if names and all(name.endswith('.npy') for name in names):
+        return 'npz'
+    return None
+
+
+def clear_sniff_cache():
+    """Forget every cached detection."""
+    _sniff.cache_clear()
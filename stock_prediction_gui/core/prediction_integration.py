@@ -8,8 +8,6 @@ This module manages model loading, prediction generation, and result handling.
 import os
 import sys
 import threading
-import time
-import json
 import logging
 from datetime import datetime
 import pandas as pd
@@ -20,6 +18,8 @@ from tkinter import messagebox
 # Import model classes
 from stock_net import StockNet
 from advanced_stock_net import AdvancedStockNet
+from model_registry import find_history_weights, get_model
+from .data_manager import DATE_COLUMN_NAMES
 
 # Import Keras integration if available
 try:
@@ -28,6 +28,67 @@ try:
 except ImportError:
     KERAS_AVAILABLE = False
 
+# Rows per forward pass: large enough to amortize Python overhead, small
+# enough that a chunk's activations stay in cache
+PREDICTION_CHUNK_ROWS = 65536
+
+# Frames per second sent to the forward pass visualizer
+VISUALIZATION_FPS = 10
+
+
+class ForwardPassFeed:
+    """
+    Feeds the forward pass visualizer at a fixed frame rate from its own thread.
+
+    The prediction loop only records the latest sampled row with update();
+    the feed thread sends at most VISUALIZATION_FPS frames per second to the
+    progress callback, so drawing never slows the computation down.
+    """
+    
+    def __init__(self, progress_callback, weights, bias, fps=VISUALIZATION_FPS):
+        self.progress_callback = progress_callback
+        self.weights = weights
+        self.bias = bias
+        self.interval = 1.0 / fps
+        self.logger = logging.getLogger(__name__)
+        self._latest = None
+        self._sent = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def start(self):
+        self._thread.start()
+        return self
+    
+    def update(self, sample_prediction, sample_input, progress):
+        """Record the newest sampled row; cheap enough to call per chunk."""
+        with self._lock:
+            self._latest = (sample_prediction, sample_input, progress)
+    
+    def stop(self):
+        """Stop the thread after sending the last recorded frame."""
+        self._stopped.set()
+        self._thread.join()
+        self._send()
+    
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self._send()
+    
+    def _send(self):
+        with self._lock:
+            frame = self._latest
+            if frame is None or frame is self._sent:
+                return
+            self._sent = frame
+        sample_prediction, sample_input, progress = frame
+        try:
+            self.progress_callback(self.weights, self.bias, sample_prediction, sample_input, progress)
+        except Exception as e:
+            self.logger.error(f"Error in forward pass visualization: {e}")
+
+
 class PredictionIntegration:
     """Integration class for prediction operations."""
     
@@ -101,23 +162,23 @@ class PredictionIntegration:
                 model_dir = os.path.abspath(os.path.dirname(params['model_path']))
                 model_file = os.path.abspath(params['model_path'])
             
-            # Load model info - try both feature_info.json and model_params.json
-            feature_info = None
+            # Weights, feature info and normalization files are read once per
+            # model and shared through the process-wide registry
+            weights_file = None
+            if model_file:
+                weights_file = os.path.join(model_dir, os.path.splitext(os.path.basename(model_file))[0] + '.npz')
+            loaded = get_model(model_dir, weights_file)
             
+            # Load model info - try both feature_info.json and model_params.json
             # Try feature_info.json first (newer format)
-            feature_info_path = os.path.join(model_dir, "feature_info.json")
-            if os.path.exists(feature_info_path):
-                with open(feature_info_path, 'r') as f:
-                    feature_info = json.load(f)
-                self.logger.info(f"Loaded feature info from: {feature_info_path}")
+            feature_info = loaded.feature_info
+            if feature_info is not None:
+                self.logger.info(f"Loaded feature info from: {os.path.join(model_dir, 'feature_info.json')}")
             
             # Try model_params.json if feature_info.json not found (older format)
             if feature_info is None:
-                model_params_path = os.path.join(model_dir, "model_params.json")
-                if os.path.exists(model_params_path):
-                    with open(model_params_path, 'r') as f:
-                        model_params = json.load(f)
-                    
+                model_params = loaded.model_params
+                if model_params is not None:
                     # Convert model_params to feature_info format
                     feature_info = {
                         'x_features': [],  # Will need to be determined from data
@@ -125,7 +186,7 @@ class PredictionIntegration:
                         'model_type': 'basic',
                         'training_params': model_params
                     }
-                    self.logger.info(f"Loaded model params from: {model_params_path}")
+                    self.logger.info(f"Loaded model params from: {os.path.join(model_dir, 'model_params.json')}")
             
             if feature_info is None:
                 # No model info files found - create a basic feature info structure
@@ -139,12 +200,18 @@ class PredictionIntegration:
                     'training_params': {'hidden_size': 4}  # Default parameters
                 }
             
-            # Load data using the data manager to handle different file formats
+            # Load data using the data manager to handle different file formats,
+            # reading only the model's columns (plus any date column, for the
+            # output file) when the feature info names them. The data panel's
+            # dataset is left as it is.
             try:
-                data_info = self.app.data_manager.load_data(params['data_file'])
-                df = self.app.data_manager.get_current_data()
-                if df is None:
-                    raise ValueError("No data loaded from file")
+                columns = None
+                if feature_info.get('x_features'):
+                    columns = list(DATE_COLUMN_NAMES) + list(feature_info['x_features'])
+                    if feature_info.get('y_feature'):
+                        columns.append(feature_info['y_feature'])
+                    columns = list(dict.fromkeys(columns))
+                df = self.app.data_manager.read_columns(params['data_file'], columns=columns)
             except Exception as e:
                 raise ValueError(f"Failed to load data from {params['data_file']}: {e}")
             
@@ -176,6 +243,9 @@ class PredictionIntegration:
             # Determine model type
             model_type = feature_info.get('model_type', 'basic')
             
+            # Feeding the forward pass visualizer is opt-in
+            visualize = bool(params.get('visualize', False))
+            
             # Load model and make predictions with forward pass visualization
             if model_type == 'keras':
                 # Load Keras model
@@ -188,7 +258,7 @@ class PredictionIntegration:
                 # Make predictions with visualization
                 predictions = self._predict_with_visualization(
                     model, X, model_feature_info, progress_callback, 
-                    model_type='keras', integration=integration
+                    model_type='keras', integration=integration, visualize=visualize
                 )
                 
             elif model_type == 'advanced':
@@ -196,7 +266,7 @@ class PredictionIntegration:
                 model = AdvancedStockNet.load_model(model_dir)
                 predictions = self._predict_with_visualization(
                     model, X, None, progress_callback, 
-                    model_type='advanced'
+                    model_type='advanced', visualize=visualize
                 )
                 
             else:
@@ -210,87 +280,56 @@ class PredictionIntegration:
                 # Log the hidden size being used
                 self.logger.info(f"Using hidden size from training parameters: {hidden_size}")
                 
-                # Load weights using the class method
-                if model_file:
-                    # If a specific model file is provided, load it
-                    model = StockNet.load_weights(model_dir, prefix=os.path.splitext(os.path.basename(model_file))[0])
+                # Build the network from the registry's weights
+                if loaded.has_weights:
+                    if 'weights_history' in (os.path.basename(loaded.weights_file),
+                                             os.path.basename(os.path.dirname(loaded.weights_file))):
+                        self.logger.info(f"Using weight file from history: {os.path.basename(loaded.weights_file)}")
+                    model = StockNet.from_arrays(loaded.arrays)
                 else:
-                    # Try to find the model file in the directory
-                    possible_model_files = [
-                        os.path.join(model_dir, "stock_model.npz"),
-                        os.path.join(model_dir, "model.npz"),
-                        os.path.join(model_dir, "final_model.npz"),
-                        os.path.join(model_dir, "best_model.npz")
-                    ]
-                    
-                    model_file_found = None
-                    for mf in possible_model_files:
-                        if os.path.exists(mf):
-                            model_file_found = mf
-                            break
-                    
-                    # If no main model file found, try weights_history directory
-                    if not model_file_found:
-                        weights_history_dir = os.path.join(model_dir, "weights_history")
-                        if os.path.exists(weights_history_dir):
-                            weight_files = [f for f in os.listdir(weights_history_dir) if f.endswith('.npz')]
-                            if weight_files:
-                                # Use the most recent weight file
-                                weight_files.sort(key=lambda x: os.path.getctime(os.path.join(weights_history_dir, x)), reverse=True)
-                                model_file_found = os.path.join(weights_history_dir, weight_files[0])
-                                self.logger.info(f"Using weight file from history: {weight_files[0]}")
-                    
+                    # Try enhanced model file search
+                    model_file_found = self._find_model_file_enhanced(model_dir)
                     if model_file_found:
-                        # Load model using the class method with the found file
-                        model = StockNet.load_weights(model_dir, prefix=os.path.splitext(os.path.basename(model_file_found))[0])
+                        found = get_model(os.path.dirname(model_file_found), model_file_found)
+                        model = StockNet.from_arrays(found.arrays)
                     else:
-                        # Try enhanced model file search
-                        model_file_found = self._find_model_file_enhanced(model_dir)
-                        if model_file_found:
-                            # Load model using the class method with the found file
-                            model_dir_found = os.path.dirname(model_file_found)
-                            model = StockNet.load_weights(model_dir_found, prefix=os.path.splitext(os.path.basename(model_file_found))[0])
-                        else:
-                            # Generate detailed error message
-                            error_msg = self._generate_model_not_found_error(model_dir)
-                            raise FileNotFoundError(error_msg)
+                        # Generate detailed error message
+                        error_msg = self._generate_model_not_found_error(model_dir)
+                        raise FileNotFoundError(error_msg)
                 
                 # Check for normalization parameters
-                scaler_mean_path = os.path.join(model_dir, "scaler_mean.csv")
-                scaler_std_path = os.path.join(model_dir, "scaler_std.csv")
+                normalization = loaded.normalization
                 
-                if os.path.exists(scaler_mean_path) and os.path.exists(scaler_std_path):
-                    model.X_min = np.loadtxt(scaler_mean_path)
-                    model.X_max = model.X_min + np.loadtxt(scaler_std_path)
+                if 'scaler_mean' in normalization and 'scaler_std' in normalization:
+                    model.X_min = normalization['scaler_mean']
+                    model.X_max = model.X_min + normalization['scaler_std']
                     
                     # Normalize input data
                     X_norm = (X - model.X_min) / (model.X_max - model.X_min + 1e-8)
                     predictions = self._predict_with_visualization(
                         model, X_norm, None, progress_callback, 
-                        model_type='basic', original_X=X
+                        model_type='basic', original_X=X, visualize=visualize
                     )
                     
                     # Denormalize predictions
-                    target_min_path = os.path.join(model_dir, "target_min.csv")
-                    target_max_path = os.path.join(model_dir, "target_max.csv")
-                    
-                    if os.path.exists(target_min_path) and os.path.exists(target_max_path):
-                        Y_min = np.loadtxt(target_min_path)
-                        Y_max = np.loadtxt(target_max_path)
+                    if 'target_min' in normalization and 'target_max' in normalization:
+                        Y_min = normalization['target_min']
+                        Y_max = normalization['target_max']
                         predictions = predictions * (Y_max - Y_min) + Y_min
                 else:
                     # No normalization parameters, use raw predictions
                     predictions = self._predict_with_visualization(
                         model, X, None, progress_callback, 
-                        model_type='basic'
+                        model_type='basic', visualize=visualize
                     )
             
             # Create output file
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = os.path.join(model_dir, f"predictions_{timestamp}.csv")
             
-            # Save predictions
-            results_df = df.copy()
+            # Save predictions; a shallow copy gets the new columns without
+            # duplicating the loaded data
+            results_df = df.copy(deep=False)
             results_df['predicted_' + y_feature] = predictions.flatten()
             
             if y_feature in df.columns:
@@ -311,56 +350,68 @@ class PredictionIntegration:
                 completion_callback(None, str(e))
     
     def _predict_with_visualization(self, model, X, feature_info, progress_callback, 
-                                  model_type='basic', integration=None, original_X=None):
-        """Make predictions with forward pass visualization."""
+                                  model_type='basic', integration=None, original_X=None, visualize=False):
+        """
+        Make predictions, optionally feeding the forward pass visualizer.
+
+        The whole input runs through vectorized forward passes of
+        PREDICTION_CHUNK_ROWS rows. With visualize on, one row sampled from each
+        chunk is offered to a ForwardPassFeed, which draws at a fixed frame
+        rate on its own thread; computation never waits for it.
+
+        Args:
+            model: Loaded model
+            X (numpy.ndarray): Model inputs
+            feature_info (dict): Keras feature info (scalers), else None
+            progress_callback (callable): callback(weights, bias, prediction,
+                input_row, progress_percent)
+            model_type (str): 'basic', 'advanced' or 'keras'
+            integration (KerasModelIntegration): Required for Keras models
+            original_X (numpy.ndarray): Unnormalized inputs shown instead of X
+            visualize (bool): Send sampled forward passes to progress_callback
+
+        Returns:
+            numpy.ndarray: Flat array of predictions (shorter than X if stopped)
+        """
         try:
             total_samples = len(X)
-            batch_size = 32  # Default batch size
-            
-            # Determine batch size from params if available
-            if hasattr(self.app, 'prediction_batch_size'):
-                batch_size = self.app.prediction_batch_size
+            feed = None
+            if visualize and progress_callback and total_samples:
+                # Parameters do not change while predicting: extract them once
+                weights, bias = self._extract_model_parameters(model, model_type)
+                feed = ForwardPassFeed(progress_callback, weights, bias).start()
             
+            rng = np.random.default_rng()
             predictions = []
-            
-            # Process in batches for visualization
-            for i in range(0, total_samples, batch_size):
-                if self.stop_prediction:
-                    break
-                
-                batch_end = min(i + batch_size, total_samples)
-                X_batch = X[i:batch_end]
-                
-                # Make prediction for this batch
-                if model_type == 'keras':
-                    batch_predictions = integration.predict(model, X_batch, feature_info)
-                else:
-                    # For StockNet models, use forward method instead of predict
-                    batch_predictions = model.forward(X_batch)
-                
-                predictions.extend(batch_predictions.flatten())
-                
-                # Calculate progress
-                progress = (batch_end / total_samples) * 100
-                
-                # Get model weights and bias for visualization
-                weights, bias = self._extract_model_parameters(model, model_type)
-                
-                # Use original X for visualization if available (for normalized data)
-                input_data = original_X[i:batch_end] if original_X is not None else X_batch
-                
-                # Call progress callback with visualization data
-                if progress_callback:
-                    # Use the first prediction of the batch for visualization
-                    sample_prediction = batch_predictions[0] if len(batch_predictions) > 0 else 0
-                    sample_input = input_data[0] if len(input_data) > 0 else X_batch[0]
+            try:
+                for i in range(0, total_samples, PREDICTION_CHUNK_ROWS):
+                    if self.stop_prediction:
+                        break
                     
-                    progress_callback(weights, bias, sample_prediction, sample_input, progress)
-                
-                # Small delay for visualization
-                time.sleep(0.01)
-            
-            return np.array(predictions)
+                    chunk_end = min(i + PREDICTION_CHUNK_ROWS, total_samples)
+                    X_chunk = X[i:chunk_end]
+                    
+                    if model_type == 'keras':
+                        chunk_predictions = integration.predict(model, X_chunk, feature_info)
+                    elif model_type == 'advanced':
+                        # Inference mode: no dropout
+                        chunk_predictions = model.predict(X_chunk)
+                    else:
+                        chunk_predictions = model.forward(X_chunk)
+                    chunk_predictions = np.asarray(chunk_predictions).reshape(-1)
+                    predictions.append(chunk_predictions)
+                    
+                    if feed is not None:
+                        row = i + rng.integers(chunk_end - i)
+                        input_row = original_X[row] if original_X is not None else X[row]
+                        feed.update(chunk_predictions[row - i], input_row, chunk_end / total_samples * 100)
+            finally:
+                if feed is not None:
+                    feed.stop()
+            
+            if not predictions:
+                return np.empty(0)
+            return np.concatenate(predictions)
             
         except Exception as e:
             self.logger.error(f"Error in prediction with visualization: {e}")
@@ -436,15 +487,11 @@ class PredictionIntegration:
                                 self.logger.info(f"Using model file from other model directory: {mf}")
                                 return mf
                         
-                        # Check weights_history in this directory
-                        weights_history_dir = os.path.join(item_path, "weights_history")
-                        if os.path.exists(weights_history_dir):
-                            weight_files = [f for f in os.listdir(weights_history_dir) if f.endswith('.npz')]
-                            if weight_files:
-                                weight_files.sort(key=lambda x: os.path.getctime(os.path.join(weights_history_dir, x)), reverse=True)
-                                model_file_found = os.path.join(weights_history_dir, weight_files[0])
-                                self.logger.info(f"Using weight file from other model directory: {weight_files[0]}")
-                                return model_file_found
+                        # Check weights_history in this directory (store or legacy NPZ files)
+                        model_file_found = find_history_weights(item_path)
+                        if model_file_found:
+                            self.logger.info(f"Using weight history from other model directory: {model_file_found}")
+                            return model_file_found
             
             # 3. Check the main project root (one level up from stock_prediction_gui)
             main_project_root = os.path.dirname(parent_dir)
@@ -464,15 +511,11 @@ class PredictionIntegration:
                                 self.logger.info(f"Using model file from main project root: {mf}")
                                 return mf
                         
-                        # Check weights_history in this directory
-                        weights_history_dir = os.path.join(item_path, "weights_history")
-                        if os.path.exists(weights_history_dir):
-                            weight_files = [f for f in os.listdir(weights_history_dir) if f.endswith('.npz')]
-                            if weight_files:
-                                weight_files.sort(key=lambda x: os.path.getctime(os.path.join(weights_history_dir, x)), reverse=True)
-                                model_file_found = os.path.join(weights_history_dir, weight_files[0])
-                                self.logger.info(f"Using weight file from main project root: {weight_files[0]}")
-                                return model_file_found
+                        # Check weights_history in this directory (store or legacy NPZ files)
+                        model_file_found = find_history_weights(item_path)
+                        if model_file_found:
+                            self.logger.info(f"Using weight history from main project root: {model_file_found}")
+                            return model_file_found
             
             return None
             
@@ -509,11 +552,8 @@ class PredictionIntegration:
                                 break
                         
                         # Check weights_history
-                        weights_history_dir = os.path.join(item_path, "weights_history")
-                        if os.path.exists(weights_history_dir):
-                            weight_files = [f for f in os.listdir(weights_history_dir) if f.endswith('.npz')]
-                            if weight_files:
-                                has_model_files = True
+                        if find_history_weights(item_path):
+                            has_model_files = True
                         
                         if has_model_files:
                             other_models.append(item)
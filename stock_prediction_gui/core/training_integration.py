@@ -25,6 +25,8 @@ if project_root not in sys.path:
 # Import model classes
 from stock_net import StockNet
 from advanced_stock_net import AdvancedStockNet
+from artifact_writer import ArtifactWriter
+from checkpoint import CHECKPOINT_FILE, TrainingCheckpointer
 
 # Import Keras integration if available
 try:
@@ -43,6 +45,7 @@ class TrainingIntegration:
         # Training state
         self.training_thread = None
         self.stop_training = False
+        self.checkpointer = None
         
         # Training manager for live plotting
         try:
@@ -140,6 +143,10 @@ class TrainingIntegration:
         """Stop the training process."""
         self.stop_training = True
         
+        # Ask the basic model loop to checkpoint and stop after this epoch
+        if self.checkpointer is not None:
+            self.checkpointer.request_stop()
+        
         # Stop training manager if available
         if self.training_manager:
             self.training_manager.stop_training()
@@ -171,15 +178,16 @@ class TrainingIntegration:
     
     def _training_worker(self, params, model_dir, progress_callback, completion_callback):
         """Training worker function that runs in a separate thread."""
+        writer = None
         try:
             self.logger.info(f"Starting training in directory: {model_dir}")
             
             # Load data using the data manager to handle different file formats
             try:
-                data_info = self.app.data_manager.load_data(params['data_file'])
-                df = self.app.data_manager.get_current_data()
-                if df is None:
-                    raise ValueError("No data loaded from file")
+                # Only read the columns the model trains on, leaving the
+                # data panel's dataset as it is
+                df = self.app.data_manager.read_columns(
+                    params['data_file'], columns=list(params['x_features']) + [params['y_feature']])
             except Exception as e:
                 raise ValueError(f"Failed to load data from {params['data_file']}: {e}")
             
@@ -193,6 +201,11 @@ class TrainingIntegration:
                 random_state=params.get('random_seed', 42)
             )
             
+            # Write artifacts in the background; the input copy does not
+            # depend on the model, so it overlaps with training
+            writer = ArtifactWriter()
+            writer.write_csv(df, os.path.join(model_dir, "training_data.csv"))
+            
             # Choose model type
             model_type = params.get('model_type', 'basic')
             total_epochs = params.get('epochs', 100)
@@ -272,7 +285,7 @@ class TrainingIntegration:
                     history.history.get('loss', []),
                     history.history.get('val_loss', [])
                 ])
-                np.savetxt(os.path.join(model_dir, "training_losses.csv"), losses_data, delimiter=',')
+                writer.savetxt(os.path.join(model_dir, "training_losses.csv"), losses_data)
                 
             elif model_type == 'advanced':
                 # Use advanced model
@@ -316,6 +329,10 @@ class TrainingIntegration:
                         progress = ((epoch + 1) / total_epochs) * 100
                         safe_progress_callback(epoch + 1, train_loss, val_loss, progress)
                 
+                # Checkpoint periodically and when the user stops training
+                self.checkpointer = TrainingCheckpointer(os.path.join(model_dir, CHECKPOINT_FILE),
+                                                         every=params.get('checkpoint_every', 0))
+                
                 # Train basic model with progress callback
                 train_losses, val_losses = model.train(
                     X_train_norm, y_train_norm,
@@ -326,47 +343,44 @@ class TrainingIntegration:
                     save_history=True,
                     history_interval=params.get('history_interval', 50),
                     patience=params.get('patience', 20),
-                    progress_callback=basic_progress_callback if safe_progress_callback else None
+                    progress_callback=basic_progress_callback if safe_progress_callback else None,
+                    checkpointer=self.checkpointer
                 )
+                self.checkpointer = None
                 
                 # Save basic model
-                model.save_weights(model_dir, "stock_model")
+                model.save_weights(model_dir, "stock_model", writer=writer)
                 
                 # Save normalization parameters
-                np.savetxt(os.path.join(model_dir, "scaler_mean.csv"), model.X_min, delimiter=',')
-                np.savetxt(os.path.join(model_dir, "scaler_std.csv"), model.X_max - model.X_min, delimiter=',')
+                writer.savetxt(os.path.join(model_dir, "scaler_mean.csv"), model.X_min)
+                writer.savetxt(os.path.join(model_dir, "scaler_std.csv"), model.X_max - model.X_min)
                 
                 if model.has_target_norm:
-                    np.savetxt(os.path.join(model_dir, "target_min.csv"), [model.Y_min], delimiter=',')
-                    np.savetxt(os.path.join(model_dir, "target_max.csv"), [model.Y_max], delimiter=',')
+                    writer.savetxt(os.path.join(model_dir, "target_min.csv"), [model.Y_min])
+                    writer.savetxt(os.path.join(model_dir, "target_max.csv"), [model.Y_max])
                 
                 # Save training losses
                 losses_data = np.column_stack([train_losses, val_losses])
-                np.savetxt(os.path.join(model_dir, "training_losses.csv"), losses_data, delimiter=',')
+                writer.savetxt(os.path.join(model_dir, "training_losses.csv"), losses_data)
             
             # Save feature info
             feature_info = {
                 'x_features': params['x_features'],
                 'y_feature': params['y_feature'],
                 'model_type': model_type,
-                'training_params': params
+                'training_params': params,
+                'rows_trained': len(df)
             }
             
-            with open(os.path.join(model_dir, "feature_info.json"), 'w') as f:
-                json.dump(feature_info, f, indent=4)
-            
-            # Save training data
-            df.to_csv(os.path.join(model_dir, "training_data.csv"), index=False)
+            writer.write_json(os.path.join(model_dir, "feature_info.json"), feature_info)
             
             # Move weight history if it exists (for basic models)
             if model_type == 'basic':
-                weights_history_src = os.path.join(os.getcwd(), "weights_history")
-                weights_history_dst = os.path.join(model_dir, "weights_history")
-                if os.path.exists(weights_history_src):
-                    import shutil
-                    if os.path.exists(weights_history_dst):
-                        shutil.rmtree(weights_history_dst)
-                    shutil.move(weights_history_src, weights_history_dst)
+                writer.move(os.path.join(os.getcwd(), "weights_history"),
+                            os.path.join(model_dir, "weights_history"))
+            
+            # Barrier: all artifacts must be on disk before completion is reported
+            writer.close()
             
             self.logger.info(f"Training completed successfully. Model saved to: {model_dir}")
             # Log file path, format, and model type for debugging
@@ -386,6 +400,8 @@ class TrainingIntegration:
             safe_completion_callback(model_dir)
             
         except Exception as e:
+            if writer is not None:
+                writer.shutdown()
             self.logger.error(f"Training failed: {e}")
             safe_completion_callback(None, str(e))
     
@@ -19,6 +19,10 @@ class DataPanel:
         # Create the main panel
         self.frame = ttk.Frame(parent, padding="10")
         self.create_widgets()
+        
+        # Statistics are computed in the background after a file loads
+        if hasattr(self.app, 'data_manager'):
+            self.app.data_manager.add_stats_listener(self.on_stats_ready)
     
     def create_widgets(self):
         """Create the consolidated panel widgets."""
@@ -316,6 +320,11 @@ class DataPanel:
         ttk.Label(info_grid, text="Last Accessed:").grid(row=7, column=0, sticky="w", pady=2)
         self.last_accessed_var = tk.StringVar(value="Not loaded")
         ttk.Label(info_grid, textvariable=self.last_accessed_var, font=("Arial", 9)).grid(row=7, column=1, sticky="w", padx=(10, 0), pady=2)
+        
+        # Data cache usage and counters
+        ttk.Label(info_grid, text="Data Cache:").grid(row=8, column=0, sticky="w", pady=2)
+        self.cache_stats_var = tk.StringVar(value="Empty")
+        ttk.Label(info_grid, textvariable=self.cache_stats_var, font=("Arial", 9)).grid(row=8, column=1, sticky="w", padx=(10, 0), pady=2)
     
     def create_bottom_section(self):
         """Create the bottom action section."""
@@ -663,6 +672,9 @@ class DataPanel:
             if 'memory_usage' in data_info:
                 self.memory_usage_var.set(data_info['memory_usage'])
             
+            if 'cache_summary' in data_info:
+                self.cache_stats_var.set(data_info['cache_summary'])
+            
             if 'shape' in data_info:
                 rows, cols = data_info['shape']
                 self.data_shape_var.set(f"{rows:,} rows × {cols} columns")
@@ -704,6 +716,23 @@ class DataPanel:
             self.format_details_var.set("Error")
             self.last_accessed_var.set("Error")
     
+    def on_stats_ready(self, data_info):
+        """Show background statistics; called from the statistics worker thread."""
+        try:
+            self.frame.after(0, lambda: self._show_stats(data_info))
+        except RuntimeError:
+            # The Tk main loop is gone
+            pass
+    
+    def _show_stats(self, data_info):
+        """Update the display with statistics if they belong to the current data."""
+        if data_info is not self.app.data_manager.current_data_info:
+            return
+        self.memory_usage_var.set(data_info.get('memory_usage', 'Unknown'))
+        total_missing = sum(data_info.get('missing_values', {}).values())
+        sampled = " (sampled)" if data_info.get('stats_sampled') else ""
+        self.status_var.set(f"Statistics ready{sampled}: {total_missing:,} missing values")
+    
     def get_format_specific_details(self, file_info, data_info):
         """Get format-specific details for display."""
         try:
@@ -712,13 +741,14 @@ class DataPanel:
             
             if format_type == 'JSON':
                 # JSON-specific details
-                if data_info.get('file_path', '').endswith('.json'):
+                if data_info.get('file_path', '').endswith(('.json', '.jsonl', '.ndjson')):
                     json_info = self.app.data_manager.get_json_info(data_info.get('file_path'))
                     if json_info:
                         details.append(f"Structure: {json_info.get('structure_type', 'Unknown')}")
                         details.append(f"Format: {json_info.get('format_type', 'Unknown')}")
                         if json_info.get('format_type') == 'json_lines':
-                            details.append(f"Lines: {json_info.get('valid_json_lines', 0)} valid")
+                            approx = '~' if json_info.get('sampled') else ''
+                            details.append(f"Lines: {approx}{json_info.get('valid_json_lines', 0):,} valid")
             
             elif format_type == 'Feather':
                 # Feather-specific details
@@ -782,7 +812,7 @@ class DataPanel:
             file_path = data_info.get('file_path', '')
             
             # Log JSON-specific information if it's a JSON file
-            if file_path.endswith('.json'):
+            if file_path.endswith(('.json', '.jsonl', '.ndjson')):
                 json_info = self.app.data_manager.get_json_info(file_path)
                 if json_info:
                     self.logger.info(f"JSON Structure: {json_info.get('structure_type')}")
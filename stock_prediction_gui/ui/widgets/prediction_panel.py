@@ -117,6 +117,11 @@ class PredictionPanel:
         ttk.Checkbutton(data_frame, text="Use current data", variable=self.use_current_data_var, 
                        command=self.on_use_current_data_change).pack(anchor="w", pady=(5, 0))
         
+        # Drawing forward passes is opt-in; predictions run at full speed either way
+        self.visualize_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(data_frame, text="Visualize forward pass", 
+                       variable=self.visualize_var).pack(anchor="w")
+        
     def create_compact_controls_section(self, parent):
         """Create compact controls section."""
         # Controls frame
@@ -354,12 +359,13 @@ class PredictionPanel:
             messagebox.showwarning("No Data", "Please select a valid prediction data file.")
             return
         
-        # Start forward pass visualization
-        self.forward_pass_visualizer.start_prediction_mode()
-        
         # Get prediction parameters
         params = self.get_prediction_params()
         
+        # Start forward pass visualization
+        if params['visualize']:
+            self.forward_pass_visualizer.start_prediction_mode()
+        
         # Start prediction with visualization callback
         if self.app.start_prediction(params, self.on_prediction_progress):
             self.predict_button.config(state="disabled")
@@ -555,6 +561,7 @@ class PredictionPanel:
             'use_current_data': self.use_current_data_var.get(),
             'batch_size': getattr(self.app, 'prediction_batch_size', 32),
             'confidence_threshold': getattr(self.app, 'prediction_confidence', 0.8),
+            'visualize': self.visualize_var.get(),
             'visualization_callback': self.on_prediction_progress
         }
         return params
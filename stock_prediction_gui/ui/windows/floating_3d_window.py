@@ -22,6 +22,8 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+from weight_history import load_snapshots
+
 class Floating3DWindow:
     """Floating window for 3D Matplotlib plots."""
     
@@ -101,9 +103,9 @@ class Floating3DWindow:
             # Load weights history if available
             weights_dir = os.path.join(self.model_path, "weights_history")
             if os.path.exists(weights_dir):
-                self.weights_files = sorted([f for f in os.listdir(weights_dir) 
-                                           if f.endswith('.npz')])
-                self.logger.info(f"Found {len(self.weights_files)} weight files")
+                # Memory-mapped store, or per-epoch NPZ files from older models
+                self.weights_files = load_snapshots(weights_dir)
+                self.logger.info(f"Found {len(self.weights_files)} weight snapshots")
             else:
                 self.weights_files = []
                 self.logger.warning("No weights history found")
@@ -5,6 +5,8 @@ Validation utilities for the Stock Prediction GUI.
 import os
 import logging
 
+from weight_history import has_snapshots
+
 class ValidationUtils:
     """Utility class for input validation."""
     
@@ -99,13 +101,11 @@ class ValidationUtils:
         # If no main model file found, check weights_history directory
         if not has_model_file:
             weights_history_dir = os.path.join(model_dir, 'weights_history')
-            if os.path.exists(weights_history_dir):
-                weight_files = [f for f in os.listdir(weights_history_dir) if f.endswith('.npz')]
-                if weight_files:
-                    has_model_file = True
+            if os.path.isdir(weights_history_dir) and has_snapshots(weights_history_dir):
+                has_model_file = True
         
         if not has_model_file:
-            return False, "No model weights file found (stock_model.npz, model.npz, final_model.npz, best_model.npz, or weight files in weights_history/)"
+            return False, "No model weights file found (stock_model.npz, model.npz, final_model.npz, best_model.npz, or snapshots in weights_history/)"
         
         # Check for feature info (optional but preferred)
         feature_info_path = os.path.join(model_dir, 'feature_info.json')
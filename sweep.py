@@ -0,0 +1,444 @@
+"""
+Hyperparameter sweep for Stock Price Prediction Neural Network
+
+Runs many train.train_model trials in parallel from a grid or random-search
+specification and writes a leaderboard of validation MSE per trial.
+
+- Trials fan out across a ProcessPoolExecutor.
+- BLAS/OpenMP thread pools are pinned to one thread per worker, so N workers
+  use N cores instead of oversubscribing every core N times.
+- The data file is read once by the parent and placed in shared memory; every
+  worker builds its DataFrame as a zero-copy view of that block.
+- Successive halving: all trials first run for a small epoch budget, then only
+  the best 1/eta survive to the next rung with eta times more epochs, until
+  max_epochs is reached. Survivors resume from the checkpoint their previous
+  rung left in the trial directory, so each rung only trains the extra epochs.
+
+Usage:
+    python sweep.py --data_file <csv> --y_feature close --spec sweep_spec.json --output_dir sweeps/run1
+
+Spec format (JSON file or inline JSON string). Each key is a train_model
+argument; a list gives the candidate values, a dict gives a random-search
+distribution:
+
+    {
+        "hidden_size": [4, 8, 16, 32],
+        "learning_rate": {"log_uniform": [0.0001, 0.01]},
+        "batch_size": [16, 32, 64],
+        "patience": [10, 20],
+        "x_features": [["open", "high", "low", "vol"], ["open", "high", "low", "vol", "ma_10"]]
+    }
+
+Grid search expands every list (distributions are not allowed); random search
+draws --n_trials samples.
+"""
+
+import os
+import sys
+import argparse
+import contextlib
+import itertools
+import json
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# Add the project directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# BLAS libraries size their thread pools when NumPy is first imported, so these
+# must be set in the environment before the worker processes start
+BLAS_THREAD_VARIABLES = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                         'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS')
+
+# Worker-side handles to the shared data block
+_shared_block = None
+_shared_frame = None
+
+
+def load_spec(spec):
+    """
+    Load a sweep specification.
+
+    Args:
+        spec (str): Path to a JSON file, or an inline JSON string
+
+    Returns:
+        dict: Mapping of train_model argument name to candidate values or distribution
+    """
+    if os.path.exists(spec):
+        with open(spec, 'r') as f:
+            return json.load(f)
+    return json.loads(spec)
+
+
+def _sample_value(values, rng):
+    """Draw one value from a candidate list or a distribution dict."""
+    if isinstance(values, dict):
+        if 'log_uniform' in values:
+            low, high = values['log_uniform']
+            return float(math.exp(rng.uniform(math.log(low), math.log(high))))
+        if 'uniform' in values:
+            low, high = values['uniform']
+            return float(rng.uniform(low, high))
+        if 'int_uniform' in values:
+            low, high = values['int_uniform']
+            return int(rng.randint(low, high + 1))
+        raise ValueError(f"Unknown distribution in sweep spec: {values}")
+    if isinstance(values, list):
+        return values[rng.randint(len(values))]
+    return values
+
+
+def generate_trials(spec, search='grid', n_trials=20, seed=0):
+    """
+    Expand a sweep specification into a list of trial configurations.
+
+    Args:
+        spec (dict): Sweep specification (see module docstring)
+        search (str): 'grid' or 'random'
+        n_trials (int): Number of configurations to draw for random search
+        seed (int): Seed for random search sampling
+
+    Returns:
+        list: One dict of train_model keyword arguments per trial
+    """
+    if search == 'grid':
+        keys = list(spec.keys())
+        value_lists = []
+        for key in keys:
+            values = spec[key]
+            if isinstance(values, dict):
+                raise ValueError(f"Grid search needs explicit values for '{key}', got a distribution")
+            value_lists.append(values if isinstance(values, list) else [values])
+        return [dict(zip(keys, combo)) for combo in itertools.product(*value_lists)]
+
+    if search == 'random':
+        rng = np.random.RandomState(seed)
+        return [{key: _sample_value(values, rng) for key, values in spec.items()}
+                for _ in range(n_trials)]
+
+    raise ValueError(f"Unknown search type: {search}")
+
+
+def rung_budgets(min_epochs, max_epochs, eta):
+    """
+    Epoch budget of each successive-halving rung.
+
+    Args:
+        min_epochs (int): Budget of the first rung
+        max_epochs (int): Budget of the final rung
+        eta (int): Growth factor between rungs
+
+    Returns:
+        list: Increasing epoch budgets ending at max_epochs
+    """
+    budgets = []
+    epochs = max(1, min_epochs)
+    while epochs < max_epochs:
+        budgets.append(epochs)
+        epochs *= eta
+    budgets.append(max_epochs)
+    return budgets
+
+
+def pin_blas_threads(n_threads=1):
+    """
+    Limit BLAS/OpenMP thread pools for this process and any it starts.
+
+    Environment variables only take effect in processes that import NumPy
+    afterwards (the spawned workers); threadpoolctl, when installed, also
+    limits libraries that are already loaded.
+    """
+    for variable in BLAS_THREAD_VARIABLES:
+        os.environ[variable] = str(n_threads)
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(n_threads)
+    except ImportError:
+        pass
+
+
+def share_frame(df):
+    """
+    Copy a numeric DataFrame into a shared memory block.
+
+    Args:
+        df (pandas.DataFrame): Numeric data to share
+
+    Returns:
+        tuple: (SharedMemory block, descriptor dict needed to attach to it)
+    """
+    values = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+    block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+    descriptor = {
+        'name': block.name,
+        'shape': values.shape,
+        'dtype': values.dtype.str,
+        'columns': list(df.columns)
+    }
+    return block, descriptor
+
+
+def _init_worker(descriptor, n_threads):
+    """Pool initializer: pin BLAS threads and attach to the shared data."""
+    global _shared_block, _shared_frame
+
+    pin_blas_threads(n_threads)
+
+    # Spawned workers share the parent's resource tracker, and the parent
+    # unlinks the block once the sweep finishes
+    _shared_block = shared_memory.SharedMemory(name=descriptor['name'])
+    values = np.ndarray(descriptor['shape'], dtype=np.dtype(descriptor['dtype']), buffer=_shared_block.buf)
+    values.flags.writeable = False
+    _shared_frame = pd.DataFrame(values, columns=descriptor['columns'], copy=False)
+
+
+def _run_trial(trial):
+    """
+    Run one trial in a worker process.
+
+    Args:
+        trial (dict): Trial id, rung, epoch budget, whether the rung is the last,
+            model directory and train_model arguments
+
+    Returns:
+        dict: Trial record for the leaderboard
+    """
+    from train import train_model
+
+    params = dict(trial['params'])
+    model_dir = trial['model_dir']
+    os.makedirs(model_dir, exist_ok=True)
+
+    record = {
+        'trial_id': trial['trial_id'],
+        'rung': trial['rung'],
+        'epochs': trial['epochs'],
+        'model_dir': model_dir,
+        'params': dict(params)
+    }
+
+    start_time = time.time()
+    try:
+        x_features = params.pop('x_features', trial['x_features'])
+        if isinstance(x_features, str):
+            x_features = x_features.split(',')
+
+        # Rungs that a later rung may continue end with a checkpoint (saved
+        # once, after their last epoch); later rungs resume from it
+        params['checkpoint_every'] = 0 if trial['final'] else trial['epochs']
+        params['resume'] = trial['rung'] > 0
+
+        # Keep per-epoch output out of the parent's terminal. Trials share
+        # data_file, so none of them writes its own training_data.csv copy
+        with open(os.path.join(model_dir, 'train.log'), 'a' if trial['rung'] > 0 else 'w') as log_file, \
+                contextlib.redirect_stdout(log_file):
+            result = train_model(trial['data_file'], model_dir, x_features, trial['y_feature'],
+                                 epochs=trial['epochs'], save_history=False, save_training_data=False,
+                                 df=_shared_frame, **params)
+
+        record.update({
+            'status': 'ok',
+            'best_val_mse': result['best_val_mse'],
+            'final_val_mse': result['final_val_mse'],
+            'epochs_run': result['epochs_run']
+        })
+    except Exception as e:
+        record.update({
+            'status': 'failed',
+            'error': str(e),
+            'best_val_mse': float('inf'),
+            'final_val_mse': float('inf'),
+            'epochs_run': 0
+        })
+
+    if trial['final']:
+        _remove_checkpoint(model_dir)
+
+    record['seconds'] = time.time() - start_time
+    return record
+
+
+def _remove_checkpoint(model_dir):
+    """Delete a trial's checkpoint once no later rung will resume from it."""
+    from checkpoint import CHECKPOINT_FILE
+    path = os.path.join(model_dir, CHECKPOINT_FILE)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def write_leaderboard(records, output_dir):
+    """
+    Write the leaderboard of the latest rung reached by every trial.
+
+    Args:
+        records (list): Trial records from all rungs
+        output_dir (str): Sweep output directory
+
+    Returns:
+        pandas.DataFrame: Leaderboard sorted by best validation MSE
+    """
+    latest = {}
+    for record in records:
+        if record['trial_id'] not in latest or record['rung'] > latest[record['trial_id']]['rung']:
+            latest[record['trial_id']] = record
+
+    rows = []
+    for record in latest.values():
+        row = {key: value for key, value in record.items() if key != 'params'}
+        for key, value in record['params'].items():
+            row[key] = ','.join(value) if isinstance(value, list) else value
+        rows.append(row)
+
+    leaderboard = pd.DataFrame(rows)
+    leaderboard = leaderboard.sort_values(['rung', 'best_val_mse'], ascending=[False, True])
+    leaderboard.to_csv(os.path.join(output_dir, 'leaderboard.csv'), index=False)
+
+    with open(os.path.join(output_dir, 'trials.json'), 'w') as f:
+        json.dump(records, f, indent=4, default=str)
+
+    return leaderboard
+
+
+def run_sweep(data_file, y_feature, spec, output_dir, x_features=None, search='grid',
+              n_trials=20, workers=None, min_epochs=10, max_epochs=100, eta=3,
+              successive_halving=True, seed=42):
+    """
+    Run a parallel hyperparameter sweep over train.train_model.
+
+    Args:
+        data_file (str): Path to the input CSV data file
+        y_feature (str): Target feature name
+        spec (dict): Sweep specification
+        output_dir (str): Directory for trial model directories and the leaderboard
+        x_features (list, optional): Input features for trials whose spec has no x_features
+        search (str): 'grid' or 'random'
+        n_trials (int): Number of random-search trials
+        workers (int, optional): Worker processes (default: CPU count)
+        min_epochs (int): Epoch budget of the first successive-halving rung
+        max_epochs (int): Epoch budget of the final rung
+        eta (int): Fraction of trials kept per rung is 1/eta
+        successive_halving (bool): If False, every trial runs for max_epochs
+        seed (int): Seed for random search and trial random_seed defaults
+
+    Returns:
+        pandas.DataFrame: Leaderboard sorted by best validation MSE
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    trials = generate_trials(spec, search, n_trials, seed)
+    if not trials:
+        raise ValueError("Sweep specification produced no trials")
+
+    # Load only the columns some trial needs, once, in the parent
+    feature_sets = [t.get('x_features', x_features) for t in trials]
+    if any(fs is None for fs in feature_sets):
+        raise ValueError("x_features must be given on the command line or in the sweep spec")
+    feature_sets = [fs.split(',') if isinstance(fs, str) else list(fs) for fs in feature_sets]
+    columns = sorted(set(itertools.chain.from_iterable(feature_sets)) | {y_feature})
+
+    print(f"Loading {len(columns)} columns from {data_file}...")
+    df = pd.read_csv(data_file, usecols=columns)
+    block, descriptor = share_frame(df)
+    del df
+
+    budgets = rung_budgets(min_epochs, max_epochs, eta) if successive_halving else [max_epochs]
+    workers = workers or os.cpu_count() or 1
+    print(f"Sweep: {len(trials)} trials, rung budgets {budgets}, {workers} workers")
+
+    # Pin BLAS in the parent environment so spawned workers start single-threaded
+    saved_env = {variable: os.environ.get(variable) for variable in BLAS_THREAD_VARIABLES}
+    for variable in BLAS_THREAD_VARIABLES:
+        os.environ[variable] = '1'
+
+    records = []
+    survivors = list(range(len(trials)))
+    try:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(descriptor, 1)) as executor:
+            for rung, epochs in enumerate(budgets):
+                jobs = []
+                for trial_id in survivors:
+                    params = dict(trials[trial_id])
+                    params.setdefault('random_seed', seed)
+                    jobs.append({
+                        'trial_id': trial_id,
+                        'rung': rung,
+                        'epochs': epochs,
+                        'params': params,
+                        'x_features': feature_sets[trial_id],
+                        'y_feature': y_feature,
+                        'data_file': data_file,
+                        'final': rung == len(budgets) - 1,
+                        'model_dir': os.path.join(output_dir, f"trial_{trial_id:04d}")
+                    })
+
+                rung_records = []
+                futures = [executor.submit(_run_trial, job) for job in jobs]
+                for future in as_completed(futures):
+                    record = future.result()
+                    rung_records.append(record)
+                    print(f"  rung {rung} trial {record['trial_id']:4d}: {record['status']:6s} "
+                          f"best val MSE {record['best_val_mse']:.6f} ({record['seconds']:.1f}s)")
+                records.extend(rung_records)
+                write_leaderboard(records, output_dir)
+
+                # Keep the best 1/eta for the next rung
+                if rung == len(budgets) - 1:
+                    break
+                ranked = sorted(rung_records, key=lambda r: r['best_val_mse'])
+                keep = max(1, int(math.ceil(len(ranked) / eta)))
+                survivors = [r['trial_id'] for r in ranked[:keep] if r['status'] == 'ok']
+                for record in rung_records:
+                    if record['trial_id'] not in survivors:
+                        _remove_checkpoint(record['model_dir'])
+                if not survivors:
+                    break
+                print(f"Rung {rung} done: keeping {len(survivors)} of {len(ranked)} trials")
+    finally:
+        for variable, value in saved_env.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+        block.close()
+        block.unlink()
+
+    leaderboard = write_leaderboard(records, output_dir)
+    print(f"\nLeaderboard written to: {os.path.join(output_dir, 'leaderboard.csv')}")
+    return leaderboard
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel hyperparameter sweep for stock price prediction models")
+    parser.add_argument("--data_file", type=str, required=True, help="Path to input CSV data file")
+    parser.add_argument("--y_feature", type=str, required=True, help="Target feature name")
+    parser.add_argument("--spec", type=str, required=True, help="Sweep specification (JSON file or inline JSON)")
+    parser.add_argument("--x_features", type=str, help="Comma-separated input features for trials whose spec has none")
+    parser.add_argument("--output_dir", type=str, help="Directory for trials and the leaderboard (default: sweep_<timestamp>)")
+    parser.add_argument("--search", choices=['grid', 'random'], default='grid', help="Search strategy")
+    parser.add_argument("--n_trials", type=int, default=20, help="Number of random-search trials")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--min_epochs", type=int, default=10, help="Epoch budget of the first successive-halving rung")
+    parser.add_argument("--max_epochs", type=int, default=100, help="Epoch budget of the final rung")
+    parser.add_argument("--eta", type=int, default=3, help="Keep the best 1/eta trials at each rung")
+    parser.add_argument("--no_halving", action="store_true", help="Run every trial for max_epochs")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for sampling and training")
+
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or f"sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    leaderboard = run_sweep(args.data_file, args.y_feature, load_spec(args.spec), output_dir,
+                            x_features=args.x_features.split(',') if args.x_features else None,
+                            search=args.search, n_trials=args.n_trials, workers=args.workers,
+                            min_epochs=args.min_epochs, max_epochs=args.max_epochs, eta=args.eta,
+                            successive_halving=not args.no_halving, seed=args.seed)
+    print(leaderboard.head(10).to_string(index=False))
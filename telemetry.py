@@ -0,0 +1,174 @@
+"""
+Training telemetry
+
+Structured per-epoch training records delivered to pluggable sinks instead of
+being printed and scraped from stdout. TrainingTelemetry samples every N
+epochs, aggregates the losses in between, and only computes weight summaries
+for epochs it actually emits.
+
+Sinks:
+    CallbackSink    call a function in-process with each record
+    JsonLinesSink   write one JSON object per line to a file or pipe
+    StdoutSink      legacy "LOSS:epoch,loss" / "WEIGHTS:epoch,w1,w2" lines
+
+Usage:
+    telemetry = TrainingTelemetry([JsonLinesSink("telemetry.jsonl")], every=10)
+    model.train(X, y, telemetry=telemetry)
+"""
+
+import sys
+import json
+
+import numpy as np
+
+AGGREGATIONS = ('last', 'mean', 'min')
+
+
+class TelemetrySink:
+    """Base class for telemetry sinks."""
+
+    def emit(self, record):
+        """
+        Deliver one telemetry record.
+
+        Args:
+            record (dict): epoch, train_loss, val_loss, n_epochs and, when
+                enabled, w1_mean/w2_mean
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the sink."""
+        pass
+
+
+class CallbackSink(TelemetrySink):
+    """Deliver records to an in-process callable."""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def emit(self, record):
+        self.callback(record)
+
+
+class JsonLinesSink(TelemetrySink):
+    """Write records as JSON lines to a path or an open text stream."""
+
+    def __init__(self, target, flush_every=1):
+        """
+        Args:
+            target (str or file): Path to append to, or a writable text stream
+            flush_every (int): Flush the stream after this many records
+        """
+        self._owns_stream = isinstance(target, str)
+        self.stream = open(target, 'a') if self._owns_stream else target
+        self.flush_every = max(1, int(flush_every))
+        self._pending = 0
+
+    def emit(self, record):
+        self.stream.write(json.dumps(record) + "\n")
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.stream.flush()
+            self._pending = 0
+
+    def close(self):
+        if self._owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+
+class StdoutSink(TelemetrySink):
+    """Adapter reproducing the LOSS:/WEIGHTS: lines older GUIs parse from stdout."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def emit(self, record):
+        stream = self.stream or sys.stdout
+        stream.write(f"LOSS:{record['epoch']},{record['train_loss']:.6f}\n")
+        if 'w1_mean' in record:
+            stream.write(f"WEIGHTS:{record['epoch']},{record['w1_mean']:.6f},{record['w2_mean']:.6f}\n")
+        stream.flush()
+
+
+class TrainingTelemetry:
+    """Sampling and aggregating front end that fans records out to sinks."""
+
+    def __init__(self, sinks=None, every=1, aggregate='last', include_weights=True):
+        """
+        Args:
+            sinks (list): TelemetrySink instances
+            every (int): Emit one record per this many epochs
+            aggregate (str): How losses within a window are combined:
+                'last', 'mean' or 'min'
+            include_weights (bool): Add mean W1/W2 values to emitted records
+        """
+        if aggregate not in AGGREGATIONS:
+            raise ValueError(f"aggregate must be one of {AGGREGATIONS}, got {aggregate!r}")
+        self.sinks = list(sinks or [])
+        self.every = max(1, int(every))
+        self.aggregate = aggregate
+        self.include_weights = include_weights
+        self._train = []
+        self._val = []
+        self._last_epoch = None
+        self._model = None
+
+    def record_epoch(self, epoch, train_loss, val_loss, model=None):
+        """
+        Record one finished epoch, emitting when the sampling window is full.
+
+        Args:
+            epoch (int): Epoch index
+            train_loss (float): Average training loss for the epoch
+            val_loss (float): Validation loss for the epoch
+            model: Object with W1/W2 attributes used for weight summaries
+        """
+        self._train.append(float(train_loss))
+        self._val.append(float(val_loss))
+        self._last_epoch = epoch
+        self._model = model
+        if len(self._train) >= self.every:
+            self._emit()
+
+    def flush(self):
+        """Emit any partially filled window."""
+        if self._train:
+            self._emit()
+
+    def close(self):
+        """Flush the last window and close every sink."""
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+    def _combine(self, values):
+        if self.aggregate == 'mean':
+            return float(np.mean(values))
+        if self.aggregate == 'min':
+            return float(np.min(values))
+        return values[-1]
+
+    def _emit(self):
+        record = {
+            'epoch': self._last_epoch,
+            'train_loss': self._combine(self._train),
+            'val_loss': self._combine(self._val),
+            'n_epochs': len(self._train),
+        }
+        # Weight summaries are only computed for epochs that are emitted
+        if self.include_weights and self._model is not None:
+            record['w1_mean'] = float(np.mean(self._model.W1))
+            record['w2_mean'] = float(np.mean(self._model.W2))
+        self._train = []
+        self._val = []
+        for sink in self.sinks:
+            sink.emit(record)
+
+
+def stdout_telemetry(every=1):
+    """Telemetry reproducing the legacy per-epoch stdout lines."""
+    return TrainingTelemetry([StdoutSink()], every=every)
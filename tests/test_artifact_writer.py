@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the background artifact writer
+
+Checks that writes are snapshotted at submit time, run in order, surface
+errors at the flush barrier, and that train_model still produces every
+artifact before returning.
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from artifact_writer import ArtifactWriter
+from train import train_model
+
+
+def test_arrays_are_snapshotted_at_submit():
+    """Later in-place updates do not leak into queued writes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        W = np.zeros((2, 2))
+        with ArtifactWriter() as writer:
+            writer.savez(os.path.join(tmp, "w.npz"), W=W)
+            writer.savetxt(os.path.join(tmp, "w.csv"), W)
+            W += 1
+        with np.load(os.path.join(tmp, "w.npz")) as data:
+            assert np.array_equal(data['W'], np.zeros((2, 2)))
+        assert np.array_equal(np.loadtxt(os.path.join(tmp, "w.csv"), delimiter=','), np.zeros((2, 2)))
+
+
+def test_barrier_waits_for_earlier_writes():
+    """The barrier future completes only after every queued write."""
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = ArtifactWriter()
+        order = []
+        for i in range(5):
+            writer.submit(order.append, i)
+        writer.write_json(os.path.join(tmp, "info.json"), {'a': 1})
+        assert writer.barrier().result(timeout=10) == []
+        assert order == [0, 1, 2, 3, 4]
+        with open(os.path.join(tmp, "info.json")) as f:
+            assert json.load(f) == {'a': 1}
+        writer.close()
+
+
+def test_flush_raises_write_errors():
+    """A failed write is re-raised at the flush barrier."""
+    writer = ArtifactWriter()
+    writer.savetxt(os.path.join(tempfile.gettempdir(), "missing_dir_xyz", "a.csv"), [1.0])
+    try:
+        writer.flush()
+        assert False, "flush should have raised"
+    except (FileNotFoundError, OSError):
+        pass
+    finally:
+        writer.shutdown()
+
+
+def test_train_model_writes_all_artifacts():
+    """Every artifact exists once train_model returns."""
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(rng.rand(80, 3), columns=['open', 'high', 'close'])
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            model_dir = os.path.join(tmp, "model")
+            train_model(None, model_dir, ['open', 'high'], 'close', epochs=5,
+                        history_interval=2, df=df)
+        finally:
+            os.chdir(cwd)
+        for name in ('stock_model.npz', 'scaler_mean.csv', 'scaler_std.csv', 'target_min.csv',
+                     'target_max.csv', 'training_losses.csv', 'training_data.csv',
+                     'feature_info.json', os.path.join('weights_history', 'W1.npy')):
+            assert os.path.exists(os.path.join(model_dir, name)), name
+        assert not os.path.exists(os.path.join(tmp, "weights_history"))
+        assert len(pd.read_csv(os.path.join(model_dir, "training_data.csv"))) == 80
+
+
+if __name__ == "__main__":
+    test_arrays_are_snapshotted_at_submit()
+    test_barrier_waits_for_earlier_writes()
+    test_flush_raises_write_errors()
+    test_train_model_writes_all_artifacts()
+    print("✅ All artifact writer tests passed!")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test script for resumable training checkpoints
+
+Checks that checkpoints round-trip the optimizer and loop state, and that a
+run stopped mid-way and resumed from its checkpoint ends exactly where an
+uninterrupted run does, with the weight history of the first part kept.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from checkpoint import MODEL_ARRAYS, TrainingCheckpointer, load_checkpoint, save_checkpoint
+from stock_net import StockNet
+from telemetry import CallbackSink, TrainingTelemetry
+from train import train_model
+from weight_history import WeightHistory
+
+
+def _make_data(n_samples=120, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.rand(n_samples, 3)
+    y = X @ np.array([[0.2], [0.5], [0.3]])
+    return X, y
+
+
+def _fresh_model():
+    np.random.seed(11)
+    model = StockNet(input_size=3, hidden_size=5)
+    model.X_min, model.X_max = np.zeros(3), np.ones(3)
+    return model
+
+
+def test_round_trip():
+    """Parameters, Adam state, normalization, loop state and RNG survive."""
+    X, y = _make_data()
+    model = _fresh_model()
+    model.train(X, y, epochs=2, batch_size=16, save_history=False, patience=100)
+    np.random.seed(99)
+    state = {'epoch': 2, 'best_mse': 0.5, 'patience_counter': 1,
+             'train_losses': [1.0, 0.7], 'val_losses': [1.1, 0.8]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "checkpoint.npz")
+        save_checkpoint(path, model, state)
+        expected_draw = np.random.rand()
+        restored, restored_state = load_checkpoint(path)
+
+    for name in MODEL_ARRAYS:
+        assert np.array_equal(getattr(model, name), getattr(restored, name)), name
+    assert restored.t == model.t
+    assert np.array_equal(restored.X_max, model.X_max)
+    assert restored_state['train_losses'] == [1.0, 0.7]
+    assert restored_state['patience_counter'] == 1
+    np.random.set_state(restored_state['rng_state'])
+    assert np.random.rand() == expected_draw
+
+
+def test_stop_and_resume_matches_uninterrupted_run():
+    """Stopping after epoch 3 and resuming reproduces the full run exactly."""
+    X, y = _make_data()
+    X_val, y_val = _make_data(30, seed=1)
+    kwargs = dict(X_val=X_val, y_val=y_val, epochs=8, learning_rate=0.01, batch_size=16,
+                  save_history=False, patience=100)
+
+    reference = _fresh_model()
+    np.random.seed(5)
+    ref_train, ref_val = reference.train(X, y, **kwargs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpointer = TrainingCheckpointer(os.path.join(tmp, "checkpoint.npz"))
+
+        def stop_after_three(epoch, train_loss, val_loss):
+            if epoch == 3:
+                checkpointer.request_stop()
+
+        interrupted = _fresh_model()
+        np.random.seed(5)
+        partial_train, _ = interrupted.train(X, y, progress_callback=stop_after_three,
+                                             checkpointer=checkpointer, **kwargs)
+        assert len(partial_train) == 4
+
+        resumed, state = load_checkpoint(checkpointer.path)
+        np.random.seed(1234)  # Must be overridden by the checkpointed RNG state
+        res_train, res_val = resumed.train(X, y, resume_state=state, **kwargs)
+
+    assert np.allclose(res_train, ref_train, rtol=1e-12)
+    assert np.allclose(res_val, ref_val, rtol=1e-12)
+    for name in MODEL_ARRAYS:
+        assert np.allclose(getattr(resumed, name), getattr(reference, name), rtol=1e-12), name
+    assert resumed.t == reference.t
+
+
+def test_train_model_resume():
+    """train_model checkpoints only when asked and continues from model_dir/checkpoint.npz."""
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(rng.rand(60, 3), columns=['a', 'b', 'target'])
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            model_dir = os.path.join(tmp, "model")
+            # Without checkpoint_every or resume no checkpoint is written
+            train_model(None, model_dir, ['a', 'b'], 'target', epochs=2, patience=100,
+                        save_history=False, df=df)
+            assert not os.path.exists(os.path.join(model_dir, "checkpoint.npz"))
+            train_model(None, model_dir, ['a', 'b'], 'target', epochs=4, patience=100,
+                        save_history=False, checkpoint_every=3, df=df)
+            assert os.path.exists(os.path.join(model_dir, "checkpoint.npz"))
+            summary = train_model(None, model_dir, ['a', 'b'], 'target', epochs=7, patience=100,
+                                  save_history=False, resume=True, df=df)
+        finally:
+            os.chdir(cwd)
+    assert summary['epochs_run'] == 7
+
+
+def test_resume_keeps_weight_history():
+    """Snapshots taken before the interruption survive the resumed run."""
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(rng.rand(60, 3), columns=['a', 'b', 'target'])
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            model_dir = os.path.join(tmp, "model")
+            checkpointer = TrainingCheckpointer(os.path.join(model_dir, "checkpoint.npz"))
+
+            def stop_after_two(record):
+                if record['epoch'] == 2:
+                    checkpointer.request_stop()
+
+            kwargs = dict(epochs=6, patience=100, history_interval=1, df=df)
+            train_model(None, model_dir, ['a', 'b'], 'target', checkpointer=checkpointer,
+                        telemetry=TrainingTelemetry([CallbackSink(stop_after_two)]), **kwargs)
+            early = WeightHistory(os.path.join(model_dir, "weights_history"))
+            assert list(early.epochs) == [0, 1, 2]
+            early_W1 = np.array(early[1]['W1'])
+            del early
+
+            train_model(None, model_dir, ['a', 'b'], 'target', resume=True, **kwargs)
+            history = WeightHistory(os.path.join(model_dir, "weights_history"))
+            assert list(history.epochs) == [0, 1, 2, 3, 4, 5]
+            np.testing.assert_array_equal(history[1]['W1'], early_W1)
+            del history
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_stop_and_resume_matches_uninterrupted_run()
+    test_train_model_resume()
+    test_resume_keeps_weight_history()
+    print("✅ All checkpoint tests passed!")
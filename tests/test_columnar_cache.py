@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for columnar CSV sidecars
+
+Checks that a CSV read through its Feather/Parquet sidecar gives the same
+frame as pd.read_csv, that later reads do not parse the CSV, that changing
+the CSV rebuilds the sidecar, and that DataManager uses it when enabled.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import columnar_cache
+from columnar_cache import read_csv_cached, sidecar_is_fresh, sidecar_path
+from stock_prediction_gui.core.data_manager import DataManager
+
+
+def _write_csv(path, rows=3000, seed=0):
+    rng = np.random.RandomState(seed)
+    df = pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=rows, freq='h').strftime('%Y-%m-%d %H:%M:%S'),
+        'ticker': rng.choice(['AAPL', 'MSFT'], rows),
+        'close': rng.rand(rows),
+        'vol': rng.randint(0, 1000, rows),
+        'empty': np.nan,
+    })
+    df.loc[rows - 5, 'vol'] = np.nan  # Integer column with a null in a late block
+    df.to_csv(path, index=False)
+
+
+def test_sidecar_matches_read_csv():
+    """Both sidecar formats round-trip to the frame pd.read_csv gives."""
+    original_block = columnar_cache.CSV_BLOCK_BYTES
+    columnar_cache.CSV_BLOCK_BYTES = 16 * 1024  # Force several streamed blocks
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'prices.csv')
+            _write_csv(path)
+            expected = pd.read_csv(path)
+            for fmt in ('feather', 'parquet'):
+                pd.testing.assert_frame_equal(read_csv_cached(path, fmt=fmt), expected)
+                assert sidecar_is_fresh(path, sidecar_path(path, fmt))
+            projected = read_csv_cached(path, columns=['vol', 'close', 'missing'])
+            pd.testing.assert_frame_equal(projected, expected[['close', 'vol']])
+    finally:
+        columnar_cache.CSV_BLOCK_BYTES = original_block
+
+
+def test_revalidation():
+    """Later reads skip the CSV; rewriting it rebuilds the sidecar."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'prices.csv')
+        _write_csv(path)
+        read_csv_cached(path, cache_dir=os.path.join(tmp, 'cache'))
+
+        original = columnar_cache.convert_csv
+        columnar_cache.convert_csv = None  # Any reconversion would fail
+        try:
+            assert len(read_csv_cached(path, cache_dir=os.path.join(tmp, 'cache'))) == 3000
+        finally:
+            columnar_cache.convert_csv = original
+
+        time.sleep(0.01)
+        _write_csv(path, rows=100, seed=1)
+        assert not sidecar_is_fresh(path, sidecar_path(path, cache_dir=os.path.join(tmp, 'cache')))
+        df = read_csv_cached(path, cache_dir=os.path.join(tmp, 'cache'))
+        pd.testing.assert_frame_equal(df, pd.read_csv(path))
+
+
+def test_data_manager_opt_in():
+    """DataManager builds a sidecar only when the mode is on, and filters still apply."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'prices.csv')
+        _write_csv(path)
+        DataManager(columnar_cache=False).load_data(path)
+        assert not os.path.exists(sidecar_path(path))
+
+        manager = DataManager(columnar_cache=True)
+        manager.load_data(path, columns=['close'], row_filter=[('ticker', '==', 'AAPL')])
+        assert os.path.exists(sidecar_path(path))
+        expected = pd.read_csv(path)
+        expected = expected.loc[expected['ticker'] == 'AAPL', ['close']].reset_index(drop=True)
+        pd.testing.assert_frame_equal(manager.get_current_data(), expected)
+
+
+if __name__ == "__main__":
+    test_sidecar_matches_read_csv()
+    test_revalidation()
+    test_data_manager_opt_in()
+    print("✅ All columnar cache tests passed!")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the GUI data cache
+
+Checks that DataManager's cache is bounded by DataFrame memory, evicts least
+recently used files first, reloads files that changed on disk and keeps its
+byte total in step with its entries, sizing object columns from a row
+sample and refining that once the statistics job has measured them.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_prediction_gui.core.data_cache import DataCache
+from stock_prediction_gui.core.data_manager import DataManager
+
+
+def _write_csv(path, rows, seed=0):
+    rng = np.random.RandomState(seed)
+    pd.DataFrame(rng.rand(rows, 5), columns=['open', 'high', 'low', 'close', 'vol']).to_csv(path, index=False)
+
+
+def test_lru_eviction_by_memory():
+    """The byte budget holds two frames; the least recently used one goes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"data_{i}.csv") for i in range(3)]
+        for i, path in enumerate(paths):
+            _write_csv(path, 1000, seed=i)
+        frame_bytes = int(pd.read_csv(paths[0]).memory_usage(deep=True).sum())
+
+        manager = DataManager(cache_max_bytes=int(frame_bytes * 2.5))
+        manager.load_data(paths[0])
+        manager.load_data(paths[1])
+        manager.load_data(paths[0])  # Hit, now most recently used
+        manager.load_data(paths[2])  # Evicts paths[1]
+
+        stats = manager.get_data_info()['cache_stats']
+        assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 3, 1)
+        assert stats['entries'] == 2 and stats['bytes'] == 2 * frame_bytes
+        assert paths[0] in manager.data_cache and paths[1] not in manager.data_cache
+        assert "1 hits" in manager.get_data_info()['cache_summary']
+
+
+def test_stale_file_is_reloaded():
+    """A file rewritten on disk misses and is read again."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.csv")
+        _write_csv(path, 100)
+        manager = DataManager()
+        assert manager.load_data(path)['rows'] == 100
+
+        time.sleep(0.01)
+        _write_csv(path, 150)
+        assert manager.load_data(path)['rows'] == 150
+        assert len(manager.get_current_data()) == 150
+        assert manager.data_cache.invalidations == 1
+        assert len(manager.data_cache) == 1
+
+
+def test_oversized_frames_and_replacement():
+    """Frames over the budget are not cached; re-putting a path replaces its size."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.csv")
+        _write_csv(path, 100)
+        small = pd.read_csv(path)
+        cache = DataCache(max_bytes=10)
+        cache.put(path, small, {})
+        assert len(cache) == 0 and cache.total_bytes == 0
+
+        cache.max_bytes = 10 ** 9
+        cache.put(path, small, {})
+        cache.put(path, pd.concat([small, small]), {})
+        assert len(cache) == 1
+        assert cache.total_bytes == int(pd.concat([small, small]).memory_usage(deep=True).sum())
+        cache.clear()
+        assert cache.total_bytes == 0 and cache.get(path) is None
+
+
+def test_object_columns_sized_deeply():
+    """Object columns are sized from a row sample on put and refined by statistics."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.csv")
+        df = pd.DataFrame({'close': np.arange(5000.0), 'ticker': [f"TICKER{i}" for i in range(5000)]})
+        df.to_csv(path, index=False)
+
+        frame = df.astype({'ticker': object})
+        shallow, deep = int(frame.memory_usage(deep=False).sum()), int(frame.memory_usage(deep=True).sum())
+        assert deep > 3 * shallow
+        cache = DataCache()
+        cache.put(path, frame, {})
+        np.testing.assert_allclose(cache.total_bytes, deep, rtol=0.05)
+        assert cache.resize(frame, deep) and cache.total_bytes == deep
+
+        # A corrected size over the budget evicts the entry
+        cache.max_bytes = deep - 1
+        assert cache.resize(frame, deep)
+        assert len(cache) == 0 and cache.total_bytes == 0
+        assert not cache.resize(frame, deep)
+
+        # DataManager hands the statistics job's measurement to the cache
+        manager = DataManager()
+        manager.load_data(path)
+        assert manager.wait_for_stats(timeout=10)
+        assert manager.data_cache.total_bytes == manager.get_data_info()['memory_bytes']
+
+
+if __name__ == "__main__":
+    test_lru_eviction_by_memory()
+    test_stale_file_is_reloaded()
+    test_oversized_frames_and_replacement()
+    test_object_columns_sized_deeply()
+    print("✅ All data cache tests passed!")
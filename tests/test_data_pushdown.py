@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test script for column-projected, filtered loading in DataManager
+
+Checks that load_data(columns=..., row_filter=..., date_range=...) returns the
+same frame as loading everything and selecting in pandas, for CSV, Parquet,
+Feather and SQLite files, that projected loads are cached separately, and
+that read_columns leaves the current data alone.
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_prediction_gui.core.data_manager import DataManager
+
+
+def _make_frame(rows=500, seed=0):
+    rng = np.random.RandomState(seed)
+    df = pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=rows, freq='D').strftime('%Y-%m-%d'),
+        'ticker': rng.choice(['AAPL', 'MSFT', 'GOOG'], rows),
+        'open': rng.rand(rows),
+        'close': rng.rand(rows),
+        'vol': rng.randint(0, 1000, rows).astype(float),
+    })
+    for i in range(20):
+        df[f'extra_{i}'] = rng.rand(rows)
+    df.loc[::17, 'close'] = np.nan
+    return df
+
+
+def _expected(df, columns, row_filter=(), date_range=None):
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in row_filter:
+        values = df[column]
+        if op == 'in':
+            matches = values.isin(value)
+        elif op == 'not in':
+            matches = ~values.isin(value)
+        else:
+            matches = eval(f"values {op} value")
+        mask &= matches & values.notna()
+    if date_range is not None:
+        dates = pd.to_datetime(df['date'])
+        mask &= (dates >= pd.Timestamp(date_range[0])) & (dates <= pd.Timestamp(date_range[1]))
+    return df.loc[mask, columns].reset_index(drop=True)
+
+
+def _write_all(tmp, df):
+    paths = {'csv': os.path.join(tmp, 'data.csv'),
+             'parquet': os.path.join(tmp, 'data.parquet'),
+             'feather': os.path.join(tmp, 'data.feather'),
+             'sqlite': os.path.join(tmp, 'data.db')}
+    df.to_csv(paths['csv'], index=False)
+    df.to_parquet(paths['parquet'], index=False, row_group_size=100)
+    df.to_feather(paths['feather'])
+    with sqlite3.connect(paths['sqlite']) as conn:
+        df.to_sql('bars', conn, index=False)
+    return paths
+
+
+def _assert_same(actual, expected):
+    assert list(actual.columns) == list(expected.columns)
+    assert len(actual) == len(expected)
+    for column in expected.columns:
+        if expected[column].dtype.kind == 'f':
+            np.testing.assert_allclose(actual[column].to_numpy(float), expected[column].to_numpy(float))
+        else:
+            assert actual[column].astype(str).tolist() == expected[column].astype(str).tolist()
+
+
+def test_projection_every_format():
+    """Only the requested columns come back, in request order; unknown ones are left out."""
+    df = _make_frame()
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind, path in _write_all(tmp, df).items():
+            manager = DataManager()
+            info = manager.load_data(path, columns=['close', 'open', 'missing'])
+            assert info['columns'] == 2, kind
+            _assert_same(manager.get_current_data(), _expected(df, ['close', 'open']))
+
+
+def test_filters_every_format():
+    """Row filters and date ranges match pandas, with missing values never matching."""
+    df = _make_frame()
+    row_filter = [('close', '>', 0.3), ('ticker', 'in', ['AAPL', 'GOOG']), ('vol', '!=', 500.0)]
+    date_range = ('2024-02-01', '2024-10-15')
+    expected = _expected(df, ['open', 'close'], row_filter, date_range)
+    assert 0 < len(expected) < len(df)
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind, path in _write_all(tmp, df).items():
+            manager = DataManager()
+            manager.load_data(path, columns=['open', 'close'], row_filter=row_filter, date_range=date_range)
+            _assert_same(manager.get_current_data(), expected)
+
+            # Filtering without a projection keeps every column
+            manager.load_data(path, row_filter=[('ticker', 'not in', ['MSFT'])])
+            _assert_same(manager.get_current_data(),
+                         _expected(df, list(df.columns), [('ticker', 'not in', ['MSFT'])]))
+
+
+def test_errors_and_cache_keys():
+    """Bad filters raise; full and projected loads of one file are cached apart."""
+    df = _make_frame()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_all(tmp, df)['csv']
+        manager = DataManager()
+        for bad in ([('close', '~', 1)], [('nope', '==', 1)]):
+            try:
+                manager.load_data(path, row_filter=bad)
+            except (KeyError, ValueError):
+                pass
+            else:
+                raise AssertionError(f"{bad} should have been rejected")
+        try:
+            manager.load_data(path, row_filter=[('close', '>', 2.0)])
+        except ValueError as e:
+            assert "No rows match" in str(e)
+        else:
+            raise AssertionError("An empty selection should raise")
+
+        manager.load_data(path)
+        manager.load_data(path, columns=['open'])
+        assert len(manager.data_cache) == 2
+        manager.load_data(path, columns=['open'])
+        assert manager.data_cache.hits == 1
+        assert list(manager.get_current_data().columns) == ['open']
+        manager.load_data(path)
+        assert manager.get_current_data().shape == df.shape
+
+
+def test_read_columns_keeps_current_data():
+    """read_columns returns a selection without replacing the loaded dataset."""
+    df = _make_frame()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'data.csv')
+        df.to_csv(path, index=False)
+        manager = DataManager()
+
+        # Nothing loaded yet: read from disk, cache nothing
+        projected = manager.read_columns(path, columns=['date', 'time', 'open', 'close'])
+        pd.testing.assert_frame_equal(projected, _expected(df, ['date', 'open', 'close']))
+        assert manager.get_current_data() is None and len(manager.data_cache) == 0
+
+        # With the file loaded, the cached frame is reused
+        info = manager.load_data(path)
+        full = manager.get_current_data()
+        selected = manager.read_columns(path, columns=['open'], row_filter=[('ticker', '==', 'AAPL')])
+        pd.testing.assert_frame_equal(selected, _expected(df, ['open'], [('ticker', '==', 'AAPL')]))
+        assert manager.get_current_data() is full and manager.current_data_info is info
+        assert len(manager.data_cache) == 1
+
+
+if __name__ == "__main__":
+    test_projection_every_format()
+    test_filters_every_format()
+    test_errors_and_cache_keys()
+    test_read_columns_keeps_current_data()
+    print("✅ All data pushdown tests passed!")
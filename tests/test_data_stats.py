@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the background data statistics
+
+Checks that the streaming statistics match pandas' describe(), isnull().sum()
+and memory_usage(deep=True), that large frames are sampled, that a job can be
+cancelled, and that DataManager fills the statistics in after load_data
+returns without them.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_prediction_gui.core.data_manager import DataManager
+from stock_prediction_gui.core.data_stats import StatsJob, compute_data_stats
+
+
+def _make_frame(rows, seed=0):
+    rng = np.random.RandomState(seed)
+    df = pd.DataFrame({
+        'open': rng.normal(100, 5, rows),
+        'vol': rng.randint(0, 10 ** 6, rows),
+        'ticker': rng.choice(['AAPL', 'MSFT', 'GOOG'], rows).astype(object),
+        'empty': np.nan,
+    })
+    df.loc[::7, 'open'] = np.nan
+    return df
+
+
+def test_exact_below_threshold():
+    """Small frames get exactly describe()'s numbers, even across chunks."""
+    df = _make_frame(5000)
+    stats = compute_data_stats(df, chunk_rows=333)
+    expected = df.describe().to_dict()
+    for column in ('open', 'vol', 'empty'):
+        for key, value in expected[column].items():
+            np.testing.assert_allclose(stats['summary_stats'][column][key], value, rtol=1e-10, equal_nan=True)
+    assert stats['missing_values'] == df.isnull().sum().to_dict()
+    assert stats['memory_bytes'] == int(df.memory_usage(deep=True).sum())
+    assert not stats['stats_sampled']
+
+
+def test_sampled_above_threshold():
+    """Large frames keep exact moments but sample quantiles and object memory."""
+    df = _make_frame(60000, seed=1)
+    stats = compute_data_stats(df, sample_size=5000, chunk_rows=4096)
+    assert stats['stats_sampled'] and stats['stats_sample_rows'] == 5000
+    summary = stats['summary_stats']['open']
+    column = df['open']
+    np.testing.assert_allclose(summary['mean'], column.mean(), rtol=1e-12)
+    np.testing.assert_allclose(summary['std'], column.std(), rtol=1e-10)
+    assert summary['min'] == column.min() and summary['max'] == column.max()
+    assert abs(summary['50%'] - column.median()) < 0.5
+    assert stats['memory_usage'].startswith('~')
+    np.testing.assert_allclose(stats['memory_bytes'], df.memory_usage(deep=True).sum(), rtol=0.05)
+
+
+def test_cancel():
+    """A cancelled job stops and never calls back."""
+    cancel = threading.Event()
+    cancel.set()
+    assert compute_data_stats(_make_frame(100), cancel_event=cancel) is None
+
+    called = []
+    job = StatsJob(_make_frame(200000), called.append, chunk_rows=1000)
+    job.cancel()
+    job.start()
+    assert job.wait(10)
+    assert job.result is None and called == []
+
+
+def test_data_manager_background_stats():
+    """load_data returns a header first; statistics follow and reach listeners."""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = os.path.join(tmp, 'first.csv')
+        second = os.path.join(tmp, 'second.csv')
+        _make_frame(3000).to_csv(first, index=False)
+        _make_frame(2000, seed=2).to_csv(second, index=False)
+
+        manager = DataManager()
+        ready = []
+        manager.add_stats_listener(ready.append)
+        info = manager.load_data(first)
+        assert info['rows'] == 3000 and info['stats_status'] in ('running', 'ready')
+
+        info = manager.load_data(second)  # Cancels the first file's job
+        assert manager.wait_for_stats(10)
+        assert info['stats_status'] == 'ready'
+        assert info['missing_values']['open'] == manager.get_current_data()['open'].isnull().sum()
+        assert ready and ready[-1] is info
+        assert all(item is info for item in ready if item['rows'] == 2000)
+
+        # A cache hit keeps the finished statistics
+        manager.load_data(first)
+        manager.wait_for_stats(10)
+        assert manager.load_data(second)['stats_status'] == 'ready'
+
+
+if __name__ == "__main__":
+    test_exact_below_threshold()
+    test_sampled_above_threshold()
+    test_cancel()
+    test_data_manager_background_stats()
+    print("✅ All data stats tests passed!")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for the parallel directory loader
+
+Checks that load_directory gives the same rows as a serial read-and-concat,
+tags rows with their ticker, rejects files missing required columns before
+reading any data, and that iter_directory keeps file order and can stop early.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dataset_loader
+from dataset_loader import iter_directory, load_directory, map_files
+from stock_net import load_data_from_directory
+
+TICKERS = ['aapl', 'goog', 'msft', 'tsla', 'amzn']
+
+
+def _write_universe(directory, tickers=TICKERS, rows=200):
+    paths = []
+    for i, ticker in enumerate(tickers):
+        rng = np.random.RandomState(i)
+        df = pd.DataFrame({
+            'open': rng.rand(rows + i), 'high': rng.rand(rows + i), 'low': rng.rand(rows + i),
+            'close': rng.rand(rows + i), 'vol': rng.randint(0, 1000, rows + i),
+        })
+        path = os.path.join(directory, f"{ticker}_combined.csv")
+        df.to_csv(path, index=False)
+        paths.append(path)
+    return sorted(paths)
+
+
+def test_matches_serial_concat():
+    """Parallel loading gives the serial result plus a categorical ticker column."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_universe(tmp)
+        expected = pd.concat([pd.read_csv(p) for p in paths], ignore_index=True)
+        df = load_directory(tmp, max_workers=4)
+        pd.testing.assert_frame_equal(df.drop(columns='ticker'), expected)
+        assert isinstance(df['ticker'].dtype, pd.CategoricalDtype)
+        assert df['ticker'].value_counts()['TSLA'] == 203
+
+        columns = load_directory(tmp, columns=['close', 'vol'], ticker_column=None)
+        pd.testing.assert_frame_equal(columns, expected[['close', 'vol']])
+
+        pd.testing.assert_frame_equal(load_data_from_directory(tmp), df)
+
+
+def test_schema_validation():
+    """A file missing a required column fails the load before any parsing."""
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_universe(tmp)
+        pd.DataFrame({'open': [1.0], 'close': [2.0]}).to_csv(os.path.join(tmp, 'bad_combined.csv'), index=False)
+
+        parsed = []
+        original = dataset_loader._read_csv
+        dataset_loader._read_csv = lambda path, columns=None: parsed.append(path)
+        try:
+            load_directory(tmp)
+            assert False, "Expected ValueError"
+        except ValueError as e:
+            assert 'bad_combined.csv' in str(e)
+        finally:
+            dataset_loader._read_csv = original
+        assert parsed == []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            load_data_from_directory(tmp)
+            assert False, "Expected FileNotFoundError"
+        except FileNotFoundError:
+            pass
+
+
+def test_iter_directory():
+    """Frames arrive in file order, and stopping early leaves no work behind."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_universe(tmp)
+        seen = [(ticker, len(frame)) for ticker, frame in iter_directory(tmp, max_workers=2, prefetch=2)]
+        assert [ticker for ticker, _ in seen] == ['AAPL', 'AMZN', 'GOOG', 'MSFT', 'TSLA']
+        assert [rows for _, rows in seen] == [len(pd.read_csv(p)) for p in paths]
+
+        frames = iter_directory(tmp, columns=['close'], max_workers=1, prefetch=1)
+        ticker, frame = next(frames)
+        frames.close()
+        assert ticker == 'AAPL' and list(frame.columns) == ['close']
+
+
+def test_map_files_order():
+    """Results come back in input order whatever order workers finish in."""
+    items = list(range(50))
+    assert map_files(lambda i: i * i, items, max_workers=8) == [i * i for i in items]
+    assert map_files(str, []) == []
+
+
+if __name__ == "__main__":
+    test_matches_serial_concat()
+    test_schema_validation()
+    test_iter_directory()
+    test_map_files_order()
+    print("✅ All dataset loader tests passed!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized prediction path
+
+Checks that PredictionIntegration gives the same predictions as a single
+forward pass, never calls the progress callback unless visualization is
+requested, and that the visualizer is fed at a bounded frame rate.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_net import StockNet
+from stock_prediction_gui.core import prediction_integration
+from stock_prediction_gui.core.prediction_integration import ForwardPassFeed, PredictionIntegration
+
+
+class _App:
+    prediction_batch_size = 32
+
+
+def _model_and_inputs(rows=300000, seed=0):
+    np.random.seed(seed)
+    model = StockNet(input_size=4, hidden_size=8)
+    X = np.random.rand(rows, 4)
+    return model, X
+
+
+def test_matches_single_forward_pass():
+    """Chunked prediction equals one forward pass and runs without throttling."""
+    model, X = _model_and_inputs()
+    expected = model.forward(X).flatten()
+    calls = []
+    integration = PredictionIntegration(_App())
+
+    start = time.perf_counter()
+    predictions = integration._predict_with_visualization(
+        model, X, None, lambda *args: calls.append(args), model_type='basic')
+    elapsed = time.perf_counter() - start
+
+    np.testing.assert_allclose(predictions, expected, rtol=1e-12)
+    assert calls == []
+    assert elapsed < 5, f"{len(X)} rows took {elapsed:.2f}s"
+
+
+def test_visualization_feed():
+    """With visualization on, frames are sampled rows sent at a bounded rate."""
+    model, X = _model_and_inputs(rows=200000, seed=1)
+    original_chunk = prediction_integration.PREDICTION_CHUNK_ROWS
+    prediction_integration.PREDICTION_CHUNK_ROWS = 1000  # Many chunks
+    frames = []
+    try:
+        integration = PredictionIntegration(_App())
+        start = time.perf_counter()
+        predictions = integration._predict_with_visualization(
+            model, X, None, lambda *args: frames.append(args), model_type='basic',
+            original_X=X * 2, visualize=True)
+        elapsed = time.perf_counter() - start
+    finally:
+        prediction_integration.PREDICTION_CHUNK_ROWS = original_chunk
+
+    assert len(predictions) == len(X)
+    assert 1 <= len(frames) <= elapsed * prediction_integration.VISUALIZATION_FPS + 2
+    weights, bias, prediction, input_row, progress = frames[-1]
+    assert progress == 100
+    assert len(weights) == model.W1.size + model.W2.size
+    row = int(np.flatnonzero((X * 2 == input_row).all(axis=1))[0])
+    assert prediction == predictions[row]
+
+
+def test_feed_sends_latest_frame_once():
+    """Unchanged frames are not redrawn, and stop() flushes the last one."""
+    sent = []
+    feed = ForwardPassFeed(lambda *args: sent.append(args[2]), np.zeros(1), 0, fps=1000).start()
+    feed.update(1.0, np.zeros(2), 10)
+    time.sleep(0.05)
+    feed.update(2.0, np.zeros(2), 100)
+    feed.stop()
+    assert sent == [1.0, 2.0]
+
+
+if __name__ == "__main__":
+    test_matches_single_forward_pass()
+    test_visualization_feed()
+    test_feed_sends_latest_frame_once()
+    print("✅ All fast prediction tests passed!")
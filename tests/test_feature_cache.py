@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent feature cache
+
+Checks that an unchanged file is served from the cache without recomputing
+indicators, that changing the file or the requested columns misses, and that
+the cache is trimmed to its byte budget least-recently-used first.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feature_cache
+from feature_cache import FeatureCache, load_features
+from indicators import compute_indicators
+
+
+def _write_bars(path, n=200, seed=0):
+    rng = np.random.RandomState(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    pd.DataFrame({
+        'open': close * (1 + rng.normal(0, 0.005, n)),
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'vol': rng.randint(1000, 10000, n).astype(float),
+    }).to_csv(path, index=False)
+
+
+def test_hit_skips_computation():
+    """A second load of an unchanged file returns the cached frame."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, "bars.csv")
+        _write_bars(data_file)
+        cache = FeatureCache(os.path.join(tmp, "cache"))
+        columns = ['open', 'rsi', 'cci']
+
+        first = cache.load_features(data_file, columns)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        original = feature_cache.compute_indicators
+        feature_cache.compute_indicators = None  # Any recomputation would fail
+        try:
+            second = cache.load_features(data_file, columns)
+        finally:
+            feature_cache.compute_indicators = original
+        assert cache.hits == 1
+        pd.testing.assert_frame_equal(first, second)
+        pd.testing.assert_frame_equal(second, compute_indicators(pd.read_csv(data_file), columns=columns))
+
+        # Different columns or variant are separate entries
+        assert cache.get(data_file, ['open', 'rsi']) is None
+        assert cache.get(data_file, columns, variant='gui') is None
+
+
+def test_changed_file_invalidates():
+    """Rewriting the file misses and replaces the stale entry."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, "bars.csv")
+        _write_bars(data_file)
+        cache = FeatureCache(os.path.join(tmp, "cache"))
+        cache.load_features(data_file, ['macd'])
+        assert len(cache.entries()) == 1
+
+        time.sleep(0.01)
+        _write_bars(data_file, n=210, seed=1)
+        df = cache.load_features(data_file, ['macd'])
+        assert len(df) == 210 and cache.misses == 2
+        assert len(cache.entries()) == 1
+
+        hashed = FeatureCache(os.path.join(tmp, "hashed"), content_hash=True)
+        hashed.load_features(data_file, ['macd'])
+        os.utime(data_file)  # Touching without changing content still hits
+        hashed.load_features(data_file, ['macd'])
+        assert hashed.hits == 1
+
+
+def test_eviction_budget():
+    """Least recently used entries go first once the budget is exceeded."""
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i in range(3):
+            files.append(os.path.join(tmp, f"bars_{i}.csv"))
+            _write_bars(files[-1], seed=i)
+        cache = FeatureCache(os.path.join(tmp, "cache"))
+        cache.load_features(files[0])
+        entry_size = cache.size_bytes()
+        cache.max_bytes = int(entry_size * 2.5)
+
+        time.sleep(0.01)
+        cache.load_features(files[1])
+        time.sleep(0.01)
+        cache.load_features(files[0])  # Hit refreshes files[0]
+        time.sleep(0.01)
+        cache.load_features(files[2])  # Evicts files[1]
+        assert len(cache.entries()) == 2
+        assert cache.get(files[1]) is None
+        assert cache.get(files[0]) is not None
+
+        # Module-level helper without a cache always recomputes
+        df = load_features(files[0], columns=['rsi'], cache=False)
+        assert list(df.columns)[-1] == 'rsi'
+        cache.clear()
+        assert cache.size_bytes() == 0
+
+
+def test_corrupt_entry_is_recomputed():
+    """A truncated entry in either format is dropped and treated as a miss."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, "bars.csv")
+        _write_bars(data_file)
+        expected = compute_indicators(pd.read_csv(data_file), columns=['rsi'])
+        for feather in (feature_cache.FEATHER_AVAILABLE, False):
+            original = feature_cache.FEATHER_AVAILABLE
+            feature_cache.FEATHER_AVAILABLE = feather
+            try:
+                cache = FeatureCache(os.path.join(tmp, f"cache_{feather}"))
+                cache.load_features(data_file, ['rsi'])
+                path = cache.entry_path(data_file, ['rsi'])
+                with open(path, 'r+b') as f:
+                    f.truncate(os.path.getsize(path) // 2)
+
+                assert cache.get(data_file, ['rsi']) is None
+                assert not os.path.exists(path)
+                pd.testing.assert_frame_equal(cache.load_features(data_file, ['rsi']), expected)
+                assert cache.hits == 0 and os.path.exists(path)
+            finally:
+                feature_cache.FEATHER_AVAILABLE = original
+
+
+if __name__ == "__main__":
+    test_hit_skips_computation()
+    test_changed_file_invalidates()
+    test_eviction_budget()
+    test_corrupt_entry_is_recomputed()
+    print("✅ All feature cache tests passed!")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test script for content-based format detection
+
+Checks that format_sniffer recognizes each binary format from its leading
+bytes, that DataManager loads misnamed files and ambiguous extensions with the
+right reader, and that detections are cached until the file changes.
+"""
+
+import os
+import sys
+import pickle
+import sqlite3
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_prediction_gui.core import format_sniffer
+from stock_prediction_gui.core.data_manager import DataManager
+from stock_prediction_gui.core.format_sniffer import HDF5_SIGNATURE, sniff_format
+
+
+def _frame():
+    return pd.DataFrame({'close': [1.5, 2.5, 3.5], 'vol': [10, 20, 30]})
+
+
+def _write_samples(tmp):
+    """One file per format, each given a misleading extension."""
+    df = _frame()
+    paths = {}
+
+    paths['parquet'] = os.path.join(tmp, 'parquet.csv')
+    df.to_parquet(paths['parquet'])
+
+    paths['feather'] = os.path.join(tmp, 'feather.ipc')
+    feather.write_feather(df, paths['feather'])
+
+    paths['arrow_stream'] = os.path.join(tmp, 'stream.arrow')
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(paths['arrow_stream'], 'wb') as sink, pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    paths['sqlite'] = os.path.join(tmp, 'sqlite.bin')
+    with sqlite3.connect(paths['sqlite']) as conn:
+        df.to_sql('prices', conn, index=False)
+    conn.close()
+
+    paths['npy'] = os.path.join(tmp, 'array.dat')
+    with open(paths['npy'], 'wb') as f:
+        np.save(f, df.to_numpy())
+
+    paths['npz'] = os.path.join(tmp, 'arrays.zip')
+    with open(paths['npz'], 'wb') as f:
+        np.savez(f, prices=df.to_numpy())
+
+    paths['pickle'] = os.path.join(tmp, 'frame.data')
+    with open(paths['pickle'], 'wb') as f:
+        pickle.dump(df, f, protocol=4)
+
+    return paths
+
+
+def test_signatures():
+    """Each binary format is recognized whatever its extension."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for expected, path in _write_samples(tmp).items():
+            assert sniff_format(path) == expected, (path, sniff_format(path))
+
+        signatures = {
+            'hdf5': HDF5_SIGNATURE + b'\0' * 64,
+            'duckdb': b'\0' * 8 + b'DUCK' + b'\0' * 64,
+            'excel': b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + b'\0' * 64,
+        }
+        for expected, content in signatures.items():
+            path = os.path.join(tmp, f'{expected}.bin')
+            with open(path, 'wb') as f:
+                f.write(content)
+            assert sniff_format(path) == expected
+
+        # HDF5 after a 512-byte user block
+        path = os.path.join(tmp, 'userblock.h5')
+        with open(path, 'wb') as f:
+            f.write(b'\0' * 512 + HDF5_SIGNATURE + b'\0' * 64)
+        assert sniff_format(path) == 'hdf5'
+
+        keras = os.path.join(tmp, 'model.keras')
+        with zipfile.ZipFile(keras, 'w') as archive:
+            archive.writestr('config.json', '{}')
+            archive.writestr('metadata.json', '{}')
+        assert sniff_format(keras) == 'keras'
+
+        text = os.path.join(tmp, 'prices.csv')
+        _frame().to_csv(text, index=False)
+        assert sniff_format(text) is None
+
+
+def test_loads_by_content():
+    """Misnamed files load with the reader their content calls for."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DataManager()
+        for file_format, path in _write_samples(tmp).items():
+            manager.load_data(path)
+            data = manager.get_current_data()
+            if file_format in ('npy', 'npz'):
+                np.testing.assert_array_equal(data.to_numpy(), _frame().to_numpy())
+            else:
+                pd.testing.assert_frame_equal(data, _frame(), check_dtype=False)
+
+        # Text formats still go by extension
+        text = os.path.join(tmp, 'prices.csv')
+        _frame().to_csv(text, index=False)
+        assert manager.detect_format(text) == 'csv'
+        assert manager.detect_format(os.path.join(tmp, 'frame.data')) == 'pickle'
+
+
+def test_cached_per_fingerprint():
+    """Unchanged files are not re-read; rewritten files are sniffed again."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'prices.dat')
+        _frame().to_parquet(path)
+        format_sniffer.clear_sniff_cache()
+        assert sniff_format(path) == 'parquet'
+        assert sniff_format(path) == 'parquet'
+        info = format_sniffer._sniff.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+        time.sleep(0.01)
+        feather.write_feather(_frame(), path)
+        assert sniff_format(path) == 'feather'
+
+
+if __name__ == "__main__":
+    test_signatures()
+    test_loads_by_content()
+    test_cached_per_fingerprint()
+    print("✅ All format sniffer tests passed!")
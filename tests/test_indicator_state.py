@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming indicator state
+
+Checks that bar-by-bar updates reproduce the batch indicator output row for
+row, that seeding from the tail of a long history matches the full history,
+and that StockPredictor.predict_next agrees with batch prediction.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indicator_state import IndicatorState
+from indicators import available_indicators, compute_indicators
+from predict import StockPredictor
+from train import train_model
+
+
+def _make_bars(n=400, seed=0):
+    rng = np.random.RandomState(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame({
+        'open': close * (1 + rng.normal(0, 0.005, n)),
+        'high': close * (1 + np.abs(rng.normal(0, 0.01, n))),
+        'low': close * (1 - np.abs(rng.normal(0, 0.01, n))),
+        'close': close,
+        'vol': rng.randint(1000000, 10000000, n).astype(float),
+    })
+
+
+def _assert_row_matches(row, expected):
+    for name in available_indicators():
+        a, b = row[name], expected[name]
+        assert (np.isnan(a) and np.isnan(b)) or np.isclose(a, b, rtol=1e-9, atol=1e-12), (name, a, b)
+
+
+def test_updates_match_batch():
+    """Every streamed row equals the batch output for that bar."""
+    df = _make_bars()
+    batch = compute_indicators(df)
+    state = IndicatorState()
+    for i, bar in enumerate(df.to_dict('records')):
+        row = state.update(bar)
+        _assert_row_matches(row, batch.iloc[i])
+    assert state.bars_seen == len(df)
+    assert set(available_indicators()) <= set(state.last_row)
+
+
+def test_seed_from_tail_of_long_history():
+    """Replaying only the last SEED_ROWS bars gives the full-history values."""
+    df = _make_bars(3000, seed=1)
+    history, new_bars = df.iloc[:-5], df.iloc[-5:]
+    state = IndicatorState.from_history(history)
+    assert state.bars_seen == 1000
+    batch = compute_indicators(df)
+    for i, bar in enumerate(new_bars.to_dict('records')):
+        _assert_row_matches(state.update(bar), batch.iloc[len(history) + i])
+
+    # Flat prices give zero ranges; streaming must not raise where pandas gives NaN/inf
+    flat = pd.DataFrame({'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'vol': 0.0}, index=range(30))
+    state = IndicatorState.from_history(flat)
+    _assert_row_matches(state.last_row, compute_indicators(flat).iloc[-1])
+
+
+def test_predict_next_matches_batch_predict():
+    """Scoring one new bar incrementally equals re-running the full pipeline."""
+    df = _make_bars(300, seed=2)
+    features = ['open', 'rsi', 'macd', 'cci']
+    train_df = compute_indicators(df.iloc[:250], columns=features + ['close']).dropna()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = os.path.join(tmp, "model")
+        os.chdir(tmp)
+        try:
+            train_model(None, model_dir, features, 'close', epochs=3, save_history=False, df=train_df)
+        finally:
+            os.chdir(cwd)
+        predictor = StockPredictor.load_model(model_dir)
+
+    state = predictor.indicator_state(df.iloc[:-1])
+    streamed = predictor.predict_next(state, df.iloc[-1].to_dict())
+    full = compute_indicators(df, columns=features)
+    expected = predictor.predict(full[features].values[-1:])[0]
+    assert np.isclose(streamed, expected, rtol=1e-9)
+
+
+if __name__ == "__main__":
+    test_updates_match_batch()
+    test_seed_from_tail_of_long_history()
+    test_predict_next_matches_batch_predict()
+    print("✅ All indicator state tests passed!")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test script for the indicator engine
+
+Checks that the dependency-graph engine reproduces the original
+add_technical_indicators output column for column, that selective computation
+only evaluates what the requested columns need, and that overrides replace
+individual indicators.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import indicators
+from indicators import INDICATORS, Indicator, alias, compute_indicators, compute_rsi, plan_indicators
+from stock_net import add_technical_indicators
+
+
+def _make_bars(n=300, seed=0):
+    rng = np.random.RandomState(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame({
+        'open': close * (1 + rng.normal(0, 0.005, n)),
+        'high': close * (1 + np.abs(rng.normal(0, 0.01, n))),
+        'low': close * (1 - np.abs(rng.normal(0, 0.01, n))),
+        'close': close,
+        'vol': rng.randint(1000000, 10000000, n).astype(float),
+    })
+
+
+def _reference_indicators(df):
+    """The original per-module implementation, kept as an oracle."""
+    out = df.copy()
+    close, high, low, vol = out['close'], out['high'], out['low'], out['vol']
+    for w in (5, 10, 20, 50):
+        out[f'ma_{w}'] = close.rolling(window=w).mean()
+    out['ema_12'] = close.ewm(span=12).mean()
+    out['ema_26'] = close.ewm(span=26).mean()
+    out['rsi'] = compute_rsi(close, 14)
+    out['price_change'] = close.pct_change()
+    out['price_change_5'] = close.pct_change(periods=5)
+    out['price_change_10'] = close.pct_change(periods=10)
+    out['volatility_10'] = close.rolling(window=10).std()
+    out['volatility_20'] = close.rolling(window=20).std()
+    out['bb_middle'] = close.rolling(window=20).mean()
+    bb_std = close.rolling(window=20).std()
+    out['bb_upper'] = out['bb_middle'] + (bb_std * 2)
+    out['bb_lower'] = out['bb_middle'] - (bb_std * 2)
+    out['bb_width'] = (out['bb_upper'] - out['bb_lower']) / out['bb_middle']
+    out['bb_position'] = (close - out['bb_lower']) / (out['bb_upper'] - out['bb_lower'])
+    out['macd'] = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+    out['macd_signal'] = out['macd'].ewm(span=9).mean()
+    out['macd_histogram'] = out['macd'] - out['macd_signal']
+    low_min = low.rolling(window=14).min()
+    high_max = high.rolling(window=14).max()
+    out['stoch_k'] = 100 * (close - low_min) / (high_max - low_min)
+    out['stoch_d'] = out['stoch_k'].rolling(window=3).mean()
+    out['williams_r'] = -100 * (high_max - close) / (high_max - low_min)
+    out['volume_ma'] = vol.rolling(window=10).mean()
+    out['volume_ratio'] = vol / out['volume_ma']
+    out['volume_sma_ratio'] = vol / vol.rolling(window=20).mean()
+    out['momentum_5'] = close - close.shift(5)
+    out['momentum_10'] = close - close.shift(10)
+    out['roc_5'] = ((close - close.shift(5)) / close.shift(5)) * 100
+    out['roc_10'] = ((close - close.shift(10)) / close.shift(10)) * 100
+    true_range = np.maximum(high - low, np.maximum(np.abs(high - close.shift()), np.abs(low - close.shift())))
+    out['atr'] = true_range.rolling(window=14).mean()
+    tp = (high + low + close) / 3
+    mad = tp.rolling(window=20).apply(lambda x: np.mean(np.abs(x - x.mean())))
+    out['cci'] = (tp - tp.rolling(window=20).mean()) / (0.015 * mad)
+    money_flow = tp * vol
+    positive_flow = money_flow.where(tp > tp.shift(1), 0).rolling(window=14).sum()
+    negative_flow = money_flow.where(tp < tp.shift(1), 0).rolling(window=14).sum()
+    out['mfi'] = 100 - (100 / (1 + positive_flow / negative_flow))
+    out['support_20'] = low.rolling(window=20).min()
+    out['resistance_20'] = high.rolling(window=20).max()
+    out['price_to_support'] = (close - out['support_20']) / out['support_20']
+    out['price_to_resistance'] = (out['resistance_20'] - close) / close
+    return out
+
+
+def test_full_output_matches_reference():
+    """All indicators, same columns in the same order, same values."""
+    df = _make_bars()
+    expected = _reference_indicators(df)
+    result = add_technical_indicators(df)
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+    assert list(df.columns) == ['open', 'high', 'low', 'close', 'vol']
+
+
+def test_selective_computation():
+    """Only the requested indicators and their dependencies are evaluated."""
+    df = _make_bars()[['open', 'high', 'low', 'close']]
+    planned = [node.name for node in plan_indicators(['bb_position'], df.columns)]
+    assert planned == ['ma_20', 'bb_middle', '_close_std_20', 'bb_upper', 'bb_lower', 'bb_position']
+
+    # No 'vol' column is needed for these, so a frame without it works
+    result = compute_indicators(df, columns=['open', 'high', 'rsi', 'bb_position', 'cci'])
+    assert list(result.columns) == ['open', 'high', 'low', 'close', 'rsi', 'bb_position', 'cci']
+    expected = _reference_indicators(_make_bars())
+    for name in ('rsi', 'bb_position', 'cci'):
+        pd.testing.assert_series_equal(result[name], expected[name], check_exact=False, rtol=1e-12)
+
+
+def test_shared_nodes_computed_once():
+    """Intermediates used by several indicators are evaluated a single time."""
+    calls = []
+    original = INDICATORS['_typical_price']
+
+    def counting(high, low, close):
+        calls.append(1)
+        return original.func(high, low, close)
+
+    overrides = {'_typical_price': Indicator('_typical_price', original.inputs, counting)}
+    compute_indicators(_make_bars(), columns=['cci', 'mfi'], overrides=overrides)
+    assert len(calls) == 1
+
+
+def test_missing_inputs_and_overrides():
+    """Missing raw columns raise a clear error; overrides replace nodes."""
+    df = _make_bars()[['open', 'close']]
+    try:
+        compute_indicators(df, columns=['atr'])
+        assert False, "Expected KeyError for missing 'high'"
+    except KeyError as e:
+        assert "requires column 'high'" in str(e)
+    try:
+        compute_indicators(df, columns=['no_such_indicator'])
+        assert False, "Expected KeyError for unknown column"
+    except KeyError:
+        pass
+
+    renamed = compute_indicators(df, columns=['close', 'sma_5'], overrides={'sma_5': alias('sma_5', 'ma_5')})
+    assert 'ma_5' not in renamed.columns
+    assert np.allclose(renamed['sma_5'].dropna(), df['close'].rolling(5).mean().dropna())
+
+    # Columns already present are not recomputed
+    df = df.assign(rsi=1.0)
+    assert (compute_indicators(df, columns=['rsi'])['rsi'] == 1.0).all()
+    assert indicators.available_indicators()[0] == 'ma_5'
+
+
+if __name__ == "__main__":
+    test_full_output_matches_reference()
+    test_selective_computation()
+    test_shared_nodes_computed_once()
+    test_missing_inputs_and_overrides()
+    print("✅ All indicator engine tests passed!")
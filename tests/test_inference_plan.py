@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test script for compiled inference plans
+
+Checks that an InferencePlan with the normalization folded into its weights
+predicts the same values as StockPredictor.predict for min-max, z-score and
+missing normalization, in float64 and float32, and after a save/load round
+trip, and that predict.py reports a plan that cannot be saved as a
+prediction error.
+"""
+
+import os
+import sys
+import tempfile
+import contextlib
+import io
+
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inference_plan import InferencePlan, fold_normalization
+import predict
+from predict import StockPredictor
+from stock_net import StockNet
+
+
+def _predictor(tmp, seed=0, input_size=5, hidden_size=7):
+    rng = np.random.RandomState(seed)
+    model = StockNet(input_size=input_size, hidden_size=hidden_size)
+    model.W1 = rng.normal(0, 1, model.W1.shape)
+    model.b1 = rng.normal(0, 1, model.b1.shape)
+    model.W2 = rng.normal(0, 1, model.W2.shape)
+    model.b2 = rng.normal(0, 1, model.b2.shape)
+    model.X_min = rng.uniform(50, 100, input_size)
+    model.X_max = model.X_min + rng.uniform(1, 30, input_size)
+    model.Y_min, model.Y_max = np.float64(40.0), np.float64(160.0)
+    model.has_target_norm = True
+    model_dir = os.path.join(tmp, f"model_{seed}")
+    model.save_weights(model_dir)
+    return StockPredictor(model_dir), rng
+
+
+def test_matches_predict():
+    """Folded float64 plans agree with the unfolded path for each normalization mode."""
+    with tempfile.TemporaryDirectory() as tmp:
+        predictor, rng = _predictor(tmp)
+        X = rng.uniform(40, 140, (5000, 5))
+
+        # Min-max inputs and targets, as saved by training
+        np.testing.assert_allclose(predictor.compile_plan().predict(X), predictor.predict(X), rtol=1e-12, atol=1e-9)
+
+        # Z-score inputs
+        predictor.use_standardization = True
+        predictor.X_mean, predictor.X_std = X.mean(axis=0), X.std(axis=0)
+        np.testing.assert_allclose(predictor.compile_plan().predict(X), predictor.predict(X), rtol=1e-12, atol=1e-9)
+
+        # No normalization at all
+        predictor.use_standardization = False
+        predictor.X_min = predictor.X_max = None
+        predictor.has_target_norm = False
+        np.testing.assert_allclose(predictor.compile_plan().predict(X), predictor.predict(X), rtol=1e-12, atol=1e-12)
+
+
+def test_float32_and_layout():
+    """float32 plans are C-contiguous float32 and close to the float64 result."""
+    with tempfile.TemporaryDirectory() as tmp:
+        predictor, rng = _predictor(tmp, seed=1)
+        X = rng.uniform(40, 140, (2000, 5))
+        plan = predictor.compile_plan(dtype=np.float32)
+        for array in (plan.W1, plan.b1, plan.W2, plan.b2):
+            assert array.dtype == np.float32 and array.flags['C_CONTIGUOUS']
+        predictions = plan.predict(X)
+        assert predictions.dtype == np.float32 and predictions.shape == (2000,)
+        expected = predictor.predict(X)
+        np.testing.assert_allclose(predictions, expected, rtol=0, atol=1e-4 * np.abs(expected).max())
+
+
+def test_save_load_and_folding():
+    """Saved plans reload unchanged; folding without scalings changes nothing."""
+    with tempfile.TemporaryDirectory() as tmp:
+        predictor, rng = _predictor(tmp, seed=2)
+        X = rng.uniform(40, 140, (100, 5))
+        path = os.path.join(tmp, 'plan.npz')
+        for dtype in (np.float64, np.float32):
+            plan = predictor.compile_plan(dtype=dtype)
+            plan.save(path)
+            loaded = InferencePlan.load(path)
+            assert loaded.dtype == plan.dtype
+            np.testing.assert_array_equal(loaded.predict(X), plan.predict(X))
+
+        W1, b1, W2, b2 = fold_normalization(predictor.W1, predictor.b1, predictor.W2, predictor.b2)
+        np.testing.assert_array_equal(W1, predictor.W1)
+        np.testing.assert_array_equal(b2, predictor.b2.reshape(-1))
+
+
+def test_export_failure_is_a_prediction_error():
+    """A failing --export_plan is caught by predict.py's error handling."""
+    with tempfile.TemporaryDirectory() as tmp:
+        _predictor(tmp, seed=3)
+        input_file = os.path.join(tmp, 'input.csv')
+        with open(input_file, 'w') as f:
+            f.write("open,high,low,close,vol\n1,2,3,4,5\n")
+        bad_path = os.path.join(tmp, 'missing', 'plan.npz')
+        for extra in ([], ['--stream']):
+            argv = ['predict.py', input_file, '--model_dir', os.path.join(tmp, 'model_3'),
+                    '--output_dir', tmp, '--export_plan', bad_path] + extra
+            output = io.StringIO()
+            old_argv, sys.argv = sys.argv, argv
+            try:
+                with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+                    predict.main()
+            finally:
+                sys.argv = old_argv
+            assert "Error during prediction" in output.getvalue()
+
+
+if __name__ == "__main__":
+    test_matches_predict()
+    test_float32_and_layout()
+    test_save_load_and_folding()
+    test_export_failure_is_a_prediction_error()
+    print("✅ All inference plan tests passed!")
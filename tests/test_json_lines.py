@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming JSON Lines ingestion
+
+Checks that the PyArrow and line-by-line JSON Lines readers build the same
+frame, that files PyArrow rejects still load, that single JSON documents are
+not mistaken for JSON Lines, and that get_json_info samples large files.
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_prediction_gui.core import data_manager as data_manager_module
+from stock_prediction_gui.core.data_manager import DataManager
+
+
+def _records(rows, seed=0):
+    rng = np.random.RandomState(seed)
+    records = []
+    for i in range(rows):
+        records.append({'date': f"2024-01-{i % 28 + 1:02d}", 'ticker': 'AB'[i % 2],
+                        'close': float(rng.rand()), 'vol': i})
+    records[3]['close'] = None
+    return records
+
+
+def _write_jsonl(path, records, extra_lines=()):
+    with open(path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+        for line in extra_lines:
+            f.write(line + '\n')
+
+
+def test_readers_agree():
+    """PyArrow and batched line-by-line parsing give the same frame."""
+    original_batch = data_manager_module.JSON_LINES_BATCH_ROWS
+    data_manager_module.JSON_LINES_BATCH_ROWS = 700  # Several batches
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bars.jsonl')
+            records = _records(5000)
+            _write_jsonl(path, records)
+            manager = DataManager()
+            arrow = manager._read_json_lines_arrow(path)
+            manager.libraries_available['pyarrow'] = False
+            batched = manager._load_json_lines(path)
+            pd.testing.assert_frame_equal(arrow, batched)
+            pd.testing.assert_frame_equal(batched, pd.DataFrame(records))
+    finally:
+        data_manager_module.JSON_LINES_BATCH_ROWS = original_batch
+
+
+def test_fallbacks():
+    """Invalid lines are skipped; new fields late in the file still load."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bars.json')
+        records = _records(50)
+        _write_jsonl(path, records, extra_lines=['{not json', '{"ticker": "C", "extra": 1.5}'])
+        manager = DataManager()
+        info = manager.load_data(path)
+        assert info['rows'] == 51
+        df = manager.get_current_data()
+        assert df['extra'].notna().sum() == 1 and df['ticker'].iloc[-1] == 'C'
+
+        # A pretty-printed document and a one-line array are single JSON
+        document = os.path.join(tmp, 'doc.json')
+        with open(document, 'w') as f:
+            json.dump(records, f, indent=2)
+        assert manager._detect_json_layout(document) == 'single_json'
+        assert manager.load_data(document)['rows'] == 50
+        with open(document, 'w') as f:
+            json.dump(records, f)
+        assert manager._detect_json_layout(document) == 'single_json'
+        assert manager.get_json_info(document)['array_length'] == 50
+
+
+def test_sampled_info():
+    """get_json_info reads a bounded head sample and extrapolates the row count."""
+    original_lines = data_manager_module.JSON_INFO_SAMPLE_LINES
+    data_manager_module.JSON_INFO_SAMPLE_LINES = 200
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bars.jsonl')
+            _write_jsonl(path, _records(20000))
+            info = DataManager().get_json_info(path)
+            assert info['format_type'] == 'json_lines' and info['sampled']
+            assert info['object_keys'] == ['date', 'ticker', 'close', 'vol']
+            assert abs(info['estimated_rows'] - 20000) < 20000 * 0.1
+
+            _write_jsonl(path, _records(150), extra_lines=['oops'])
+            info = DataManager().get_json_info(path)
+            assert not info['sampled']
+            assert (info['valid_json_lines'], info['invalid_lines']) == (150, 1)
+    finally:
+        data_manager_module.JSON_INFO_SAMPLE_LINES = original_lines
+
+
+if __name__ == "__main__":
+    test_readers_agree()
+    test_fallbacks()
+    test_sampled_info()
+    print("✅ All JSON Lines tests passed!")
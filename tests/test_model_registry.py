@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared model registry
+
+Checks that a model directory is read once and then served from memory,
+that changed or added files trigger a reload, that resident models are
+capped, and that StockPredictor gets the same weights through the registry.
+"""
+
+import os
+import sys
+import json
+import tempfile
+import time
+
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import model_registry
+from model_registry import ModelRegistry
+from predict import StockPredictor
+from stock_net import StockNet
+from weight_history import WeightHistoryWriter
+
+
+def _save_model(model_dir, hidden_size=3, seed=0):
+    np.random.seed(seed)
+    model = StockNet(input_size=4, hidden_size=hidden_size)
+    model.X_min, model.X_max = np.zeros(4), np.full(4, 2.0)
+    model.Y_min, model.Y_max = np.float64(10.0), np.float64(20.0)
+    model.has_target_norm = True
+    model.save_weights(model_dir)
+    with open(os.path.join(model_dir, 'feature_info.json'), 'w') as f:
+        json.dump({'x_features': ['open', 'high', 'low', 'vol'], 'y_feature': 'close'}, f)
+    np.savetxt(os.path.join(model_dir, 'target_min.csv'), [10.0])
+    np.savetxt(os.path.join(model_dir, 'target_max.csv'), [20.0])
+    return model
+
+
+class _CountingLoad:
+    """Counts np.load calls made by the registry."""
+
+    def __init__(self):
+        self.calls = 0
+        self.original = np.load
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.original(*args, **kwargs)
+
+
+def test_loads_once_until_changed():
+    """Repeated gets read nothing; rewriting a file reloads the model."""
+    counting = _CountingLoad()
+    model_registry.np.load = counting
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            saved = _save_model(tmp)
+            registry = ModelRegistry()
+            first = registry.get(tmp)
+            for _ in range(5):
+                assert registry.get(tmp) is first
+            assert counting.calls == 1 and (registry.misses, registry.hits) == (1, 5)
+            np.testing.assert_array_equal(first.arrays['W1'], saved.W1)
+            assert first.x_features == ['open', 'high', 'low', 'vol'] and first.y_feature == 'close'
+            assert float(first.normalization['target_max']) == 20.0
+
+            time.sleep(0.01)
+            _save_model(tmp, hidden_size=5, seed=1)
+            second = registry.get(tmp)
+            assert second is not first and second.arrays['W1'].shape == (4, 5)
+            assert registry.reloads == 1
+
+            # Adding scaler files is noticed too
+            np.savetxt(os.path.join(tmp, 'scaler_mean.csv'), np.zeros(4))
+            assert 'scaler_mean' in registry.get(tmp).normalization
+    finally:
+        model_registry.np.load = counting.original
+
+
+def test_read_only_and_lru():
+    """Models cannot be modified through the registry and old ones are evicted."""
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs = []
+        for i in range(3):
+            model_dir = os.path.join(tmp, f"model_{i}")
+            _save_model(model_dir, seed=i)
+            dirs.append(model_dir)
+        registry = ModelRegistry(max_models=2)
+        loaded = registry.get(dirs[0])
+        try:
+            loaded.arrays['W1'][0, 0] = 1.0
+            assert False, "Expected read-only weights"
+        except ValueError:
+            pass
+        info = loaded.feature_info
+        info['x_features'].append('close')
+        assert loaded.x_features == ['open', 'high', 'low', 'vol']
+
+        registry.get(dirs[1])
+        registry.get(dirs[2])
+        assert len(registry) == 2 and registry.evictions == 1
+        assert registry.get(dirs[0]) is not loaded
+
+        empty = os.path.join(tmp, 'keras_model')
+        os.makedirs(empty)
+        assert not registry.get(empty).has_weights
+        try:
+            registry.get(empty, os.path.join(empty, 'stock_model.npz'))
+            assert False, "Expected FileNotFoundError"
+        except FileNotFoundError:
+            pass
+
+
+def test_stock_predictor_uses_registry():
+    """StockPredictor predictions match the saved network and share its arrays."""
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = _save_model(tmp)
+        model_registry.MODEL_REGISTRY.invalidate()
+        predictor = StockPredictor(tmp)
+        again = StockPredictor(tmp)
+        assert again.W1 is predictor.W1
+        assert predictor.expected_x_features == ['open', 'high', 'low', 'vol']
+
+        X = np.random.rand(10, 4)
+        expected = saved.forward(X / (2.0 + 1e-8)) * 10.0 + 10.0
+        np.testing.assert_allclose(predictor.predict(X), expected.flatten(), rtol=1e-6)
+
+        rebuilt = StockNet.from_arrays(model_registry.get_model(tmp).arrays)
+        np.testing.assert_array_equal(rebuilt.forward(X), saved.forward(X))
+
+
+def test_history_store_counts_as_weights():
+    """A directory with only a weights_history store serves its last snapshot."""
+    with tempfile.TemporaryDirectory() as tmp:
+        history_dir = os.path.join(tmp, 'weights_history')
+        W1, W2 = np.zeros((4, 3)), np.zeros((3, 1))
+        writer = WeightHistoryWriter(history_dir, {'W1': W1, 'W2': W2}, capacity=5)
+        registry = ModelRegistry()
+        assert not registry.get(tmp).has_weights
+
+        for epoch in range(2):
+            writer.append(epoch, W1=W1 + epoch, W2=W2 - epoch)
+        loaded = registry.get(tmp)
+        assert loaded.weights_file == history_dir
+        np.testing.assert_array_equal(loaded.arrays['W1'], W1 + 1)
+
+        # Appending in place is noticed through epochs.npy
+        writer.append(2, W1=W1 + 2, W2=W2 - 2)
+        writer.close()
+        np.testing.assert_array_equal(registry.get(tmp).arrays['W2'], W2 - 2)
+        assert model_registry.find_history_weights(tmp) == history_dir
+
+
+if __name__ == "__main__":
+    test_loads_once_until_changed()
+    test_read_only_and_lru()
+    test_stock_predictor_uses_registry()
+    test_history_store_counts_as_weights()
+    print("✅ All model registry tests passed!")
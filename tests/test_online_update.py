@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental (partial_fit) training
+
+Checks that rescaling normalization bounds leaves predictions unchanged, that
+partial_fit continues the optimizer state, and that online_update trains only
+on unseen rows and updates the model directory in place.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from online_update import load_model_for_update, update_model
+from stock_net import StockNet
+import train
+from train import train_model
+
+
+def _fitted_model(seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.rand(100, 3) * 50 + 100
+    y = X.mean(axis=1, keepdims=True)
+    np.random.seed(seed)
+    model = StockNet(input_size=3, hidden_size=4)
+    X_norm, y_norm = model.normalize(X, y)
+    model.train(X_norm, y_norm, epochs=3, batch_size=16, save_history=False, patience=100)
+    return model, X, y
+
+
+def test_rescale_preserves_predictions():
+    """Widening the bounds rewrites weights without changing outputs."""
+    model, X, _ = _fitted_model()
+    before = model.denormalize(model.forward(model.normalize(X)))
+    model.rescale_normalization(model.X_min - 10, model.X_max + 25, model.Y_min - 5, model.Y_max + 40)
+    after = model.denormalize(model.forward(model.normalize(X)))
+    assert np.allclose(before, after, rtol=1e-10)
+    assert model.t == 0
+
+
+def test_partial_fit_continues_optimizer():
+    """partial_fit keeps Adam's step counter and learns the new rows."""
+    model, X, y = _fitted_model()
+    t_before = model.t
+    losses = model.partial_fit(X[:40] + 60, y[:40] + 60, epochs=30, learning_rate=0.01,
+                               batch_size=8, rescale=True)
+    assert len(losses) == 30
+    assert losses[-1] < losses[0]
+    assert model.X_max.max() >= X[:40].max() + 60
+
+    frozen, X, y = _fitted_model()
+    X_min = frozen.X_min.copy()
+    frozen.partial_fit(X[:20], y[:20], epochs=2)
+    assert np.array_equal(frozen.X_min, X_min)
+    assert frozen.t > t_before
+
+
+def test_update_model_in_place():
+    """Only unseen rows are trained on and the model directory is updated."""
+    rng = np.random.RandomState(0)
+    close = 100 + np.cumsum(rng.randn(260))
+    df = pd.DataFrame({'open': close + rng.randn(260) * 0.1, 'high': close + 1, 'close': close})
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, "bars.csv")
+        model_dir = os.path.join(tmp, "model")
+        df.iloc[:200].to_csv(data_file, index=False)
+        os.chdir(tmp)
+        try:
+            train_model(data_file, model_dir, ['open', 'high'], 'close', epochs=5,
+                        save_history=False, patience=100, checkpoint_every=10)
+        finally:
+            os.chdir(cwd)
+
+        # The final checkpoint matches the saved weights, so Adam state carries over
+        model, state = load_model_for_update(model_dir)
+        assert state is not None and model.t > 0
+
+        df.to_csv(data_file, index=False)
+        result = update_model(model_dir, data_file, epochs=3, rescale=True)
+        assert result['new_rows'] == 60
+        assert len(pd.read_csv(os.path.join(model_dir, "training_data.csv"))) == 260
+        assert len(np.loadtxt(os.path.join(model_dir, "training_losses.csv"), delimiter=',')) == 8
+
+        assert update_model(model_dir, data_file)['new_rows'] == 0
+        try:
+            update_model(model_dir, data_file, epochs=0, all_rows=True)
+            assert False, "epochs=0 should be rejected"
+        except ValueError:
+            pass
+        updated = StockNet.load_weights(model_dir)
+        assert updated.X_min.shape == (2,)
+
+
+def test_out_of_core_model_counts_trained_rows():
+    """Rows seen come from feature_info.json, not the training_data.csv sample."""
+    rng = np.random.RandomState(1)
+    close = 100 + np.cumsum(rng.randn(260))
+    df = pd.DataFrame({'open': close + rng.randn(260) * 0.1, 'high': close + 1, 'close': close})
+    cwd = os.getcwd()
+    sample_rows = train.TRAINING_DATA_SAMPLE_ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, "bars.csv")
+        model_dir = os.path.join(tmp, "model")
+        df.iloc[:200].to_csv(data_file, index=False)
+        os.chdir(tmp)
+        train.TRAINING_DATA_SAMPLE_ROWS = 50
+        try:
+            train_model(data_file, model_dir, ['open', 'high'], 'close', epochs=2,
+                        save_history=False, patience=100, out_of_core=True)
+        finally:
+            train.TRAINING_DATA_SAMPLE_ROWS = sample_rows
+            os.chdir(cwd)
+        assert len(pd.read_csv(os.path.join(model_dir, "training_data.csv"))) == 50
+
+        df.to_csv(data_file, index=False)
+        assert update_model(model_dir, data_file, epochs=1, rescale=True)['new_rows'] == 60
+
+
+if __name__ == "__main__":
+    test_rescale_preserves_predictions()
+    test_partial_fit_continues_optimizer()
+    test_update_model_in_place()
+    test_out_of_core_model_counts_trained_rows()
+    print("✅ All online update tests passed!")
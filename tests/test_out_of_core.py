@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test script for out-of-core training
+
+Checks that features are materialized into float32 memory maps with streamed
+statistics, that block budgets are respected, that StockNet.train_streaming
+learns from the store, and that out-of-core runs stop on request and resume
+from their checkpoint.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from feature_store import FeatureStore, block_rows_for_budget, iter_blocks, materialize_features
+from checkpoint import TrainingCheckpointer
+from stock_net import StockNet
+from telemetry import CallbackSink, TrainingTelemetry
+from train import train_model
+
+
+def _write_csv(path, n_rows=1000, seed=0):
+    rng = np.random.RandomState(seed)
+    df = pd.DataFrame({'a': rng.rand(n_rows) * 10, 'b': rng.rand(n_rows) - 5, 'noise': rng.rand(n_rows)})
+    df['target'] = 2 * df['a'] - df['b']
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_materialize_matches_dataframe():
+    """The store holds the same values and min/max as the in-memory frame."""
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = os.path.join(tmp, "data.csv")
+        df = _write_csv(csv)
+        store = materialize_features(csv, ['a', 'b'], 'target', os.path.join(tmp, "store"), chunksize=128)
+
+        assert store.X.dtype == np.float32
+        assert store.X.shape == (1000, 2)
+        assert np.allclose(store.X, df[['a', 'b']].values, rtol=1e-6)
+        assert np.allclose(store.X_min, df[['a', 'b']].min().values)
+        assert np.allclose(store.X_max, df[['a', 'b']].max().values)
+        assert np.isclose(store.Y_max, df['target'].max())
+
+        # A second call with the same source reuses the store
+        again = materialize_features(csv, ['a', 'b'], 'target', os.path.join(tmp, "store"))
+        assert again.n_rows == store.n_rows
+        assert FeatureStore(os.path.join(tmp, "store")).split(0.2) == ((0, 800), (800, 1000))
+
+
+def test_blocks_cover_range_once():
+    """Shuffled blocks cover every row exactly once and fit the budget."""
+    block_rows = block_rows_for_budget(n_features=3, memory_budget_mb=0.001, batch_size=8)
+    # 1048 budget bytes / 40 bytes per row (float64 X and y plus an index)
+    assert block_rows == 26
+    assert block_rows_for_budget(n_features=3, memory_budget_mb=0.0, batch_size=8) == 8
+    np.random.seed(0)
+    rows = np.concatenate([np.arange(lo, hi) for lo, hi in iter_blocks(5, 103, block_rows, shuffle=True)])
+    assert np.array_equal(np.sort(rows), np.arange(5, 103))
+
+
+def test_streaming_training_learns():
+    """Training from the store with a tiny budget reduces the loss."""
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = os.path.join(tmp, "data.csv")
+        _write_csv(csv)
+        store = materialize_features(csv, ['a', 'b'], 'target', os.path.join(tmp, "store"))
+        np.random.seed(1)
+        model = StockNet(input_size=2, hidden_size=4)
+        train_losses, val_losses = model.train_streaming(store, epochs=15, learning_rate=0.01,
+                                                         batch_size=16, memory_budget_mb=0.005,
+                                                         save_history=False, patience=100)
+        assert len(val_losses) == 15
+        assert train_losses[-1] < train_losses[0]
+        assert val_losses[-1] < val_losses[0]
+
+
+def test_train_model_out_of_core():
+    """train_model writes the usual artifacts in out-of-core mode."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = os.path.join(tmp, "data.csv")
+        _write_csv(csv)
+        os.chdir(tmp)
+        try:
+            summary = train_model(csv, os.path.join(tmp, "model"), ['a', 'b'], 'target', epochs=3,
+                                  out_of_core=True, memory_budget_mb=0.01)
+        finally:
+            os.chdir(cwd)
+        assert summary['epochs_run'] == 3
+        for name in ('stock_model.npz', 'scaler_mean.csv', 'training_data.csv',
+                     os.path.join('features', 'X.npy')):
+            assert os.path.exists(os.path.join(tmp, "model", name)), name
+
+
+def test_out_of_core_stop_and_resume():
+    """A stop request checkpoints the streaming run; resuming matches an uninterrupted one."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = os.path.join(tmp, "data.csv")
+        _write_csv(csv)
+        os.chdir(tmp)
+        try:
+            kwargs = dict(epochs=6, patience=100, save_history=False, out_of_core=True, memory_budget_mb=0.01)
+            reference = train_model(csv, os.path.join(tmp, "reference"), ['a', 'b'], 'target', **kwargs)
+
+            model_dir = os.path.join(tmp, "model")
+            checkpointer = TrainingCheckpointer(os.path.join(model_dir, "checkpoint.npz"))
+
+            def stop_after_two(record):
+                if record['epoch'] == 2:
+                    checkpointer.request_stop()
+
+            telemetry = TrainingTelemetry([CallbackSink(stop_after_two)])
+            stopped = train_model(csv, model_dir, ['a', 'b'], 'target', telemetry=telemetry,
+                                  checkpointer=checkpointer, **kwargs)
+            assert stopped['epochs_run'] == 3
+            assert os.path.exists(checkpointer.path)
+
+            resumed = train_model(csv, model_dir, ['a', 'b'], 'target', resume=True, **kwargs)
+        finally:
+            os.chdir(cwd)
+        assert resumed['epochs_run'] == 6
+        np.testing.assert_allclose(resumed['val_losses'], reference['val_losses'], rtol=1e-12)
+
+
+if __name__ == "__main__":
+    test_materialize_matches_dataframe()
+    test_blocks_cover_range_once()
+    test_streaming_training_learns()
+    test_train_model_out_of_core()
+    test_out_of_core_stop_and_resume()
+    print("✅ All out-of-core training tests passed!")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for the local prediction server
+
+Checks that JSON and Arrow requests get the same predictions as the compiled
+inference plan, that concurrent requests are coalesced into micro-batches,
+that bad requests get error statuses on a connection that stays usable, and
+that the load generator reports latencies and batch counts.
+"""
+
+import os
+import sys
+import json
+import asyncio
+import tempfile
+
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prediction_client import PredictionClient, run_load
+from prediction_server import PredictionServer, PYARROW_AVAILABLE
+from predict import StockPredictor
+from stock_net import StockNet
+
+X_FEATURES = ['open', 'high', 'low', 'vol']
+
+
+def _save_model(model_dir, seed=0):
+    np.random.seed(seed)
+    model = StockNet(input_size=len(X_FEATURES), hidden_size=5)
+    model.X_min, model.X_max = np.zeros(len(X_FEATURES)), np.full(len(X_FEATURES), 100.0)
+    model.Y_min, model.Y_max = np.float64(10.0), np.float64(90.0)
+    model.has_target_norm = True
+    model.save_weights(model_dir)
+    with open(os.path.join(model_dir, 'feature_info.json'), 'w') as f:
+        json.dump({'x_features': X_FEATURES, 'y_feature': 'close'}, f)
+
+
+def _serve(tmp, coroutine, **kwargs):
+    """Run coroutine(server, socket_path) against a server on a Unix socket."""
+    model_dir = os.path.join(tmp, 'model')
+    _save_model(model_dir)
+    socket_path = os.path.join(tmp, 'predict.sock')
+
+    async def main():
+        server = PredictionServer([model_dir], **kwargs)
+        await server.start(unix_path=socket_path)
+        try:
+            return await coroutine(server, socket_path)
+        finally:
+            await server.close()
+
+    return asyncio.run(main()), StockPredictor(model_dir).compile_plan()
+
+
+def test_predictions_and_batching():
+    """Concurrent JSON and Arrow requests match the plan and share batches."""
+    rng = np.random.RandomState(0)
+    requests = [rng.uniform(0, 100, (rng.randint(1, 20), len(X_FEATURES))) for _ in range(40)]
+
+    async def scenario(server, socket_path):
+        clients = [await PredictionClient(unix_path=socket_path).connect() for _ in requests]
+        try:
+            results = await asyncio.gather(*(client.predict(X) for client, X in zip(clients, requests)))
+            named = await clients[0].predict([dict(zip(X_FEATURES, row)) for row in requests[0]])
+            arrow = None
+            if PYARROW_AVAILABLE:
+                arrow = await clients[1].predict_arrow({name: requests[1][:, i] for i, name in enumerate(X_FEATURES)})
+        finally:
+            for client in clients:
+                await client.close()
+        return results, named, arrow, server.batchers[server.default_model_dir].stats()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        (results, named, arrow, stats), plan = _serve(tmp, scenario, max_delay_ms=20)
+        for X, predictions in zip(requests, results):
+            np.testing.assert_allclose(predictions, plan.predict(X), rtol=1e-12)
+        np.testing.assert_allclose(named, results[0], rtol=1e-12)
+        if arrow is not None:
+            np.testing.assert_allclose(arrow, results[1], rtol=1e-12)
+        assert stats['requests'] == len(requests) + (2 if arrow is not None else 1)
+        assert stats['batches'] < len(requests)
+
+
+def test_errors_keep_connection():
+    """Bad requests get 4xx answers and the connection keeps working."""
+    async def scenario(server, socket_path):
+        async with PredictionClient(unix_path=socket_path) as client:
+            statuses = [
+                (await client.request('POST', '/predict', b'{"rows": [[1, 2]]}'))[0],
+                (await client.request('POST', '/predict', b'not json'))[0],
+                (await client.request('POST', '/predict', b'{"rows": [[1, 2, 3, 4]], "model_dir": "elsewhere"}'))[0],
+                (await client.request('GET', '/predict'))[0],
+                (await client.request('GET', '/missing'))[0],
+            ]
+            health = await client.get_json('/health')
+            empty = await client.predict([])
+            last = await client.predict([[50, 60, 40, 70]])
+        return statuses, health, empty, last
+
+    with tempfile.TemporaryDirectory() as tmp:
+        (statuses, health, empty, last), plan = _serve(tmp, scenario)
+        assert statuses == [400, 400, 404, 405, 404]
+        assert health['models'][0]['x_features'] == X_FEATURES
+        assert len(empty) == 0
+        np.testing.assert_allclose(last, plan.predict([[50, 60, 40, 70]]), rtol=1e-12)
+
+
+def test_load_generator():
+    """run_load reports percentiles and the server batches under load."""
+    async def scenario(server, socket_path):
+        return await run_load(unix_path=socket_path, concurrency=8, duration=0.3,
+                              rows_per_request=4, warmup=0.05)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        summary, _ = _serve(tmp, scenario, max_delay_ms=1)
+        assert summary['requests'] > 0
+        assert 0 < summary['p50_ms'] <= summary['p99_ms'] <= summary['max_ms']
+        assert summary['server_requests'] >= summary['requests']
+        assert summary['mean_batch_requests'] > 1
+
+
+if __name__ == "__main__":
+    test_predictions_and_batching()
+    test_errors_keep_connection()
+    test_load_generator()
+    print("✅ All prediction server tests passed!")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test script for StockNetBatch
+
+Checks that training K stacked models on shared mini-batches gives the same
+result as training each StockNet on its own, including mixed hidden sizes,
+per-model learning rates and per-model early stopping.
+"""
+
+import os
+import sys
+import copy
+
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_net import StockNet, StockNetBatch
+
+
+def _make_data(n_samples=150, n_features=4, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.rand(n_samples, n_features)
+    y = (X @ rng.rand(n_features, 1)) / n_features
+    return X, y
+
+
+def _initial_models(hidden_sizes, n_features):
+    models = []
+    for i, hidden_size in enumerate(hidden_sizes):
+        np.random.seed(100 + i)
+        models.append(StockNet(n_features, hidden_size))
+    return models
+
+
+def test_batch_matches_individual_training():
+    """Each stacked model follows the trajectory of an individually trained StockNet."""
+    X, y = _make_data()
+    X_val, y_val = _make_data(n_samples=30, seed=1)
+    hidden_sizes = [2, 4, 7]
+    learning_rates = [0.01, 0.003, 0.02]
+
+    batch = StockNetBatch.from_models(_initial_models(hidden_sizes, X.shape[1]), learning_rates)
+    np.random.seed(5)
+    batch_train, batch_val = batch.train(X, y, X_val=X_val, y_val=y_val, epochs=8,
+                                         batch_size=16, patience=100)
+    assert batch_train.shape == (8, 3)
+
+    for k, (model, lr) in enumerate(zip(_initial_models(hidden_sizes, X.shape[1]), learning_rates)):
+        np.random.seed(5)
+        train_losses, val_losses = model.train(X, y, X_val=X_val, y_val=y_val, epochs=8,
+                                               learning_rate=lr, batch_size=16,
+                                               save_history=False, patience=100)
+        stacked = batch.to_models()[k]
+        for name in ('W1', 'b1', 'W2', 'b2', 'm_W1', 'v_W2'):
+            assert np.allclose(getattr(model, name), getattr(stacked, name), rtol=1e-9, atol=1e-12), name
+        assert np.allclose(train_losses, batch_train[:, k], rtol=1e-9)
+        assert np.allclose(val_losses, batch_val[:, k], rtol=1e-9)
+
+
+def test_per_model_early_stopping_freezes_model():
+    """A model that stops early keeps its weights and Adam state while the others continue."""
+    X, y = _make_data()
+    X_val, y_val = _make_data(n_samples=30, seed=1)
+    # Learning rate 0 leaves the validation loss constant after the first epoch
+    batch = StockNetBatch(X.shape[1], [3, 3], learning_rates=[0.0, 0.05], seeds=[1, 2])
+    W1_frozen = batch.W1[0].copy()
+    at_stop = {}
+
+    def snapshot(epoch, train_loss, val_loss):
+        if epoch == 2:
+            at_stop.update({name: getattr(batch, name)[0].copy() for name in ('m_W1', 'v_W1', 'm_b2', 't')})
+
+    np.random.seed(0)
+    train_losses, val_losses = batch.train(X, y, X_val=X_val, y_val=y_val, epochs=6,
+                                           batch_size=32, patience=2, progress_callback=snapshot)
+
+    assert batch.stopped_epoch[0] == 2
+    assert batch.active[1] or batch.stopped_epoch[1] > 2
+    assert np.array_equal(batch.W1[0], W1_frozen)
+    # The frozen model's Adam state stops with it while model 1 keeps stepping
+    for name, value in at_stop.items():
+        assert np.array_equal(getattr(batch, name)[0], value), name
+    assert batch.t[1] > batch.t[0] == batch.to_models()[0].t
+    assert np.isnan(val_losses[3:, 0]).all()
+    assert not np.isnan(val_losses[:4, 1]).any()
+
+
+def test_padded_hidden_units_stay_zero():
+    """Padding for narrower models never receives weight in the output layer."""
+    X, y = _make_data()
+    batch = StockNetBatch(X.shape[1], [2, 6], learning_rates=0.05, seeds=[3, 4])
+    np.random.seed(0)
+    batch.train(X, y, epochs=5, batch_size=16, patience=100)
+
+    assert np.all(batch.W2[0, 2:, :] == 0)
+    narrow = batch.to_models()[0]
+    assert narrow.W1.shape == (X.shape[1], 2)
+    assert np.allclose(narrow.forward(X), batch.forward(X)[0])
+
+
+def test_models_with_different_step_counts():
+    """Stacked models keep their own Adam step counts and bias correction."""
+    X, y = _make_data()
+    fresh, trained = _initial_models([3, 3], X.shape[1])
+    np.random.seed(7)
+    trained.train(X, y, epochs=3, learning_rate=0.01, batch_size=16, save_history=False, patience=100)
+    assert trained.t > 0 and fresh.t == 0
+
+    batch = StockNetBatch.from_models([copy.deepcopy(fresh), copy.deepcopy(trained)], 0.01)
+    np.random.seed(9)
+    batch.train(X, y, epochs=2, batch_size=16, patience=100)
+    stacked = batch.to_models()
+    for k, model in enumerate((fresh, trained)):
+        np.random.seed(9)
+        model.train(X, y, epochs=2, learning_rate=0.01, batch_size=16, save_history=False, patience=100)
+        assert stacked[k].t == model.t
+        assert np.allclose(model.W1, stacked[k].W1, rtol=1e-9, atol=1e-12)
+
+
+if __name__ == "__main__":
+    test_batch_matches_individual_training()
+    test_per_model_early_stopping_freezes_model()
+    test_padded_hidden_units_stay_zero()
+    test_models_with_different_step_counts()
+    print("✅ All StockNetBatch tests passed!")
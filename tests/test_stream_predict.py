@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming prediction
+
+Checks that chunked indicator computation with carried-over warm-up rows
+matches the whole-file computation, that stream_predictions writes the same
+predictions as scoring the whole file at once to CSV and Parquet, and that
+the plot sample stays bounded.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indicators import compute_indicators
+from predict import StockPredictor, iter_feature_chunks, stream_predictions
+from stock_net import StockNet
+
+X_FEATURES = ['close', 'vol', 'rsi', 'macd_signal', 'ma_50', 'volatility_10', 'cci', 'mfi', 'price_change_10']
+
+
+def _write_bars(path, rows=5000, seed=0):
+    rng = np.random.RandomState(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    df = pd.DataFrame({
+        'date': pd.date_range('2000-01-01', periods=rows, freq='D').strftime('%Y-%m-%d'),
+        'open': close * (1 + rng.normal(0, 0.002, rows)),
+        'high': close * (1 + np.abs(rng.normal(0, 0.01, rows))),
+        'low': close * (1 - np.abs(rng.normal(0, 0.01, rows))),
+        'close': close,
+        'vol': rng.randint(1000, 100000, rows).astype(float),
+    })
+    df.to_csv(path, index=False)
+
+
+def _save_model(model_dir, input_size, seed=0):
+    np.random.seed(seed)
+    model = StockNet(input_size=input_size, hidden_size=6)
+    model.X_min, model.X_max = np.full(input_size, -50.0), np.full(input_size, 150.0)
+    model.Y_min, model.Y_max = np.float64(50.0), np.float64(250.0)
+    model.has_target_norm = True
+    model.save_weights(model_dir)
+
+
+def test_chunked_indicators_match():
+    """Features at every chunk boundary equal the whole-file features."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bars.csv')
+        _write_bars(path)
+        expected = compute_indicators(pd.read_csv(path), columns=X_FEATURES)
+        chunks = list(iter_feature_chunks(path, X_FEATURES, chunksize=700))
+        assert max(len(chunk) for chunk in chunks) == 700
+        streamed = pd.concat(chunks)
+        pd.testing.assert_frame_equal(streamed[X_FEATURES], expected[X_FEATURES], rtol=1e-9)
+
+
+def test_stream_matches_whole_file():
+    """CSV and Parquet outputs hold the whole-file predictions."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bars.csv')
+        _write_bars(path, seed=1)
+        model_dir = os.path.join(tmp, 'model')
+        _save_model(model_dir, len(X_FEATURES))
+        plan = StockPredictor(model_dir).compile_plan()
+
+        features = compute_indicators(pd.read_csv(path), columns=X_FEATURES)
+        expected = plan.predict(features[X_FEATURES].to_numpy())
+
+        csv_out = os.path.join(tmp, 'predictions.csv')
+        summary = stream_predictions(path, plan, X_FEATURES, 'close', csv_out, chunksize=900, plot_points=100)
+        results = pd.read_csv(csv_out)
+        assert summary['rows'] == len(results) == 5000
+        np.testing.assert_allclose(results['predicted'], expected, rtol=1e-9)
+        np.testing.assert_allclose(results['error'], features['close'] - expected, rtol=1e-9, atol=1e-9)
+        valid = ~np.isnan(expected)
+        np.testing.assert_allclose(summary['mse'], np.mean((features['close'].to_numpy() - expected)[valid] ** 2))
+
+        # Plot sample is bounded and evenly strided from the first row
+        rows = summary['plot_rows']
+        assert 50 <= len(rows) <= 100 and rows[0] == 0
+        assert len(set(np.diff(rows))) == 1
+        np.testing.assert_allclose(summary['plot_predicted'], expected[rows], rtol=1e-9)
+
+        parquet_out = os.path.join(tmp, 'predictions.parquet')
+        stream_predictions(path, plan, X_FEATURES, 'close', parquet_out, chunksize=900, plot_points=0)
+        parquet = pd.read_parquet(parquet_out)
+        np.testing.assert_allclose(parquet['predicted'], results['predicted'], rtol=1e-12)
+        assert str(parquet['date'].iloc[-1].date()) == results['date'].iloc[-1]
+
+
+if __name__ == "__main__":
+    test_chunked_indicators_match()
+    test_stream_matches_whole_file()
+    print("✅ All streaming prediction tests passed!")
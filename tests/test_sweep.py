@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for the hyperparameter sweep
+
+Covers spec expansion, successive-halving budgets and a small end-to-end
+sweep running in worker processes against shared memory.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sweep import generate_trials, rung_budgets, run_sweep
+
+
+def test_grid_expansion():
+    """Grid search expands the cartesian product of all candidate lists."""
+    spec = {'hidden_size': [4, 8], 'learning_rate': [0.001, 0.01, 0.1], 'patience': 5}
+    trials = generate_trials(spec, 'grid')
+    assert len(trials) == 6
+    assert {'hidden_size': 8, 'learning_rate': 0.1, 'patience': 5} in trials
+
+
+def test_random_search_is_reproducible():
+    """Random search samples from distributions deterministically per seed."""
+    spec = {'learning_rate': {'log_uniform': [1e-4, 1e-1]}, 'hidden_size': {'int_uniform': [4, 64]}}
+    first = generate_trials(spec, 'random', n_trials=10, seed=3)
+    second = generate_trials(spec, 'random', n_trials=10, seed=3)
+    assert first == second
+    assert all(1e-4 <= t['learning_rate'] <= 1e-1 for t in first)
+    assert all(4 <= t['hidden_size'] <= 64 for t in first)
+
+
+def test_rung_budgets():
+    """Budgets grow by eta and always end at max_epochs."""
+    assert rung_budgets(5, 100, 3) == [5, 15, 45, 100]
+    assert rung_budgets(10, 10, 3) == [10]
+
+
+def test_end_to_end_sweep():
+    """A small sweep runs in worker processes and prunes weak trials."""
+    rng = np.random.RandomState(0)
+    close = 100 + np.cumsum(rng.randn(300))
+    df = pd.DataFrame({'open': close + rng.randn(300) * 0.1, 'high': close + 1,
+                       'low': close - 1, 'close': close, 'extra': rng.rand(300)})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, 'data.csv')
+        df.to_csv(data_file, index=False)
+        spec = {'hidden_size': [2, 4], 'learning_rate': [0.001, 0.02]}
+
+        leaderboard = run_sweep(data_file, 'close', spec, os.path.join(tmp, 'sweep'),
+                                x_features=['open', 'high', 'low'], workers=2,
+                                min_epochs=2, max_epochs=4, eta=2)
+
+        assert os.path.exists(os.path.join(tmp, 'sweep', 'leaderboard.csv'))
+        assert len(leaderboard) == 4
+        assert (leaderboard['status'] == 'ok').all()
+        # Half the trials survive to the final 4-epoch rung
+        assert (leaderboard['rung'] == 1).sum() == 2
+        assert leaderboard.iloc[0]['epochs'] == 4
+
+        # Survivors continued their first-rung run in place instead of
+        # retraining, and no trial keeps a checkpoint afterwards
+        for model_dir in leaderboard.loc[leaderboard['rung'] == 1, 'model_dir']:
+            with open(os.path.join(model_dir, 'train.log')) as f:
+                assert 'Resuming training at epoch 2' in f.read()
+        # Trials train from the shared frame without copying it to disk
+        for model_dir in leaderboard['model_dir']:
+            assert not os.path.exists(os.path.join(model_dir, 'checkpoint.npz'))
+            assert not os.path.exists(os.path.join(model_dir, 'training_data.csv'))
+            assert os.path.exists(os.path.join(model_dir, 'stock_model.npz'))
+
+
+if __name__ == "__main__":
+    test_grid_expansion()
+    test_random_search_is_reproducible()
+    test_rung_budgets()
+    test_end_to_end_sweep()
+    print("✅ All sweep tests passed!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the training telemetry channel
+
+Checks sampling and aggregation, the legacy stdout adapter format, the
+JSON-lines sink, and that StockNet.train no longer prints per-epoch lines
+unless a stdout adapter is attached.
+"""
+
+import io
+import os
+import sys
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_net import StockNet
+from telemetry import CallbackSink, JsonLinesSink, StdoutSink, TrainingTelemetry
+
+
+class _Weights:
+    W1 = np.full((2, 2), 0.5)
+    W2 = np.full((2, 1), -1.0)
+
+
+def test_sampling_and_aggregation():
+    """Records are emitted once per window with aggregated losses."""
+    records = []
+    telemetry = TrainingTelemetry([CallbackSink(records.append)], every=3, aggregate='mean')
+    for epoch, loss in enumerate([3.0, 2.0, 1.0, 0.5, 0.25]):
+        telemetry.record_epoch(epoch, loss, loss * 2, _Weights)
+    assert len(records) == 1
+    assert records[0]['epoch'] == 2
+    assert records[0]['train_loss'] == 2.0
+    assert records[0]['val_loss'] == 4.0
+    assert records[0]['w1_mean'] == 0.5
+
+    telemetry.close()
+    assert len(records) == 2
+    assert records[1]['epoch'] == 4
+    assert records[1]['n_epochs'] == 2
+
+
+def test_stdout_adapter_format():
+    """The stdout adapter reproduces the legacy LOSS:/WEIGHTS: lines."""
+    stream = io.StringIO()
+    telemetry = TrainingTelemetry([StdoutSink(stream)])
+    telemetry.record_epoch(7, 0.1234567, 0.2, _Weights)
+    assert stream.getvalue().splitlines() == ["LOSS:7,0.123457", "WEIGHTS:7,0.500000,-1.000000"]
+
+
+def test_json_lines_sink():
+    """The JSON-lines sink writes one parseable record per line."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "telemetry.jsonl")
+        telemetry = TrainingTelemetry([JsonLinesSink(path)], include_weights=False)
+        for epoch in range(4):
+            telemetry.record_epoch(epoch, 1.0 / (epoch + 1), 0.0)
+        telemetry.close()
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+    assert [r['epoch'] for r in records] == [0, 1, 2, 3]
+    assert 'w1_mean' not in records[0]
+
+
+def test_train_is_silent_without_stdout_adapter():
+    """Training emits through telemetry instead of printing every epoch."""
+    rng = np.random.RandomState(0)
+    X = rng.rand(40, 3)
+    y = X.mean(axis=1, keepdims=True)
+    model = StockNet(input_size=3, hidden_size=4)
+    records = []
+    stdout = io.StringIO()
+    with redirect_stdout(stdout):
+        train_losses, _ = model.train(X, y, epochs=6, batch_size=8, save_history=False, patience=100,
+                                      telemetry=TrainingTelemetry([CallbackSink(records.append)], every=2))
+    assert "LOSS:" not in stdout.getvalue()
+    assert [r['epoch'] for r in records] == [1, 3, 5]
+    assert records[-1]['train_loss'] == train_losses[-1]
+
+
+if __name__ == "__main__":
+    test_sampling_and_aggregation()
+    test_stdout_adapter_format()
+    test_json_lines_sink()
+    test_train_is_silent_without_stdout_adapter()
+    print("✅ All telemetry tests passed!")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the preallocated training workspace
+
+Verifies that StockNet.train with use_workspace=True produces the same weights,
+Adam state and loss history as the allocating path, and that the in-place
+sigmoid matches the reference formula.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_net import StockNet, TrainingWorkspace, sigmoid
+
+
+def _make_data(n_samples=203, n_features=5, seed=0):
+    """Create a small regression problem with a ragged final batch."""
+    rng = np.random.RandomState(seed)
+    X = rng.rand(n_samples, n_features)
+    y = (X @ rng.rand(n_features, 1)) / n_features + 0.05 * rng.rand(n_samples, 1)
+    return X, y
+
+
+def _train(use_workspace, X, y, X_val=None, y_val=None):
+    np.random.seed(123)
+    model = StockNet(input_size=X.shape[1], hidden_size=8)
+    np.random.seed(7)
+    losses = model.train(X, y, X_val=X_val, y_val=y_val, epochs=15, learning_rate=0.01,
+                         batch_size=32, save_history=False, patience=100,
+                         use_workspace=use_workspace)
+    return model, losses
+
+
+def test_sigmoid_matches_reference():
+    """The in-place sigmoid matches 1 / (1 + exp(-x)) and never overflows."""
+    x = np.linspace(-60, 60, 1001)
+    expected = 1.0 / (1.0 + np.exp(-x))
+    assert np.allclose(sigmoid(x), expected, rtol=1e-12, atol=1e-15)
+
+    with np.errstate(over='raise'):
+        extreme = sigmoid(np.array([-1e6, -800.0, 0.0, 800.0, 1e6]))
+    assert np.all(np.isfinite(extreme))
+    assert extreme[2] == 0.5
+
+    out = np.empty_like(x)
+    result = sigmoid(x, out=out)
+    assert result is out
+    assert np.allclose(out, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_workspace_training_matches_allocating_path():
+    """Workspace training gives the same weights, Adam state and losses."""
+    X, y = _make_data()
+    X_val, y_val = _make_data(n_samples=40, seed=1)
+
+    ref_model, (ref_train, ref_val) = _train(False, X, y, X_val, y_val)
+    ws_model, (ws_train, ws_val) = _train(True, X, y, X_val, y_val)
+
+    assert ref_model.t == ws_model.t
+    for name in ('W1', 'b1', 'W2', 'b2', 'm_W1', 'm_b1', 'm_W2', 'm_b2',
+                 'v_W1', 'v_b1', 'v_W2', 'v_b2'):
+        assert np.allclose(getattr(ref_model, name), getattr(ws_model, name),
+                           rtol=1e-10, atol=1e-12), name
+    assert np.allclose(ref_train, ws_train, rtol=1e-10)
+    assert np.allclose(ref_val, ws_val, rtol=1e-10)
+
+
+def test_workspace_buffers_are_reused():
+    """Parameters and moments keep their identity across in-place updates."""
+    X, y = _make_data(n_samples=64)
+    model = StockNet(input_size=X.shape[1], hidden_size=4)
+    workspace = TrainingWorkspace(model, 32)
+    W1, m_W1 = model.W1, model.m_W1
+
+    for start in (0, 32):
+        X_batch = X[start:start + 32]
+        model.forward_workspace(X_batch, workspace)
+        mse = model.backward_workspace(X_batch, y[start:start + 32], workspace, 0.01)
+        assert np.isfinite(mse)
+
+    assert model.W1 is W1
+    assert model.m_W1 is m_W1
+    assert model.t == 2
+
+
+if __name__ == "__main__":
+    test_sigmoid_matches_reference()
+    test_workspace_training_matches_allocating_path()
+    test_workspace_buffers_are_reused()
+    print("✅ All training workspace tests passed!")
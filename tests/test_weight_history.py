@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for the memory-mapped weight history store
+
+Checks append/read round trips, lazy epoch-range slicing, that
+StockNet.train writes a single store instead of per-epoch npz files, and that
+load_snapshots reads both the store and legacy npz directories.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_net import StockNet
+from weight_history import WeightHistory, WeightHistoryWriter, load_snapshots
+
+
+def test_round_trip_and_epoch_range():
+    """Snapshots read back exactly and epoch ranges slice without copying."""
+    with tempfile.TemporaryDirectory() as tmp:
+        W1 = np.zeros((3, 4))
+        W2 = np.zeros((4, 1))
+        writer = WeightHistoryWriter(tmp, {'W1': W1, 'W2': W2}, capacity=10)
+        for epoch in range(0, 60, 10):
+            assert writer.append(epoch, W1=W1 + epoch, W2=W2 - epoch)
+        writer.close()
+
+        history = WeightHistory(tmp)
+        assert len(history) == 6
+        assert np.array_equal(history.epochs, np.arange(0, 60, 10))
+        assert np.array_equal(history[2]['W1'], W1 + 20)
+
+        window = history.epoch_range(15, 45)
+        assert np.array_equal(window['epochs'], [20, 30, 40])
+        assert isinstance(window['W1'], np.memmap)
+        assert np.array_equal(window['W2'][:, 0, 0], [-20, -30, -40])
+        assert np.array_equal(history.series('W1', 5), np.arange(0, 60, 10))
+
+
+def test_writer_drops_snapshots_past_capacity():
+    """A full store refuses further snapshots instead of growing."""
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = WeightHistoryWriter(tmp, {'W1': np.zeros(2)}, capacity=2)
+        assert writer.append(0, W1=np.ones(2))
+        assert writer.append(1, W1=np.ones(2))
+        assert not writer.append(2, W1=np.ones(2))
+        writer.close()
+        assert len(WeightHistory(tmp)) == 2
+
+
+def test_training_writes_single_store():
+    """StockNet.train records snapshots into one store in ./weights_history."""
+    rng = np.random.RandomState(0)
+    X = rng.rand(64, 3)
+    y = X.sum(axis=1, keepdims=True) / 3
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            model = StockNet(input_size=3, hidden_size=4)
+            model.train(X, y, epochs=12, batch_size=16, history_interval=5, patience=100)
+            history_dir = os.path.join(tmp, "weights_history")
+            assert not [f for f in os.listdir(history_dir) if f.endswith('.npz')]
+
+            history = WeightHistory(history_dir)
+            assert list(history.epochs) == [0, 5, 10, 11]
+            assert np.allclose(history[len(history) - 1]['W1'], model.W1)
+        finally:
+            os.chdir(cwd)
+
+
+def test_load_snapshots_reads_both_formats():
+    """load_snapshots serves W1/W2 by index from a store or legacy npz files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store_dir = os.path.join(tmp, "store")
+        writer = WeightHistoryWriter(store_dir, {'W1': np.zeros((2, 3)), 'W2': np.zeros((3, 1))}, capacity=4)
+        for epoch in range(3):
+            writer.append(epoch, W1=np.full((2, 3), epoch), W2=np.full((3, 1), -epoch))
+        writer.close()
+
+        legacy_dir = os.path.join(tmp, "legacy")
+        os.makedirs(legacy_dir)
+        for epoch in range(3):
+            np.savez(os.path.join(legacy_dir, f"weights_history_{epoch:04d}.npz"),
+                     W1=np.full((2, 3), epoch), W2=np.full((3, 1), -epoch))
+
+        for directory in (store_dir, legacy_dir):
+            snapshots = load_snapshots(directory)
+            assert len(snapshots) == 3
+            assert np.array_equal(snapshots[2]['W1'], np.full((2, 3), 2))
+            assert np.array_equal(snapshots[len(snapshots) - 1]['W2'], np.full((3, 1), -2))
+
+
+if __name__ == "__main__":
+    test_round_trip_and_epoch_range()
+    test_writer_drops_snapshots_past_capacity()
+    test_training_writes_single_store()
+    test_load_snapshots_reads_both_formats()
+    print("✅ All weight history tests passed!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized rolling-window kernels
+
+Checks each kernel against the pandas rolling operation it replaces,
+including NaN handling, short inputs and chunk boundaries.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from window_kernels import rolling_mad, rolling_max, rolling_mean, rolling_min, rolling_std
+
+
+def _series(n=2000, seed=0):
+    rng = np.random.RandomState(seed)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    values[[3, n // 5, n // 5 + 1, n - 500]] = np.nan
+    return values
+
+
+def _assert_matches(actual, expected, rtol=1e-10):
+    expected = np.asarray(expected, dtype=np.float64)
+    assert actual.shape == expected.shape
+    assert np.array_equal(np.isnan(actual), np.isnan(expected))
+    assert np.allclose(actual, expected, rtol=rtol, atol=0, equal_nan=True)
+
+
+def test_matches_pandas():
+    """Every kernel agrees with pandas, NaN windows included."""
+    values = _series()
+    series = pd.Series(values)
+    for window in (1, 3, 14, 20):
+        _assert_matches(rolling_mean(values, window), series.rolling(window).mean())
+        _assert_matches(rolling_min(values, window), series.rolling(window).min(), rtol=0)
+        _assert_matches(rolling_max(values, window), series.rolling(window).max(), rtol=0)
+        if window > 1:
+            # pandas' online update drifts on small-variance windows, so compare
+            # exactly against a two-pass std and loosely against pandas
+            exact = series.rolling(window).apply(lambda x: np.std(x, ddof=1), raw=True)
+            _assert_matches(rolling_std(values, window), exact, rtol=1e-8)
+            _assert_matches(rolling_std(values, window), series.rolling(window).std(), rtol=1e-5)
+        mad = series.rolling(window).apply(lambda x: np.mean(np.abs(x - x.mean())), raw=True)
+        _assert_matches(rolling_mad(values, window), mad, rtol=1e-9)
+
+
+def test_chunk_boundaries_and_short_inputs():
+    """Chunking does not change results; inputs shorter than the window are all NaN."""
+    values = _series(1000, seed=1)
+    for chunk_rows in (1, 7, 64, 999):
+        _assert_matches(rolling_std(values, 20, chunk_rows=chunk_rows), rolling_std(values, 20), rtol=1e-12)
+        _assert_matches(rolling_mad(values, 20, chunk_rows=chunk_rows), rolling_mad(values, 20), rtol=1e-12)
+    for n in (0, 1, 19):
+        short = np.arange(n, dtype=float)
+        for kernel in (rolling_mean, rolling_std, rolling_min, rolling_max, rolling_mad):
+            result = kernel(short, 20)
+            assert result.shape == (n,) and np.isnan(result).all()
+    assert np.allclose(rolling_min([3, 1, 2, 5], 2), [np.nan, 1, 1, 2], equal_nan=True)
+
+
+def test_std_stable_on_drifting_series():
+    """Block-local sums stay accurate when the level drifts by orders of magnitude."""
+    rng = np.random.RandomState(2)
+    values = np.exp(np.cumsum(rng.normal(0, 0.05, 200000))) * 1e3
+    exact = np.lib.stride_tricks.sliding_window_view(values, 20).std(axis=1, ddof=1)
+    assert np.allclose(rolling_std(values, 20)[19:], exact, rtol=1e-9)
+
+
+if __name__ == "__main__":
+    test_matches_pandas()
+    test_chunk_boundaries_and_short_inputs()
+    test_std_stable_on_drifting_series()
+    print("✅ All window kernel tests passed!")
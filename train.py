@@ -16,6 +16,15 @@ import json
 # Add the project directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from stock_net import StockNet
+from artifact_writer import ArtifactWriter
+from telemetry import TrainingTelemetry, JsonLinesSink, StdoutSink
+from feature_store import materialize_features
+from columnar_cache import read_csv_cached
+from checkpoint import CHECKPOINT_FILE, TrainingCheckpointer, load_checkpoint
+from weight_history import WeightHistory
+
+# Rows of training_data.csv written for visualization in out-of-core mode
+TRAINING_DATA_SAMPLE_ROWS = 10000
 
 def str2bool(v):
     """Convert string to boolean for argument parsing."""
@@ -28,9 +37,126 @@ def str2bool(v):
     else:
         raise argparse.ArgumentTypeError('Boolean value expected.')
 
+def _save_model_artifacts(writer, net, model_dir, train_losses, val_losses):
+    """Queue the model weights, normalization CSVs, losses and weight history."""
+    net.save_weights(model_dir, "stock_model", writer=writer)
+    
+    # Save normalization parameters in CSV format for 3D visualization compatibility
+    # Extract normalization parameters from the network
+    X_min = net.X_min
+    X_max = net.X_max
+    Y_min = net.Y_min if net.has_target_norm else None
+    Y_max = net.Y_max if net.has_target_norm else None
+    
+    # Save as CSV files for 3D visualization compatibility
+    writer.savetxt(os.path.join(model_dir, "scaler_mean.csv"), X_min)
+    writer.savetxt(os.path.join(model_dir, "scaler_std.csv"), X_max - X_min)
+    
+    if Y_min is not None and Y_max is not None:
+        writer.savetxt(os.path.join(model_dir, "target_min.csv"), [Y_min])
+        writer.savetxt(os.path.join(model_dir, "target_max.csv"), [Y_max])
+    
+    # Save training losses for 3D visualization
+    losses_data = np.column_stack([train_losses, val_losses])
+    writer.savetxt(os.path.join(model_dir, "training_losses.csv"), losses_data)
+    
+    # Move weight history to model directory for 3D visualization
+    writer.move(os.path.join(os.getcwd(), "weights_history"),
+                os.path.join(model_dir, "weights_history"))
+
+def _finish_training(writer, net, model_dir, train_losses, val_losses):
+    """Save all artifacts, wait for them to hit disk and build the summary."""
+    _save_model_artifacts(writer, net, model_dir, train_losses, val_losses)
+    
+    # Barrier: every artifact is on disk before we report completion
+    writer.close()
+    
+    print(f"\nModel training completed successfully!")
+    print(f"Model saved to: {os.path.join(model_dir, 'stock_model.npz')}")
+    
+    # Force garbage collection
+    import gc
+    gc.collect()
+    
+    return {
+        'model_dir': model_dir,
+        'train_losses': list(train_losses),
+        'val_losses': list(val_losses),
+        'best_val_mse': float(np.min(val_losses)),
+        'final_val_mse': float(val_losses[-1]),
+        'epochs_run': len(train_losses)
+    }
+
+def _restore_or_create(model_dir, input_size, hidden_size, resume, checkpoint_every, checkpointer):
+    """
+    Build the network, restoring it from model_dir's checkpoint when resuming.
+
+    Returns:
+        tuple: (net, resume_state or None, checkpointer or None)
+    """
+    checkpoint_path = os.path.join(model_dir, CHECKPOINT_FILE)
+    resume_state = None
+    if resume and os.path.exists(checkpoint_path):
+        net, resume_state = load_checkpoint(checkpoint_path)
+        if net.W1.shape != (input_size, hidden_size):
+            raise ValueError(f"Checkpoint shape {net.W1.shape} does not match "
+                             f"({input_size}, {hidden_size})")
+        print(f"Loaded checkpoint from {checkpoint_path}")
+        # Continue the weight history saved with the interrupted run
+        history_dir = os.path.join(model_dir, "weights_history")
+        if WeightHistory.exists(history_dir):
+            resume_state['history_dir'] = history_dir
+    else:
+        if resume:
+            print(f"No checkpoint found at {checkpoint_path}, starting from scratch")
+        net = StockNet(input_size, hidden_size, 1)
+    
+    # Runs that neither checkpoint periodically nor resume (GUI runs
+    # bring their own checkpointer, sweep trials none) write no checkpoint
+    if checkpointer is None and (checkpoint_every > 0 or resume):
+        checkpointer = TrainingCheckpointer(checkpoint_path, every=checkpoint_every)
+    return net, resume_state, checkpointer
+
+def _train_out_of_core(writer, data_file, model_dir, x_features, y_feature, hidden_size,
+                      learning_rate, batch_size, epochs, patience, history_interval,
+                      save_history, validation_split, memory_budget_mb, telemetry,
+                      resume, checkpoint_every, checkpointer, save_training_data):
+    """Materialize the CSV into a feature store and train from it in blocks."""
+    print("\nMaterializing features...")
+    store = materialize_features(data_file, x_features, y_feature,
+                                 os.path.join(model_dir, "features"))
+    
+    # training_data.csv is only a sample here, so record how many rows of
+    # data_file were trained on for online_update
+    writer.write_json(os.path.join(model_dir, "feature_info.json"),
+                      {'x_features': x_features, 'y_feature': y_feature,
+                       'rows_trained': int(store.n_rows)})
+    
+    # Keep a bounded sample for the 3D visualization instead of a full copy
+    if save_training_data:
+        n_sample = min(store.n_rows, TRAINING_DATA_SAMPLE_ROWS)
+        sample = pd.DataFrame(np.asarray(store.X[:n_sample]), columns=x_features)
+        sample[y_feature] = np.asarray(store.y[:n_sample, 0])
+        writer.write_csv(sample, os.path.join(model_dir, "training_data.csv"))
+    
+    net, resume_state, checkpointer = _restore_or_create(model_dir, len(x_features), hidden_size,
+                                                        resume, checkpoint_every, checkpointer)
+    train_losses, val_losses = net.train_streaming(store, epochs=epochs, learning_rate=learning_rate,
+                                                   batch_size=batch_size,
+                                                   validation_split=validation_split,
+                                                   memory_budget_mb=memory_budget_mb,
+                                                   save_history=save_history,
+                                                   history_interval=history_interval,
+                                                   patience=patience, telemetry=telemetry,
+                                                   checkpointer=checkpointer,
+                                                   resume_state=resume_state)
+    return _finish_training(writer, net, model_dir, train_losses, val_losses)
+
 def train_model(data_file, model_dir, x_features, y_feature, hidden_size=4, learning_rate=0.001, 
                 batch_size=32, epochs=1000, patience=20, history_interval=50, random_seed=42, 
-                save_history=True, memory_opt=True, validation_split=0.2):
+                save_history=True, memory_opt=True, validation_split=0.2, use_workspace=True, df=None,
+                telemetry=None, out_of_core=False, memory_budget_mb=256, checkpoint_every=0,
+                resume=False, checkpointer=None, columnar_cache=False, save_training_data=True):
     """
     Train a neural network model for stock price prediction.
     
@@ -49,6 +175,32 @@ def train_model(data_file, model_dir, x_features, y_feature, hidden_size=4, lear
         save_history (bool): Whether to save weight history
         memory_opt (bool): Whether to enable memory optimization
         validation_split (float): Validation split ratio
+        use_workspace (bool): Whether to train with preallocated in-place buffers
+        df (pandas.DataFrame, optional): Preloaded data to train on instead of
+            reading data_file (used by sweep.py to share one copy across trials)
+        telemetry (TrainingTelemetry, optional): Channel receiving per-epoch
+            loss records; None trains silently apart from periodic summaries
+        out_of_core (bool): Stream the CSV into a float32 memory-mapped feature
+            store under model_dir/features and train from it block by block
+            instead of loading the whole file into RAM
+        memory_budget_mb (float): Block buffer budget for out-of-core training
+        checkpoint_every (int): Write model_dir/checkpoint.npz every N epochs
+            and after the last one (0 writes none, except when a passed
+            checkpointer is asked to stop)
+        resume (bool): Continue from model_dir/checkpoint.npz if it exists
+        checkpointer (TrainingCheckpointer, optional): Externally owned
+            checkpointer, e.g. one the GUI can ask to stop; overrides
+            checkpoint_every
+        columnar_cache (bool): Read data_file through a Feather sidecar that
+            is built on first use and rebuilt when the CSV changes
+        save_training_data (bool): Copy the training rows (a sample in
+            out_of_core mode) to model_dir/training_data.csv for the 3D
+            visualization; sweep trials turn this off
+    
+    Returns:
+        dict: Training summary with the model directory, the per-epoch
+        train/validation losses, the best and final validation MSE and the
+        number of epochs run
     """
     print(f"\nTraining parameters:")
     print(f"Data File: {data_file}")
@@ -69,17 +221,29 @@ def train_model(data_file, model_dir, x_features, y_feature, hidden_size=4, lear
     # Set random seed for reproducibility
     np.random.seed(random_seed)
     
+    writer = None
     try:
         # Validate input paths
-        if not os.path.exists(data_file):
+        if df is None and not os.path.exists(data_file):
             raise ValueError(f"Data file not found: {data_file}")
         
         # Create model directory if it doesn't exist
         os.makedirs(model_dir, exist_ok=True)
         
+        if out_of_core:
+            if df is not None:
+                raise ValueError("out_of_core training reads data_file; do not pass df")
+            writer = ArtifactWriter()
+            return _train_out_of_core(writer, data_file, model_dir, x_features, y_feature,
+                                      hidden_size, learning_rate, batch_size, epochs, patience,
+                                      history_interval, save_history, validation_split,
+                                      memory_budget_mb, telemetry, resume, checkpoint_every,
+                                      checkpointer, save_training_data)
+        
         # Load and preprocess data
-        print("\nLoading data...")
-        df = pd.read_csv(data_file)
+        if df is None:
+            print("\nLoading data...")
+            df = read_csv_cached(data_file) if columnar_cache else pd.read_csv(data_file)
         
         # Validate features
         if not all(col in df.columns for col in x_features):
@@ -87,6 +251,15 @@ def train_model(data_file, model_dir, x_features, y_feature, hidden_size=4, lear
         if y_feature not in df.columns:
             raise ValueError(f"Y feature not found in data: {y_feature}")
         
+        # Artifacts are written on a background thread; the input copy and
+        # feature info do not depend on training, so they overlap with it
+        writer = ArtifactWriter()
+        if save_training_data:
+            writer.write_csv(df, os.path.join(model_dir, "training_data.csv"))
+        writer.write_json(os.path.join(model_dir, "feature_info.json"),
+                          {'x_features': x_features, 'y_feature': y_feature,
+                           'rows_trained': len(df)})
+        
         X = df[x_features].values
         y = df[y_feature].values.reshape(-1, 1)
         
@@ -108,9 +281,9 @@ def train_model(data_file, model_dir, x_features, y_feature, hidden_size=4, lear
             X_val, y_val = None, None
             print(f"Using all {len(X_train)} samples for training (no validation split)")
         
-        # Initialize neural network
-        input_size = len(x_features)
-        net = StockNet(input_size, hidden_size, 1)
+        # Initialize neural network, or restore it with its optimizer state
+        net, resume_state, checkpointer = _restore_or_create(model_dir, len(x_features), hidden_size,
+                                                            resume, checkpoint_every, checkpointer)
         
         # Normalize data using the network's built-in normalization
         X_train_norm, y_train_norm = net.normalize(X_train, y_train)
@@ -140,60 +313,17 @@ def train_model(data_file, model_dir, x_features, y_feature, hidden_size=4, lear
                  epochs=epochs,
                  save_history=save_history,
                  history_interval=history_interval,
-                 patience=patience)
-        
-        # Save model
-        model_path = os.path.join(model_dir, "stock_model.npz")
-        net.save_weights(model_dir, "stock_model")
-        
-        # Save normalization parameters in CSV format for 3D visualization compatibility
-        # Extract normalization parameters from the network
-        X_min = net.X_min
-        X_max = net.X_max
-        Y_min = net.Y_min if net.has_target_norm else None
-        Y_max = net.Y_max if net.has_target_norm else None
-        
-        # Save as CSV files for 3D visualization compatibility
-        np.savetxt(os.path.join(model_dir, "scaler_mean.csv"), X_min, delimiter=',')
-        np.savetxt(os.path.join(model_dir, "scaler_std.csv"), X_max - X_min, delimiter=',')
-        
-        if Y_min is not None and Y_max is not None:
-            np.savetxt(os.path.join(model_dir, "target_min.csv"), [Y_min], delimiter=',')
-            np.savetxt(os.path.join(model_dir, "target_max.csv"), [Y_max], delimiter=',')
-        
-        # Save training losses for 3D visualization
-        losses_data = np.column_stack([train_losses, val_losses])
-        np.savetxt(os.path.join(model_dir, "training_losses.csv"), losses_data, delimiter=',')
-        
-        # Save training data for 3D visualization
-        df.to_csv(os.path.join(model_dir, "training_data.csv"), index=False)
-        
-        # Move weight history to model directory for 3D visualization
-        weights_history_src = os.path.join(os.getcwd(), "weights_history")
-        weights_history_dst = os.path.join(model_dir, "weights_history")
-        if os.path.exists(weights_history_src):
-            import shutil
-            if os.path.exists(weights_history_dst):
-                shutil.rmtree(weights_history_dst)
-            shutil.move(weights_history_src, weights_history_dst)
-        
-        # Save feature info for compatibility with other scripts
-        feature_info = {
-            'x_features': x_features,
-            'y_feature': y_feature
-        }
-        
-        with open(os.path.join(model_dir, "feature_info.json"), 'w') as f:
-            json.dump(feature_info, f, indent=4)
-        
-        print(f"\nModel training completed successfully!")
-        print(f"Model saved to: {model_path}")
-        
-        # Force garbage collection
-        import gc
-        gc.collect()
+                 patience=patience,
+                 use_workspace=use_workspace,
+                 telemetry=telemetry,
+                 checkpointer=checkpointer,
+                 resume_state=resume_state)
+        
+        return _finish_training(writer, net, model_dir, train_losses, val_losses)
         
     except Exception as e:
+        if writer is not None:
+            writer.shutdown()
         print(f"\nTraining failed: {str(e)}")
         raise
 
@@ -213,6 +343,20 @@ if __name__ == "__main__":
     parser.add_argument("--save_history", type=str2bool, default=True, help="Whether to save weight history")
     parser.add_argument("--memory_opt", type=str2bool, default=True, help="Whether to enable memory optimization")
     parser.add_argument("--validation_split", type=float, default=0.2, help="Validation split ratio")
+    parser.add_argument("--use_workspace", type=str2bool, default=True, help="Whether to train with preallocated in-place buffers")
+    parser.add_argument("--out_of_core", type=str2bool, default=False,
+                        help="Train from a memory-mapped feature store instead of loading the CSV into RAM")
+    parser.add_argument("--memory_budget_mb", type=float, default=256,
+                        help="Memory budget for out-of-core block buffers")
+    parser.add_argument("--checkpoint_every", type=int, default=10,
+                        help="Save a resumable checkpoint every N epochs (0 to only save on interrupt)")
+    parser.add_argument("--resume", type=str2bool, nargs='?', const=True, default=False,
+                        help="Resume from the checkpoint in model_dir")
+    parser.add_argument("--telemetry_every", type=int, default=1, help="Emit one loss record per this many epochs")
+    parser.add_argument("--telemetry_file", type=str, default=None,
+                        help="Write loss records as JSON lines to this file instead of LOSS:/WEIGHTS: stdout lines")
+    parser.add_argument("--columnar_cache", type=str2bool, default=False,
+                        help="Convert the CSV to a Feather sidecar on first load and read that afterwards")
     
     args = parser.parse_args()
     
@@ -239,8 +383,24 @@ if __name__ == "__main__":
     if not x_features:
         raise ValueError("No input features specified")
     
+    # Stream loss records to a JSON-lines file, or to stdout for GUIs that scrape it
+    sink = JsonLinesSink(args.telemetry_file) if args.telemetry_file else StdoutSink()
+    telemetry = TrainingTelemetry([sink], every=args.telemetry_every)
+    
+    # First Ctrl-C checkpoints and stops cleanly; a second one aborts
+    checkpointer = TrainingCheckpointer(os.path.join(args.model_dir, CHECKPOINT_FILE),
+                                        every=args.checkpoint_every)
+    checkpointer.install_sigint_handler()
+    
     # Run training
-    train_model(args.data_file, args.model_dir, x_features, args.y_feature,
-               args.hidden_size, args.learning_rate, args.batch_size,
-               args.epochs, args.patience, args.history_interval, args.random_seed,
-               args.save_history, args.memory_opt, args.validation_split)
+    try:
+        train_model(args.data_file, args.model_dir, x_features, args.y_feature,
+                   args.hidden_size, args.learning_rate, args.batch_size,
+                   args.epochs, args.patience, args.history_interval, args.random_seed,
+                   args.save_history, args.memory_opt, args.validation_split, args.use_workspace,
+                   telemetry=telemetry, out_of_core=args.out_of_core,
+                   memory_budget_mb=args.memory_budget_mb, resume=args.resume,
+                   checkpointer=checkpointer, columnar_cache=args.columnar_cache)
+    finally:
+        checkpointer.restore_sigint_handler()
+        telemetry.close()
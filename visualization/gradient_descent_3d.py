@@ -18,6 +18,10 @@ from datetime import datetime
 import argparse
 import sys
 
+# The weight history store lives in the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from weight_history import WeightHistory, load_legacy_npz_history
+
 def load_config(config_file=None):
     """Load configuration from JSON file or return default configuration."""
     default_config = {
@@ -105,17 +109,13 @@ def load_training_data(model_dir):
     else:
         losses = losses
     
-    # Load weight history
-    weights_files = sorted(glob.glob(os.path.join(weights_dir, "weights_history_*.npz")))
-    weights = []
-    if weights_files:
-        for wf in weights_files:
-            with np.load(wf) as data:
-                weights.append({
-                    'W1': data['W1'],
-                    'W2': data['W2']
-                })
+    # Load weight history: memory-mapped store, or per-epoch npz files from older models
+    if WeightHistory.exists(weights_dir):
+        weights = WeightHistory(weights_dir)
+        print(f"Mapped weight history with {len(weights)} snapshots")
     else:
+        weights = load_legacy_npz_history(weights_dir)
+    if len(weights) == 0:
         print("No weight history found, using placeholder weights")
         weights = [{'W1': np.zeros((len(norm_params['x_features']), 4)), 
                     'W2': np.zeros((4, 1))} for _ in range(len(losses))]
@@ -173,6 +173,17 @@ def extract_weight_by_index(weights, index, layer='W1'):
         print(f"Warning: Could not extract weight at index {index} from {layer}: {e}")
         return 0.0
 
+def extract_weight_path(weights, index, layer='W1'):
+    """Extract the trajectory of one weight across every snapshot as a 1D array."""
+    if isinstance(weights, WeightHistory):
+        size = int(np.prod(weights.meta['params'][layer]))
+        if not 0 <= index < size:
+            print(f"Warning: Index {index} out of range for {layer} (size: {size}), using index 0")
+            index = 0
+        # One strided read from the memory map instead of a pass per frame
+        return np.array(weights.series(layer, index), dtype=np.float64)
+    return np.array([extract_weight_by_index(w, index, layer) for w in weights], dtype=np.float64)
+
 class GradientDescentVisualizer:
     def __init__(self, model_dir=None, w1_range=(-2, 2), w2_range=(-2, 2), n_points=50,
                  view_elev=30, view_azim=45, fps=30, color='viridis', point_size=8, 
@@ -195,6 +206,10 @@ class GradientDescentVisualizer:
         
         self.norm_params, self.history = load_training_data(self.model_dir)
         
+        # Precompute the clamped loss path so each frame only slices it
+        self.w1_path = np.clip(extract_weight_path(self.history['weights'], w1_index, 'W1'), w1_range[0], w1_range[1])
+        self.w2_path = np.clip(extract_weight_path(self.history['weights'], w2_index, 'W2'), w2_range[0], w2_range[1])
+        
         data_file = os.path.join(self.model_dir, "training_data.csv")
         if os.path.exists(data_file):
             try:
@@ -299,24 +314,10 @@ class GradientDescentVisualizer:
         
         loss = self.history['losses'][frame]
         
-        # Collect path data with better error handling
-        x, y = [], []
-        for i in range(min(frame + 1, len(self.history['weights']))):
-            try:
-                w = self.history['weights'][i]
-                x_val = extract_weight_by_index(w, self.w1_index, 'W1')
-                y_val = extract_weight_by_index(w, self.w2_index, 'W2')
-                
-                # Clamp values to stay within visualization bounds
-                x_val = np.clip(x_val, self.w1_range[0], self.w1_range[1])
-                y_val = np.clip(y_val, self.w2_range[0], self.w2_range[1])
-                
-                x.append(x_val)
-                y.append(y_val)
-            except (IndexError, KeyError) as e:
-                print(f"Warning: Could not extract weights for path point {i}: {e}")
-                x.append(0.0)
-                y.append(0.0)
+        # Path up to the current frame, sliced from the precomputed trajectory
+        n_path = min(frame + 1, len(self.w1_path))
+        x = self.w1_path[:n_path].tolist()
+        y = self.w2_path[:n_path].tolist()
         
         z = self.history['losses'][:frame + 1]
         
@@ -0,0 +1,240 @@
+"""
+Append-only weight history store
+
+Training snapshots are written into one preallocated .npy file per parameter
+(shape [capacity, ...]) plus an epochs.npy index, all opened once as memory
+maps. Readers map the same files read-only and can slice any epoch range
+without loading the rest of the history.
+
+Layout of a history directory:
+    history.json    parameter names, shapes, dtype and capacity
+    epochs.npy      int64 [capacity], -1 marks unused slots
+    <name>.npy      [capacity, *shape] for every recorded parameter
+"""
+
+import os
+import json
+import glob
+
+import numpy as np
+
+HISTORY_META_FILE = "history.json"
+EPOCHS_FILE = "epochs.npy"
+
+
+class WeightHistoryWriter:
+    """Preallocated append-only writer for weight snapshots."""
+
+    def __init__(self, directory, params, capacity, dtype=np.float64, continue_from=None, before_epoch=None):
+        """
+        Create the store and map every parameter file for writing.
+
+        Args:
+            directory (str): Directory to hold the store (created if missing)
+            params (dict): Parameter name -> array giving the snapshot shape
+            capacity (int): Maximum number of new snapshots
+            dtype: Storage dtype for parameter snapshots
+            continue_from (str): Existing store whose snapshots before
+                before_epoch are copied to the front of this one, e.g. when
+                resuming an interrupted run (may be `directory` itself)
+            before_epoch (int): First epoch not copied from continue_from
+        """
+        # Read the earlier snapshots first: mode='w+' below truncates the files
+        kept = _read_snapshots(continue_from, params, before_epoch) if continue_from else None
+        n_kept = 0 if kept is None else len(kept['epochs'])
+
+        self.directory = directory
+        self.capacity = int(capacity) + n_kept
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+
+        self.names = list(params)
+        self.arrays = {}
+        for name in self.names:
+            shape = (self.capacity,) + np.shape(params[name])
+            self.arrays[name] = np.lib.format.open_memmap(
+                os.path.join(directory, f"{name}.npy"), mode='w+', dtype=dtype, shape=shape)
+        self._epochs_path = os.path.join(directory, EPOCHS_FILE)
+        self.epochs = np.lib.format.open_memmap(
+            self._epochs_path, mode='w+', dtype=np.int64, shape=(self.capacity,))
+        self.epochs[:] = -1
+
+        meta = {
+            'format': 'weight_history/1',
+            'capacity': self.capacity,
+            'dtype': np.dtype(dtype).str,
+            'params': {name: list(np.shape(params[name])) for name in self.names},
+        }
+        with open(os.path.join(directory, HISTORY_META_FILE), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+        for i in range(n_kept):
+            self.append(int(kept['epochs'][i]), **{name: kept[name][i] for name in self.names})
+
+    def append(self, epoch, **params):
+        """
+        Copy one snapshot into the next free slot.
+
+        Args:
+            epoch (int): Epoch the snapshot belongs to
+            **params: Parameter arrays keyed by name
+
+        Returns:
+            bool: False if the store is full and the snapshot was dropped
+        """
+        if self.count >= self.capacity:
+            return False
+        for name in self.names:
+            self.arrays[name][self.count] = params[name]
+        # The epoch is written last so readers never see a half-written slot
+        self.epochs[self.count] = epoch
+        self.count += 1
+        # Writes through a memory map only update the file's mtime on the
+        # first write after a flush; touch the index so stat-based readers
+        # (model_registry) notice every snapshot
+        os.utime(self._epochs_path)
+        return True
+
+    def flush(self):
+        """Flush all memory maps to disk."""
+        for array in self.arrays.values():
+            array.flush()
+        self.epochs.flush()
+
+    def close(self):
+        """Flush and release the memory maps."""
+        self.flush()
+        self.arrays = {}
+        self.epochs = None
+
+
+class WeightHistory:
+    """Read-only, lazily sliced view of a weight history store."""
+
+    def __init__(self, directory):
+        """
+        Map an existing store read-only.
+
+        Args:
+            directory (str): Directory written by WeightHistoryWriter
+        """
+        self.directory = directory
+        with open(os.path.join(directory, HISTORY_META_FILE), 'r') as f:
+            self.meta = json.load(f)
+        self.names = list(self.meta['params'])
+
+        epochs = np.load(os.path.join(directory, EPOCHS_FILE), mmap_mode='r')
+        # Slots are filled in order, so the used prefix ends at the first -1
+        self.count = int(np.argmax(epochs < 0)) if (epochs < 0).any() else len(epochs)
+        self.epochs = epochs[:self.count]
+        self.arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')[:self.count]
+                       for name in self.names}
+
+    @staticmethod
+    def exists(directory):
+        """Return True if the directory holds a memory-mapped store."""
+        return os.path.exists(os.path.join(directory, HISTORY_META_FILE))
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        """Return snapshot `index` as a dict of parameter views."""
+        return {name: array[index] for name, array in self.arrays.items()}
+
+    def epoch_range(self, start=None, stop=None):
+        """
+        Slice all parameters to snapshots with start <= epoch < stop.
+
+        Args:
+            start (int): First epoch to include (None for the beginning)
+            stop (int): Epoch to stop before (None for the end)
+
+        Returns:
+            dict: 'epochs' plus one memory-mapped view per parameter
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.epochs, start, side='left'))
+        hi = self.count if stop is None else int(np.searchsorted(self.epochs, stop, side='left'))
+        result = {name: array[lo:hi] for name, array in self.arrays.items()}
+        result['epochs'] = self.epochs[lo:hi]
+        return result
+
+    def series(self, name, flat_index):
+        """
+        Trajectory of a single weight across all snapshots.
+
+        Args:
+            name (str): Parameter name, e.g. 'W1'
+            flat_index (int): Index into the flattened parameter
+
+        Returns:
+            numpy.ndarray: Values with shape [len(self)]
+        """
+        array = self.arrays[name]
+        return array.reshape(self.count, -1)[:, flat_index]
+
+
+def _read_snapshots(directory, params, before_epoch=None):
+    """
+    Copy the snapshots of a store recorded before an epoch into memory.
+
+    Returns:
+        dict: 'epochs' plus one array per parameter, or None if the directory
+            holds no store or its parameters do not match `params`
+    """
+    if not WeightHistory.exists(directory):
+        return None
+    history = WeightHistory(directory)
+    if history.meta['params'] != {name: list(np.shape(value)) for name, value in params.items()}:
+        print(f"Warning: Weight history in {directory} has different parameters, not continuing it")
+        return None
+    selected = history.epoch_range(stop=before_epoch)
+    return {name: np.array(values) for name, values in selected.items()}
+
+
+def has_snapshots(directory):
+    """
+    Return True if a weights_history directory holds at least one snapshot,
+    either in a memory-mapped store or as legacy per-epoch NPZ files.
+
+    Args:
+        directory (str): weights_history directory
+    """
+    if WeightHistory.exists(directory):
+        epochs = np.load(os.path.join(directory, EPOCHS_FILE), mmap_mode='r')
+        return len(epochs) > 0 and epochs[0] >= 0
+    return bool(glob.glob(os.path.join(directory, "*.npz")))
+
+
+def load_snapshots(directory):
+    """
+    Open a weights_history directory in whichever format it was written.
+
+    Args:
+        directory (str): weights_history directory
+
+    Returns:
+        WeightHistory or list: The memory-mapped store, or the legacy NPZ
+            snapshots from load_legacy_npz_history; either gives len() and
+            dicts with 'W1' and 'W2' by index
+    """
+    if WeightHistory.exists(directory):
+        return WeightHistory(directory)
+    return load_legacy_npz_history(directory)
+
+
+def load_legacy_npz_history(directory):
+    """
+    Read per-epoch weights_history_XXXX.npz files from older models.
+
+    Args:
+        directory (str): weights_history directory
+
+    Returns:
+        list: Dicts with 'W1' and 'W2' arrays, in epoch order
+    """
+    weights = []
+    for path in sorted(glob.glob(os.path.join(directory, "weights_history_*.npz"))):
+        with np.load(path) as data:
+            weights.append({'W1': data['W1'], 'W2': data['W2']})
+    return weights
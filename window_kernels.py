@@ -0,0 +1,187 @@
+"""
+Vectorized rolling-window kernels
+
+NumPy replacements for the pandas rolling operations used by the indicator
+engine. All kernels follow pandas' default semantics (min_periods equal to the
+window): the first window-1 outputs are NaN, as is every window that contains
+a NaN.
+
+    rolling_mean, rolling_std   block-local cumulative sums, O(n)
+    rolling_min, rolling_max    van Herk/Gil-Werman block prefix/suffix scans, O(n)
+    rolling_mad                 mean absolute deviation over sliding_window_view
+                                in bounded-memory chunks, O(n * window)
+
+Each kernel accepts any 1-D array-like and returns a float64 ndarray of the
+same length.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Windows processed per chunk; bounds the temporary window matrices.
+CHUNK_ROWS = 65536
+
+# Windows sharing one cumulative sum. Each block is centered on its own mean
+# before summing, so differencing the sums stays accurate even when the level
+# of the series drifts by orders of magnitude.
+SUM_BLOCK_ROWS = 64
+
+
+def _prepare(values, window):
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 1:
+        raise ValueError(f"Expected a 1-D array, got shape {values.shape}")
+    window = int(window)
+    if window < 1:
+        raise ValueError(f"Window must be at least 1, got {window}")
+    return values, window, np.full(values.shape[0], np.nan)
+
+
+def _window_chunks(n, window, chunk_rows):
+    """Yield (start, stop) input ranges whose full windows end in [start + window - 1, stop)."""
+    step = max(1, int(chunk_rows))
+    for first_end in range(window - 1, n, step):
+        yield first_end - window + 1, min(n, first_end + step)
+
+
+def _window_sums(values, window, chunk_rows):
+    """
+    Yield per-window sums of shifted values, squared shifted values and NaNs.
+
+    Yields:
+        tuple: (lo, hi, sum, sum_of_squares, nan_count, shift) for the windows
+        ending at lo..hi-1, where shift is the value each window was centered on
+    """
+    for start, stop in _window_chunks(values.shape[0], window, chunk_rows):
+        n_windows = stop - start - window + 1
+        n_blocks = -(-n_windows // SUM_BLOCK_ROWS)
+        span = SUM_BLOCK_ROWS + window - 1
+        padded = np.full(n_blocks * SUM_BLOCK_ROWS + window - 1, np.nan)
+        padded[:stop - start] = values[start:stop]
+        blocks = sliding_window_view(padded, span)[::SUM_BLOCK_ROWS]
+
+        nan_mask = np.isnan(blocks)
+        clean = np.where(nan_mask, 0.0, blocks)
+        shift = clean.sum(axis=1) / np.maximum((~nan_mask).sum(axis=1), 1)
+        centered = np.where(nan_mask, 0.0, clean - shift[:, None])
+
+        def windowed(x):
+            c = np.zeros((n_blocks, span + 1))
+            np.cumsum(x, axis=1, out=c[:, 1:])
+            return (c[:, window:] - c[:, :-window]).ravel()[:n_windows]
+
+        yield (start + window - 1, stop, windowed(centered), windowed(centered * centered),
+               windowed(nan_mask.astype(np.float64)),
+               np.repeat(shift, SUM_BLOCK_ROWS)[:n_windows])
+
+
+def rolling_mean(values, window, chunk_rows=CHUNK_ROWS):
+    """
+    Rolling mean over a trailing window.
+
+    Args:
+        values (array-like): Input series
+        window (int): Window length
+        chunk_rows (int): Windows processed per chunk
+
+    Returns:
+        numpy.ndarray: Rolling means (NaN where the window is incomplete)
+    """
+    values, window, out = _prepare(values, window)
+    for lo, hi, s1, _, nans, shift in _window_sums(values, window, chunk_rows):
+        out[lo:hi] = np.where(nans > 0, np.nan, s1 / window + shift)
+    return out
+
+
+def rolling_std(values, window, ddof=1, chunk_rows=CHUNK_ROWS):
+    """
+    Rolling standard deviation over a trailing window.
+
+    Args:
+        values (array-like): Input series
+        window (int): Window length
+        ddof (int): Delta degrees of freedom (1 matches pandas)
+        chunk_rows (int): Windows processed per chunk
+
+    Returns:
+        numpy.ndarray: Rolling standard deviations
+    """
+    values, window, out = _prepare(values, window)
+    if window - ddof <= 0:
+        return out
+    for lo, hi, s1, s2, nans, _ in _window_sums(values, window, chunk_rows):
+        var = (s2 - s1 * s1 / window) / (window - ddof)
+        out[lo:hi] = np.where(nans > 0, np.nan, np.sqrt(np.maximum(var, 0.0)))
+    return out
+
+
+def _rolling_extreme(values, window, ufunc):
+    values, window, out = _prepare(values, window)
+    n = values.shape[0]
+    if n < window:
+        return out
+    # Prefix scans within blocks of `window` give the extreme from the block
+    # start up to i; suffix scans give it from j to the block end. A window
+    # [j, i] spans at most two blocks, so it is the extreme of the two.
+    n_blocks = -(-n // window)
+    padded = np.empty(n_blocks * window)
+    padded[:n] = values
+    padded[n:] = values[-1]
+    blocks = padded.reshape(n_blocks, window)
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    ends = np.arange(window - 1, n)
+    out[window - 1:] = ufunc(suffix[ends - window + 1], prefix[ends])
+    return out
+
+
+def rolling_min(values, window):
+    """
+    Rolling minimum over a trailing window.
+
+    Args:
+        values (array-like): Input series
+        window (int): Window length
+
+    Returns:
+        numpy.ndarray: Rolling minima
+    """
+    return _rolling_extreme(values, window, np.minimum)
+
+
+def rolling_max(values, window):
+    """
+    Rolling maximum over a trailing window.
+
+    Args:
+        values (array-like): Input series
+        window (int): Window length
+
+    Returns:
+        numpy.ndarray: Rolling maxima
+    """
+    return _rolling_extreme(values, window, np.maximum)
+
+
+def rolling_mad(values, window, chunk_rows=CHUNK_ROWS):
+    """
+    Rolling mean absolute deviation around each window's mean.
+
+    Equivalent to rolling(window).apply(lambda x: np.mean(np.abs(x - x.mean())))
+    without a Python call per row.
+
+    Args:
+        values (array-like): Input series
+        window (int): Window length
+        chunk_rows (int): Windows materialized per chunk
+
+    Returns:
+        numpy.ndarray: Rolling mean absolute deviations
+    """
+    values, window, out = _prepare(values, window)
+    for start, stop in _window_chunks(values.shape[0], window, chunk_rows):
+        windows = sliding_window_view(values[start:stop], window)
+        means = windows.mean(axis=1)
+        out[start + window - 1:stop] = np.abs(windows - means[:, None]).mean(axis=1)
+    return out